@@ -2,24 +2,64 @@
 """
 Complete Emaux Soyer Image Downloader
 Downloads ALL high-quality enamel images from the complete product catalog
+Catalog-specific logic comes from a supplier adapter (see
+enamel_downloader.suppliers); emaux-soyer.com unless another is passed
 """
 
 import os
-import re
-import time
-import requests
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin
 from pathlib import Path
 import json
+import threading
+from collections import Counter
+
+from enamel_downloader.cache import HttpCache
+from enamel_downloader.candidates import CandidateResolver
+from enamel_downloader.dedupe import DedupeIndex
+from enamel_downloader.discovery import EMAUX_SOYER_LISTING_URLS
+from enamel_downloader.download import fetch_to_file, is_complete_image
+from enamel_downloader.engine import CrawlEngine
+from enamel_downloader.manifest import Manifest, file_sha256
+from enamel_downloader.metrics import StageMetrics
+from enamel_downloader.page import ParsedPage
+from enamel_downloader.pools import ConnectionPools
+from enamel_downloader.results import ResultLog, strip, write_report
+from enamel_downloader.retry import RetryQueue
+from enamel_downloader.store import STORE_DIR, BlobStore
+from enamel_downloader.suppliers import EmauxSoyerAdapter
 
 class CompleteEmauxDownloader:
-    def __init__(self, base_dir="public"):
+    def __init__(self, base_dir="public", concurrency=8, rate_limit=4.0, host_concurrency=4,
+                 cache_dir=None, cache_max_bytes=256 * 1024 * 1024, manifest_ttl=7 * 24 * 3600,
+                 pool_size=None, http2=False, event_log=None, supplier=None):
         self.base_dir = Path(base_dir)
-        self.session = requests.Session()
-        self.session.headers.update({
+        # Everything catalog-specific: discovery, references, image selection, type hints
+        self.supplier = supplier or EmauxSoyerAdapter()
+        # Keep-alive sessions for pages and for images, pooled for the number of workers
+        self.pools = ConnectionPools(pool_size=pool_size or max(concurrency, host_concurrency), http2=http2, headers={
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
         })
+        self.session = self.pools.html
+        # Keeps several products in flight while staying polite to each host
+        self.engine = CrawlEngine(concurrency=concurrency, rate=rate_limit,
+                                  burst=host_concurrency, host_concurrency=host_concurrency)
+        # Conditional cache: unchanged pages and images cost a 304 on later runs
+        self.cache = HttpCache(cache_dir or self.base_dir / ".cache" / "http", max_bytes=cache_max_bytes)
+        # Manifest of previous runs: only new, stale or changed products are processed
+        self.manifest = Manifest(self.cache.directory.parent / "complete_download_manifest.sqlite", ttl=manifest_ttl)
+        # Content and perceptual hashes of stored swatches, so each image is stored once
+        self.dedupe = DedupeIndex(self.cache.directory.parent / "dedupe_index.json")
+        # Each image's bytes once, by content hash; the type folders link to them
+        self.store = BlobStore(self.base_dir / STORE_DIR)
+        # Products that failed, replayable on their own with retry_failed()
+        self.retry_queue = RetryQueue(self.cache.directory.parent / "complete_retry_queue.json")
+        # Best source image per product (originals over cache renditions), probed once and remembered
+        self.resolver = CandidateResolver(self.probe, self.cache.directory.parent / "image_choices.json",
+                                          originals=self.supplier.original_url)
+        # Product URLs of the last complete discovery
+        self.discovery_file = self.cache.directory.parent / self.supplier.discovery_file
+        # Latency and bytes per pipeline stage; event_log appends every observation as JSON lines
+        self.metrics = StageMetrics(event_log=event_log)
+        self.lock = threading.Lock()
         
         # Create directories
         self.transparent_dir = self.base_dir / "transparent_colors"
@@ -29,94 +69,73 @@ class CompleteEmauxDownloader:
         for dir_path in [self.transparent_dir, self.opaque_dir, self.opal_dir]:
             dir_path.mkdir(parents=True, exist_ok=True)
             
-        self.results = []
-        self.stats = {"total": 0, "success": 0, "failed": 0, "skipped": 0}
-        self.type_counts = {"transparent": 0, "opaque": 0, "opal": 0, "unknown": 0}
+        # Every finished product is appended here; the report is built from it at the end
+        self.result_log = ResultLog(self.cache.directory.parent / "complete_results.jsonl")
+        # Input position per product URL, so the report keeps catalog order
+        self.sequence = {}
+        self.stats = {"total": 0, "success": 0, "failed": 0, "skipped": 0, "pages_fetched": 0}
+        # Page fetches per product URL, so a second fetch of the same page shows up in the report
+        self.page_fetches = Counter()
+        self.discovery = None
 
     def extract_color_reference(self, url, title=""):
         """Extract color reference from URL or title"""
-        # Try to extract from URL
-        patterns = [
-            r'(\d+[a-zA-Z]*)-?(?:en-poudre|en-grains|en-morceaux|powder|poudre|150g|150-gr)',
-            r'(\d+)-?[fF]?-?(?:en-poudre|en-grains|en-morceaux|powder|poudre)',
-            r'([a-zA-Z]+-\d+)',
-            r'(\d+)'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1).upper().replace('-', '')
-        
-        return None
+        return self.supplier.reference(url, title)[0]
 
     def determine_enamel_type(self, url, title="", content=""):
         """Determine if enamel is transparent, opaque, or opal"""
-        text = f"{url} {title} {content}".lower()
-        
-        # Opal indicators
-        if any(word in text for word in ['opal', 'opale', 'opalescent']):
-            return "opal"
-        
-        # Transparent indicators  
-        if any(word in text for word in ['transparent', 'translucent', 'clear']):
-            return "transparent"
+        return self.supplier.enamel_type(url, title, content)
+
+    def get(self, url, **kwargs):
+        """GET through the HTTP cache and the crawl engine's per-host rate limiter"""
+        return self.cache.get(self.send, url, **kwargs)
+
+    def send(self, url, **kwargs):
+        return self.engine.request(self.pools.session_for(url), 'GET', url, **kwargs)
+
+    def probe(self, method, url, **kwargs):
+        """Uncached request for the candidate resolver, still under the engine's rate limits"""
+        return self.engine.request(self.pools.session_for(url), method, url, **kwargs)
+
+    def fetch_page(self, product_url):
+        """Fetch and parse a product page once"""
+        with self.metrics.time("fetch", url=product_url) as observation:
+            response = self.get(product_url, timeout=10)
+            response.raise_for_status()
+            observation["bytes"] = len(response.content)
+        with self.lock:
+            self.stats["pages_fetched"] += 1
+            self.page_fetches[product_url] += 1
+        with self.metrics.time("parse", url=product_url) as observation:
+            observation["bytes"] = len(response.content)
+            return ParsedPage.from_html(product_url, response.content, self.supplier.image_selectors)
+
+    def select_image_url(self, page):
+        """Pick the highest quality image URL from a parsed product page
         
-        # Default to opaque for most standard colors
-        return "opaque"
+        The supplier's candidates are traced back to their originals (e.g.
+        Magento cache renditions) and their real sizes compared (see
+        CandidateResolver).
+        """
+        return self.resolver.resolve(page.url, self.supplier.image_candidates(page))
 
-    def get_high_quality_image_url(self, product_url):
+    def get_high_quality_image_url(self, product_url, page=None):
         """Extract the highest quality image URL from a product page"""
         try:
-            response = self.session.get(product_url, timeout=10)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Look for various image selectors
-            image_selectors = [
-                'img.product-image-main',
-                '.product-image-main img',
-                '.fotorama__img', 
-                '.gallery-image img',
-                'img[src*="catalog/product"]',
-                '.product-media img',
-                'img[alt*="enamel"]',
-                'img[alt*="Enamel"]'
-            ]
-            
-            best_image_url = None
-            best_size = 0
-            
-            for selector in image_selectors:
-                images = soup.select(selector)
-                for img in images:
-                    src = img.get('src') or img.get('data-src')
-                    if not src:
-                        continue
-                        
-                    # Skip placeholder images
-                    if any(skip in src.lower() for skip in ['placeholder', 'default', 'defaut']):
-                        continue
-                    
-                    # Prefer higher quality versions
-                    if 'catalog/product' in src:
-                        if not best_image_url or 'cache' in src:
-                            best_image_url = urljoin(product_url, src)
-                            
-            return best_image_url
+            if page is None:
+                page = self.fetch_page(product_url)
+            with self.metrics.time("select_image", url=product_url):
+                return self.select_image_url(page)
             
         except Exception as e:
             print(f"Error fetching {product_url}: {e}")
             return None
 
     def download_image(self, image_url, filename):
-        """Download an image file"""
+        """Stream an image file to disk; it only appears under filename once complete"""
         try:
-            response = self.session.get(image_url, timeout=15)
-            response.raise_for_status()
-            
-            with open(filename, 'wb') as f:
-                f.write(response.content)
+            with self.metrics.time("download", url=image_url) as observation:
+                observation["bytes"], _ = fetch_to_file(self.cache, self.send, image_url, filename, timeout=15)
             return True
         except Exception as e:
             print(f"Error downloading {image_url}: {e}")
@@ -127,19 +146,14 @@ class CompleteEmauxDownloader:
         print(f"\nProcessing: {product_url}")
         
         try:
-            # Get page content for analysis
-            response = self.session.get(product_url, timeout=10)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            title = soup.find('title')
-            title_text = title.text if title else ""
+            # Fetch and parse the page once; everything below reads from it
+            page = self.fetch_page(product_url)
+            title_text = page.title
             
             # Extract color reference
             color_ref = self.extract_color_reference(product_url, title_text)
             if not color_ref:
-                print(f"Could not extract color reference from {product_url}")
-                return False
+                return self.fail(product_url, f"Could not extract color reference from {product_url}")
             
             # Determine enamel type
             enamel_type = self.determine_enamel_type(product_url, title_text)
@@ -152,45 +166,88 @@ class CompleteEmauxDownloader:
             else:
                 target_dir = self.opaque_dir
                 
-            filename = target_dir / f"{color_ref}_hq.jpg"
+            filename = target_dir / self.supplier.filename(color_ref)
             
-            # Skip if file already exists
-            if filename.exists():
+            # Skip files downloaded before the manifest existed; record them so the TTL applies from now.
+            # Products already in the manifest are re-checked so changed images are picked up.
+            if is_complete_image(filename) and self.manifest.get(product_url) is None:
                 print(f"File already exists: {filename}")
+                self.manifest.record(product_url, color_reference=color_ref, enamel_type=enamel_type,
+                                     filename=str(filename), content_hash=file_sha256(filename),
+                                     size=filename.stat().st_size)
+                self.log_result(product_url, color_reference=color_ref, enamel_type=enamel_type,
+                                filename=str(filename), pages_fetched=self.page_fetches[product_url],
+                                status="existing")
                 return True
             
             # Get high-quality image URL
-            image_url = self.get_high_quality_image_url(product_url)
+            image_url = self.get_high_quality_image_url(product_url, page)
             if not image_url:
-                print(f"No suitable image found for {product_url}")
-                return False
+                return self.fail(product_url, f"No suitable image found for {product_url}")
             
-            # Download the image
-            print(f"Downloading {color_ref} ({enamel_type}): {image_url}")
-            if self.download_image(image_url, filename):
-                print(f"✓ Saved: {filename}")
-                
-                # Record result
-                self.results.append({
-                    "product_url": product_url,
-                    "color_reference": color_ref,
-                    "enamel_type": enamel_type,
-                    "image_url": image_url,
-                    "filename": str(filename),
-                    "status": "success"
-                })
-                
-                self.type_counts[enamel_type] += 1
-                return True
+            # Images checked within the manifest TTL (e.g. by the powder page of this color) are not fetched
+            # again; older ones are revalidated with a conditional request through the HTTP cache
+            stored, content_hash = None, None
+            if self.manifest.image_is_fresh(image_url):
+                stored, content_hash = self.dedupe.lookup_url(image_url)
+            if stored:
+                print(f"Already stored as {stored}, not downloading again")
             else:
-                return False
+                print(f"Downloading {color_ref} ({enamel_type}): {image_url}")
+                # Download to a staging file; it only replaces filename if it is not a duplicate
+                staged = filename.with_name(f".{filename.name}.incoming")
+                if not self.download_image(image_url, staged):
+                    self.resolver.forget(product_url)
+                    return self.fail(product_url, f"Download failed: {image_url}")
+                with self.metrics.time("write", url=image_url) as observation:
+                    observation["bytes"] = staged.stat().st_size
+                    stored, content_hash = self.dedupe.add(image_url, staged, filename, reference=color_ref)
+                    if stored != str(filename):
+                        print(f"Same image as {stored}, keeping one copy")
+                        staged.unlink()
+                    else:
+                        self.store.link(self.store.put(staged, content_hash), filename)
+                        print(f"✓ Saved: {filename}")
+            
+            self.manifest.record(product_url, color_reference=color_ref, enamel_type=enamel_type,
+                                 image_url=image_url, filename=stored,
+                                 content_hash=content_hash, size=os.path.getsize(stored))
+            
+            # Record result
+            result = {
+                "product_url": product_url,
+                "color_reference": color_ref,
+                "enamel_type": enamel_type,
+                "image_url": image_url,
+                "filename": stored,
+                "pages_fetched": self.page_fetches[product_url],
+                "status": "success"
+            }
+            if stored != str(filename):
+                result["duplicate_of"] = stored
+            self.log_result(**result)
+            return True
                 
         except Exception as e:
-            print(f"Error processing {product_url}: {e}")
-            return False
+            return self.fail(product_url, f"Error processing {product_url}: {e}")
+
+    def fail(self, product_url, error):
+        """Report a failed product and queue it for retry_failed(); returns False"""
+        print(error)
+        self.retry_queue.add(product_url, error)
+        self.log_result(product_url, status="failed", error=error, pages_fetched=self.page_fetches[product_url])
+        return False
 
-    def run_complete_download(self):
-        """Download all enamel images from the complete product catalog"""
+    def log_result(self, product_url, **fields):
+        """Append a finished product to the results log"""
+        self.result_log.write(dict(product_url=product_url, **fields, seq=self.sequence.get(product_url)))
+
+    def run_complete_download(self, listing_urls=None):
+        """Download all enamel images from the complete product catalog
+
+        With listing_urls the catalog is discovered from the category
+        listing pages, and the URL list below is only a fallback.
+        """
         
         # COMPLETE URL LIST FROM ALL PAGES (1-11)
         all_product_urls = [
@@ -365,52 +422,180 @@ class CompleteEmauxDownloader:
             "https://www.emaux-soyer.com/en/turquoise-273-poudre.html"
         ]
         
-        print(f"Starting download of {len(all_product_urls)} product images...")
+        if listing_urls:
+            self.download_all(self.discover_products(listing_urls, fallback=all_product_urls))
+        else:
+            self.download_all(all_product_urls)
         
-        self.stats["total"] = len(all_product_urls)
+        # Generate final report
+        self.generate_report()
+
+    def discover_products(self, listing_urls=None, fallback=()):
+        """Generator of product URLs found by walking the category listing pages
+
+        listing_urls defaults to the supplier's own.
+        """
+        self.discovery = self.supplier.discovery(self.get, listing_urls, state_file=self.discovery_file,
+                                                 fallback=fallback)
+        return self.discovery.discover()
+
+    def download_all(self, product_urls, journal=None):
+        """Process product URLs concurrently; rate limiting is handled by the engine
+
+        product_urls may be a generator (see discover_products); downloads
+        start as soon as the first URLs arrive. With a CheckpointJournal,
+        products it already holds are skipped and each finished one is
+        recorded in it.
+        """
+        total = len(product_urls) if hasattr(product_urls, '__len__') else '?'
+        if journal:
+            product_urls = journal.pending(product_urls)
+            if journal.resumed:
+                self.result_log.resume()
         
-        for i, url in enumerate(all_product_urls, 1):
-            print(f"\n--- Processing {i}/{len(all_product_urls)}: {url} ---")
-            
-            if self.process_product(url):
+        def work():
+            # Only new URLs and entries older than the manifest TTL need any network work
+            for url in product_urls:
+                self.sequence.setdefault(url, len(self.sequence))
+                self.stats["total"] += 1
+                if self.manifest.classify(url) == "fresh":
+                    self.stats["skipped"] += 1
+                    self.log_result(url, status="skipped")
+                    continue
+                yield url
+        
+        print(f"Starting download of {total} product images...")
+        
+        def run_one(item):
+            i, url = item
+            print(f"\n--- Processing {i}/{total}: {url} ---")
+            ok = self.process_product(url)
+            if journal:
+                journal.record(url, "success" if ok else "failed")
+            return url, ok
+        
+        for url, ok in self.engine.run(enumerate(work(), 1), run_one):
+            if ok:
                 self.stats["success"] += 1
+                self.retry_queue.remove(url)
             else:
                 self.stats["failed"] += 1
-            
-            # Rate limiting
-            time.sleep(1)
         
-        # Generate final report
+        print(f"{self.stats['skipped']} products were already up to date in the manifest")
+        if len(self.retry_queue):
+            print(f"{len(self.retry_queue)} failed products queued; replay them with --retry-failed")
+        self.cache.save()
+        self.dedupe.save()
+        self.resolver.save()
+        self.retry_queue.save()
+
+    def retry_failed(self):
+        """Replay only the products in the retry queue"""
+        urls = self.retry_queue.urls()
+        print(f"Retrying {len(urls)} failed products")
+        self.download_all(urls)
         self.generate_report()
 
-    def generate_report(self):
-        """Generate comprehensive download report"""
+    def report_sections(self):
+        """The run's live statistics, as they appear in the report"""
+        return {
+            "http_cache": self.cache.stats,
+            "manifest": self.manifest.stats,
+            "dedupe": self.dedupe.stats,
+            "image_candidates": self.resolver.stats,
+            "discovery": self.discovery.report() if self.discovery else None,
+            "retries": dict(self.engine.stats, circuit=self.engine.breaker.stats,
+                            queued=len(self.retry_queue)),
+            "connections": self.pools.stats(),
+            "stages": self.metrics.report(),
+        }
+
+    def generate_report(self, sections=None):
+        """Generate comprehensive download report
+
+        sections defaults to this process's statistics; a sharded crawl
+        passes the merged statistics of its workers instead.
+        """
+        sections = sections or self.report_sections()
+        report = self.summarize(sections)
+        summary = report["summary"]
+        connections, stages, retries = sections["connections"], sections["stages"], sections["retries"]
+
         print("\n" + "="*60)
         print("COMPLETE DOWNLOAD REPORT")
         print("="*60)
         
-        print(f"Total processed: {self.stats['total']}")
-        print(f"Successfully downloaded: {self.stats['success']}")
-        print(f"Failed: {self.stats['failed']}")
-        print(f"Success rate: {(self.stats['success']/self.stats['total']*100):.1f}%")
+        processed = summary['total'] - summary['skipped']
+        print(f"Total processed: {summary['total']}")
+        print(f"Up to date (skipped): {summary['skipped']}")
+        print(f"Successfully downloaded: {summary['success']}")
+        print(f"Failed: {summary['failed']}")
+        if processed:
+            print(f"Success rate: {(summary['success']/processed*100):.1f}%")
+            print(f"Pages fetched per product: {(summary['pages_fetched']/processed):.2f}")
+        cache_stats = sections["http_cache"]
+        print(f"HTTP cache: {cache_stats['hits']} hits, {cache_stats['revalidated']} revalidated, "
+              f"{cache_stats['misses']} misses")
+        for name, counts in connections.items():
+            print(f"{name.upper()} connections: {counts['new_connections']} new, {counts['reused_connections']} reused "
+                  f"for {counts['requests']} requests")
+        for stage, timing in stages.items():
+            if timing["count"]:
+                print(f"{stage}: p50 {timing['p50'] * 1000:.0f} ms, p95 {timing['p95'] * 1000:.0f} ms, "
+                      f"p99 {timing['p99'] * 1000:.0f} ms over {timing['count']}")
+        print(f"Retries: {retries['retries']}, gave up: {retries['gave_up']}, "
+              f"circuit opened: {retries['circuit']['opened']}")
         
         print(f"\nBy Type:")
-        for enamel_type, count in self.type_counts.items():
+        for enamel_type, count in report["type_counts"].items():
             if count > 0:
                 print(f"- {enamel_type.title()}: {count}")
         
-        # Save detailed JSON report
-        report_file = self.base_dir / "complete_download_report.json"
-        with open(report_file, 'w') as f:
-            json.dump({
-                "summary": self.stats,
-                "type_counts": self.type_counts,
-                "results": self.results
-            }, f, indent=2)
+        print(f"\nDetailed report saved to: {self.base_dir / 'complete_download_report.json'}")
         
-        print(f"\nDetailed report saved to: {report_file}")
+        metrics_file = self.cache.directory.parent / "complete_download_metrics.prom"
+        self.metrics.write_prometheus(metrics_file, labels={"downloader": "complete"})
+        self.metrics.close()
+        print(f"Stage metrics saved to: {metrics_file}")
+        return report
 
+    def summarize(self, sections=None):
+        """Build complete_download_report.json from the results log
+
+        The log is read as a stream; results are written in catalog order
+        without being held in memory. sections holds the run's live
+        statistics (cache, manifest, connections, ...); without them, e.g.
+        when rebuilding the report of a crashed run, those keys are null.
+        Returns the report without its results.
+        """
+        summary = {"total": 0, "success": 0, "failed": 0, "skipped": 0, "pages_fetched": 0}
+        type_counts = {"transparent": 0, "opaque": 0, "opal": 0, "unknown": 0}
+        for record in self.result_log.records():
+            summary["total"] += 1
+            summary["pages_fetched"] += record.get("pages_fetched") or 0
+            status = record.get("status")
+            summary["skipped" if status == "skipped" else "failed" if status == "failed" else "success"] += 1
+            if status == "success":
+                type_counts[record["enamel_type"]] = type_counts.get(record["enamel_type"], 0) + 1
+
+        sections = sections or {}
+        report = {"summary": summary, "type_counts": type_counts}
+        for key in ("http_cache", "manifest", "dedupe", "image_candidates", "discovery", "retries", "connections",
+                    "stages"):
+            report[key] = sections.get(key)
+        write_report(self.base_dir / "complete_download_report.json",
+                     dict(report, results=strip(self.result_log.sorted_records("success"), "seq", "time")))
+        return report
 
 if __name__ == "__main__":
+    import sys
+
     downloader = CompleteEmauxDownloader()
-    downloader.run_complete_download()
\ No newline at end of file
+    if "--retry-failed" in sys.argv[1:]:
+        downloader.retry_failed()
+    else:
+        downloader.run_complete_download(listing_urls=EMAUX_SOYER_LISTING_URLS)
+    
+    # Type folders, type report, variants, features, color index and storefront catalog
+    from enamel_downloader.stages import run_post_download
+    run_post_download(downloader.base_dir)
\ No newline at end of file
@@ -6,21 +6,56 @@ Organized by enamel type (transparent, opaque, opal)
 """
 
 import os
-import re
-import time
-import requests
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin, urlparse
+import sys
+from urllib.parse import urlparse
 from pathlib import Path
 import json
 
+from enamel_downloader.cache import HttpCache
+from enamel_downloader.candidates import CandidateResolver
+from enamel_downloader.dedupe import DedupeIndex
+from enamel_downloader.discovery import EMAUX_SOYER_LISTING_URLS
+from enamel_downloader.download import fetch_to_file
+from enamel_downloader.engine import CrawlEngine
+from enamel_downloader.manifest import Manifest
+from enamel_downloader.metrics import StageMetrics
+from enamel_downloader.page import ParsedPage
+from enamel_downloader.pools import ConnectionPools
+from enamel_downloader.results import ResultLog, strip, write_report
+from enamel_downloader.retry import RetryQueue
+from enamel_downloader.store import STORE_DIR, BlobStore
+from enamel_downloader.suppliers import EmauxSoyerAdapter
+
 class EmauxSoyerImageDownloader:
-    def __init__(self, base_dir="public"):
+    def __init__(self, base_dir="public", concurrency=8, rate_limit=4.0, host_concurrency=4,
+                 cache_dir=None, cache_max_bytes=256 * 1024 * 1024, manifest_ttl=7 * 24 * 3600,
+                 pool_size=None, http2=False, event_log=None):
         self.base_dir = Path(base_dir)
-        self.session = requests.Session()
-        self.session.headers.update({
+        # The emaux-soyer.com specifics: references, types, image ranking and discovery
+        self.supplier = EmauxSoyerAdapter()
+        # Keep-alive sessions for pages and for images, pooled for the number of workers
+        self.pools = ConnectionPools(pool_size=pool_size or max(concurrency, host_concurrency), http2=http2, headers={
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
+        self.session = self.pools.html
+        # Keeps several products in flight while staying polite to each host
+        self.engine = CrawlEngine(concurrency=concurrency, rate=rate_limit,
+                                  burst=host_concurrency, host_concurrency=host_concurrency)
+        # Conditional cache: unchanged pages and images cost a 304 on later runs
+        self.cache = HttpCache(cache_dir or self.base_dir / ".cache" / "http", max_bytes=cache_max_bytes)
+        # Manifest of previous runs: only new, stale or changed products are processed
+        self.manifest = Manifest(self.cache.directory.parent / "download_manifest.sqlite", ttl=manifest_ttl)
+        # Content and perceptual hashes of stored swatches, so each image is stored once
+        self.dedupe = DedupeIndex(self.cache.directory.parent / "dedupe_index.json")
+        # Each image's bytes once, by content hash; the type folders link to them
+        self.store = BlobStore(self.base_dir / STORE_DIR)
+        # Products that failed, replayable on their own with retry_failed()
+        self.retry_queue = RetryQueue(self.cache.directory.parent / "retry_queue.json")
+        # Best source image per product (originals over cache renditions), probed once and remembered
+        self.resolver = CandidateResolver(self.probe, self.cache.directory.parent / "image_choices.json",
+                                          originals=self.supplier.original_url)
+        # Latency and bytes per pipeline stage; event_log appends every observation as JSON lines
+        self.metrics = StageMetrics(event_log=event_log)
         
         # Create directories
         self.transparent_dir = self.base_dir / "transparent_colors"
@@ -31,159 +66,51 @@ class EmauxSoyerImageDownloader:
         for directory in [self.transparent_dir, self.opaque_dir, self.opal_dir, self.samples_dir]:
             directory.mkdir(parents=True, exist_ok=True)
         
-        # Results tracking
-        self.results = {
-            "downloaded": [],
-            "failed": [],
-            "skipped": [],
-            "by_type": {
-                "transparent": [],
-                "opaque": [],
-                "opal": [],
-                "unknown": []
-            }
-        }
+        # Results tracking: every processed product is appended to the log as it finishes
+        self.result_log = ResultLog(self.cache.directory.parent / "download_results.jsonl")
+        self.discovery = None
+
+    def get(self, url, **kwargs):
+        """GET through the HTTP cache and the crawl engine's per-host rate limiter"""
+        return self.cache.get(self.send, url, **kwargs)
+
+    def send(self, url, **kwargs):
+        return self.engine.request(self.pools.session_for(url), 'GET', url, **kwargs)
+
+    def probe(self, method, url, **kwargs):
+        """Uncached request for the candidate resolver, still under the engine's rate limits"""
+        return self.engine.request(self.pools.session_for(url), method, url, **kwargs)
 
     def extract_color_info(self, url, title):
-        """Extract color number and type from URL and title"""
-        # Extract color number from URL or title
-        color_match = re.search(r'(\d+)', url.split('/')[-1])
-        if not color_match:
-            color_match = re.search(r'(\d+)', title)
-        
-        color_number = color_match.group(1) if color_match else "unknown"
-        
-        # Determine enamel type based on URL/title patterns
-        url_lower = url.lower()
-        title_lower = title.lower()
-        
-        # Enhanced pattern matching for better classification
-        if any(keyword in url_lower or keyword in title_lower for keyword in 
-               ['transparent', 'trans', 'cristal', 'crystal']):
-            enamel_type = "transparent"
-        elif any(keyword in url_lower or keyword in title_lower for keyword in 
-                ['opal', 'opale']):
-            enamel_type = "opal"
-        elif any(keyword in url_lower or keyword in title_lower for keyword in 
-                ['opaque', 'opaq', 'mat']):
-            enamel_type = "opaque"
-        else:
-            # Enhanced classification based on Emaux Soyer numbering system
-            color_num = int(color_number) if color_number.isdigit() else 0
-            
-            # Transparent ranges (common patterns in Emaux Soyer catalog)
-            if (color_num in range(2000, 3000) or 
-                color_num in range(4000, 5000) or
-                color_num in range(1040, 1050) or
-                color_num in [104, 111, 194, 1942, 383, 388, 29, 31, 39, 40, 41, 53]):
-                enamel_type = "transparent"
-            # Opal ranges
-            elif (color_num in range(600, 650) or 
-                  color_num in [101, 607, 609, 610, 8]):
-                enamel_type = "opal"
-            # Default to opaque for standard ranges
-            else:
-                enamel_type = "opaque"
-        
-        return color_number, enamel_type
+        """Extract color reference and type from URL and title"""
+        reference, _ = self.supplier.reference(url, title)
+        return reference or "unknown", self.supplier.enamel_type(url, title)
 
     def get_highest_quality_image(self, product_url):
         """Extract the highest quality image URL from a product page"""
         try:
             print(f"Fetching: {product_url}")
-            response = self.session.get(product_url, timeout=30)
-            response.raise_for_status()
+            with self.metrics.time("fetch", url=product_url) as observation:
+                response = self.get(product_url, timeout=30)
+                response.raise_for_status()
+                observation["bytes"] = len(response.content)
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            with self.metrics.time("parse", url=product_url) as observation:
+                observation["bytes"] = len(response.content)
+                page = ParsedPage.from_html(product_url, response.content)
             
             # Get product title for context
-            title_elem = soup.find('h1') or soup.find('title')
-            title = title_elem.get_text().strip() if title_elem else ""
-            
-            # Look for product images in multiple possible locations
-            image_candidates = []
-            
-            # Method 1: Look for main product image
-            main_img = soup.find('img', {'class': re.compile(r'product.*image|main.*image', re.I)})
-            if main_img and main_img.get('src'):
-                image_candidates.append(main_img['src'])
-            
-            # Method 2: Look for images in product gallery
-            gallery_imgs = soup.find_all('img', {'class': re.compile(r'gallery|zoom|product', re.I)})
-            for img in gallery_imgs:
-                if img.get('src'):
-                    image_candidates.append(img['src'])
-            
-            # Method 3: Look for high-res versions (common patterns)
-            for img in soup.find_all('img'):
-                src = img.get('src', '')
-                data_src = img.get('data-src', '')
-                data_zoom = img.get('data-zoom-image', '')
-                
-                # Check for high-resolution indicators
-                for url in [src, data_src, data_zoom]:
-                    if url and any(indicator in url.lower() for indicator in 
-                                 ['large', 'zoom', 'full', 'hd', 'high', 'original']):
-                        image_candidates.append(url)
-            
-            # Method 4: Look for any product-related images
-            if not image_candidates:
-                for img in soup.find_all('img'):
-                    src = img.get('src', '')
-                    if src and not any(skip in src.lower() for skip in 
-                                     ['logo', 'icon', 'banner', 'nav', 'footer']):
-                        image_candidates.append(src)
+            title = page.display_title
             
-            # Remove duplicates and filter
-            image_candidates = list(set(image_candidates))
-            
-            # Filter out unwanted images
-            filtered_candidates = []
-            for url in image_candidates:
-                if url and not any(skip in url.lower() for skip in 
-                                 ['logo', 'icon', 'placeholder', 'banner', 'nav']):
-                    filtered_candidates.append(url)
-            
-            if not filtered_candidates:
-                return None, title, "No suitable images found"
-            
-            # Select the best image (preferably largest or highest quality)
-            best_image = None
-            best_score = 0
-            
-            for img_url in filtered_candidates:
-                score = 0
-                img_url_lower = img_url.lower()
-                
-                # Scoring based on quality indicators
-                if any(qual in img_url_lower for qual in ['large', 'zoom', 'full', 'hd']):
-                    score += 10
-                if 'product' in img_url_lower:
-                    score += 5
-                if img_url_lower.endswith(('.jpg', '.jpeg')):
-                    score += 3
-                elif img_url_lower.endswith('.png'):
-                    score += 2
+            with self.metrics.time("select_image", url=product_url):
+                candidates = self.supplier.ranked_images(page)
+                if not candidates:
+                    return None, title, "No suitable images found"
                 
-                # Prefer longer URLs (often more detailed)
-                score += len(img_url) * 0.01
-                
-                if score > best_score:
-                    best_score = score
-                    best_image = img_url
+                # Trace cache renditions back to their originals and keep the largest real image
+                best_image = self.resolver.resolve(product_url, candidates)
             
-            if best_image:
-                # Convert relative URL to absolute
-                if best_image.startswith('//'):
-                    best_image = 'https:' + best_image
-                elif best_image.startswith('/'):
-                    best_image = urljoin(product_url, best_image)
-                elif not best_image.startswith('http'):
-                    best_image = urljoin(product_url, best_image)
-                
-                return best_image, title, None
-            else:
-                return None, title, "No suitable image found after filtering"
+            return best_image, title, None
                 
         except Exception as e:
             return None, "", f"Error fetching page: {str(e)}"
@@ -191,11 +118,6 @@ class EmauxSoyerImageDownloader:
     def download_image(self, image_url, color_number, enamel_type, title):
         """Download an image and save it with appropriate filename"""
         try:
-            print(f"Downloading image for color {color_number} ({enamel_type})")
-            
-            response = self.session.get(image_url, timeout=30)
-            response.raise_for_status()
-            
             # Determine file extension
             parsed_url = urlparse(image_url)
             file_ext = os.path.splitext(parsed_url.path)[1]
@@ -217,102 +139,221 @@ class EmauxSoyerImageDownloader:
             
             filepath = target_dir / filename
             
-            # Save image
-            with open(filepath, 'wb') as f:
-                f.write(response.content)
-            
-            print(f"Saved: {filepath}")
+            # Images checked within the manifest TTL (e.g. by the powder page of this color) are not fetched
+            # again; older ones are revalidated with a conditional request through the HTTP cache
+            stored, content_hash = None, None
+            if self.manifest.image_is_fresh(image_url):
+                stored, content_hash = self.dedupe.lookup_url(image_url)
+            if stored:
+                print(f"Color {color_number}: already stored as {stored}, not downloading again")
+            else:
+                print(f"Downloading image for color {color_number} ({enamel_type})")
+                # Stream to a staging file; it only replaces filepath once complete and not a duplicate
+                staged = filepath.with_name(f".{filepath.name}.incoming")
+                with self.metrics.time("download", url=image_url) as observation:
+                    observation["bytes"], content_hash = fetch_to_file(self.cache, self.send, image_url, staged,
+                                                                       timeout=30)
+                with self.metrics.time("write", url=image_url) as observation:
+                    observation["bytes"] = staged.stat().st_size
+                    reference = None if color_number == "unknown" else color_number
+                    stored, content_hash = self.dedupe.add(image_url, staged, filepath, content_hash, reference)
+                    if stored != str(filepath):
+                        print(f"Same image as {stored}, keeping one copy")
+                        staged.unlink()
+                    else:
+                        self.store.link(self.store.put(staged, content_hash), filepath)
+                        print(f"Saved: {filepath}")
             
-            return {
+            result = {
                 "color": color_number,
                 "type": enamel_type,
-                "filename": filename,
-                "filepath": str(filepath),
+                "filename": os.path.basename(stored),
+                "filepath": stored,
                 "title": title,
                 "image_url": image_url,
-                "file_size": len(response.content)
+                "file_size": os.path.getsize(stored),
+                "content_hash": content_hash
             }
+            if stored != str(filepath):
+                result["duplicate_of"] = stored
+            return result
             
         except Exception as e:
             print(f"Error downloading {image_url}: {str(e)}")
             return None
 
-    def process_product_urls(self, product_urls):
-        """Process a list of product URLs"""
-        total_urls = len(product_urls)
+    def process_product(self, url):
+        """Fetch one product page and download its image
+
+        Returns an (outcome, record) pair where outcome is one of
+        "downloaded", "failed" or "skipped".
+        """
+        # Extract image URL
+        image_url, title, error = self.get_highest_quality_image(url)
         
-        for i, url in enumerate(product_urls, 1):
-            print(f"\n--- Processing {i}/{total_urls}: {url} ---")
-            
-            # Extract image URL
-            image_url, title, error = self.get_highest_quality_image(url)
-            
-            if error:
-                print(f"Failed to get image: {error}")
-                self.results["failed"].append({
-                    "url": url,
-                    "error": error,
-                    "title": title
-                })
-                continue
-            
-            if not image_url:
-                print("No image found")
-                self.results["skipped"].append({
+        if error:
+            print(f"Failed to get image: {error}")
+            return "failed", {
+                "url": url,
+                "error": error,
+                "title": title
+            }
+        
+        if not image_url:
+            print("No image found")
+            return "skipped", {
+                "url": url,
+                "reason": "No image found",
+                "title": title
+            }
+        
+        # Extract color info
+        color_number, enamel_type = self.extract_color_info(url, title)
+        
+        # Download image
+        download_result = self.download_image(image_url, color_number, enamel_type, title)
+        
+        if download_result:
+            print(f"Successfully downloaded: {download_result['filename']}")
+            self.manifest.record(url, color_reference=color_number, enamel_type=enamel_type,
+                                 image_url=image_url, filename=download_result["filepath"],
+                                 content_hash=download_result["content_hash"],
+                                 size=download_result["file_size"])
+            return "downloaded", download_result
+        
+        self.resolver.forget(url)
+        return "failed", {
+            "url": url,
+            "error": "Download failed",
+            "title": title,
+            "image_url": image_url
+        }
+
+    def record_result(self, outcome, record, seq=None, product_url=None):
+        """Append a processed product to the results log"""
+        self.result_log.write(dict(record, status=outcome, seq=seq, product_url=product_url))
+
+    def discover_products(self, listing_urls, fallback=()):
+        """Generator of product URLs found by walking the category listing pages"""
+        self.discovery = self.supplier.discovery(self.get, listing_urls,
+                                                 state_file=self.cache.directory.parent / "discovered_products.json",
+                                                 fallback=fallback)
+        return self.discovery.discover()
+
+    def process_product_urls(self, product_urls, journal=None):
+        """Process product URLs concurrently; rate limiting is handled by the engine
+
+        product_urls may be a generator (see discover_products); downloads
+        start as soon as the first URLs arrive. With a CheckpointJournal,
+        products it already holds are skipped and each finished one is
+        recorded in it.
+        """
+        total_urls = len(product_urls) if hasattr(product_urls, '__len__') else '?'
+        if journal:
+            product_urls = journal.pending(product_urls)
+            if journal.resumed:
+                self.result_log.resume()
+        
+        def run_one(item):
+            i, url = item
+            # Only new URLs and entries older than the manifest TTL need any network work
+            if self.manifest.classify(url) == "fresh":
+                outcome, record = "skipped", {
                     "url": url,
-                    "reason": "No image found",
-                    "title": title
-                })
-                continue
-            
-            # Extract color info
-            color_number, enamel_type = self.extract_color_info(url, title)
-            
-            # Download image
-            download_result = self.download_image(image_url, color_number, enamel_type, title)
-            
-            if download_result:
-                self.results["downloaded"].append(download_result)
-                self.results["by_type"][enamel_type].append(download_result)
-                print(f"Successfully downloaded: {download_result['filename']}")
+                    "reason": "Up to date in manifest",
+                    "title": ""
+                }
             else:
-                self.results["failed"].append({
-                    "url": url,
-                    "error": "Download failed",
-                    "title": title,
-                    "image_url": image_url
-                })
-            
-            # Be respectful to the server
-            time.sleep(1)
+                print(f"\n--- Processing {i}/{total_urls}: {url} ---")
+                outcome, record = self.process_product(url)
+                if journal:
+                    journal.record(url, outcome)
+            # Logged as soon as it finishes; the report puts the log back in input order
+            self.record_result(outcome, record, seq=i, product_url=url)
+            return url, outcome, record
+        
+        for url, outcome, record in self.engine.run(enumerate(product_urls, 1), run_one):
+            # Failed products are kept for retry_failed(); anything else leaves the queue
+            if outcome == "failed":
+                self.retry_queue.add(url, record["error"])
+            else:
+                self.retry_queue.remove(url)
+        
+        self.cache.save()
+        self.dedupe.save()
+        self.resolver.save()
+        self.retry_queue.save()
+
+    def retry_failed(self):
+        """Replay only the products in the retry queue"""
+        urls = self.retry_queue.urls()
+        print(f"Retrying {len(urls)} failed products")
+        self.process_product_urls(urls)
 
     def generate_report(self):
         """Generate a comprehensive download report"""
+        report = self.summarize({
+            "http_cache": self.cache.stats,
+            "manifest": self.manifest.stats,
+            "dedupe": self.dedupe.stats,
+            "image_candidates": self.resolver.stats,
+            "discovery": self.discovery.report() if self.discovery else None,
+            "retries": dict(self.engine.stats, circuit=self.engine.breaker.stats,
+                            queued=len(self.retry_queue)),
+            "connections": self.pools.stats(),
+            "stages": self.metrics.report(),
+        })
+        
+        self.metrics.write_prometheus(self.cache.directory.parent / "download_metrics.prom",
+                                      labels={"downloader": "soyer"})
+        self.metrics.close()
+        return report
+
+    def summarize(self, sections=None):
+        """Build download_report.json from the results log
+
+        The log is streamed once for the counts and once per results list,
+        so detailed_results never sits in memory. sections holds the run's
+        live statistics; without them (rebuilding the report of a crashed
+        run) those keys are null. Returns the report without detailed_results.
+        """
+        counts = {"downloaded": 0, "failed": 0, "skipped": 0}
+        by_type = {"transparent": 0, "opaque": 0, "opal": 0, "unknown": 0}
+        for record in self.result_log.records():
+            counts[record["status"]] += 1
+            if record["status"] == "downloaded":
+                by_type[record["type"]] += 1
+
+        sections = sections or {}
         report = {
             "summary": {
-                "total_processed": len(self.results["downloaded"]) + len(self.results["failed"]) + len(self.results["skipped"]),
-                "successful_downloads": len(self.results["downloaded"]),
-                "failed_downloads": len(self.results["failed"]),
-                "skipped": len(self.results["skipped"])
+                "total_processed": counts["downloaded"] + counts["failed"] + counts["skipped"],
+                "successful_downloads": counts["downloaded"],
+                "failed_downloads": counts["failed"],
+                "skipped": counts["skipped"]
             },
-            "by_type": {
-                "transparent": len(self.results["by_type"]["transparent"]),
-                "opaque": len(self.results["by_type"]["opaque"]),
-                "opal": len(self.results["by_type"]["opal"]),
-                "unknown": len(self.results["by_type"]["unknown"])
-            },
-            "detailed_results": self.results
+            "by_type": by_type,
         }
-        
+        for key in ("http_cache", "manifest", "dedupe", "image_candidates", "discovery", "retries", "connections",
+                    "stages"):
+            report[key] = sections.get(key)
+
+        def results(status, enamel_type=None):
+            for record in strip(self.result_log.sorted_records(status), "status", "seq", "time", "product_url"):
+                if enamel_type is None or record["type"] == enamel_type:
+                    yield record
+
         # Save report to file
-        report_file = self.base_dir / "download_report.json"
-        with open(report_file, 'w') as f:
-            json.dump(report, f, indent=2)
-        
+        write_report(self.base_dir / "download_report.json", dict(report, detailed_results={
+            "downloaded": results("downloaded"),
+            "failed": results("failed"),
+            "skipped": results("skipped"),
+            "by_type": {enamel_type: results("downloaded", enamel_type) for enamel_type in by_type},
+        }))
         return report
 
 def main():
-    # All product URLs from pages 1-11
+    # Known product URLs from pages 1-2; used if the listing pages yield nothing
     product_urls = [
         # Page 1
         "https://www.emaux-soyer.com/en/noir-36-en-poudre.html",
@@ -351,13 +392,15 @@ def main():
         "https://www.emaux-soyer.com/en/rose-299-f-poudre.html"
     ]
     
-    # Note: You mentioned URLs from pages 3-11 but didn't provide them in the message
-    # The script can be easily extended with additional URLs
-    
     downloader = EmauxSoyerImageDownloader()
     
-    print(f"Starting download of {len(product_urls)} product images...")
-    downloader.process_product_urls(product_urls)
+    if "--retry-failed" in sys.argv[1:]:
+        # Only the products that failed on earlier runs
+        downloader.retry_failed()
+    else:
+        # Walk every listing page (1-11 and any added later) instead of a hand-kept list
+        print("Discovering products from the catalog listing pages...")
+        downloader.process_product_urls(downloader.discover_products(EMAUX_SOYER_LISTING_URLS, fallback=product_urls))
     
     print("\n" + "="*60)
     print("GENERATING REPORT...")
@@ -375,7 +418,23 @@ def main():
     print(f"- Opal: {report['by_type']['opal']}")
     print(f"- Unknown: {report['by_type']['unknown']}")
     
+    print(f"\nHTTP cache: {report['http_cache']['hits']} hits, {report['http_cache']['revalidated']} revalidated, "
+          f"{report['http_cache']['misses']} misses")
+    for name, counts in report['connections'].items():
+        print(f"{name.upper()} connections: {counts['new_connections']} new, {counts['reused_connections']} reused "
+              f"for {counts['requests']} requests")
+    for stage, timing in report['stages'].items():
+        if timing['count']:
+            print(f"{stage}: p50 {timing['p50'] * 1000:.0f} ms, p95 {timing['p95'] * 1000:.0f} ms, "
+                  f"p99 {timing['p99'] * 1000:.0f} ms over {timing['count']}")
+    print(f"Retries: {report['retries']['retries']}, gave up: {report['retries']['gave_up']}, "
+          f"queued for --retry-failed: {report['retries']['queued']}")
+    
     print(f"\nDetailed report saved to: public/download_report.json")
+    
+    # Type folders, type report, variants, features, color index and storefront catalog
+    from enamel_downloader.stages import run_post_download
+    run_post_download(downloader.base_dir)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,5 @@
+import sys
+
+from enamel_downloader.cli import main
+
+sys.exit(main())
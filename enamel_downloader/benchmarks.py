@@ -0,0 +1,375 @@
+"""
+Micro-benchmarks for the downloader pipeline
+
+    python -m enamel_downloader.benchmarks classifier [--repeat N]
+    python -m enamel_downloader.benchmarks parser [--repeat N] [--pages DIR]
+    python -m enamel_downloader.benchmarks retry [--repeat N]
+    python -m enamel_downloader.benchmarks pool [--repeat N]
+    python -m enamel_downloader.benchmarks similarity [--repeat N]
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import requests
+from bs4 import BeautifulSoup
+
+from enamel_downloader import classifier, parsers
+from enamel_downloader.engine import CrawlEngine
+from enamel_downloader.page import ParsedPage
+from enamel_downloader.pools import ConnectionPools, CountingHTTPAdapter
+from enamel_downloader.retry import CircuitBreaker, RetryPolicy
+from enamel_downloader.suppliers import EmauxSoyerAdapter
+
+REPORT_FILES = ("public/complete_download_report.json", "public/download_report.json")
+# Product pages saved from emaux-soyer.com, shared with the test suite
+PAGES_DIR = Path(__file__).resolve().parent.parent / "tests" / "fixtures" / "pages"
+
+# The complete downloader's selectors for emaux-soyer.com product pages
+IMAGE_SELECTORS = EmauxSoyerAdapter.image_selectors
+
+
+def report_fixtures(report_files=REPORT_FILES):
+    """(product URL, recorded reference, recorded type) triples from the saved reports"""
+    fixtures = {}
+    for report_file in report_files:
+        path = Path(report_file)
+        if not path.exists():
+            continue
+        with open(path) as f:
+            report = json.load(f)
+        for result in report.get("results", []):
+            fixtures[result["product_url"]] = (result.get("color_reference"), result.get("enamel_type"))
+        for section in ("failed", "skipped"):
+            for result in report.get("detailed_results", {}).get(section, []):
+                fixtures.setdefault(result["url"], (None, None))
+    return [(url, reference, enamel_type) for url, (reference, enamel_type) in fixtures.items()]
+
+
+def legacy_classify(url, title=""):
+    """The per-call classification the downloaders used before the shared classifier"""
+    patterns = [
+        r'(\d+[a-zA-Z]*)-?(?:en-poudre|en-grains|en-morceaux|powder|poudre|150g|150-gr)',
+        r'(\d+)-?[fF]?-?(?:en-poudre|en-grains|en-morceaux|powder|poudre)',
+        r'([a-zA-Z]+-\d+)',
+        r'(\d+)'
+    ]
+    reference = None
+    for pattern in patterns:
+        match = re.search(pattern, url)
+        if match:
+            reference = match.group(1).upper().replace('-', '')
+            break
+
+    color_match = re.search(r'(\d+)', url.split('/')[-1])
+    color_num = int(color_match.group(1)) if color_match else 0
+    text = f"{url} {title}".lower()
+    if any(word in text for word in ['opal', 'opale', 'opalescent']):
+        enamel_type = "opal"
+    elif any(word in text for word in ['transparent', 'translucent', 'clear']):
+        enamel_type = "transparent"
+    elif (color_num in range(2000, 3000) or color_num in range(4000, 5000) or color_num in range(1040, 1050)
+          or color_num in [104, 111, 194, 1942, 383, 388, 29, 31, 39, 40, 41, 53]):
+        enamel_type = "transparent"
+    elif color_num in range(600, 650) or color_num in [101, 607, 609, 610, 8]:
+        enamel_type = "opal"
+    else:
+        enamel_type = "opaque"
+    return reference, enamel_type
+
+
+def _time(function, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return time.perf_counter() - start
+
+
+def bench_classifier(repeat=200):
+    fixtures = report_fixtures()
+    urls = [url for url, _, _ in fixtures]
+    if not urls:
+        print("No report fixtures found under public/")
+        return None
+
+    legacy = _time(lambda: [legacy_classify(url) for url in urls], repeat)
+    shared = _time(lambda: classifier.classify_urls(urls), repeat)
+    calls = len(urls) * repeat
+
+    results = classifier.classify_urls(urls)
+    changed = [(url, reference, result.reference)
+               for (url, reference, _), result in zip(fixtures, results)
+               if reference and reference != result.reference]
+
+    print(f"Classifier over {len(urls)} report URLs x {repeat}")
+    print(f"- legacy per-call: {legacy / calls * 1e6:.2f} us/url")
+    print(f"- shared batch:    {shared / calls * 1e6:.2f} us/url ({legacy / shared:.1f}x)")
+    print(f"- references that differ from the saved report: {len(changed)}")
+    for url, old, new in changed:
+        print(f"  {url}: {old} -> {new}")
+    return {"urls": len(urls), "legacy_us": legacy / calls * 1e6, "shared_us": shared / calls * 1e6,
+            "changed_references": len(changed)}
+
+
+def page_fixtures(pages_dir=PAGES_DIR):
+    """Saved product pages: the *.html files under pages_dir"""
+    return [path.read_bytes() for path in sorted(Path(pages_dir).glob("*.html"))]
+
+
+def legacy_parse(html):
+    """Full BeautifulSoup tree plus one select() per selector, as the downloaders used to do"""
+    soup = BeautifulSoup(html, 'html.parser')
+    title = soup.find('title')
+    candidates = [img for selector in IMAGE_SELECTORS for img in soup.select(selector)]
+    return title, candidates, soup.find_all('img')
+
+
+def bench_parser(repeat=20, pages=None):
+    fixtures = page_fixtures(pages or PAGES_DIR)
+    if not fixtures:
+        print(f"No saved product pages found under {pages or PAGES_DIR}")
+        return None
+
+    timings = {"beautifulsoup (full tree)": _time(lambda: [legacy_parse(html) for html in fixtures], repeat)}
+    for name in parsers.BACKENDS:
+        timings[name] = _time(
+            lambda: [ParsedPage.from_html("", html, IMAGE_SELECTORS, backend=name) for html in fixtures], repeat)
+
+    # Every backend has to find the same images
+    reference = [[img.get("src") for img in ParsedPage.from_html("", html, IMAGE_SELECTORS, "html.parser").candidates]
+                 for html in fixtures]
+    for name in parsers.BACKENDS:
+        found = [[img.get("src") for img in ParsedPage.from_html("", html, IMAGE_SELECTORS, name).candidates]
+                 for html in fixtures]
+        if found != reference:
+            print(f"Warning: {name} disagrees with html.parser on candidate images")
+
+    calls = len(fixtures) * repeat
+    size = sum(len(html) for html in fixtures) / len(fixtures)
+    print(f"Parse time per page over {len(fixtures)} pages (avg {size / 1024:.0f} KB) x {repeat}")
+    baseline = timings["beautifulsoup (full tree)"]
+    for name, elapsed in sorted(timings.items(), key=lambda item: item[1]):
+        print(f"- {name:<26} {elapsed / calls * 1000:7.2f} ms/page ({baseline / elapsed:.1f}x)")
+    return {name: elapsed / calls * 1000 for name, elapsed in timings.items()}
+
+
+class FaultInjectingHandler(BaseHTTPRequestHandler):
+    """Answers 200, or one of the faults in `faults` with its probability"""
+
+    faults = {"503": 0.2, "429": 0.05, "timeout": 0.05, "drop": 0.05}
+    down = False
+    rng = random.Random(0)
+    lock = threading.Lock()
+    requests_seen = 0
+
+    def do_GET(self):
+        with self.lock:
+            type(self).requests_seen += 1
+            roll = self.rng.random()
+        fault = "503" if self.down else None
+        for name, probability in self.faults.items():
+            if fault:
+                break
+            if roll < probability:
+                fault = name
+            roll -= probability
+
+        if fault in ("timeout", "drop"):
+            # A timeout outlasts the client's read timeout; either way no response arrives
+            if fault == "timeout":
+                time.sleep(1.0)
+            self.close_connection = True
+            return
+        if fault in ("503", "429"):
+            self.send_response(int(fault))
+            if fault == "429":
+                self.send_header("Retry-After", "0")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = b"ok"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _fetch_all(engine, urls):
+    session = requests.Session()
+
+    def fetch(url):
+        try:
+            return engine.request(session, "GET", url, timeout=0.5).status_code == 200
+        except requests.RequestException:
+            return False
+
+    start = time.perf_counter()
+    ok = sum(engine.run(urls, fetch))
+    return ok, time.perf_counter() - start
+
+
+def bench_retry(repeat=200):
+    """Retry policy and circuit breaker against a local fault-injecting server"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FaultInjectingHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+    urls = [f"{base}/en/product-{i}.html" for i in range(repeat)]
+    faults = ", ".join(f"{name} {probability:.0%}" for name, probability in FaultInjectingHandler.faults.items())
+    print(f"{repeat} requests against a server injecting {faults}")
+
+    results = {}
+    try:
+        for name, policy in [("no retries", RetryPolicy(attempts=1)),
+                             ("retry policy", RetryPolicy(attempts=4, backoff=0.05, max_backoff=0.5))]:
+            engine = CrawlEngine(concurrency=8, rate=0, host_concurrency=8, retry=policy,
+                                 breaker=CircuitBreaker(threshold=1000))
+            ok, elapsed = _fetch_all(engine, urls)
+            print(f"- {name:<13} {ok}/{repeat} succeeded in {elapsed:.2f}s "
+                  f"({engine.stats['retries']} retries, {engine.stats['gave_up']} gave up)")
+            results[name] = dict(engine.stats, succeeded=ok, seconds=elapsed)
+
+        # Host down: the breaker should stop sending after `threshold` failures
+        FaultInjectingHandler.down = True
+        FaultInjectingHandler.requests_seen = 0
+        engine = CrawlEngine(concurrency=8, rate=0, host_concurrency=8,
+                             retry=RetryPolicy(attempts=4, backoff=0.05, max_backoff=0.5),
+                             breaker=CircuitBreaker(threshold=5, reset_timeout=60))
+        ok, elapsed = _fetch_all(engine, urls)
+        print(f"- host down     {FaultInjectingHandler.requests_seen} of {repeat} requests reached the server "
+              f"before the circuit opened ({engine.breaker.stats['rejected']} rejected) in {elapsed:.2f}s")
+        results["host down"] = dict(engine.breaker.stats, reached_server=FaultInjectingHandler.requests_seen)
+    finally:
+        FaultInjectingHandler.down = False
+        server.shutdown()
+    return results
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    """HTTP/1.1 server where opening a connection costs `setup_delay`, like a TLS handshake,
+    and every response takes `latency`"""
+
+    protocol_version = "HTTP/1.1"
+    setup_delay = 0.05
+    latency = 0.05
+
+    def setup(self):
+        time.sleep(self.setup_delay)
+        super().setup()
+
+    def do_GET(self):
+        time.sleep(self.latency)
+        body = b"x" * (20 * 1024 if self.path.startswith("/media/") else 2 * 1024)
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def bench_pool(repeat=400):
+    """Connection reuse of a default-sized pool against the downloaders' tuned pools"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+    urls = [f"{base}/en/product-{i}.html" if i % 2 else f"{base}/media/catalog/product/{i}.jpg"
+            for i in range(repeat)]
+    concurrency = 16
+    print(f"{repeat} page and image requests, {concurrency} workers, "
+          f"{KeepAliveHandler.setup_delay * 1000:.0f} ms connection setup, {KeepAliveHandler.latency * 1000:.0f} ms latency")
+
+    def default_pools(keep_alive=True):
+        # One session with requests' default adapter size (10 connections per host)
+        session = requests.Session()
+        if not keep_alive:
+            session.headers["Connection"] = "close"
+        adapter = CountingHTTPAdapter()
+        session.mount("http://", adapter)
+        return lambda url: session, {"default": adapter.counter}
+
+    def tuned_pools(http2=False):
+        pools = ConnectionPools(pool_size=concurrency, http2=http2)
+        return pools.session_for, {name: adapter.counter for name, adapter in pools.adapters.items()}
+
+    setups = [("no keep-alive", lambda: default_pools(keep_alive=False)), ("default pool", default_pools),
+              ("tuned pools", tuned_pools)]
+    try:
+        import httpx  # noqa: F401
+        setups.append(("httpx", lambda: tuned_pools(http2=True)))
+    except ImportError:
+        pass
+
+    results = {}
+    try:
+        for name, setup in setups:
+            session_for, counters = setup()
+            engine = CrawlEngine(concurrency=concurrency, rate=0, host_concurrency=concurrency)
+            start = time.perf_counter()
+            engine.run(urls, lambda url: engine.request(session_for(url), "GET", url, timeout=10).content)
+            elapsed = time.perf_counter() - start
+            new = sum(counter.report()["new_connections"] for counter in counters.values())
+            print(f"- {name:<13} {elapsed:.2f}s, {new} new connections, {repeat - new} reused")
+            results[name] = {"seconds": elapsed, "new_connections": new, "reused_connections": repeat - new}
+    finally:
+        server.shutdown()
+    return results
+
+
+def bench_similarity(repeat=2000):
+    """Top-5 nearest-color queries against the saved index and synthetic catalogs (needs NumPy)"""
+    import numpy as np
+    from enamel_downloader.similarity import INDEX_FILE, ColorIndex
+
+    rng = np.random.default_rng(0)
+    targets = [f"#{value:06x}" for value in rng.integers(0, 1 << 24, 64)]
+    catalogs = [("saved index", ColorIndex.load(Path("public") / INDEX_FILE))]
+    for size in (1000, 10000):
+        lab = rng.uniform([0, -80, -80], [100, 80, 80], (size, 3))
+        catalogs.append((f"{size} random", ColorIndex([str(n) for n in range(size)], lab)))
+
+    results = {}
+    print(f"Top-5 nearest-color queries x {repeat}")
+    for name, index in catalogs:
+        if not len(index):
+            continue
+        elapsed = _time(lambda: [index.nearest(target, 5) for target in targets], max(1, repeat // len(targets)))
+        per_query = elapsed / (max(1, repeat // len(targets)) * len(targets))
+        print(f"- {name:<12} {len(index):>6} swatches: {per_query * 1e6:.1f} us/query")
+        results[name] = {"swatches": len(index), "us_per_query": per_query * 1e6}
+    return results
+
+
+BENCHMARKS = {
+    "classifier": bench_classifier,
+    "parser": bench_parser,
+    "retry": bench_retry,
+    "pool": bench_pool,
+    "similarity": bench_similarity,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("benchmark", choices=sorted(BENCHMARKS))
+    parser.add_argument("--repeat", type=int)
+    parser.add_argument("--pages", help=f"directory of saved product page *.html files (parser benchmark, default {PAGES_DIR})")
+    args = parser.parse_args()
+
+    options = {"repeat": args.repeat} if args.repeat else {}
+    if args.benchmark == "parser":
+        options["pages"] = args.pages
+    BENCHMARKS[args.benchmark](**options)
+
+
+if __name__ == "__main__":
+    main()
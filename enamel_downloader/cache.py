@@ -0,0 +1,212 @@
+"""
+Conditional HTTP cache
+Stores response bodies on disk keyed by URL together with their ETag and
+Last-Modified validators, revalidates them with If-None-Match /
+If-Modified-Since, and evicts least recently used entries past a size cap
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import threading
+import time
+from pathlib import Path
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+_MAX_AGE = re.compile(r'max-age=(\d+)')
+
+
+class HttpCache:
+    """Persistent cache of GET responses for product pages and images"""
+
+    def __init__(self, directory, max_bytes=256 * 1024 * 1024):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.index_file = self.directory / "index.json"
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "revalidated": 0, "stored": 0, "evicted": 0}
+
+        self.index = {}
+        if self.index_file.exists():
+            try:
+                with open(self.index_file) as f:
+                    self.index = json.load(f)
+            except (OSError, ValueError):
+                self.index = {}
+        # Bytes of all indexed bodies, kept up to date as entries come and go
+        self.total_bytes = sum(entry.get("size", 0) for entry in self.index.values())
+        self._evict()
+
+    def body_path(self, url):
+        return self.directory / hashlib.sha256(url.encode()).hexdigest()
+
+    def get(self, send, url, **kwargs):
+        """GET url through send(url, **kwargs), answering from the cache when possible
+
+        The returned response carries a `cache_status` attribute of "hit",
+        "revalidated" or "miss". With stream=True cached bodies are streamed
+        from disk, and a fresh 200 body is left unread for the caller, who
+        hands the written file back through store_file.
+        """
+        stream = kwargs.get('stream', False)
+        with self.lock:
+            entry = self.index.get(url)
+        body_file = self.body_path(url)
+        if entry and not body_file.exists():
+            entry = None
+
+        if entry and entry.get("expires", 0) > time.time():
+            response = self._from_cache(url, entry, body_file, "hit", stream)
+            if response is not None:
+                self._count("hits")
+                return response
+
+        headers = dict(kwargs.pop('headers', None) or {})
+        if entry:
+            if entry.get("etag"):
+                headers['If-None-Match'] = entry["etag"]
+            if entry.get("last_modified"):
+                headers['If-Modified-Since'] = entry["last_modified"]
+
+        response = send(url, headers=headers, **kwargs)
+
+        if response.status_code == 304 and entry:
+            entry["expires"] = self._expires(response.headers)
+            response.close()
+            cached = self._from_cache(url, entry, body_file, "revalidated", stream)
+            if cached is not None:
+                self._count("revalidated")
+                return cached
+            # Evicted while we were revalidating; fetch the full body instead
+            headers.pop('If-None-Match', None)
+            headers.pop('If-Modified-Since', None)
+            response = send(url, headers=headers, **kwargs)
+
+        self._count("misses")
+        response.cache_status = "miss"
+        if response.status_code == 200 and not stream:
+            self._store(url, response)
+        return response
+
+    def forget(self, url):
+        """Drop url's cached body, e.g. because the file written from it was found damaged"""
+        with self.lock:
+            entry = self.index.pop(url, None)
+            if entry:
+                self.total_bytes -= entry.get("size", 0)
+        self.body_path(url).unlink(missing_ok=True)
+
+    def _count(self, key):
+        with self.lock:
+            self.stats[key] += 1
+
+    def _expires(self, headers):
+        cache_control = headers.get('Cache-Control', '')
+        match = _MAX_AGE.search(cache_control)
+        if match and 'no-cache' not in cache_control:
+            return time.time() + int(match.group(1))
+        return 0
+
+    def _from_cache(self, url, entry, body_file, status, stream=False):
+        try:
+            body = open(body_file, 'rb')
+        except OSError:
+            return None
+        with self.lock:
+            entry["accessed"] = time.time()
+            self.index[url] = entry
+
+        response = requests.Response()
+        response.status_code = 200
+        response.url = url
+        response.headers = CaseInsensitiveDict(entry.get("headers", {}))
+        response.headers['Content-Length'] = str(entry.get("size", 0))
+        response.cache_status = status
+        if stream:
+            # iter_content reads plain file objects chunk by chunk
+            response.raw = body
+        else:
+            with body:
+                response._content = body.read()
+        return response
+
+    def _cacheable(self, response):
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        return bool(etag or last_modified) and 'no-store' not in response.headers.get('Cache-Control', '')
+
+    def _store(self, url, response):
+        """Keep a 200 response if it carries validators the server can check later"""
+        if not self._cacheable(response):
+            return
+
+        body_file = self.body_path(url)
+        temp_file = body_file.with_name(f"{body_file.name}.{threading.get_ident()}.tmp")
+        with open(temp_file, 'wb') as f:
+            f.write(response.content)
+        os.replace(temp_file, body_file)
+        self._index(url, response, len(response.content))
+
+    def store_file(self, url, response, path):
+        """Keep a streamed 200 response whose body the caller already wrote to path"""
+        if not self._cacheable(response):
+            return
+
+        body_file = self.body_path(url)
+        temp_file = body_file.with_name(f"{body_file.name}.{threading.get_ident()}.tmp")
+        try:
+            # Another name for the same bytes; bodies are only ever replaced, never written in place
+            os.link(path, temp_file)
+        except OSError:
+            shutil.copyfile(path, temp_file)
+        os.replace(temp_file, body_file)
+        self._index(url, response, os.path.getsize(body_file))
+
+    def _index(self, url, response, size):
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        with self.lock:
+            previous = self.index.get(url)
+            if previous:
+                self.total_bytes -= previous.get("size", 0)
+            self.total_bytes += size
+            self.index[url] = {
+                "etag": etag,
+                "last_modified": last_modified,
+                "expires": self._expires(response.headers),
+                "headers": {key: value for key, value in response.headers.items()
+                            if key.lower() in ('content-type', 'etag', 'last-modified')},
+                "size": size,
+                "accessed": time.time(),
+            }
+            self.stats["stored"] += 1
+            self._evict()
+
+    def _evict(self):
+        """Drop least recently used entries until the cache fits its size cap"""
+        if self.total_bytes <= self.max_bytes:
+            return
+
+        for url, entry in sorted(self.index.items(), key=lambda item: item[1].get("accessed", 0)):
+            if self.total_bytes <= self.max_bytes:
+                break
+            try:
+                self.body_path(url).unlink()
+            except FileNotFoundError:
+                pass
+            self.total_bytes -= entry.get("size", 0)
+            del self.index[url]
+            self.stats["evicted"] += 1
+
+    def save(self):
+        """Write the index so the next run can revalidate"""
+        with self.lock:
+            temp_file = self.index_file.with_suffix(".tmp")
+            with open(temp_file, 'w') as f:
+                json.dump(self.index, f)
+            os.replace(temp_file, self.index_file)
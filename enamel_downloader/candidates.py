@@ -0,0 +1,183 @@
+"""
+Image candidate resolver
+Product pages link resized Magento renditions
+(media/catalog/product/cache/<hash>/o/p/opq-0062.jpg) rather than the
+uploaded originals. Every rendition's cache path is rewritten back to the
+original asset path, and each candidate's real size is checked with a small
+range request: the first bytes carry the JPEG/PNG header (pixel dimensions)
+and the Content-Range header the file size. Probes for one product run in
+parallel through the crawl engine, so they still obey the per-host limits.
+The largest image by pixels, then bytes, wins.
+
+Decisions are cached per product in .cache/image_choices.json and reused
+while the page offers the same candidates, so later runs skip the probes.
+"""
+
+import json
+import os
+import re
+import struct
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import urlsplit, urlunsplit
+
+from enamel_downloader.download import JPEG_SIGNATURE, PNG_SIGNATURE, is_image_header
+
+# Magento 2: cache/<32 hex>/; Magento 1: cache/<store>/<role>/[<w>x<h>/]<32 hex>/
+MAGENTO_CACHE = re.compile(r'(/media/catalog/product)/cache/(?:\d+/[a-z_]+/(?:\d*x\d*/)?)?[0-9a-f]{32}/')
+# Enough for the JPEG frame header behind typical EXIF/ICC segments
+PROBE_BYTES = 32 * 1024
+PROBE_WORKERS = 4
+# JPEG start-of-frame markers (SOF0-SOF15 without DHT, JPG and DAC)
+SOF_MARKERS = set(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def original_url(url):
+    """The original asset behind a Magento cache rendition, or None if url is not one"""
+    parts = urlsplit(url)
+    path, count = MAGENTO_CACHE.subn(r'\1/', parts.path, count=1)
+    if not count:
+        return None
+    return urlunsplit(parts._replace(path=path, query=""))
+
+
+def expand(urls, originals=original_url):
+    """Candidate URLs in preference order, each rendition preceded by its original"""
+    candidates = []
+    for url in urls:
+        for candidate in (originals(url), url):
+            if candidate and candidate not in candidates:
+                candidates.append(candidate)
+    return candidates
+
+
+def image_dimensions(head):
+    """(width, height) from the first bytes of a JPEG or PNG, or None"""
+    if head.startswith(PNG_SIGNATURE) and head[12:16] == b'IHDR':
+        return struct.unpack(">II", head[16:24])
+    if not head.startswith(JPEG_SIGNATURE):
+        return None
+    position = 2
+    while position + 9 <= len(head):
+        if head[position] != 0xFF:
+            return None
+        marker = head[position + 1]
+        if marker == 0xFF:
+            # Fill byte
+            position += 1
+            continue
+        if marker in SOF_MARKERS:
+            height, width = struct.unpack(">HH", head[position + 5:position + 9])
+            return width, height
+        if 0xD0 <= marker <= 0xD9 or marker == 0x01:
+            # Markers without a length
+            position += 2
+            continue
+        position += 2 + struct.unpack(">H", head[position + 2:position + 4])[0]
+    return None
+
+
+class CandidateResolver:
+    """Pick the largest real image among a product's candidate URLs"""
+
+    def __init__(self, request, path, workers=PROBE_WORKERS, originals=original_url):
+        # request(method, url, **kwargs) -> response, e.g. through CrawlEngine.request
+        self.request = request
+        # url -> the full-size asset behind it, or None; Magento cache paths by default
+        self.originals = originals
+        self.path = Path(path)
+        self.workers = workers
+        self.lock = threading.Lock()
+        self.stats = {"resolved": 0, "cached": 0, "probes": 0, "originals": 0, "unverified": 0}
+
+        # product URL -> {"candidates": [...], "url": chosen, "bytes", "width", "height", "checked_at"}
+        self.choices = {}
+        if self.path.exists():
+            try:
+                with open(self.path) as f:
+                    self.choices = json.load(f)
+            except (OSError, ValueError):
+                self.choices = {}
+
+    def _count(self, key):
+        with self.lock:
+            self.stats[key] += 1
+
+    def probe(self, url):
+        """Size of one candidate: {"url", "bytes", "width", "height"}, or None if it is not a reachable image"""
+        self._count("probes")
+        try:
+            response = self.request('GET', url, headers={"Range": f"bytes=0-{PROBE_BYTES - 1}"},
+                                    stream=True, timeout=15)
+        except Exception:
+            return None
+        try:
+            if response.status_code not in (200, 206):
+                return None
+            head = b''
+            for chunk in response.iter_content(8192):
+                head += chunk
+                if len(head) >= PROBE_BYTES:
+                    break
+        except Exception:
+            return None
+        finally:
+            response.close()
+
+        if not is_image_header(head):
+            return None
+        size = None
+        content_range = response.headers.get("Content-Range", "")
+        if response.status_code == 206 and "/" in content_range:
+            total = content_range.rsplit("/", 1)[1]
+            size = int(total) if total.isdigit() else None
+        elif response.headers.get("Content-Length", "").isdigit():
+            size = int(response.headers["Content-Length"])
+        width, height = image_dimensions(head) or (None, None)
+        return {"url": url, "bytes": size, "width": width, "height": height}
+
+    def resolve(self, product_url, urls):
+        """The best image URL among urls (as found on the page) and their originals
+
+        Falls back to the page's first choice when no candidate could be
+        verified, so a failed probe never costs the product its image.
+        """
+        if not urls:
+            return None
+        candidates = expand(urls, self.originals)
+        with self.lock:
+            cached = self.choices.get(product_url)
+        if cached and cached["candidates"] == candidates:
+            self._count("cached")
+            return cached["url"]
+
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(candidates))) as pool:
+            probes = [probe for probe in pool.map(self.probe, candidates) if probe]
+        if not probes:
+            # Not remembered: the next run probes again
+            self._count("unverified")
+            return urls[0]
+
+        # Largest by pixels, then by bytes; ties keep preference order (originals first)
+        best = max(probes, key=lambda probe: ((probe["width"] or 0) * (probe["height"] or 0), probe["bytes"] or 0))
+        self._count("resolved")
+        if best["url"] not in urls:
+            self._count("originals")
+        with self.lock:
+            self.choices[product_url] = dict(best, candidates=candidates, checked_at=time.time())
+        return best["url"]
+
+    def forget(self, product_url):
+        """Drop a product's cached decision, e.g. after its chosen image failed to download"""
+        with self.lock:
+            self.choices.pop(product_url, None)
+
+    def save(self):
+        with self.lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = self.path.with_suffix(".tmp")
+            with open(temp_file, 'w') as f:
+                json.dump(self.choices, f)
+            os.replace(temp_file, self.path)
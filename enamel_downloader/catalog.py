@@ -0,0 +1,294 @@
+"""
+Storefront catalog
+Generates the frontend's product image catalog from what the downloaders
+actually stored: the download manifests (or, before any manifest exists,
+the JSON reports), keeping only images that are on disk, plus the swatches
+on disk that no manifest tracks. Each image gets its size, dimensions,
+responsive variants from public/image_variants.json and, when the features
+stage has run, dominant colors and Lab values.
+
+Writes a typed module (src/data/catalog.ts) by default, or a compact JSON
+file the frontend can fetch lazily. The output records a fingerprint of its
+inputs and is only rewritten when they change.
+
+    python -m enamel_downloader.catalog [--format json] [--output PATH]
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import os
+from pathlib import Path
+
+from enamel_downloader.manifest import Manifest, file_sha256
+from enamel_downloader.store import SOURCE_SUFFIXES, view_key
+
+try:
+    from PIL import Image
+except ImportError:
+    # Dimensions then come from image_variants.json only
+    Image = None
+
+try:
+    from enamel_downloader.features import FEATURES_FILE, SwatchFeatures
+    from enamel_downloader.swatch_types import load_moves
+except ImportError:
+    # Needs NumPy (and Pillow); without it the catalog has no colors, and no swatch was moved
+    SwatchFeatures = None
+    load_moves = None
+
+# Swatch folder under public/ -> storefront enamel type
+FOLDER_TYPES = {
+    "transparent_colors": "transparent",
+    "opaques": "opaque",
+    "opale_colors": "opale",
+}
+# Product id prefix per type; opaque and opale must not share one
+ID_PREFIXES = {"transparent": "t", "opaque": "o", "opale": "op"}
+MANIFESTS = (".cache/complete_download_manifest.sqlite", ".cache/download_manifest.sqlite")
+REPORTS = ("complete_download_report.json", "download_report.json")
+VARIANTS_FILE = "image_variants.json"
+# Lab chroma below which a swatch counts as a gray, without a hue
+NEUTRAL_CHROMA = 5
+
+TS_HEADER = """\
+// Generated by `python -m enamel_downloader.catalog` from the download manifest. Do not edit.
+// source: {fingerprint}
+
+export interface CatalogImage {{
+  id: string;
+  reference: string;
+  colorReference: string | null;
+  type: 'transparent' | 'opaque' | 'opale';
+  image: string;
+  width: number | null;
+  height: number | null;
+  bytes: number;
+  hash: string | null;
+  srcset: {{ jpg: string; webp: string }} | null;
+  productUrls: string[];
+  color: string | null;
+  palette: string[];
+  lab: [number, number, number] | null;
+  hue: number | null;
+}}
+
+export const catalogImages: CatalogImage[] = """
+
+
+class CatalogBuilder:
+    """Build the storefront image catalog from the manifests or reports"""
+
+    def __init__(self, base_dir="public", output=None, output_format="ts"):
+        self.base_dir = Path(base_dir)
+        self.output_format = output_format
+        # The frontend's src/ sits next to its public/ folder, wherever the command is run from
+        default = (self.base_dir.resolve().parent / "src" / "data" / "catalog.ts" if output_format == "ts"
+                   else self.base_dir / "catalog.json")
+        self.output = Path(output) if output else default
+        self.stats = {"products": 0, "images": 0, "missing": 0, "untyped": 0, "untracked": 0}
+
+    def manifest_entries(self):
+        """Rows of every download manifest, or the results of the saved reports"""
+        entries = []
+        for name in MANIFESTS:
+            path = self.base_dir / name
+            if path.exists():
+                manifest = Manifest(path)
+                entries.extend(manifest.entries())
+                manifest.close()
+        if entries:
+            return entries
+
+        for name in REPORTS:
+            path = self.base_dir / name
+            if not path.exists():
+                continue
+            with open(path) as f:
+                report = json.load(f)
+            for result in report.get("results", []):
+                entries.append({"product_url": result["product_url"], "filename": result.get("filename"),
+                                "color_reference": result.get("color_reference"), "content_hash": None})
+            for result in report.get("detailed_results", {}).get("downloaded", []):
+                entries.append({"product_url": None, "filename": result.get("filepath"),
+                                "color_reference": result.get("color"), "content_hash": result.get("content_hash")})
+        return entries
+
+    def relative_path(self, filename):
+        """filename as a path under base_dir, however the downloader recorded it"""
+        return view_key(self.base_dir, filename)
+
+    def load_variants(self):
+        path = self.base_dir / VARIANTS_FILE
+        if not path.exists():
+            return {}
+        try:
+            with open(path) as f:
+                return json.load(f).get("images", {})
+        except (OSError, ValueError):
+            return {}
+
+    def collect(self):
+        """One record per swatch on disk, merging the product URLs that share it"""
+        images = {}
+        # Swatches the type classifier refiled; the reports still name their old paths
+        moves = load_moves(self.base_dir) if load_moves else {}
+        for entry in self.manifest_entries():
+            if not entry.get("filename"):
+                continue
+            self.stats["products"] += 1
+            key = self.relative_path(entry["filename"])
+            key = moves.get(key, key)
+            enamel_type = FOLDER_TYPES.get(key.split("/")[0])
+            if enamel_type is None:
+                self.stats["untyped"] += 1
+                continue
+            path = self.base_dir / key
+            if not path.exists():
+                self.stats["missing"] += 1
+                continue
+            image = images.setdefault(key, {
+                "path": path,
+                "type": enamel_type,
+                "color_reference": entry.get("color_reference"),
+                "hash": entry.get("content_hash"),
+                "product_urls": [],
+            })
+            if entry.get("product_url") and entry["product_url"] not in image["product_urls"]:
+                image["product_urls"].append(entry["product_url"])
+
+        # Swatches on disk without a manifest entry (filed by hand, or from before the
+        # manifests) are still products; like store.adopt_untracked, take them as they are
+        for folder, enamel_type in FOLDER_TYPES.items():
+            directory = self.base_dir / folder
+            if not directory.is_dir():
+                continue
+            for path in sorted(directory.iterdir()):
+                key = path.relative_to(self.base_dir).as_posix()
+                if (key in images or path.name.startswith('.') or path.suffix.lower() not in SOURCE_SUFFIXES
+                        or not path.is_file()):
+                    continue
+                images[key] = {"path": path, "type": enamel_type, "color_reference": None, "hash": None,
+                               "product_urls": []}
+                self.stats["untracked"] += 1
+        return dict(sorted(images.items()))
+
+    def load_features(self):
+        if SwatchFeatures is None:
+            return None
+        return SwatchFeatures.load(self.base_dir / FEATURES_FILE)
+
+    def colors(self, key, features):
+        """color, palette, lab and hue fields of one image from the feature file"""
+        row = features.row(key) if features is not None else None
+        if row is None:
+            return {"color": None, "palette": [], "lab": None, "hue": None}
+        lightness, a, b = (round(float(value), 1) for value in row["lab"])
+        palette = features.colors(key)
+        return {
+            "color": palette[0] if palette else None,
+            "palette": palette,
+            "lab": [lightness, a, b],
+            # Hue angle in the a*b* plane, for filtering by color family; grays have none
+            "hue": round(math.degrees(math.atan2(b, a)) % 360, 1) if math.hypot(a, b) >= NEUTRAL_CHROMA else None,
+        }
+
+    def fingerprint(self, images, variants, features=None):
+        """Hash of everything the catalog is generated from"""
+        digest = hashlib.sha256(self.output_format.encode())
+        for key, image in images.items():
+            # Content, not mtimes: a fresh checkout must not change the fingerprint
+            content_hash = image["hash"] or file_sha256(image["path"])
+            digest.update(json.dumps([key, image["type"], image["color_reference"], content_hash,
+                                      image["product_urls"], image["path"].stat().st_size]).encode())
+            digest.update(json.dumps(variants.get(key, {}).get("srcset"), sort_keys=True).encode())
+            digest.update(json.dumps(self.colors(key, features)).encode())
+        return digest.hexdigest()[:16]
+
+    def current_fingerprint(self):
+        """The fingerprint recorded in the existing output, if any"""
+        try:
+            with open(self.output) as f:
+                if self.output_format == "ts":
+                    for line in f:
+                        if line.startswith("// source: "):
+                            return line.split(":", 1)[1].strip()
+                    return None
+                return json.load(f).get("source")
+        except (OSError, ValueError):
+            return None
+
+    def dimensions(self, image, variant):
+        if variant.get("width"):
+            return variant["width"], variant["height"]
+        if Image is None:
+            return None, None
+        try:
+            with Image.open(image["path"]) as opened:
+                return opened.size
+        except OSError:
+            return None, None
+
+    def build(self, force=False):
+        """Write the catalog if its inputs changed; returns the stats"""
+        images = self.collect()
+        variants = self.load_variants()
+        features = self.load_features()
+        fingerprint = self.fingerprint(images, variants, features)
+        if not force and fingerprint == self.current_fingerprint():
+            print(f"Catalog up to date: {self.output}")
+            return dict(self.stats, images=len(images), written=False)
+
+        catalog = []
+        for key, image in images.items():
+            variant = variants.get(key, {})
+            # The variant entry only describes this file while its hash matches
+            if image["hash"] and variant.get("hash") not in (None, image["hash"]):
+                variant = {}
+            width, height = self.dimensions(image, variant)
+            reference = image["path"].stem
+            catalog.append({
+                "id": f"{ID_PREFIXES[image['type']]}-{reference}",
+                "reference": reference,
+                "colorReference": image["color_reference"],
+                "type": image["type"],
+                "image": key,
+                "width": width,
+                "height": height,
+                "bytes": image["path"].stat().st_size,
+                "hash": image["hash"] or variant.get("hash"),
+                "srcset": variant.get("srcset"),
+                "productUrls": image["product_urls"],
+                **self.colors(key, features),
+            })
+        self.stats["images"] = len(catalog)
+
+        self.output.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = self.output.with_name(f".{self.output.name}.tmp")
+        with open(temp_file, 'w') as f:
+            if self.output_format == "ts":
+                f.write(TS_HEADER.format(fingerprint=fingerprint))
+                f.write(json.dumps(catalog, indent=2, ensure_ascii=False) + ";\n")
+            else:
+                json.dump({"source": fingerprint, "images": catalog}, f, separators=(",", ":"), ensure_ascii=False)
+        os.replace(temp_file, self.output)
+
+        print(f"Catalog of {len(catalog)} images saved to: {self.output}"
+              + (f" ({self.stats['missing']} manifest entries without a file left out)" if self.stats["missing"] else ""))
+        return dict(self.stats, written=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate the storefront image catalog from the download manifest")
+    parser.add_argument("--base-dir", default="public")
+    parser.add_argument("--format", choices=("ts", "json"), default="ts",
+                        help="typed module (default src/data/catalog.ts beside BASE_DIR) or JSON (default BASE_DIR/catalog.json)")
+    parser.add_argument("--output")
+    parser.add_argument("--force", action="store_true", help="rewrite even if the inputs did not change")
+    args = parser.parse_args()
+    print(CatalogBuilder(args.base_dir, args.output, args.format).build(force=args.force))
+
+
+if __name__ == "__main__":
+    main()
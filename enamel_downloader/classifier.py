@@ -0,0 +1,94 @@
+"""
+Color reference and enamel type classifier
+Shared by both downloaders so a product URL always maps to the same
+reference and type. Patterns are compiled once and the numbering-system
+ranges are expanded into a lookup table at import time.
+"""
+
+import re
+from collections import namedtuple
+from urllib.parse import urlsplit
+
+Classification = namedtuple("Classification", ["reference", "number", "enamel_type"])
+
+# Product number in a URL slug, with an optional "n-" prefix (fondant n-1) and a
+# single-letter variant suffix either glued (62f) or hyphenated (66-f, 97-p, 238-b)
+_SLUG_REFERENCE = re.compile(r'(?:^|-)(?:(n)-)?(\d+)(?:-?([a-z])(?=-|$))?')
+_TITLE_NUMBER = re.compile(r'(\d+)')
+
+# Checked in this order; the first group that matches decides the type
+_TYPE_KEYWORDS = [
+    ("opal", re.compile(r'opal')),
+    ("transparent", re.compile(r'transparent|translucent|cristal|crystal|clear')),
+    ("opaque", re.compile(r'opaque')),
+]
+
+_TRANSPARENT_NUMBERS = (
+    set(range(2000, 3000)) | set(range(4000, 5000)) | set(range(1040, 1050))
+    | {104, 111, 194, 1942, 383, 388, 29, 31, 39, 40, 41, 53}
+)
+_OPAL_NUMBERS = set(range(600, 650)) | {101, 607, 609, 610, 8}
+
+# Emaux Soyer numbering system: product number -> enamel type
+NUMBER_TYPES = {number: "transparent" for number in _TRANSPARENT_NUMBERS}
+NUMBER_TYPES.update({number: "opal" for number in _OPAL_NUMBERS - _TRANSPARENT_NUMBERS})
+
+DEFAULT_TYPE = "opaque"
+
+
+def url_slug(url):
+    """Last path segment of a product URL without its .html extension"""
+    slug = urlsplit(url).path.rstrip('/').rsplit('/', 1)[-1].lower()
+    return slug[:-5] if slug.endswith('.html') else slug
+
+
+def extract_reference(url, title=""):
+    """Return (reference, number) for a product, e.g. ("62F", 62), or (None, None)"""
+    match = _SLUG_REFERENCE.search(url_slug(url))
+    if match:
+        prefix, digits, suffix = match.groups()
+        reference = f"{(prefix or '').upper()}{digits}{(suffix or '').upper()}"
+        return reference, int(digits)
+
+    match = _TITLE_NUMBER.search(title)
+    if match:
+        return match.group(1), int(match.group(1))
+    return None, None
+
+
+def keyword_type(url, title="", content=""):
+    """transparent, opaque or opal if the page text names one, else None"""
+    text = f"{url} {title} {content}".lower()
+    for type_name, pattern in _TYPE_KEYWORDS:
+        if pattern.search(text):
+            return type_name
+    return None
+
+
+def type_evidence(url, title="", content="", number=None):
+    """(type, source) from the page text: source is "keyword" or "number", or (None, None)"""
+    type_name = keyword_type(url, title, content)
+    if type_name:
+        return type_name, "keyword"
+
+    if number is None:
+        _, number = extract_reference(url, title)
+    if number in NUMBER_TYPES:
+        return NUMBER_TYPES[number], "number"
+    return None, None
+
+
+def enamel_type(url, title="", content="", number=None):
+    """transparent, opaque or opal from keywords, then the numbering system"""
+    return type_evidence(url, title, content, number)[0] or DEFAULT_TYPE
+
+
+def classify(url, title=""):
+    reference, number = extract_reference(url, title)
+    return Classification(reference, number, enamel_type(url, title, number=number))
+
+
+def classify_urls(urls, titles=None):
+    """Classify a whole list of product URLs, optionally with their page titles"""
+    titles = titles or {}
+    return [classify(url, titles.get(url, "")) for url in urls]
@@ -0,0 +1,269 @@
+"""
+Command line entry point
+
+    python -m enamel_downloader sync              discover, download and report
+    python -m enamel_downloader sync discover     walk the listing pages only
+    python -m enamel_downloader sync download     download the discovered products
+    python -m enamel_downloader sync verify       check stored files against the manifest
+    python -m enamel_downloader sync report       summarize the manifest
+    python -m enamel_downloader sync report --rebuild
+                                                  rebuild the JSON report from the results log
+    python -m enamel_downloader sync --shards 4 download
+                                                  split the download over 4 worker processes
+
+Downloads keep a checkpoint journal, so an interrupted run resumes where it
+stopped; pass --fresh to start over. After a download the post-download
+stages (type folders, variants, features, color index, catalog) run as they
+do after the downloader scripts; pass --skip-post to leave them out.
+"""
+
+import argparse
+import importlib
+import json
+import sys
+from collections import Counter
+from pathlib import Path
+
+from enamel_downloader.discovery import EMAUX_SOYER_LISTING_URLS
+from enamel_downloader.download import is_complete_image
+from enamel_downloader.journal import CheckpointJournal
+from enamel_downloader.manifest import file_sha256
+from enamel_downloader.shards import ShardedCrawl
+from enamel_downloader.stages import run_post_download
+from enamel_downloader.suppliers import SUPPLIERS, EmauxSoyerAdapter
+
+# name -> (module, class); the downloader scripts live at the repository root
+DOWNLOADERS = {
+    "complete": ("download_all_emaux_images", "CompleteEmauxDownloader"),
+    "soyer": ("download_enamel_images", "EmauxSoyerImageDownloader"),
+}
+
+
+def build_supplier(args):
+    """The supplier adapter named on the command line"""
+    supplier_class = SUPPLIERS[args.supplier]
+    try:
+        return supplier_class(args.listing_url)
+    except ValueError as e:
+        build_parser().error(str(e))
+
+
+def downloader_settings(args):
+    """Constructor arguments of the downloader, as given on the command line"""
+    settings = dict(base_dir=args.base_dir, concurrency=args.concurrency, rate_limit=args.rate,
+                    host_concurrency=args.host_concurrency, cache_dir=args.cache_dir, manifest_ttl=args.manifest_ttl,
+                    http2=args.http2, event_log=args.event_log)
+    if args.downloader == "complete":
+        settings["supplier"] = build_supplier(args)
+    return settings
+
+
+def build_downloader(args):
+    module_name, class_name = DOWNLOADERS[args.downloader]
+    downloader_class = getattr(importlib.import_module(module_name), class_name)
+    return downloader_class(**downloader_settings(args))
+
+
+def journal_path(downloader, args):
+    return downloader.cache.directory.parent / f"{args.downloader}_journal.jsonl"
+
+
+def discovered_urls(downloader):
+    """Product URLs saved by the last complete discovery, or None"""
+    state_file = getattr(downloader, "discovery_file", downloader.cache.directory.parent / "discovered_products.json")
+    if not state_file.exists():
+        return None
+    with open(state_file) as f:
+        return json.load(f)
+
+
+def cmd_discover(downloader, args):
+    count = sum(1 for _ in downloader.discover_products(args.listing_url))
+    print(f"Discovered {count} products")
+    return 0
+
+
+def cmd_download(downloader, args, discover=False):
+    journal = CheckpointJournal(journal_path(downloader, args)).start(fresh=args.fresh)
+    if journal.resumed:
+        print(f"Resuming run {journal.run_id}: {len(journal.done)} products already done")
+
+    urls = None if discover else discovered_urls(downloader)
+    if urls is None:
+        urls = downloader.discover_products(args.listing_url)
+
+    try:
+        if args.shards > 1:
+            crawl = ShardedCrawl(downloader, DOWNLOADERS[args.downloader], args.shards, downloader_settings(args))
+            downloader.generate_report(crawl.download_all(urls, journal=journal))
+        elif args.downloader == "complete":
+            downloader.download_all(urls, journal=journal)
+            downloader.generate_report()
+        else:
+            downloader.process_product_urls(urls, journal=journal)
+            report = downloader.generate_report()
+            print(f"Downloaded {report['summary']['successful_downloads']}, "
+                  f"failed {report['summary']['failed_downloads']}, skipped {report['summary']['skipped']}")
+    except BaseException:
+        # Leave the run open so the next invocation resumes it
+        journal.close()
+        raise
+    journal.finish()
+    if journal.skipped:
+        print(f"{journal.skipped} products were already done before the interruption")
+    if not args.skip_post:
+        run_post_download(downloader.base_dir)
+    return 0
+
+
+def cmd_sync(downloader, args):
+    return cmd_download(downloader, args, discover=True)
+
+
+def cmd_verify(downloader, args):
+    """Check every manifest entry's file: present, a whole image, same content hash"""
+    problems = Counter()
+    checked = 0
+    for entry in downloader.manifest.entries():
+        filename = entry.get("filename")
+        if not filename:
+            continue
+        checked += 1
+        path = Path(filename)
+        if not path.exists():
+            problem = "missing"
+        elif not is_complete_image(path):
+            problem = "incomplete"
+        elif entry.get("content_hash") and file_sha256(path) != entry["content_hash"]:
+            problem = "hash mismatch"
+        else:
+            continue
+        problems[problem] += 1
+        print(f"{problem}: {filename} ({entry['product_url']})")
+        if args.repair:
+            repair(downloader, entry)
+
+    print(f"Verified {checked} files: {sum(problems.values())} problems"
+          + (f" ({', '.join(f'{count} {name}' for name, count in problems.items())})" if problems else ""))
+    if problems and args.repair:
+        downloader.dedupe.save()
+        downloader.cache.save()
+        print("Removed them and marked them stale; the next download refetches them")
+    return 1 if problems and not args.repair else 0
+
+
+def repair(downloader, entry):
+    """Remove a damaged file and every copy it could be served from again, and mark it stale
+
+    A view is a hard link to its blob and often to the HTTP cache's body as
+    well, so damage done through one name shows in all of them.
+    """
+    path = Path(entry["filename"])
+    path.unlink(missing_ok=True)
+    blob = downloader.store.find(entry["content_hash"]) if entry.get("content_hash") else None
+    if blob and file_sha256(blob) != blob.stem:
+        blob.unlink()
+    if entry.get("image_url"):
+        downloader.cache.forget(entry["image_url"])
+    downloader.dedupe.forget(entry["filename"])
+    # An expired check time makes the next download refetch the product
+    downloader.manifest.record(entry["product_url"], checked_at=0)
+
+
+def cmd_report(downloader, args):
+    """Summarize the manifest, the retry queue and any open checkpoint"""
+    if args.rebuild:
+        # The results log survives a crash that never got to write the report
+        downloader.summarize()
+        print(f"Rebuilt the report from {downloader.result_log.path}")
+    entries = downloader.manifest.entries()
+    journal = CheckpointJournal(journal_path(downloader, args))
+    summary = {
+        "products": len(entries),
+        "fresh": sum(downloader.manifest.is_fresh(entry) for entry in entries),
+        "bytes": sum(entry.get("size") or 0 for entry in entries),
+        "by_type": dict(Counter(entry.get("enamel_type") or "unknown" for entry in entries)),
+        "retry_queue": len(downloader.retry_queue),
+        "open_run": {"run": journal.run_id, "done": len(journal.done)} if journal.run_id else None,
+    }
+    if args.json:
+        print(json.dumps(summary, indent=2))
+        return 0
+
+    print(f"Products in manifest: {summary['products']} ({summary['fresh']} fresh), "
+          f"{summary['bytes'] / 1e6:.1f} MB")
+    for enamel_type, count in sorted(summary["by_type"].items()):
+        print(f"- {enamel_type}: {count}")
+    print(f"Queued for retry: {summary['retry_queue']}")
+    if summary["open_run"]:
+        print(f"Interrupted run {journal.run_id}: {len(journal.done)} products done, resumes on next download")
+    return 0
+
+
+COMMANDS = {
+    None: cmd_sync,
+    "discover": cmd_discover,
+    "download": cmd_download,
+    "verify": cmd_verify,
+    "report": cmd_report,
+}
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m enamel_downloader",
+                                     description="Sync Emaux Soyer enamel images")
+    commands = parser.add_subparsers(dest="command", required=True)
+    sync = commands.add_parser("sync", help="discover, download, verify or report")
+    sync.add_argument("--downloader", choices=sorted(DOWNLOADERS), default="complete")
+    sync.add_argument("--base-dir", default="public", help="where images and reports are written")
+    sync.add_argument("--cache-dir", help="HTTP cache directory (default: BASE_DIR/.cache/http)")
+    sync.add_argument("--concurrency", type=int, default=8, help="products in flight")
+    sync.add_argument("--rate", type=float, default=4.0, help="requests per second per host, 0 for unlimited")
+    sync.add_argument("--host-concurrency", type=int, default=4, help="simultaneous connections per host")
+    sync.add_argument("--manifest-ttl", type=float, default=7 * 24 * 3600,
+                      help="seconds before a downloaded product is checked again")
+    sync.add_argument("--http2", action="store_true", help="use HTTP/2 (needs httpx[http2])")
+    sync.add_argument("--event-log", help="append per-stage timing events to this JSON-lines file")
+    sync.add_argument("--supplier", choices=sorted(SUPPLIERS), default=EmauxSoyerAdapter.name,
+                      help="catalog adapter (complete downloader only); shopify needs --listing-url "
+                           "with the store's collection pages")
+    sync.add_argument("--shards", type=int, default=1,
+                      help="worker processes splitting the products (complete downloader only); "
+                           "the rate and host connection limits are divided among them")
+    sync.add_argument("--listing-url", action="append", help="category listing page to discover from "
+                      "(repeatable; default: the supplier's, for emaux-soyer its enamel category)")
+
+    steps = sync.add_subparsers(dest="step")
+    steps.add_parser("discover", help="walk the listing pages and save the product list")
+    download = steps.add_parser("download", help="download discovered products, resuming an interrupted run")
+    verify = steps.add_parser("verify", help="check stored files against the manifest")
+    verify.add_argument("--repair", action="store_true",
+                        help="remove broken files and mark them stale so they are refetched")
+    report = steps.add_parser("report", help="summarize the manifest")
+    report.add_argument("--json", action="store_true")
+    report.add_argument("--rebuild", action="store_true",
+                        help="rebuild the downloader's JSON report from its results log")
+
+    for step in (sync, download):
+        # SUPPRESS so "sync --fresh download" is not reset by the subcommand's default
+        step.add_argument("--fresh", action="store_true", default=argparse.SUPPRESS,
+                          help="ignore the checkpoint and start a new run")
+        step.add_argument("--skip-post", action="store_true", default=argparse.SUPPRESS,
+                          help="do not run the post-download stages (views, variants, features, index, catalog)")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    args.fresh = getattr(args, "fresh", False)
+    args.skip_post = getattr(args, "skip_post", False)
+    if args.downloader != "complete":
+        if args.shards > 1 or args.supplier != EmauxSoyerAdapter.name:
+            build_parser().error("--shards and --supplier need --downloader complete")
+        args.listing_url = args.listing_url or EMAUX_SOYER_LISTING_URLS
+    downloader = build_downloader(args)
+    return COMMANDS[args.step](downloader, args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
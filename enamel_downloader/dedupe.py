@@ -0,0 +1,162 @@
+"""
+Swatch deduplication
+Powder, grain and lump products of one color often resolve to the same or
+a near-identical image. The index maps image URLs and content hashes to the
+file that was stored first, so identical bytes are only stored once. Near-
+identical renditions (a perceptual difference hash plus the mean color) are
+only merged between variants of one color reference, e.g. 62 and 62F, and
+with the closest of them: different colors of the same shade are not
+duplicates. It is saved between runs; the downloaders resolve an image URL
+seen before without fetching any bytes while its manifest entry is fresh.
+
+Perceptual matching needs Pillow; without it only exact content matches
+are deduplicated.
+"""
+
+import json
+import os
+import re
+import threading
+from pathlib import Path
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+from enamel_downloader.manifest import file_sha256
+
+HASH_SIZE = 8
+
+
+def image_signature(path):
+    """64-bit difference hash and mean RGB of an image, or None without Pillow"""
+    if Image is None:
+        return None
+    with Image.open(path) as image:
+        rgb = image.convert("RGB")
+        mean = rgb.resize((1, 1), Image.BOX).getpixel((0, 0))
+        gray = rgb.convert("L").resize((HASH_SIZE + 1, HASH_SIZE), Image.LANCZOS)
+        # One byte per pixel in mode L, row by row
+        pixels = gray.tobytes()
+
+    bits = 0
+    for row in range(HASH_SIZE):
+        for col in range(HASH_SIZE):
+            left = pixels[row * (HASH_SIZE + 1) + col]
+            right = pixels[row * (HASH_SIZE + 1) + col + 1]
+            bits = (bits << 1) | (left > right)
+    return {"dhash": f"{bits:016x}", "mean": list(mean)}
+
+
+def distance(a, b):
+    """(difference hash bits that differ, largest mean channel delta) of two signatures"""
+    bits = bin(int(a["dhash"], 16) ^ int(b["dhash"], 16)).count("1")
+    return bits, max(abs(x - y) for x, y in zip(a["mean"], b["mean"]))
+
+
+def is_near(a, b, max_distance, max_color_delta):
+    """Same structure (difference hash) and same overall color"""
+    bits, color_delta = distance(a, b)
+    return bits <= max_distance and color_delta <= max_color_delta
+
+
+def variant_group(reference):
+    """The color a reference is a variant of: 62F and 62 are both 62; None without a reference"""
+    if not reference:
+        return None
+    return re.sub(r'(?<=\d)[A-Z]$', '', reference.upper())
+
+
+class DedupeIndex:
+    """Content-hash and perceptual-hash index of stored swatch files"""
+
+    def __init__(self, path, max_distance=4, max_color_delta=8):
+        self.path = Path(path)
+        self.max_distance = max_distance
+        self.max_color_delta = max_color_delta
+        self.lock = threading.Lock()
+        self.stats = {"unique": 0, "exact_duplicates": 0, "near_duplicates": 0, "skipped_before_fetch": 0}
+
+        # sha256 -> {"path": stored file, "signature": {...}}; image URL -> sha256
+        self.files = {}
+        self.urls = {}
+        if self.path.exists():
+            try:
+                with open(self.path) as f:
+                    data = json.load(f)
+                self.files = data.get("files", {})
+                self.urls = data.get("urls", {})
+            except (OSError, ValueError):
+                pass
+
+    def lookup_url(self, image_url):
+        """Stored file for an image URL seen before, if it is still on disk
+
+        Only for images whose manifest entry is fresh: a stale one is
+        revalidated with a conditional request instead.
+        """
+        with self.lock:
+            content_hash = self.urls.get(image_url)
+            entry = self.files.get(content_hash) if content_hash else None
+            if entry and os.path.exists(entry["path"]):
+                self.stats["skipped_before_fetch"] += 1
+                return entry["path"], content_hash
+        return None, None
+
+    def add(self, image_url, staged, destination, content_hash=None, reference=None):
+        """Register a freshly downloaded file; returns (stored path, content hash)
+
+        staged is the downloaded file, destination where it would be kept.
+        If it duplicates a stored file that file's path is returned and the
+        caller drops the staged copy; otherwise destination is returned and
+        the caller moves the staged file there. Near-identical files only
+        count as duplicates of the same color reference's variants.
+        """
+        destination = str(destination)
+        content_hash = content_hash or file_sha256(staged)
+        group = variant_group(reference)
+        signature = image_signature(staged) if Image is not None and group else None
+
+        with self.lock:
+            entry = self.files.get(content_hash)
+            if entry and os.path.exists(entry["path"]):
+                self.stats["exact_duplicates"] += 1
+                self.urls[image_url] = content_hash
+                return entry["path"], content_hash
+
+            if signature:
+                near = [(distance(signature, known["signature"]), known_hash)
+                        for known_hash, known in self.files.items()
+                        if known.get("group") == group and known.get("signature") and os.path.exists(known["path"])
+                        and is_near(signature, known["signature"], self.max_distance, self.max_color_delta)]
+                if near:
+                    _, known_hash = min(near)
+                    self.stats["near_duplicates"] += 1
+                    self.urls[image_url] = known_hash
+                    return self.files[known_hash]["path"], known_hash
+
+            # destination is about to be overwritten; forget what used to live there
+            for known_hash in [h for h, known in self.files.items() if known["path"] == destination]:
+                del self.files[known_hash]
+
+            self.files[content_hash] = {"path": destination, "signature": signature, "group": group}
+            self.urls[image_url] = content_hash
+            self.stats["unique"] += 1
+            return destination, content_hash
+
+    def forget(self, path):
+        """Drop a stored file and the image URLs resolving to it, so they are fetched again"""
+        path = str(path)
+        with self.lock:
+            hashes = {content_hash for content_hash, entry in self.files.items() if entry["path"] == path}
+            for content_hash in hashes:
+                del self.files[content_hash]
+            self.urls = {url: content_hash for url, content_hash in self.urls.items() if content_hash not in hashes}
+
+    def save(self):
+        with self.lock:
+            temp_file = self.path.with_suffix(".tmp")
+            with open(temp_file, 'w') as f:
+                json.dump({"files": self.files, "urls": self.urls}, f)
+            os.replace(temp_file, self.path)
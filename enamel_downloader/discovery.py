@@ -0,0 +1,168 @@
+"""
+Catalog discovery
+Follows category listing pages through their pagination and yields product
+URLs as soon as each listing page is parsed, so downloads can start while
+later listing pages are still being fetched
+"""
+
+import json
+import os
+from collections import deque
+from pathlib import Path
+from urllib.parse import urljoin, urlsplit, urlunsplit
+
+from bs4 import BeautifulSoup
+
+# Enamel category listings on emaux-soyer.com (Magento, paginated with ?p=N)
+EMAUX_SOYER_LISTING_URLS = [
+    "https://www.emaux-soyer.com/en/emaux.html",
+]
+
+PRODUCT_LINK_SELECTORS = [
+    'a.product-item-link',
+    'a.product-item-photo',
+    '.product-item-name a',
+    '.products-grid .product-item a',
+]
+
+NEXT_PAGE_SELECTORS = [
+    '.pages-item-next a',
+    'a.action.next',
+    'link[rel="next"]',
+]
+
+
+def normalize_url(url):
+    """Drop query string and fragment so the same product is only seen once"""
+    parts = urlsplit(url)
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, '', ''))
+
+
+def product_links(soup, page_url):
+    """Product page links on a listing page, in document order"""
+    links = []
+    for selector in PRODUCT_LINK_SELECTORS:
+        for anchor in soup.select(selector):
+            href = anchor.get('href')
+            if not href:
+                continue
+            url = normalize_url(urljoin(page_url, href))
+            if url.endswith('.html'):
+                links.append(url)
+    return links
+
+
+def next_page_links(soup, page_url):
+    """Pagination links pointing past the current listing page"""
+    links = []
+    for selector in NEXT_PAGE_SELECTORS:
+        for anchor in soup.select(selector):
+            href = anchor.get('href')
+            if href:
+                links.append(urljoin(page_url, href))
+    return links
+
+
+class CatalogDiscovery:
+    """Walk listing pages and yield deduplicated product URLs
+
+    Subclasses for other storefronts override walk() and set truncated
+    when they stop at max_pages. Only a complete walk, without listing
+    errors, is compared with the previous one to report new and removed
+    products and saved to state_file: a missed page would otherwise report
+    its products as removed now and as new on the next run.
+    """
+
+    def __init__(self, get, listing_urls, state_file=None, max_pages=500, fallback=()):
+        self.get = get
+        self.listing_urls = list(listing_urls)
+        self.state_file = Path(state_file) if state_file else None
+        self.max_pages = max_pages
+        # Used when the listings yield nothing, e.g. the category URL moved
+        self.fallback = list(fallback)
+        self.found = {}
+        # Set when the walk stopped at max_pages with listing pages left
+        self.truncated = False
+        self.stats = {"listing_pages": 0, "products": 0, "new": 0, "removed": 0, "errors": 0}
+        self.new_products = []
+        self.removed_products = []
+
+    def discover(self):
+        """Yield product URLs as listing pages are fetched"""
+        for url in self.walk():
+            if url not in self.found:
+                self.found[url] = None
+                yield url
+
+        if not self.found:
+            if self.fallback:
+                print(f"No products found on listing pages, using {len(self.fallback)} known URLs")
+            for url in self.fallback:
+                if url not in self.found:
+                    self.found[url] = None
+                    yield url
+            self.stats["products"] = len(self.found)
+            return
+
+        self.stats["products"] = len(self.found)
+        if self.stats["errors"] or self.truncated:
+            print(f"Discovered {len(self.found)} products on {self.stats['listing_pages']} listing pages; "
+                  f"the walk was incomplete, so it is not compared with or saved over the last one")
+            return
+        self._compare_with_last_run()
+
+    def walk(self):
+        """Yield the product links of every listing page, following the pagination"""
+        queue = deque(self.listing_urls)
+        visited = set()
+
+        while queue and len(visited) < self.max_pages:
+            page_url = queue.popleft()
+            if page_url in visited:
+                continue
+            visited.add(page_url)
+
+            try:
+                response = self.get(page_url, timeout=30)
+                response.raise_for_status()
+            except Exception as e:
+                print(f"Error fetching listing {page_url}: {e}")
+                self.stats["errors"] += 1
+                continue
+
+            soup = BeautifulSoup(response.content, 'html.parser')
+            self.stats["listing_pages"] += 1
+
+            yield from product_links(soup, page_url)
+
+            for next_url in next_page_links(soup, page_url):
+                if next_url not in visited:
+                    queue.append(next_url)
+
+        self.truncated = any(url not in visited for url in queue)
+
+    def _compare_with_last_run(self):
+        previous = set()
+        if self.state_file and self.state_file.exists():
+            try:
+                with open(self.state_file) as f:
+                    previous = set(json.load(f))
+            except (OSError, ValueError):
+                previous = set()
+
+        current = set(self.found)
+        self.new_products = sorted(current - previous)
+        self.removed_products = sorted(previous - current)
+        self.stats["new"] = len(self.new_products)
+        self.stats["removed"] = len(self.removed_products)
+        print(f"Discovered {len(current)} products on {self.stats['listing_pages']} listing pages "
+              f"({self.stats['new']} new, {self.stats['removed']} removed since last run)")
+
+        if self.state_file:
+            temp_file = self.state_file.with_suffix(".tmp")
+            with open(temp_file, 'w') as f:
+                json.dump(sorted(current), f, indent=2)
+            os.replace(temp_file, self.state_file)
+
+    def report(self):
+        return dict(self.stats, new_products=self.new_products, removed_products=self.removed_products)
@@ -0,0 +1,295 @@
+"""
+Streaming image downloads
+Bodies are streamed in chunks to a .part file next to the destination,
+checked against the expected length and the JPEG/PNG signatures, and only
+then moved into place with os.replace, so a crash never leaves a truncated
+image under the final name.
+
+A transfer that breaks off keeps its .part file when the server can resume
+it (Accept-Ranges: bytes and a strong ETag, recorded next to it in a
+.part.json file). The next attempt, in the same call or a later run, asks
+for the rest with Range and If-Range and only appends when the server
+answers 206 for the same ETag from the right offset; a changed image is
+fetched whole instead of being stitched onto the old bytes.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+import requests
+from urllib3.exceptions import ProtocolError, ReadTimeoutError
+from urllib3.response import BaseHTTPResponse
+
+CHUNK_SIZE = 64 * 1024
+# Resumes within one fetch_to_file call that in a row add no bytes before it gives up
+RESUME_ATTEMPTS = 3
+RESUME_DELAY = 0.5
+
+JPEG_SIGNATURE = b'\xff\xd8\xff'
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+_part_locks = {}
+_part_locks_lock = threading.Lock()
+
+
+class DownloadError(Exception):
+    """The downloaded body is incomplete or not an image"""
+
+
+class TruncatedDownload(DownloadError):
+    """The body ended before the expected length; what arrived may be resumed"""
+
+
+# Failures partway through a body, after which the bytes received are worth keeping
+INTERRUPTED = (requests.exceptions.ChunkedEncodingError, requests.ConnectionError, requests.Timeout,
+               ProtocolError, ReadTimeoutError, TruncatedDownload)
+
+
+def is_image_header(head):
+    return head.startswith(JPEG_SIGNATURE) or head.startswith(PNG_SIGNATURE)
+
+
+def is_complete_image(path):
+    """Cheap check that a file on disk is a whole JPEG or PNG"""
+    try:
+        with open(path, 'rb') as f:
+            head = f.read(len(PNG_SIGNATURE))
+            f.seek(0, os.SEEK_END)
+            if f.tell() < 16:
+                return False
+            f.seek(-12, os.SEEK_END)
+            tail = f.read()
+    except OSError:
+        return False
+
+    if head.startswith(JPEG_SIGNATURE):
+        return b'\xff\xd9' in tail
+    if head.startswith(PNG_SIGNATURE):
+        return b'IEND' in tail
+    return False
+
+
+def content_range(response):
+    """(start, total) of a 206 response's Content-Range, or None"""
+    value = response.headers.get('Content-Range', '')
+    if not value.startswith('bytes ') or '/' not in value:
+        return None
+    span, total = value[6:].split('/', 1)
+    start = span.split('-', 1)[0]
+    if not start.isdigit():
+        return None
+    return int(start), int(total) if total.isdigit() else None
+
+
+class PartialDownload:
+    """The .part file of one destination and the validator it can be resumed with"""
+
+    def __init__(self, destination, url):
+        destination = Path(destination)
+        self.url = url
+        self.path = destination.with_name(destination.name + ".part")
+        self.meta_path = destination.with_name(destination.name + ".part.json")
+        with _part_locks_lock:
+            # Two workers fetching into the same destination must not append to one .part file
+            self.lock = _part_locks.setdefault(str(self.path), threading.Lock())
+        self.etag = None
+        self.total = None
+
+    def resume_offset(self):
+        """Bytes already on disk for this URL that may be resumed, else 0 (and the .part is dropped)"""
+        try:
+            with open(self.meta_path) as f:
+                meta = json.load(f)
+            size = self.path.stat().st_size
+        except (OSError, ValueError):
+            self.discard()
+            return 0
+        if meta.get("url") != self.url or not meta.get("etag") or not 0 < size < (meta.get("total") or 0):
+            self.discard()
+            return 0
+        self.etag, self.total = meta["etag"], meta["total"]
+        return size
+
+    def continues(self, response, offset):
+        """True if a response to a Range request carries the rest of the same image"""
+        span = content_range(response)
+        return (response.status_code == 206 and span is not None and span[0] == offset
+                and span[1] == self.total and response.headers.get('ETag') == self.etag)
+
+    def begin(self, response):
+        """Record the validator of a fresh 200 response if the server can resume it"""
+        etag = response.headers.get('ETag', '')
+        length = response.headers.get('Content-Length', '')
+        resumable = (response.headers.get('Accept-Ranges', '').lower() == 'bytes' and etag
+                     and not etag.startswith('W/') and length.isdigit()
+                     and response.headers.get('Content-Encoding', 'identity') == 'identity')
+        self.etag, self.total = (etag, int(length)) if resumable else (None, None)
+        if resumable:
+            with open(self.meta_path, 'w') as f:
+                json.dump({"url": self.url, "etag": etag, "total": self.total}, f)
+        else:
+            self._unlink(self.meta_path)
+
+    @property
+    def resumable(self):
+        return self.etag is not None and self.path.exists()
+
+    def discard(self):
+        self.etag = self.total = None
+        self._unlink(self.path)
+        self._unlink(self.meta_path)
+
+    def finish(self, destination):
+        self._unlink(self.meta_path)
+        os.replace(self.path, destination)
+
+    @staticmethod
+    def _unlink(path):
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+
+def iter_body(response, chunk_size=CHUNK_SIZE):
+    """A streamed response body in chunks, handed over as they arrive
+
+    urllib3's read(amt) waits for a whole chunk and loses what it buffered
+    when the connection drops; read1 returns whatever has arrived, so an
+    interrupted body is kept on disk up to its last received byte.
+    """
+    raw = response.raw
+    if not isinstance(raw, BaseHTTPResponse) or not hasattr(raw, 'read1'):
+        yield from response.iter_content(chunk_size)
+        return
+    while True:
+        chunk = raw.read1(chunk_size, decode_content=True)
+        if not chunk:
+            return
+        yield chunk
+
+
+def stream_to_file(response, part, offset=0, chunk_size=CHUNK_SIZE):
+    """Write a streamed response body to a PartialDownload, after its first offset bytes
+
+    Returns (size, sha256 hexdigest) of the whole file. Raises
+    TruncatedDownload if the body ends short of the expected length and
+    DownloadError if the file does not start like a JPEG or PNG.
+    """
+    digest = hashlib.sha256()
+    size = 0
+    if offset:
+        with open(part.path, 'rb') as f:
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                digest.update(chunk)
+                size += len(chunk)
+
+    with open(part.path, 'r+b' if offset else 'wb') as f:
+        f.seek(size)
+        f.truncate()
+        try:
+            for chunk in iter_body(response, chunk_size):
+                if not chunk:
+                    continue
+                digest.update(chunk)
+                size += len(chunk)
+                f.write(chunk)
+        finally:
+            # Whatever arrived is flushed, so an interrupted transfer resumes from it
+            f.flush()
+            os.fsync(f.fileno())
+
+    if response.status_code == 206:
+        expected = part.total
+    else:
+        length = response.headers.get('Content-Length')
+        encoding = response.headers.get('Content-Encoding', 'identity')
+        expected = int(length) if length and encoding == 'identity' else None
+    if expected and size < expected:
+        raise TruncatedDownload(f"Truncated body: got {size} of {expected} bytes")
+    if expected and size != expected:
+        raise DownloadError(f"Body length mismatch: got {size} of {expected} bytes")
+    with open(part.path, 'rb') as f:
+        if not is_image_header(f.read(len(PNG_SIGNATURE))):
+            raise DownloadError("Body is not a JPEG or PNG image")
+    return size, digest.hexdigest()
+
+
+def fetch_to_file(cache, send, url, destination, attempts=RESUME_ATTEMPTS, **kwargs):
+    """Stream url into destination through the HTTP cache; returns (size, sha256)
+
+    A body cut off partway is resumed with a range request for as long as
+    the attempts make progress, giving up after attempts in a row that add
+    no bytes; its .part file is then kept for later runs.
+    """
+    part = PartialDownload(destination, url)
+    with part.lock:
+        stalled = 0
+        received = 0
+        while True:
+            try:
+                return _fetch(cache, send, url, destination, part, **kwargs)
+            except INTERRUPTED:
+                if not part.resumable:
+                    raise
+                size = part.path.stat().st_size
+                stalled = 0 if size > received else stalled + 1
+                received = size
+                if stalled >= attempts:
+                    raise
+                time.sleep(RESUME_DELAY * (stalled + 1))
+
+
+def _fetch(cache, send, url, destination, part, **kwargs):
+    offset = part.resume_offset()
+    if offset:
+        headers = dict(kwargs.pop('headers', None) or {}, Range=f"bytes={offset}-")
+        # If the image changed since, the server sends all of it (200) instead of the rest
+        headers['If-Range'] = part.etag
+        response = send(url, headers=headers, stream=True, **kwargs)
+        response.cache_status = "miss"
+    else:
+        response = cache.get(send, url, stream=True, **kwargs)
+
+    if offset and (response.status_code == 416 or
+                   (response.status_code == 206 and not part.continues(response, offset))):
+        # The range no longer fits, or the server ignored If-Range for a changed image: start over
+        response.close()
+        part.discard()
+        return _fetch(cache, send, url, destination, part, **kwargs)
+
+    try:
+        response.raise_for_status()
+        if response.status_code != 206:
+            # The whole image, e.g. because it changed since the .part file was written
+            offset = 0
+        if offset:
+            print(f"Resuming {url} at {offset} of {part.total} bytes")
+        elif response.cache_status == "miss":
+            part.begin(response)
+        else:
+            part.discard()
+        size, digest = stream_to_file(response, part, offset)
+        part.finish(destination)
+    except (INTERRUPTED + (KeyboardInterrupt,)):
+        # Kept for the next attempt if the server can resume it
+        if not part.resumable:
+            part.discard()
+        raise
+    except BaseException:
+        # A bad body or an error status starts over next time
+        part.discard()
+        raise
+    finally:
+        response.close()
+        if response.cache_status != "miss":
+            # Cached bodies are streamed from an open file
+            response.raw.close()
+
+    if response.cache_status == "miss":
+        cache.store_file(url, response, destination)
+    return size, digest
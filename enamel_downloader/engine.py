@@ -0,0 +1,198 @@
+"""
+Concurrent crawl engine
+Keeps several page and image requests in flight while a token bucket per host
+caps the request rate and the number of simultaneous connections. Transient
+failures are retried under a RetryPolicy and a per-host CircuitBreaker.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+from enamel_downloader.retry import RETRY_EXCEPTIONS, CircuitBreaker, RetryPolicy
+
+_DONE = object()
+
+
+class TokenBucket:
+    """Allow `rate` acquisitions per second, with up to `burst` saved up"""
+
+    def __init__(self, rate, burst=1):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a token is available and take it"""
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class HostLimiter:
+    """Requests per second plus maximum concurrent requests for one host"""
+
+    def __init__(self, rate, burst, max_concurrency):
+        self.bucket = TokenBucket(rate, burst) if rate and rate > 0 else None
+        self.slots = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def acquire(self):
+        await self.slots.acquire()
+        try:
+            if self.bucket:
+                await self.bucket.acquire()
+        except BaseException:
+            self.slots.release()
+            raise
+
+    def release(self):
+        self.slots.release()
+
+
+class CrawlEngine:
+    """Run a blocking worker over many items with bounded concurrency
+
+    Workers run in a thread pool and issue their HTTP calls through
+    `request`, which waits on the per-host limiter owned by the event loop.
+    Outside of `run` requests go straight to the session. Either way they
+    are retried and circuit-broken per host.
+    """
+
+    def __init__(self, concurrency=8, rate=4.0, burst=4, host_concurrency=4, retry=None, breaker=None):
+        self.concurrency = max(1, concurrency)
+        self.rate = rate
+        self.burst = burst
+        self.host_concurrency = host_concurrency
+        self.retry = retry or RetryPolicy()
+        self.breaker = breaker or CircuitBreaker()
+        self.stats = {"retries": 0, "gave_up": 0}
+        self._stats_lock = threading.Lock()
+        self._loop = None
+        self._limiters = {}
+
+    def _limiter(self, host):
+        limiter = self._limiters.get(host)
+        if limiter is None:
+            limiter = HostLimiter(self.rate, self.burst, self.host_concurrency)
+            self._limiters[host] = limiter
+        return limiter
+
+    async def _acquire(self, host):
+        await self._limiter(host).acquire()
+
+    def _count(self, key):
+        with self._stats_lock:
+            self.stats[key] += 1
+
+    def _send(self, session, method, url, host, **kwargs):
+        loop = self._loop
+        if loop is None:
+            return session.request(method, url, **kwargs)
+
+        asyncio.run_coroutine_threadsafe(self._acquire(host), loop).result()
+        try:
+            return session.request(method, url, **kwargs)
+        finally:
+            try:
+                loop.call_soon_threadsafe(self._limiters[host].release)
+            except RuntimeError:
+                # The run was interrupted and its loop closed while this request was out
+                pass
+
+    def request(self, session, method, url, **kwargs):
+        """Send a request through the host limiter; safe to call from worker threads
+
+        Timeouts, connection errors and retryable statuses are retried after
+        the policy's backoff, each attempt waiting on the limiter again. When
+        retries run out the last response is returned (or the last error
+        raised); a host with an open circuit raises CircuitOpenError.
+        """
+        host = urlparse(url).netloc
+        attempt = 0
+        while True:
+            self.breaker.before_request(host)
+            try:
+                response = self._send(session, method, url, host, **kwargs)
+            except RETRY_EXCEPTIONS:
+                self.breaker.record_failure(host)
+                delay = self.retry.delay(attempt)
+                if delay is None:
+                    self._count("gave_up")
+                    raise
+            except BaseException:
+                # Neither success nor a host failure, but a half-open trial must not stay claimed forever
+                self.breaker.release(host)
+                raise
+            else:
+                if not self.retry.is_retryable(response):
+                    self.breaker.record_success(host)
+                    return response
+                self.breaker.record_failure(host)
+                delay = self.retry.delay(attempt, response)
+                if delay is None:
+                    self._count("gave_up")
+                    return response
+                response.close()
+
+            self._count("retries")
+            time.sleep(delay)
+            attempt += 1
+
+    def run(self, items, worker):
+        """Call worker(item) for every item; returns the results in input order
+
+        items may be any iterable, including a generator that is still
+        producing work while earlier items are being processed.
+        """
+        return asyncio.run(self._run(items, worker))
+
+    async def _run(self, items, worker):
+        loop = asyncio.get_running_loop()
+        self._loop = loop
+        self._limiters = {}
+        executor = ThreadPoolExecutor(max_workers=self.concurrency)
+        iterator = iter(items)
+        results = {}
+        pending = set()
+        count = 0
+
+        async def call(index, item):
+            results[index] = await loop.run_in_executor(executor, worker, item)
+
+        try:
+            while True:
+                item = await asyncio.to_thread(next, iterator, _DONE)
+                if item is _DONE:
+                    break
+                pending.add(asyncio.ensure_future(call(count, item)))
+                count += 1
+
+                if len(pending) >= self.concurrency:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        task.result()
+
+            if pending:
+                done, _ = await asyncio.wait(pending)
+                for task in done:
+                    task.result()
+        except BaseException:
+            # Interrupted, or a worker failed: waiting for the workers here would
+            # block the loop they need for the limiter, so drop the queued work
+            self._loop = None
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        self._loop = None
+        executor.shutdown(wait=True)
+
+        return [results[index] for index in range(count)]
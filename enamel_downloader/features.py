@@ -0,0 +1,276 @@
+"""
+Swatch color features
+Batch stage that loads every swatch under public/opaques,
+public/transparent_colors and public/opale_colors, downsamples it and
+computes with vectorized NumPy: its dominant colors (a small k-means), its
+mean CIELAB color and a coarse RGB histogram. Product photos sit on a plain
+frame, so pixels matching a uniform border are left out first. Images are processed on a
+process pool, and the results are stored column-wise in one array file
+(public/.cache/swatch_features.npz) that later stages read without opening
+any image. Sources whose hash has not changed since the last build are
+skipped.
+
+Requires NumPy and Pillow.
+
+    python -m enamel_downloader.features
+"""
+
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from enamel_downloader.manifest import file_sha256
+from enamel_downloader.variants import SOURCE_DIRS, SOURCE_SUFFIXES
+
+FEATURES_FILE = ".cache/swatch_features.npz"
+# Swatches are downsampled to at most this many pixels per side before any math
+SAMPLE_SIZE = 64
+DOMINANT_COLORS = 3
+KMEANS_ITERATIONS = 10
+# Levels per RGB channel of the histogram (4 -> 64 bins)
+HISTOGRAM_LEVELS = 4
+# A border whose pixels stay this close to their median is treated as a plain background,
+# and pixels within BACKGROUND_DISTANCE of it are dropped (RGB Euclidean distances)
+BORDER_SPREAD = 20
+BACKGROUND_DISTANCE = 40
+
+# sRGB (D65) to XYZ, and the D65 reference white
+_RGB_TO_XYZ = np.array([[0.4124564, 0.3575761, 0.1804375],
+                        [0.2126729, 0.7151522, 0.0721750],
+                        [0.0193339, 0.1191920, 0.9503041]])
+_WHITE = np.array([0.95047, 1.0, 1.08883])
+
+
+def rgb_to_lab(rgb):
+    """CIELAB of sRGB colors given as a (..., 3) array of 0-255 values"""
+    rgb = np.asarray(rgb, dtype=np.float64) / 255.0
+    linear = np.where(rgb <= 0.04045, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+    xyz = linear @ _RGB_TO_XYZ.T / _WHITE
+    f = np.where(xyz > 216 / 24389, np.cbrt(xyz), (24389 / 27 * xyz + 16) / 116)
+    return np.stack([116 * f[..., 1] - 16, 500 * (f[..., 0] - f[..., 1]), 200 * (f[..., 1] - f[..., 2])], axis=-1)
+
+
+def dominant_colors(pixels, k=DOMINANT_COLORS, iterations=KMEANS_ITERATIONS):
+    """k-means over an (n, 3) array of RGB pixels
+
+    Starts from the means of the k most populated cells of a coarse color
+    grid, so results are deterministic. Returns (centers, weights), sorted
+    by weight, with weights the share of pixels in each cluster.
+    """
+    pixels = pixels.astype(np.float32)
+    cells = (pixels // 32).astype(np.int64) @ np.array([64, 8, 1])
+    counts = np.bincount(cells, minlength=512)
+    top = np.argsort(counts, kind="stable")[::-1][:k]
+    top = top[counts[top] > 0]
+    centers = np.stack([pixels[cells == cell].mean(axis=0) for cell in top])
+
+    for _ in range(iterations):
+        distances = ((pixels[:, None, :] - centers[None, :, :]) ** 2).sum(axis=2)
+        labels = distances.argmin(axis=1)
+        sizes = np.bincount(labels, minlength=len(centers))
+        sums = np.stack([np.bincount(labels, weights=pixels[:, channel], minlength=len(centers))
+                         for channel in range(3)], axis=1)
+        moved = np.where(sizes[:, None] > 0, sums / np.maximum(sizes, 1)[:, None], centers)
+        if np.allclose(moved, centers, atol=0.5):
+            centers = moved
+            break
+        centers = moved
+
+    labels = ((pixels[:, None, :] - centers[None, :, :]) ** 2).sum(axis=2).argmin(axis=1)
+    weights = np.bincount(labels, minlength=len(centers)) / len(pixels)
+    order = np.argsort(weights, kind="stable")[::-1]
+    centers, weights = centers[order], weights[order]
+
+    # A swatch with fewer distinct colors than k repeats its last color at zero weight
+    if len(centers) < k:
+        centers = np.concatenate([centers, np.repeat(centers[-1:], k - len(centers), axis=0)])
+        weights = np.concatenate([weights, np.zeros(k - len(weights))])
+    return np.clip(np.rint(centers), 0, 255).astype(np.uint8), weights.astype(np.float32)
+
+
+def foreground_mask(array):
+    """Boolean (h, w) mask of the pixels of an (h, w, 3) image that are not its plain border background"""
+    border = np.concatenate([array[0], array[-1], array[1:-1, 0], array[1:-1, -1]]).astype(np.float32)
+    background = np.median(border, axis=0)
+    everything = np.ones(array.shape[:2], dtype=bool)
+    if np.percentile(np.linalg.norm(border - background, axis=1), 90) > BORDER_SPREAD:
+        return everything
+    keep = np.linalg.norm(array.astype(np.float32) - background, axis=2) > BACKGROUND_DISTANCE
+    # A swatch that is all background color (e.g. a white enamel on white) is kept whole
+    return keep if keep.mean() >= 0.05 else everything
+
+
+def foreground(array):
+    """The pixels of an (h, w, 3) image that are not its plain border background"""
+    return array[foreground_mask(array)]
+
+
+def extract_features(source):
+    """Features of one image file; runs in a worker process"""
+    with Image.open(source) as image:
+        image = image.convert("RGB")
+        image.thumbnail((SAMPLE_SIZE, SAMPLE_SIZE), Image.BILINEAR)
+        pixels = foreground(np.asarray(image, dtype=np.uint8))
+
+    dominant, weights = dominant_colors(pixels)
+    levels = (pixels.astype(np.int64) * HISTOGRAM_LEVELS) // 256
+    bins = (levels[:, 0] * HISTOGRAM_LEVELS + levels[:, 1]) * HISTOGRAM_LEVELS + levels[:, 2]
+    histogram = np.bincount(bins, minlength=HISTOGRAM_LEVELS ** 3) / len(pixels)
+    return {
+        "dominant": dominant,
+        "weights": weights,
+        "lab": rgb_to_lab(pixels).mean(axis=0).astype(np.float32),
+        "histogram": histogram.astype(np.float32),
+    }
+
+
+def hex_color(rgb):
+    return "#" + "".join(f"{int(channel):02x}" for channel in rgb)
+
+
+class SwatchFeatures:
+    """The feature file's columns; row i describes keys[i] (a path under public/)"""
+
+    COLUMNS = ("keys", "hashes", "dominant", "weights", "lab", "histogram")
+
+    def __init__(self, keys=(), hashes=(), dominant=None, weights=None, lab=None, histogram=None):
+        self.keys = np.asarray(keys, dtype=str)
+        self.hashes = np.asarray(hashes, dtype=str)
+        count = len(self.keys)
+        self.dominant = dominant if dominant is not None else np.zeros((count, DOMINANT_COLORS, 3), np.uint8)
+        self.weights = weights if weights is not None else np.zeros((count, DOMINANT_COLORS), np.float32)
+        self.lab = lab if lab is not None else np.zeros((count, 3), np.float32)
+        self.histogram = histogram if histogram is not None else \
+            np.zeros((count, HISTOGRAM_LEVELS ** 3), np.float32)
+        self.rows = {key: row for row, key in enumerate(self.keys.tolist())}
+
+    @classmethod
+    def load(cls, path):
+        """The saved features, or an empty set if the file is missing or unreadable"""
+        try:
+            with np.load(path) as data:
+                return cls(**{column: data[column] for column in cls.COLUMNS})
+        except (OSError, KeyError, ValueError):
+            return cls()
+
+    def save(self, path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = path.with_name(f".{path.name}.tmp")
+        with open(temp_file, 'wb') as f:
+            np.savez(f, **{column: getattr(self, column) for column in self.COLUMNS})
+        os.replace(temp_file, path)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __contains__(self, key):
+        return key in self.rows
+
+    def hash(self, key):
+        row = self.rows.get(key)
+        return None if row is None else str(self.hashes[row])
+
+    def row(self, key):
+        """A dict of one image's features, or None"""
+        row = self.rows.get(key)
+        if row is None:
+            return None
+        return {"dominant": self.dominant[row], "weights": self.weights[row],
+                "lab": self.lab[row], "histogram": self.histogram[row]}
+
+    def colors(self, key):
+        """Hex codes of the image's dominant colors, most common first"""
+        row = self.rows.get(key)
+        if row is None:
+            return []
+        return [hex_color(rgb) for rgb, weight in zip(self.dominant[row], self.weights[row]) if weight > 0]
+
+
+class FeatureBuilder:
+    """Compute color features for every downloaded swatch"""
+
+    def __init__(self, base_dir="public", output=None, workers=None):
+        self.base_dir = Path(base_dir)
+        self.output = Path(output) if output else self.base_dir / FEATURES_FILE
+        self.workers = workers
+        self.stats = {"sources": 0, "computed": 0, "unchanged": 0, "removed": 0, "failed": 0}
+
+    def sources(self):
+        for folder in SOURCE_DIRS:
+            directory = self.base_dir / folder
+            if not directory.is_dir():
+                continue
+            for path in sorted(directory.iterdir()):
+                if path.suffix.lower() in SOURCE_SUFFIXES and not path.name.startswith('.'):
+                    yield path
+
+    def build(self):
+        """Extract features of new and changed swatches and rewrite the feature file"""
+        previous = SwatchFeatures.load(self.output)
+        rows = {}
+        jobs = {}
+
+        for source in self.sources():
+            key = source.relative_to(self.base_dir).as_posix()
+            source_hash = file_sha256(source)
+            self.stats["sources"] += 1
+            if previous.hash(key) == source_hash:
+                rows[key] = (source_hash, previous.row(key))
+                self.stats["unchanged"] += 1
+            else:
+                jobs[key] = (source, source_hash)
+        self.stats["removed"] = len(set(previous.rows) - set(rows) - set(jobs))
+
+        print(f"Extracting color features for {len(jobs)} images ({self.stats['unchanged']} unchanged)")
+        if jobs:
+            keys = list(jobs)
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                # Swatches are small; batching keeps the pool's per-task overhead down
+                chunksize = max(1, len(keys) // ((self.workers or os.cpu_count() or 1) * 4))
+                results = pool.map(_extract_or_error, [str(jobs[key][0]) for key in keys], chunksize=chunksize)
+                for key, (features, error) in zip(keys, results):
+                    if error:
+                        print(f"Error extracting features for {key}: {error}")
+                        self.stats["failed"] += 1
+                        continue
+                    rows[key] = (jobs[key][1], features)
+                    self.stats["computed"] += 1
+
+        keys = sorted(rows)
+        features = SwatchFeatures(
+            keys=keys,
+            hashes=[rows[key][0] for key in keys],
+            dominant=np.stack([rows[key][1]["dominant"] for key in keys]) if keys else None,
+            weights=np.stack([rows[key][1]["weights"] for key in keys]) if keys else None,
+            lab=np.stack([rows[key][1]["lab"] for key in keys]) if keys else None,
+            histogram=np.stack([rows[key][1]["histogram"] for key in keys]) if keys else None,
+        )
+        features.save(self.output)
+        print(f"Color features saved to: {self.output}")
+        return self.stats
+
+
+def _extract_or_error(source):
+    # Exceptions are returned rather than raised so one bad file does not end pool.map
+    try:
+        return extract_features(source), None
+    except Exception as e:
+        return None, str(e)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Extract swatch color features")
+    parser.add_argument("--base-dir", default="public")
+    parser.add_argument("--output", help=f"feature file (default: BASE_DIR/{FEATURES_FILE})")
+    parser.add_argument("--workers", type=int)
+    args = parser.parse_args()
+    print(FeatureBuilder(args.base_dir, args.output, args.workers).build())
+
+
+if __name__ == "__main__":
+    main()
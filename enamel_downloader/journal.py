@@ -0,0 +1,91 @@
+"""
+Checkpoint journal
+An append-only JSON-lines file with one line per finished product. A run
+that is interrupted leaves its journal open, and the next run resumes it,
+skipping every product it already finished, instead of starting over. A run
+that completes writes a finish line, so the run after it starts fresh.
+"""
+
+import json
+import threading
+import time
+import uuid
+from pathlib import Path
+
+
+class CheckpointJournal:
+    """Products finished by the current (possibly interrupted) run"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.lock = threading.Lock()
+        self.run_id = None
+        self.done = {}
+        self.resumed = False
+        self.skipped = 0
+        self.file = None
+        self._load()
+
+    def _load(self):
+        if not self.path.exists():
+            return
+        with open(self.path) as f:
+            for line in f:
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    # A line cut short by the interruption
+                    continue
+                if event.get("event") == "start":
+                    self.run_id, self.done = event["run"], {}
+                elif event.get("event") == "finish":
+                    self.run_id, self.done = None, {}
+                elif event.get("event") == "item" and self.run_id:
+                    self.done[event["url"]] = event.get("outcome")
+
+    def start(self, fresh=False):
+        """Resume the open run, or start a new one (always, with fresh=True)"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.run_id and not fresh:
+            self.resumed = True
+            self.file = open(self.path, 'a', buffering=1)
+            self._write({"event": "resume", "run": self.run_id, "time": time.time(), "done": len(self.done)})
+        else:
+            self.run_id, self.done, self.resumed = uuid.uuid4().hex[:12], {}, False
+            self.file = open(self.path, 'w', buffering=1)
+            self._write({"event": "start", "run": self.run_id, "time": time.time()})
+        return self
+
+    def _write(self, event):
+        self.file.write(json.dumps(event) + "\n")
+
+    def pending(self, product_urls):
+        """Yield the product URLs this run has not finished yet
+
+        Products that failed are tried again; the interruption itself may
+        have been what failed them.
+        """
+        for url in product_urls:
+            if self.done.get(url, "failed") != "failed":
+                self.skipped += 1
+                continue
+            yield url
+
+    def record(self, url, outcome):
+        with self.lock:
+            self.done[url] = outcome
+            self._write({"event": "item", "url": url, "outcome": outcome, "time": time.time()})
+
+    def finish(self):
+        """Mark the run complete; the next start() begins a new run"""
+        with self.lock:
+            self._write({"event": "finish", "run": self.run_id, "time": time.time(), "items": len(self.done)})
+            self.file.close()
+            self.file = None
+
+    def close(self):
+        """Stop writing without finishing, leaving the run resumable"""
+        with self.lock:
+            if self.file:
+                self.file.close()
+                self.file = None
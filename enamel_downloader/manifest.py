@@ -0,0 +1,114 @@
+"""
+Download manifest
+Remembers, for every product URL, which image it resolved to, the image's
+content hash and size, its enamel type and when it was last checked, so a
+refresh only does work for new URLs, changed images and stale entries
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+
+# Columns stored per product URL, besides the URL itself
+FIELDS = ("color_reference", "enamel_type", "image_url", "filename", "content_hash", "size", "checked_at")
+
+
+def file_sha256(path):
+    """Hash a file on disk in chunks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(64 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class Manifest:
+    """SQLite-backed record of downloaded products"""
+
+    def __init__(self, path, ttl=7 * 24 * 3600):
+        self.path = str(path)
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(self.path, check_same_thread=False)
+        self.db.row_factory = sqlite3.Row
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS products ("
+            "product_url TEXT PRIMARY KEY, color_reference TEXT, enamel_type TEXT, "
+            "image_url TEXT, filename TEXT, content_hash TEXT, size INTEGER, checked_at REAL)"
+        )
+        # image_is_fresh looks products up by their image
+        self.db.execute("CREATE INDEX IF NOT EXISTS products_image_url ON products (image_url)")
+        self.db.commit()
+        self.stats = {"new": 0, "stale": 0, "fresh": 0, "changed": 0, "unchanged": 0}
+
+    def get(self, product_url):
+        with self.lock:
+            row = self.db.execute("SELECT * FROM products WHERE product_url = ?", (product_url,)).fetchone()
+        return dict(row) if row else None
+
+    def entries(self):
+        """All manifest rows, in URL order"""
+        with self.lock:
+            rows = self.db.execute("SELECT * FROM products ORDER BY product_url").fetchall()
+        return [dict(row) for row in rows]
+
+    def is_fresh(self, entry, now=None):
+        """True if the entry was checked within the TTL and its file is still there"""
+        if not entry or not entry.get("checked_at"):
+            return False
+        now = now if now is not None else time.time()
+        if now - entry["checked_at"] > self.ttl:
+            return False
+        filename = entry.get("filename")
+        return bool(filename) and os.path.exists(filename)
+
+    def image_is_fresh(self, image_url, now=None):
+        """True if a product resolving to image_url was checked within the TTL and its file is still there"""
+        with self.lock:
+            rows = self.db.execute("SELECT * FROM products WHERE image_url = ?", (image_url,)).fetchall()
+        return any(self.is_fresh(dict(row), now) for row in rows)
+
+    def classify(self, product_url, now=None):
+        """Return "new", "stale" or "fresh" for one product URL and count it"""
+        entry = self.get(product_url)
+        if entry is None:
+            status = "new"
+        elif self.is_fresh(entry, now):
+            status = "fresh"
+        else:
+            status = "stale"
+        with self.lock:
+            self.stats[status] += 1
+        return status
+
+    def record(self, product_url, **fields):
+        """Insert or update a product's row; content_hash changes are counted"""
+        fields.setdefault("checked_at", time.time())
+        unknown = set(fields) - set(FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown manifest fields: {sorted(unknown)}")
+
+        with self.lock:
+            row = self.db.execute("SELECT content_hash FROM products WHERE product_url = ?",
+                                  (product_url,)).fetchone()
+            if row and "content_hash" in fields and row["content_hash"]:
+                key = "unchanged" if row["content_hash"] == fields["content_hash"] else "changed"
+                self.stats[key] += 1
+
+            if row:
+                assignments = ", ".join(f"{name} = ?" for name in fields)
+                self.db.execute(f"UPDATE products SET {assignments} WHERE product_url = ?",
+                                (*fields.values(), product_url))
+            else:
+                names = ", ".join(("product_url",) + tuple(fields))
+                marks = ", ".join("?" * (len(fields) + 1))
+                self.db.execute(f"INSERT INTO products ({names}) VALUES ({marks})",
+                                (product_url, *fields.values()))
+            self.db.commit()
+
+    def close(self):
+        with self.lock:
+            self.db.close()
+
@@ -0,0 +1,147 @@
+"""
+Per-stage timing
+The downloaders time each product's hot path in five stages (fetch, parse,
+select_image, download, write) and record latency, bytes and errors per
+stage. The summary (p50/p95/p99 latency, bytes and throughput) goes into the
+JSON reports and can be exported in the Prometheus text format; with an
+event log every observation is also appended as one JSON line, plus a
+summary line per run, so refreshes can be charted over time.
+"""
+
+import json
+import math
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+
+STAGES = ("fetch", "parse", "select_image", "download", "write")
+QUANTILES = (0.5, 0.95, 0.99)
+
+
+def percentile(sorted_values, q):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(q * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class StageMetrics:
+    """Thread-safe latency and byte counters per pipeline stage"""
+
+    def __init__(self, event_log=None, run_id=None):
+        self.run_id = run_id or uuid.uuid4().hex[:12]
+        self.started = time.time()
+        self.lock = threading.Lock()
+        self.durations = {stage: [] for stage in STAGES}
+        self.bytes = {stage: 0 for stage in STAGES}
+        self.errors = {stage: 0 for stage in STAGES}
+        self.event_log = None
+        if event_log:
+            Path(event_log).parent.mkdir(parents=True, exist_ok=True)
+            self.event_log = open(event_log, 'a', buffering=1)
+
+    @contextmanager
+    def time(self, stage, **fields):
+        """Time the block as one observation of stage
+
+        Yields a dict; set "bytes" in it to count bytes for the stage. An
+        exception is recorded as an error and re-raised.
+        """
+        observation = {"bytes": 0}
+        start = time.perf_counter()
+        try:
+            yield observation
+        except BaseException:
+            self.observe(stage, time.perf_counter() - start, observation["bytes"], ok=False, **fields)
+            raise
+        self.observe(stage, time.perf_counter() - start, observation["bytes"], **fields)
+
+    def observe(self, stage, seconds, nbytes=0, ok=True, **fields):
+        with self.lock:
+            self.durations.setdefault(stage, []).append(seconds)
+            self.bytes[stage] = self.bytes.get(stage, 0) + (nbytes or 0)
+            if not ok:
+                self.errors[stage] = self.errors.get(stage, 0) + 1
+            if self.event_log:
+                self.event_log.write(json.dumps(dict(
+                    fields, event="stage", run=self.run_id, time=time.time(), stage=stage,
+                    seconds=round(seconds, 6), bytes=nbytes or 0, ok=ok)) + "\n")
+
+    def state(self):
+        """The raw observations, e.g. to hand a worker process's metrics to merge()"""
+        with self.lock:
+            return {"durations": {stage: list(values) for stage, values in self.durations.items()},
+                    "bytes": dict(self.bytes), "errors": dict(self.errors)}
+
+    def merge(self, state):
+        """Add the observations of another StageMetrics' state()"""
+        with self.lock:
+            for stage, values in state["durations"].items():
+                self.durations.setdefault(stage, []).extend(values)
+            for stage, nbytes in state["bytes"].items():
+                self.bytes[stage] = self.bytes.get(stage, 0) + nbytes
+            for stage, errors in state["errors"].items():
+                self.errors[stage] = self.errors.get(stage, 0) + errors
+
+    def report(self):
+        """Count, latency percentiles, bytes and throughput per stage"""
+        with self.lock:
+            durations = {stage: sorted(values) for stage, values in self.durations.items()}
+            nbytes = dict(self.bytes)
+            errors = dict(self.errors)
+
+        report = {}
+        for stage, values in durations.items():
+            total = sum(values)
+            report[stage] = {
+                "count": len(values),
+                "errors": errors.get(stage, 0),
+                "total_seconds": round(total, 6),
+                **{f"p{round(q * 100)}": round(percentile(values, q), 6) for q in QUANTILES},
+                "max": round(values[-1], 6) if values else 0.0,
+                "bytes": nbytes.get(stage, 0),
+                "bytes_per_second": round(nbytes.get(stage, 0) / total, 1) if total else 0.0,
+            }
+        return report
+
+    def prometheus(self, prefix="enamel_downloader", labels=None):
+        """The report in the Prometheus text exposition format"""
+        report = self.report()
+        extra = "".join(f',{key}="{value}"' for key, value in (labels or {}).items())
+        lines = [
+            f"# HELP {prefix}_stage_seconds Time spent per product in each pipeline stage",
+            f"# TYPE {prefix}_stage_seconds summary",
+        ]
+        for stage, stats in report.items():
+            for q in QUANTILES:
+                lines.append(f'{prefix}_stage_seconds{{stage="{stage}",quantile="{q}"{extra}}} '
+                             f'{stats[f"p{round(q * 100)}"]}')
+            lines.append(f'{prefix}_stage_seconds_sum{{stage="{stage}"{extra}}} {stats["total_seconds"]}')
+            lines.append(f'{prefix}_stage_seconds_count{{stage="{stage}"{extra}}} {stats["count"]}')
+        for name, key, help_text in [("stage_bytes_total", "bytes", "Bytes handled in each pipeline stage"),
+                                     ("stage_errors_total", "errors", "Failed observations per pipeline stage")]:
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} counter")
+            for stage, stats in report.items():
+                lines.append(f'{prefix}_{name}{{stage="{stage}"{extra}}} {stats[key]}')
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path, **kwargs):
+        """Write the text format to path, e.g. for node_exporter's textfile collector"""
+        path = Path(path)
+        temp_file = path.with_suffix(".tmp")
+        with open(temp_file, 'w') as f:
+            f.write(self.prometheus(**kwargs))
+        temp_file.replace(path)
+
+    def close(self):
+        """Append the run summary to the event log and close it"""
+        with self.lock:
+            event_log, self.event_log = self.event_log, None
+        if event_log:
+            event_log.write(json.dumps({"event": "run", "run": self.run_id, "started": self.started,
+                                        "finished": time.time(), "stages": self.report()}) + "\n")
+            event_log.close()
@@ -0,0 +1,288 @@
+"""
+Local mock of the emaux-soyer.com catalog
+Serves generated Magento-style listing pages, product pages and swatch
+images (cache renditions and their larger originals, with HEAD and range
+support) from a local HTTP server, so the downloaders can be run end to end
+without touching the live site. Catalog size and per-request latency are
+configurable, a share of image responses can be cut off halfway (--drop)
+to exercise resumable downloads, and a share of requests can be answered
+503 (--errors) or left hanging (--stalls) to exercise retries and the
+circuit breaker.
+
+Requires Pillow.
+
+    python -m enamel_downloader.mocksite --products 2000 --latency 0.05
+"""
+
+import argparse
+import io
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from PIL import Image
+
+COLORS = ("bleu", "vert", "rouge", "jaune", "noir", "blanc", "turquoise", "rose", "orange", "gris")
+FORMS = ("en-poudre", "en-grains", "en-morceaux")
+# Pages link Magento cache renditions of IMAGE_SIZE; the originals behind them are ORIGINAL_SIZE
+IMAGE_SIZE = 96
+ORIGINAL_SIZE = 384
+# Every page and image is as old as the catalog
+LAST_MODIFIED = "Mon, 01 Jan 2024 00:00:00 GMT"
+
+
+class MockCatalog:
+    """A deterministic catalog of `products` enamel products"""
+
+    def __init__(self, products=200, per_page=48, latency=0.0, jitter=0.0, seed=0, drop=0.0, errors=0.0,
+                 stalls=0.0, stall_time=5.0):
+        self.products = products
+        self.per_page = per_page
+        self.latency = latency
+        self.jitter = jitter
+        self.seed = seed
+        # Share of image bodies whose connection is dropped halfway through
+        self.drop = drop
+        self.dropped = 0
+        # Share of requests answered 503, and of requests that hang for stall_time and are then closed unanswered
+        self.errors = errors
+        self.stalls = stalls
+        self.stall_time = stall_time
+        # While down, every request is answered 503
+        self.down = False
+        self.failed = 0
+        self.stalled = 0
+        self.images = {}
+        self.lock = threading.Lock()
+        self.rng = random.Random(seed)
+        self.requests = 0
+        self.image_requests = 0
+        # Image body bytes written, including the halves of dropped bodies
+        self.image_bytes = 0
+
+    @property
+    def pages(self):
+        return max(1, -(-self.products // self.per_page))
+
+    def slug(self, number):
+        return f"{COLORS[number % len(COLORS)]}-{number}-{FORMS[number % len(FORMS)]}"
+
+    def product_path(self, number):
+        return f"/en/{self.slug(number)}.html"
+
+    def image_path(self, number):
+        return f"/media/catalog/product/cache/0f831c1845fc143d00d6d1ebc49f446a/{number % 10}/{number}.jpg"
+
+    def listing_page(self, page):
+        first = (page - 1) * self.per_page + 1
+        numbers = range(first, min(self.products, first + self.per_page - 1) + 1)
+        items = "".join(
+            f'<li class="item product product-item"><a class="product-item-photo" href="{self.product_path(n)}">'
+            f'<img class="product-image-photo" src="{self.image_path(n)}"></a>'
+            f'<strong class="product-item-name"><a class="product-item-link" href="{self.product_path(n)}">'
+            f'{self.slug(n)}</a></strong></li>'
+            for n in numbers)
+        pages = ""
+        if page < self.pages:
+            pages = f'<ul class="pages-items"><li class="item pages-item-next"><a href="/en/emaux.html?p={page + 1}">' \
+                    f'Next</a></li></ul>'
+        return (f'<html><head><title>Emaux - Page {page}</title></head><body>'
+                f'<div class="products wrapper grid products-grid"><ol class="products list items">{items}</ol></div>'
+                f'{pages}</body></html>')
+
+    def product_page(self, number):
+        title = self.slug(number).replace("-", " ").title()
+        return (f'<html><head><title>{title}</title>'
+                f'<meta property="og:image" content="{self.image_path(number)}"></head><body>'
+                f'<header><img class="logo" src="/static/logo.png"></header>'
+                f'<h1 class="page-title"><span>{title}</span></h1>'
+                f'<div class="product media"><div class="gallery-placeholder">'
+                f'<img class="fotorama__img product-image-main" src="{self.image_path(number)}" alt="Enamel {number}">'
+                f'</div></div><div class="product-info-main"><p>Enamel {number}, 150 g.</p></div>'
+                f'<footer><img src="/static/icons/footer.png"></footer></body></html>')
+
+    def image(self, number, original=False):
+        """A swatch whose pattern and color are unique to the product number"""
+        with self.lock:
+            cached = self.images.get((number, original))
+        if cached:
+            return cached
+
+        rng = random.Random(self.seed * 1_000_003 + number)
+        base = tuple(rng.randrange(256) for _ in range(3))
+        image = Image.new("RGB", (8, 8))
+        image.putdata([tuple(min(255, c + rng.randrange(-60, 60)) if rng.random() < 0.5 else c for c in base)
+                       for _ in range(64)])
+        buffer = io.BytesIO()
+        size = ORIGINAL_SIZE if original else IMAGE_SIZE
+        image.resize((size, size), Image.NEAREST).save(buffer, "JPEG", quality=85)
+        body = buffer.getvalue()
+        with self.lock:
+            self.images[(number, original)] = body
+        return body
+
+    def should_drop(self):
+        with self.lock:
+            if self.drop and self.rng.random() < self.drop:
+                self.dropped += 1
+                return True
+        return False
+
+    def fault(self):
+        """"503", "stall" or None for the request being handled"""
+        with self.lock:
+            if self.down:
+                self.failed += 1
+                return "503"
+            roll = self.rng.random() if self.errors or self.stalls else 1.0
+            if roll < self.errors:
+                self.failed += 1
+                return "503"
+            if roll < self.errors + self.stalls:
+                self.stalled += 1
+                return "stall"
+        return None
+
+    def delay(self):
+        with self.lock:
+            self.requests += 1
+            extra = self.rng.uniform(0, self.jitter) if self.jitter else 0.0
+        if self.latency or extra:
+            time.sleep(self.latency + extra)
+
+
+class MockSiteHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    catalog = None
+    head_only = False
+
+    def do_GET(self):
+        self.catalog.delay()
+        fault = self.catalog.fault()
+        if fault == "stall":
+            time.sleep(self.catalog.stall_time)
+            self.close_connection = True
+            return
+        if fault == "503":
+            return self.respond(b"Service unavailable", "text/plain", status=503)
+        parts = urlsplit(self.path)
+        path = parts.path
+
+        if path == "/en/emaux.html":
+            page = int(parse_qs(parts.query).get("p", ["1"])[0])
+            return self.respond(self.catalog.listing_page(page).encode(), "text/html; charset=UTF-8")
+
+        number = self.product_number(path)
+        if number is None:
+            return self.respond(b"Not found", "text/plain", status=404)
+        if path.startswith("/media/"):
+            with self.catalog.lock:
+                self.catalog.image_requests += 1
+            original = "/cache/" not in path
+            return self.respond(self.catalog.image(number, original), "image/jpeg",
+                                etag=f'"img-{number}{"-orig" if original else ""}"', ranges=True)
+        return self.respond(self.catalog.product_page(number).encode(), "text/html; charset=UTF-8",
+                            etag=f'"page-{number}"')
+
+    def do_HEAD(self):
+        self.head_only = True
+        try:
+            self.do_GET()
+        finally:
+            self.head_only = False
+
+    def product_number(self, path):
+        if path.startswith("/media/") and path.endswith(".jpg"):
+            stem = path.rsplit("/", 1)[-1][:-4]
+        elif path.startswith("/en/") and path.endswith(".html"):
+            parts = path[4:-5].split("-")
+            stem = parts[1] if len(parts) > 1 else ""
+        else:
+            return None
+        if not stem.isdigit() or not 1 <= int(stem) <= self.catalog.products:
+            return None
+        number = int(stem)
+        return number if path.startswith("/media/") or path == self.catalog.product_path(number) else None
+
+    def respond(self, body, content_type, status=200, etag=None, ranges=False):
+        if_none_match = self.headers.get("If-None-Match")
+        if etag and (if_none_match == etag or
+                     if_none_match is None and self.headers.get("If-Modified-Since") == LAST_MODIFIED):
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        total = len(body)
+        match = re.fullmatch(r"bytes=(\d+)-(\d*)", self.headers.get("Range", "")) if ranges else None
+        if_range = self.headers.get("If-Range")
+        if match and status == 200 and int(match.group(1)) < total and if_range in (None, etag):
+            start = int(match.group(1))
+            end = min(int(match.group(2)), total - 1) if match.group(2) else total - 1
+            status, body = 206, body[start:end + 1]
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        if ranges:
+            self.send_header("Accept-Ranges", "bytes")
+        if status == 206:
+            self.send_header("Content-Range", f"bytes {start}-{end}/{total}")
+        if etag:
+            self.send_header("ETag", etag)
+            self.send_header("Last-Modified", LAST_MODIFIED)
+        self.end_headers()
+        if self.head_only:
+            return
+        if ranges and len(body) > 1 and self.catalog.should_drop():
+            # A flaky link: half the body, then the connection goes away
+            body = body[:len(body) // 2]
+            self.close_connection = True
+        if ranges:
+            with self.catalog.lock:
+                self.catalog.image_bytes += len(body)
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def serve(catalog, host="127.0.0.1", port=0):
+    """Start the mock site in a background thread; returns the server"""
+    handler = type("BoundMockSiteHandler", (MockSiteHandler,), {"catalog": catalog})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def listing_url(server):
+    return f"http://{server.server_address[0]}:{server.server_port}/en/emaux.html"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a mock emaux-soyer catalog")
+    parser.add_argument("--products", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="random extra seconds, up to this much")
+    parser.add_argument("--drop", type=float, default=0.0, help="share of image bodies cut off halfway")
+    parser.add_argument("--errors", type=float, default=0.0, help="share of requests answered 503")
+    parser.add_argument("--stalls", type=float, default=0.0, help="share of requests left hanging")
+    parser.add_argument("--stall-time", type=float, default=5.0, help="seconds a stalled request hangs")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args()
+
+    server = serve(MockCatalog(args.products, latency=args.latency, jitter=args.jitter, drop=args.drop,
+                               errors=args.errors, stalls=args.stalls, stall_time=args.stall_time), port=args.port)
+    print(f"Mock catalog of {args.products} products at {listing_url(server)}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Parsed product pages
+Fetch a product page once, parse it once, and read everything from the result
+"""
+
+from enamel_downloader import parsers
+
+
+class ParsedPage:
+    """Title, candidate images and metadata extracted from one product page"""
+
+    def __init__(self, url, title="", heading="", images=None, candidates=None, metadata=None):
+        self.url = url
+        self.title = title
+        self.heading = heading
+        # Attribute dicts for every <img> on the page, in document order
+        self.images = images or []
+        # Attribute dicts for images matched by the caller's selectors, in selector order
+        self.candidates = candidates or []
+        self.metadata = metadata or {}
+
+    @property
+    def display_title(self):
+        """Product heading if present, otherwise the <title> text"""
+        return self.heading or self.title
+
+    @classmethod
+    def from_html(cls, url, html, image_selectors=(), backend=None):
+        """Parse raw page HTML, collecting images matched by image_selectors"""
+        data = parsers.parse(html, backend)
+
+        candidates = []
+        seen = set()
+        for selector in image_selectors:
+            matches = parsers.compile_selector(selector)
+            for index, (attrs, ancestors) in enumerate(data.images):
+                if index not in seen and matches(attrs, ancestors):
+                    seen.add(index)
+                    candidates.append(attrs)
+
+        return cls(
+            url,
+            title=data.title,
+            heading=data.heading,
+            images=[attrs for attrs, _ in data.images],
+            candidates=candidates,
+            metadata=data.metadata,
+        )
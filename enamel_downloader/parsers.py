@@ -0,0 +1,197 @@
+"""
+Product page parser backends
+Product pages only matter for their title, heading, meta tags and images, so
+instead of building a full tree each backend collects exactly those in one
+pass, remembering the classes of each image's ancestors for selectors like
+".product-media img".
+
+Backends, fastest first: selectolax (if installed), lxml (if installed), and
+the standard library's html.parser as the fallback.
+"""
+
+import re
+from html.parser import HTMLParser
+
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as SelectolaxParser
+except ImportError:
+    try:
+        # selectolax < 0.3.13 only ships the Modest backend
+        from selectolax.parser import HTMLParser as SelectolaxParser
+    except ImportError:
+        SelectolaxParser = None
+
+# Elements that never have a closing tag
+VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "param",
+             "source", "track", "wbr"}
+TEXT_TAGS = ("title", "h1")
+
+
+class PageData:
+    """What a backend extracts from a product page"""
+
+    def __init__(self):
+        self.title = ""
+        self.heading = ""
+        self.metadata = {}
+        # (attribute dict, frozenset of ancestor classes) per <img>, in document order
+        self.images = []
+
+
+class _Collector:
+    """Receives start/end/data events and keeps only what PageData needs
+
+    Works both as an lxml parser target and behind the stdlib HTMLParser.
+    """
+
+    def __init__(self):
+        self.page = PageData()
+        self.stack = []
+        self.text_tag = None
+        self.text = []
+
+    def start(self, tag, attrs):
+        tag = tag.lower()
+        attrs = dict(attrs)
+        if tag == "img":
+            classes = frozenset(c for _, element_classes in self.stack for c in element_classes)
+            self.page.images.append(({k: v or "" for k, v in attrs.items()}, classes))
+        elif tag == "meta":
+            key = attrs.get("property") or attrs.get("name")
+            if key and attrs.get("content"):
+                self.page.metadata[key] = attrs["content"]
+        elif tag in TEXT_TAGS and self.text_tag is None and not getattr(self.page, _text_field(tag)):
+            self.text_tag = tag
+            self.text = []
+
+        if tag not in VOID_TAGS:
+            self.stack.append((tag, tuple((attrs.get("class") or "").split())))
+
+    def end(self, tag):
+        tag = tag.lower()
+        if tag == self.text_tag:
+            setattr(self.page, _text_field(tag), "".join(self.text).strip())
+            self.text_tag = None
+        # Pop back to the matching element; stray end tags are ignored
+        for index in range(len(self.stack) - 1, -1, -1):
+            if self.stack[index][0] == tag:
+                del self.stack[index:]
+                break
+
+    def data(self, text):
+        if self.text_tag:
+            self.text.append(text)
+
+    def close(self):
+        return self.page
+
+
+def _text_field(tag):
+    return "title" if tag == "title" else "heading"
+
+
+class _StdlibParser(HTMLParser):
+    def __init__(self, collector):
+        super().__init__(convert_charrefs=True)
+        self.collector = collector
+
+    def handle_starttag(self, tag, attrs):
+        self.collector.start(tag, attrs)
+
+    def handle_startendtag(self, tag, attrs):
+        self.collector.start(tag, attrs)
+        if tag.lower() not in VOID_TAGS:
+            self.collector.end(tag)
+
+    def handle_endtag(self, tag):
+        self.collector.end(tag)
+
+    def handle_data(self, data):
+        self.collector.data(data)
+
+
+def _as_text(html):
+    return html.decode("utf-8", errors="replace") if isinstance(html, bytes) else html
+
+
+def parse_stdlib(html):
+    collector = _Collector()
+    parser = _StdlibParser(collector)
+    parser.feed(_as_text(html))
+    parser.close()
+    return collector.close()
+
+
+def parse_lxml(html):
+    collector = _Collector()
+    parser = etree.HTMLParser(target=collector, encoding="utf-8" if isinstance(html, bytes) else None)
+    return etree.fromstring(html, parser) if html else collector.close()
+
+
+def parse_selectolax(html):
+    tree = SelectolaxParser(_as_text(html))
+    data = PageData()
+
+    title = tree.css_first("title")
+    heading = tree.css_first("h1")
+    data.title = title.text(strip=True) if title else ""
+    data.heading = heading.text(strip=True) if heading else ""
+
+    for meta in tree.css("meta"):
+        attrs = meta.attributes
+        key = attrs.get("property") or attrs.get("name")
+        if key and attrs.get("content"):
+            data.metadata[key] = attrs["content"]
+
+    for img in tree.css("img"):
+        classes = set()
+        node = img.parent
+        while node is not None:
+            classes.update((node.attributes.get("class") or "").split())
+            node = node.parent
+        data.images.append(({k: v or "" for k, v in img.attributes.items()}, frozenset(classes)))
+    return data
+
+
+BACKENDS = {"html.parser": parse_stdlib}
+if etree is not None:
+    BACKENDS["lxml"] = parse_lxml
+if SelectolaxParser is not None:
+    BACKENDS["selectolax"] = parse_selectolax
+
+DEFAULT_BACKEND = next(name for name in ("selectolax", "lxml", "html.parser") if name in BACKENDS)
+
+
+def parse(html, backend=None):
+    """Extract title, heading, meta tags and images with the chosen backend"""
+    return BACKENDS[backend or DEFAULT_BACKEND](html)
+
+
+# The simple selector forms the downloaders use: "img.cls", ".cls img",
+# ".cls" and "img[attr*=\"text\"]"
+_SELECTOR = re.compile(
+    r'^(?:\.(?P<ancestor>[\w-]+)\s+img'
+    r'|(?:img)?\.(?P<own>[\w-]+)'
+    r'|img\[(?P<attr>[\w-]+)\*="(?P<text>[^"]*)"\])$'
+)
+
+
+def compile_selector(selector):
+    """Turn a simple CSS image selector into a predicate on (attrs, ancestor classes)"""
+    match = _SELECTOR.match(selector.strip())
+    if not match:
+        raise ValueError(f"Unsupported image selector: {selector!r}")
+
+    if match.group("ancestor"):
+        name = match.group("ancestor")
+        return lambda attrs, ancestors: name in ancestors
+    if match.group("own"):
+        name = match.group("own")
+        return lambda attrs, ancestors: name in attrs.get("class", "").split()
+    attr, text = match.group("attr"), match.group("text")
+    return lambda attrs, ancestors: text in attrs.get(attr, "")
@@ -0,0 +1,212 @@
+"""
+Connection pools
+Product pages and images are fetched over separate keep-alive sessions, each
+with a mounted adapter whose pool is sized for the crawl's concurrency, so
+concurrent workers reuse connections instead of paying TCP and TLS setup per
+request. Adapters count the connections they open, which shows up in the
+reports as new versus reused connections.
+
+HTTP/2 is optional and needs httpx with the http2 extra; without it the
+standard requests/urllib3 HTTP/1.1 pools are used.
+"""
+
+import threading
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+MEDIA_SUFFIXES = (".jpg", ".jpeg", ".png", ".gif", ".webp", ".svg")
+
+
+def is_media_url(url):
+    """Images and anything under Magento's /media/ tree"""
+    path = urlsplit(url).path.lower()
+    return "/media/" in path or path.endswith(MEDIA_SUFFIXES)
+
+
+class ConnectionCounter:
+    """Requests sent and connections opened by one adapter"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.stats = {"requests": 0, "new_connections": 0}
+
+    def count(self, key):
+        with self.lock:
+            self.stats[key] += 1
+
+    def report(self):
+        with self.lock:
+            stats = dict(self.stats)
+        stats["reused_connections"] = max(0, stats["requests"] - stats["new_connections"])
+        return stats
+
+
+class CountingHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that counts requests and the connections urllib3 opens for them"""
+
+    def __init__(self, pool_connections=10, pool_maxsize=10, **kwargs):
+        self.counter = ConnectionCounter()
+        super().__init__(pool_connections=pool_connections, pool_maxsize=pool_maxsize, **kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        count = self.counter.count
+
+        # urllib3 reconnects pooled connection objects in place, so count socket connects, not objects
+        class CountingHTTPConnection(HTTPConnection):
+            def connect(self):
+                count("new_connections")
+                super().connect()
+
+        class CountingHTTPSConnection(HTTPSConnection):
+            def connect(self):
+                count("new_connections")
+                super().connect()
+
+        class CountingHTTPPool(HTTPConnectionPool):
+            ConnectionCls = CountingHTTPConnection
+
+        class CountingHTTPSPool(HTTPSConnectionPool):
+            ConnectionCls = CountingHTTPSConnection
+
+        self.poolmanager.pool_classes_by_scheme = {"http": CountingHTTPPool, "https": CountingHTTPSPool}
+
+    def send(self, request, **kwargs):
+        self.counter.count("requests")
+        return super().send(request, **kwargs)
+
+
+def _requests_error(exc):
+    """The requests exception a body read error maps to, so callers see one set of exception types"""
+    if isinstance(exc, httpx.RemoteProtocolError):
+        # The server broke off or garbled the body, as urllib3's ProtocolError does for requests
+        return requests.exceptions.ChunkedEncodingError(exc)
+    return requests.ConnectionError(exc)
+
+
+class _HttpxBody:
+    """File-like view of a streamed httpx response, for requests' iter_content"""
+
+    def __init__(self, response):
+        self.response = response
+        self.chunks = response.iter_bytes()
+        self.buffer = b''
+        # A transport error hit mid-body, raised once the bytes read before it are handed out
+        self.error = None
+
+    def read(self, size=-1):
+        while self.error is None and (size < 0 or len(self.buffer) < size):
+            try:
+                chunk = next(self.chunks, None)
+            except httpx.TransportError as exc:
+                self.error = _requests_error(exc)
+                break
+            if chunk is None:
+                break
+            self.buffer += chunk
+        if self.error is not None and not self.buffer:
+            raise self.error
+        if size < 0:
+            size = len(self.buffer)
+        data, self.buffer = self.buffer[:size], self.buffer[size:]
+        return data
+
+    def close(self):
+        self.response.close()
+
+
+class Http2Adapter(BaseAdapter):
+    """Transport adapter that sends requests through an HTTP/2 httpx client"""
+
+    def __init__(self, pool_maxsize=10):
+        if httpx is None:
+            raise RuntimeError("HTTP/2 needs httpx: pip install 'httpx[http2]'")
+        super().__init__()
+        self.counter = ConnectionCounter()
+        self.lock = threading.Lock()
+        self.client = httpx.Client(http2=True, follow_redirects=False, limits=httpx.Limits(
+            max_connections=pool_maxsize, max_keepalive_connections=pool_maxsize))
+        # Network streams seen so far; a stream not seen before is a new connection
+        self.streams = {}
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        self.counter.count("requests")
+        if isinstance(timeout, tuple):
+            timeout = httpx.Timeout(timeout[1], connect=timeout[0])
+        try:
+            # Connection headers are hop-by-hop and not allowed in HTTP/2
+            headers = {key: value for key, value in request.headers.items() if key.lower() != "connection"}
+            sent = self.client.send(self.client.build_request(
+                request.method, request.url, headers=headers, content=request.body, timeout=timeout), stream=True)
+        except httpx.TimeoutException as e:
+            raise requests.Timeout(e, request=request)
+        except httpx.TransportError as e:
+            raise requests.ConnectionError(e, request=request)
+
+        network_stream = sent.extensions.get("network_stream")
+        if network_stream is not None:
+            with self.lock:
+                new = id(network_stream) not in self.streams
+                self.streams[id(network_stream)] = network_stream
+            if new:
+                self.counter.count("new_connections")
+
+        response = requests.Response()
+        response.status_code = sent.status_code
+        response.headers = CaseInsensitiveDict(sent.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.reason = sent.reason_phrase
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        # httpx has already decoded any Content-Encoding, so the encoded length no longer applies
+        if response.headers.pop("Content-Encoding", None):
+            response.headers.pop("Content-Length", None)
+        response.raw = _HttpxBody(sent)
+        return response
+
+    def close(self):
+        self.client.close()
+
+
+class ConnectionPools:
+    """One keep-alive session for HTML pages and one for media"""
+
+    def __init__(self, pool_size=10, media_pool_size=None, headers=None, http2=False):
+        self.adapters = {}
+        self.html = self._session("html", pool_size, headers, http2)
+        self.media = self._session("media", media_pool_size or pool_size, headers, http2)
+
+    def _session(self, name, pool_size, headers, http2):
+        session = requests.Session()
+        session.headers.update(headers or {})
+        if http2:
+            adapter = Http2Adapter(pool_maxsize=pool_size)
+        else:
+            # pool_maxsize is connections kept per host; workers beyond it would open and drop extras
+            adapter = CountingHTTPAdapter(pool_maxsize=pool_size)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        self.adapters[name] = adapter
+        return session
+
+    def session_for(self, url):
+        return self.media if is_media_url(url) else self.html
+
+    def stats(self):
+        return {name: adapter.counter.report() for name, adapter in self.adapters.items()}
+
+    def close(self):
+        self.html.close()
+        self.media.close()
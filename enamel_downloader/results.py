@@ -0,0 +1,148 @@
+"""
+Streaming results log
+Each processed product is appended to a JSON-lines file as soon as it
+finishes instead of being held in memory until the end of the run, so a
+crash still leaves every finished result on disk and other tools can tail
+the file to follow a long run. The JSON reports are built by reading the
+log back as a stream (see write_report), never holding the results at once.
+
+A log is truncated by the first write of a new run; resume() keeps the
+records of an interrupted run so its report covers both parts. A product
+processed in both parts (failed, then retried) is reported by its last
+record only.
+"""
+
+import json
+import threading
+import time
+import types
+from pathlib import Path
+
+
+class ResultLog:
+    """Thread-safe, append-only JSON-lines file of product results"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.lock = threading.Lock()
+        self.file = None
+        self.append = False
+
+    def resume(self):
+        """Keep the records already in the log instead of starting over"""
+        self.append = True
+
+    def write(self, record):
+        line = json.dumps(dict(record, time=round(time.time(), 3)))
+        with self.lock:
+            if self.file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self.file = open(self.path, 'a' if self.append else 'w', buffering=1)
+                self.append = True
+                # Sequence numbers restart with every run, so records sort per segment
+                self.file.write(json.dumps({"event": "start", "time": round(time.time(), 3)}) + "\n")
+            self.file.write(line + "\n")
+
+    def close(self):
+        with self.lock:
+            if self.file:
+                self.file.close()
+                self.file = None
+
+    def _lines(self):
+        """(segment, offset, record) for the last readable line of every product, streamed"""
+        if not self.path.exists():
+            return
+        # Offset of each product's last record; earlier ones were superseded by a retry
+        last = {}
+        for _, offset, record in self._all_lines():
+            if record.get("product_url"):
+                last[record["product_url"]] = offset
+        for segment, offset, record in self._all_lines():
+            if last.get(record.get("product_url"), offset) == offset:
+                yield segment, offset, record
+
+    def _all_lines(self):
+        """(segment, offset, record) for every readable line, streamed"""
+        segment = 0
+        offset = 0
+        with open(self.path, 'rb') as f:
+            for line in f:
+                start, offset = offset, offset + len(line)
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # A line cut short by a crash
+                    continue
+                if record.get("event") == "start":
+                    segment += 1
+                    continue
+                yield segment, start, record
+
+    def records(self, status=None):
+        """Stream the records in the order they finished, optionally only one status"""
+        self.flush()
+        for _, _, record in self._lines():
+            if status is None or record.get("status") == status:
+                yield record
+
+    def sorted_records(self, status=None):
+        """Stream the records in input order (by their "seq") rather than finishing order
+
+        Only the sort keys and file offsets are held in memory; each record
+        is read back from the file as it is yielded.
+        """
+        self.flush()
+        keys = [((segment, record.get("seq") or 0), offset) for segment, offset, record in self._lines()
+                if status is None or record.get("status") == status]
+        keys.sort()
+        with open(self.path, 'rb') as f:
+            for _, offset in keys:
+                f.seek(offset)
+                yield json.loads(f.readline())
+
+    def flush(self):
+        with self.lock:
+            if self.file:
+                self.file.flush()
+
+
+def strip(records, *keys):
+    """Drop the log's bookkeeping keys from streamed records"""
+    for record in records:
+        for key in keys:
+            record.pop(key, None)
+        yield record
+
+
+def write_report(path, report, indent=2):
+    """Write report like json.dump(report, f, indent=indent), streaming its generators
+
+    Any generator in report (at any depth of dicts) is written as a JSON
+    array one item at a time, so results read from a ResultLog never have
+    to be in memory together. The file is replaced atomically.
+    """
+    path = Path(path)
+    temp_file = path.with_suffix(path.suffix + ".tmp")
+    with open(temp_file, 'w') as f:
+        _dump(report, f, indent, 0)
+    temp_file.replace(path)
+
+
+def _dump(value, f, indent, level):
+    pad = " " * (indent * (level + 1))
+    if isinstance(value, dict) and value:
+        f.write("{")
+        for i, (key, item) in enumerate(value.items()):
+            f.write(("," if i else "") + "\n" + pad + json.dumps(str(key)) + ": ")
+            _dump(item, f, indent, level + 1)
+        f.write("\n" + " " * (indent * level) + "}")
+    elif isinstance(value, types.GeneratorType):
+        empty = True
+        for item in value:
+            f.write(("[" if empty else ",") + "\n" + pad)
+            _dump(item, f, indent, level + 1)
+            empty = False
+        f.write("[]" if empty else "\n" + " " * (indent * level) + "]")
+    else:
+        f.write(json.dumps(value, indent=indent).replace("\n", "\n" + " " * (indent * level)))
@@ -0,0 +1,172 @@
+"""
+Retries, circuit breaking and the retry queue
+Transient failures (timeouts, dropped connections, 5xx and 429 responses)
+are retried with capped exponential backoff and full jitter, honouring a
+Retry-After header when the server sends one. A per-host circuit breaker
+stops requests to a host that keeps failing, and products that still fail
+are kept in a retry queue that can be replayed on its own.
+"""
+
+import json
+import os
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+
+import requests
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+RETRY_EXCEPTIONS = (requests.ConnectionError, requests.Timeout)
+
+
+class CircuitOpenError(requests.RequestException):
+    """Raised instead of sending a request to a host whose circuit is open"""
+
+
+def retry_after(response):
+    """Seconds to wait according to a Retry-After header, or None"""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryPolicy:
+    """How often and how long to wait before retrying a request
+
+    The wait before retry n is uniform in [0, min(max_backoff, backoff * 2**n)]
+    ("full jitter"), so workers that failed together do not retry together.
+    A Retry-After header replaces the computed wait, unless it asks for
+    longer than max_retry_after, in which case the request is not retried.
+    """
+
+    def __init__(self, attempts=4, backoff=0.5, max_backoff=30.0, max_retry_after=120.0,
+                 statuses=RETRY_STATUSES, rng=None):
+        self.attempts = max(1, attempts)
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.max_retry_after = max_retry_after
+        self.statuses = frozenset(statuses)
+        self.rng = rng or random.Random()
+
+    def is_retryable(self, response):
+        return response.status_code in self.statuses
+
+    def delay(self, attempt, response=None):
+        """Seconds to wait after failed attempt number `attempt` (0-based), or None to give up"""
+        if attempt + 1 >= self.attempts:
+            return None
+        if response is not None:
+            requested = retry_after(response)
+            if requested is not None:
+                return requested if requested <= self.max_retry_after else None
+        return self.rng.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+
+class CircuitBreaker:
+    """Per-host breaker: open after `threshold` consecutive failures
+
+    While open, requests to the host fail immediately with CircuitOpenError.
+    After reset_timeout seconds one trial request is let through (half-open);
+    its success closes the circuit and its failure opens it again.
+    """
+
+    def __init__(self, threshold=5, reset_timeout=30.0):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.lock = threading.Lock()
+        # host -> [consecutive failures, opened at or None, trial in flight]
+        self.hosts = {}
+        self.stats = {"opened": 0, "rejected": 0}
+
+    def before_request(self, host):
+        """Raise CircuitOpenError unless a request to host may be sent now"""
+        with self.lock:
+            state = self.hosts.setdefault(host, [0, None, False])
+            opened_at = state[1]
+            if opened_at is None:
+                return
+            if time.monotonic() - opened_at >= self.reset_timeout and not state[2]:
+                state[2] = True
+                return
+            self.stats["rejected"] += 1
+        raise CircuitOpenError(f"Circuit open for {host} after {state[0]} consecutive failures")
+
+    def record_success(self, host):
+        with self.lock:
+            self.hosts[host] = [0, None, False]
+
+    def record_failure(self, host):
+        with self.lock:
+            state = self.hosts.setdefault(host, [0, None, False])
+            state[0] += 1
+            if state[2] or (state[1] is None and state[0] >= self.threshold):
+                if state[1] is None:
+                    self.stats["opened"] += 1
+                state[1] = time.monotonic()
+            state[2] = False
+
+    def release(self, host):
+        """Give back a half-open trial that ended without a verdict, e.g. in an unexpected error"""
+        with self.lock:
+            state = self.hosts.get(host)
+            if state:
+                state[2] = False
+
+    def is_open(self, host):
+        with self.lock:
+            state = self.hosts.get(host)
+            return bool(state and state[1] is not None)
+
+
+class RetryQueue:
+    """Product URLs that failed, saved between runs so they can be replayed alone"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.lock = threading.Lock()
+        self.items = {}
+        if self.path.exists():
+            try:
+                with open(self.path) as f:
+                    self.items = json.load(f).get("items", {})
+            except (OSError, ValueError):
+                pass
+
+    def add(self, url, error):
+        with self.lock:
+            entry = self.items.setdefault(url, {"attempts": 0})
+            entry["attempts"] += 1
+            entry["error"] = error
+            entry["failed_at"] = time.time()
+
+    def remove(self, url):
+        with self.lock:
+            self.items.pop(url, None)
+
+    def urls(self):
+        with self.lock:
+            return list(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+    def save(self):
+        with self.lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = self.path.with_suffix(".tmp")
+            with open(temp_file, 'w') as f:
+                json.dump({"items": self.items}, f, indent=2)
+            os.replace(temp_file, self.path)
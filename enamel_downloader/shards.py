@@ -0,0 +1,219 @@
+"""
+Sharded crawling
+For catalogs of tens of thousands of products a single process is bound by
+page parsing. ShardedCrawl splits the product URLs over worker processes
+with a consistent-hash ring. Each worker runs the downloader's own
+download_all with its own sessions, HTTP cache and state under
+.cache/shards/<n>/, and a 1/n share of the request rate and of the per-host
+connections, so the processes together stay within the global limits. Every
+worker needs at least one connection, so there are never more shards than
+per-host connections.
+
+Products are keyed by their color's variant group (62 and 62F alike), so
+the powder and lump pages of one color, which share an image file, and the
+variants the dedupe index compares land on the same shard. Adding or
+removing a shard only moves the keys next to it on the ring, so most
+products keep their shard and its warm cache.
+
+When the workers are done their results logs, manifests, dedupe indexes,
+image choices, retry queues and stage timings are merged into the main
+downloader's, which then writes the one complete_download_report.json.
+
+    python -m enamel_downloader sync --shards 4 download
+"""
+
+import bisect
+import hashlib
+import importlib
+import math
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from enamel_downloader import classifier
+from enamel_downloader.candidates import CandidateResolver
+from enamel_downloader.dedupe import DedupeIndex, variant_group
+from enamel_downloader.manifest import Manifest
+from enamel_downloader.results import ResultLog
+
+SHARDS_DIR = ".cache/shards"
+# Points per shard on the ring; more points spread the keys more evenly
+REPLICAS = 128
+
+
+def _point(value):
+    return int.from_bytes(hashlib.md5(value.encode()).digest()[:8], "big")
+
+
+class HashRing:
+    """Consistent-hash ring over shards 0..shards-1"""
+
+    def __init__(self, shards, replicas=REPLICAS):
+        points = sorted((_point(f"shard-{shard}-{replica}"), shard)
+                        for shard in range(shards) for replica in range(replicas))
+        self.points = [point for point, _ in points]
+        self.shards = [shard for _, shard in points]
+
+    def shard(self, key):
+        """The shard owning key: the first point clockwise from the key's hash"""
+        return self.shards[bisect.bisect(self.points, _point(key)) % len(self.points)]
+
+
+def shard_key(url):
+    """Variants of one color (62, 62F) share a key, so one shard's dedupe index sees them all"""
+    return variant_group(classifier.extract_reference(url)[0]) or url
+
+
+def merge_counts(counts):
+    """Sum a list of (possibly nested) statistics dicts key by key"""
+    counts = [count for count in counts if count]
+    if not counts:
+        return None
+    merged = {}
+    for count in counts:
+        for key, value in count.items():
+            if isinstance(value, dict):
+                merged[key] = merge_counts([merged.get(key), value])
+            elif isinstance(value, (int, float)) and not isinstance(value, bool):
+                merged[key] = merged.get(key, 0) + value
+            else:
+                merged.setdefault(key, value)
+    return merged
+
+
+def run_shard(spec):
+    """Worker process: download one shard's products; returns its statistics"""
+    module_name, class_name, settings, urls, sequence = spec
+    downloader_class = getattr(importlib.import_module(module_name), class_name)
+    downloader = downloader_class(**settings)
+    downloader.sequence = sequence
+    try:
+        downloader.download_all(urls)
+        return {"sections": downloader.report_sections(), "metrics": downloader.metrics.state()}
+    finally:
+        downloader.result_log.close()
+        downloader.manifest.close()
+
+
+class ShardedCrawl:
+    """Run a downloader's download_all over shards of the product URLs in worker processes"""
+
+    def __init__(self, downloader, downloader_class, shards, settings):
+        # downloader is the main instance; its state receives the merged results
+        self.downloader = downloader
+        self.downloader_class = downloader_class
+        self.settings = settings
+        host_concurrency = settings.get("host_concurrency", 4)
+        if shards > host_concurrency:
+            print(f"Using {host_concurrency} shards: each needs one of the {host_concurrency} connections per host")
+        self.shards = max(1, min(shards, host_concurrency))
+        self.ring = HashRing(self.shards)
+        self.directory = Path(downloader.base_dir) / SHARDS_DIR
+
+    def shard_settings(self, shard):
+        """Constructor arguments of one worker's downloader: its own state, a share of the limits"""
+        settings = dict(self.settings, cache_dir=self.directory / str(shard) / "http", event_log=None)
+        if settings.get("rate_limit"):
+            settings["rate_limit"] = settings["rate_limit"] / self.shards
+        # The remainder goes to the first shards, so the shares add up to the global limit exactly
+        connections, extra = divmod(settings.get("host_concurrency", 4), self.shards)
+        settings["host_concurrency"] = connections + (shard < extra)
+        settings["concurrency"] = max(1, math.ceil(settings.get("concurrency", 8) / self.shards))
+        return settings
+
+    def split(self, product_urls):
+        """{shard: [urls]}, each list in input order"""
+        shards = {shard: [] for shard in range(self.shards)}
+        for url in product_urls:
+            shards[self.ring.shard(shard_key(url))].append(url)
+        return shards
+
+    def download_all(self, product_urls, journal=None):
+        """Download every product across the shards; returns the merged report sections
+
+        The URLs are collected before any shard starts, since each must
+        know its share. With a CheckpointJournal, finished products are
+        skipped and the merged outcomes recorded in it.
+        """
+        downloader = self.downloader
+        if journal:
+            product_urls = journal.pending(product_urls)
+            if journal.resumed:
+                downloader.result_log.resume()
+        product_urls = list(dict.fromkeys(product_urls))
+        for url in product_urls:
+            downloader.sequence.setdefault(url, len(downloader.sequence))
+        shards = self.split(product_urls)
+        print(f"Downloading {len(product_urls)} products in {self.shards} shards: "
+              + ", ".join(str(len(urls)) for urls in shards.values()))
+
+        for shard, urls in shards.items():
+            if urls:
+                # Only this run's records may be merged, even if a worker dies before its first one
+                (self.directory / str(shard) / downloader.result_log.path.name).unlink(missing_ok=True)
+        module_name, class_name = self.downloader_class
+        specs = [(module_name, class_name, self.shard_settings(shard), urls,
+                  {url: downloader.sequence[url] for url in urls})
+                 for shard, urls in shards.items() if urls]
+        results, errors = [], []
+        with ProcessPoolExecutor(max_workers=len(specs) or 1) as pool:
+            futures = [pool.submit(run_shard, spec) for spec in specs]
+            for future in futures:
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    errors.append(e)
+
+        sections = self.merge([shard for shard, urls in shards.items() if urls], results, journal)
+        if errors:
+            # The merged part is kept; an open journal resumes the rest
+            raise RuntimeError(f"{len(errors)} of {len(specs)} shards failed: {errors[0]}")
+        return sections
+
+    def merge(self, shards, results, journal=None):
+        """Fold the state of the shards that ran into the main downloader's"""
+        downloader = self.downloader
+        dedupe = downloader.dedupe
+        choices = {}
+        for shard in shards:
+            state_dir = self.directory / str(shard)
+            if not state_dir.is_dir():
+                continue
+
+            for record in ResultLog(state_dir / downloader.result_log.path.name).records():
+                record.pop("time", None)
+                downloader.result_log.write(record)
+                url = record["product_url"]
+                if record.get("status") == "failed":
+                    downloader.retry_queue.add(url, record.get("error"))
+                elif record.get("status") != "skipped":
+                    downloader.retry_queue.remove(url)
+                if journal and record.get("status") != "skipped":
+                    journal.record(url, "failed" if record.get("status") == "failed" else "success")
+
+            manifest = Manifest(state_dir / Path(downloader.manifest.path).name)
+            for entry in manifest.entries():
+                url = entry.pop("product_url")
+                downloader.manifest.record(url, **entry)
+            manifest.close()
+
+            shard_dedupe = DedupeIndex(state_dir / dedupe.path.name)
+            with dedupe.lock:
+                dedupe.files.update(shard_dedupe.files)
+                dedupe.urls.update(shard_dedupe.urls)
+            choices.update(CandidateResolver(None, state_dir / downloader.resolver.path.name).choices)
+
+        with downloader.resolver.lock:
+            downloader.resolver.choices.update(choices)
+        for result in results:
+            downloader.metrics.merge(result["metrics"])
+        downloader.result_log.flush()
+        dedupe.save()
+        downloader.resolver.save()
+        downloader.retry_queue.save()
+
+        sections = merge_counts([result["sections"] for result in results]) or {}
+        sections["discovery"] = downloader.discovery.report() if downloader.discovery else None
+        sections["stages"] = downloader.metrics.report()
+        if sections.get("retries") is not None:
+            sections["retries"]["queued"] = len(downloader.retry_queue)
+        return sections
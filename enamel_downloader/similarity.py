@@ -0,0 +1,173 @@
+"""
+Nearest-color index
+Finds the enamels closest to a target color. Every swatch is one point in
+CIELAB space (its mean foreground color from the features stage), and a
+query is a vectorized brute-force CIE76 distance (Delta E) over all points,
+which for a catalog of a few thousand swatches stays well under a
+millisecond.
+
+The index is synced incrementally from the feature file: only swatches
+that were added, changed or removed touch it. It is saved as
+public/color_index.json, Lab values at 0.1 precision as a flat integer
+list, small enough to ship to the frontend as a static asset and query
+there the same way.
+
+Requires NumPy.
+
+    python -m enamel_downloader.similarity [--query "#b03a48"] [-k 5]
+"""
+
+import argparse
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+
+from enamel_downloader.features import FEATURES_FILE, SwatchFeatures, rgb_to_lab
+
+INDEX_FILE = "color_index.json"
+# Lab values are stored as integers in tenths
+SCALE = 10
+
+
+def target_lab(target):
+    """Lab of a query given as "#rrggbb", an (r, g, b) tuple of 0-255 values or a Lab triple"""
+    if isinstance(target, str):
+        value = target.lstrip("#")
+        if len(value) != 6:
+            raise ValueError(f"Not a hex color: {target!r}")
+        return rgb_to_lab([int(value[i:i + 2], 16) for i in (0, 2, 4)])
+    return np.asarray(target, dtype=np.float64)
+
+
+class ColorIndex:
+    """Swatch keys (paths under public/) and their Lab colors, one row each"""
+
+    def __init__(self, keys=(), lab=None):
+        self.keys = list(keys)
+        self.lab = np.asarray(lab, dtype=np.float32).reshape(-1, 3) if lab is not None \
+            else np.zeros((0, 3), np.float32)
+        self.rows = {key: row for row, key in enumerate(self.keys)}
+
+    @classmethod
+    def load(cls, path):
+        """The saved index, or an empty one if the file is missing or unreadable"""
+        try:
+            with open(path) as f:
+                data = json.load(f)
+            return cls(data["keys"], np.asarray(data["lab"], dtype=np.float32) / data.get("scale", SCALE))
+        except (OSError, KeyError, ValueError):
+            return cls()
+
+    def save(self, path):
+        path = Path(path)
+        temp_file = path.with_name(f".{path.name}.tmp")
+        with open(temp_file, 'w') as f:
+            json.dump({"metric": "cie76", "scale": SCALE, "keys": self.keys,
+                       "lab": np.rint(self.lab * SCALE).astype(int).ravel().tolist()}, f, separators=(",", ":"))
+        os.replace(temp_file, path)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __contains__(self, key):
+        return key in self.rows
+
+    def upsert(self, key, lab):
+        """Add a swatch, or move an existing one to a new color"""
+        lab = np.rint(np.asarray(lab, dtype=np.float32) * SCALE) / SCALE
+        row = self.rows.get(key)
+        if row is None:
+            self.rows[key] = len(self.keys)
+            self.keys.append(key)
+            self.lab = np.vstack([self.lab, lab[None, :]])
+        else:
+            self.lab[row] = lab
+
+    def remove(self, key):
+        row = self.rows.pop(key, None)
+        if row is None:
+            return
+        # Move the last row into the gap rather than shifting every row after it
+        last = len(self.keys) - 1
+        if row != last:
+            self.keys[row] = self.keys[last]
+            self.lab[row] = self.lab[last]
+            self.rows[self.keys[row]] = row
+        self.keys.pop()
+        self.lab = self.lab[:last]
+
+    def sync(self, features):
+        """Apply the swatches added, changed or removed in a SwatchFeatures; returns the counts"""
+        changes = {"added": 0, "updated": 0, "removed": 0}
+        wanted = set(features.rows)
+        for key in [key for key in self.keys if key not in wanted]:
+            self.remove(key)
+            changes["removed"] += 1
+        for key, row in features.rows.items():
+            lab = np.rint(features.lab[row] * SCALE) / SCALE
+            current = self.rows.get(key)
+            if current is None:
+                changes["added"] += 1
+            elif np.array_equal(self.lab[current], lab.astype(np.float32)):
+                continue
+            else:
+                changes["updated"] += 1
+            self.upsert(key, lab)
+        return changes
+
+    def nearest(self, target, k=5, exclude=()):
+        """The k swatches closest to target as (key, Delta E) pairs, closest first"""
+        if not self.keys:
+            return []
+        distances = np.sqrt(((self.lab - target_lab(target).astype(np.float32)) ** 2).sum(axis=1))
+        # Keys that are not indexed (or are listed twice) must not shrink k
+        excluded = {self.rows[key] for key in exclude if key in self.rows}
+        distances[list(excluded)] = np.inf
+        k = min(k, len(self.keys) - len(excluded))
+        if k <= 0:
+            return []
+        # argpartition finds the k smallest without sorting the whole catalog
+        candidates = np.argpartition(distances, k - 1)[:k] if k < len(distances) else np.arange(len(distances))
+        candidates = candidates[np.argsort(distances[candidates], kind="stable")]
+        return [(self.keys[row], round(float(distances[row]), 2)) for row in candidates]
+
+    def similar(self, key, k=5):
+        """The k swatches closest to an indexed one, not counting itself"""
+        return self.nearest(self.lab[self.rows[key]], k, exclude=(key,))
+
+
+def build_index(base_dir="public", output=None):
+    """Sync the index file with the feature file; returns the change counts"""
+    base_dir = Path(base_dir)
+    output = Path(output) if output else base_dir / INDEX_FILE
+    index = ColorIndex.load(output)
+    changes = index.sync(SwatchFeatures.load(base_dir / FEATURES_FILE))
+    if any(changes.values()) or not output.exists():
+        index.save(output)
+        print(f"Color index of {len(index)} swatches saved to: {output} "
+              f"({changes['added']} added, {changes['updated']} updated, {changes['removed']} removed)")
+    else:
+        print(f"Color index up to date: {output}")
+    return dict(changes, swatches=len(index))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build or query the nearest-color index")
+    parser.add_argument("--base-dir", default="public")
+    parser.add_argument("--output", help=f"index file (default: BASE_DIR/{INDEX_FILE})")
+    parser.add_argument("--query", help="hex color to look up, e.g. '#b03a48', instead of building")
+    parser.add_argument("-k", type=int, default=5)
+    args = parser.parse_args()
+
+    if not args.query:
+        print(build_index(args.base_dir, args.output))
+        return
+    index = ColorIndex.load(args.output or Path(args.base_dir) / INDEX_FILE)
+    for key, distance in index.nearest(args.query, args.k):
+        print(f"{distance:6.2f}  {key}")
+
+
+if __name__ == "__main__":
+    main()
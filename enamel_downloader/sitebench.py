@@ -0,0 +1,172 @@
+"""
+End-to-end benchmark against the local mock site
+Runs CompleteEmauxDownloader and EmauxSoyerImageDownloader against
+enamel_downloader.mocksite at one or more catalog sizes, each in a fresh
+process and working directory, and records throughput, per-stage latency
+percentiles and peak RSS. Results are saved as JSON under
+public/.cache/benchmarks/, tagged with the git commit, and compared with the
+previous saved run of the same configuration.
+
+    python -m enamel_downloader.sitebench --products 200 2000 20000 --latency 0.02
+"""
+
+import argparse
+import contextlib
+import json
+import multiprocessing
+import os
+import queue
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from enamel_downloader.mocksite import MockCatalog, listing_url, serve
+
+DOWNLOADERS = ("complete", "soyer")
+RESULTS_DIR = "public/.cache/benchmarks"
+
+
+def peak_rss_mb():
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_downloader(name, listing, workdir, options, results):
+    """Child process: run one downloader end to end and put its measurements on results"""
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        start = time.perf_counter()
+        if name == "complete":
+            from download_all_emaux_images import CompleteEmauxDownloader
+            downloader = CompleteEmauxDownloader(workdir, **options)
+            downloader.run_complete_download(listing_urls=[listing])
+            succeeded, failed = downloader.stats["success"], downloader.stats["failed"]
+        else:
+            from download_enamel_images import EmauxSoyerImageDownloader
+            downloader = EmauxSoyerImageDownloader(workdir, **options)
+            downloader.process_product_urls(downloader.discover_products([listing]))
+            summary = downloader.generate_report()["summary"]
+            succeeded, failed = summary["successful_downloads"], summary["failed_downloads"]
+        elapsed = time.perf_counter() - start
+
+    stages = downloader.metrics.report()
+    image_bytes = stages["download"]["bytes"]
+    results.put({
+        "succeeded": succeeded,
+        "failed": failed,
+        "seconds": round(elapsed, 3),
+        "products_per_second": round(succeeded / elapsed, 2) if elapsed else 0.0,
+        "image_mb_per_second": round(image_bytes / elapsed / 1e6, 3) if elapsed else 0.0,
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+        "connections": downloader.pools.stats(),
+        "stages": stages,
+    })
+
+
+def run_case(name, products, latency, jitter, options):
+    catalog = MockCatalog(products, per_page=max(48, -(-products // 400)), latency=latency, jitter=jitter)
+    server = serve(catalog)
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    try:
+        with tempfile.TemporaryDirectory(prefix=f"sitebench-{name}-") as workdir:
+            process = context.Process(target=run_downloader,
+                                      args=(name, listing_url(server), workdir, options, results))
+            process.start()
+            while True:
+                try:
+                    result = results.get(timeout=1)
+                    break
+                except queue.Empty:
+                    if not process.is_alive():
+                        raise RuntimeError(f"{name} benchmark process exited with code {process.exitcode}")
+            process.join()
+    finally:
+        server.shutdown()
+    result["server_requests"] = catalog.requests
+    return result
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def case_key(run):
+    return (run["downloader"], run["products"], run["latency"], run["jitter"], run["concurrency"])
+
+
+def previous_runs(results_dir):
+    """Most recent saved run per configuration"""
+    latest = {}
+    for path in sorted(Path(results_dir).glob("site-*.json")):
+        try:
+            with open(path) as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            continue
+        for run in saved.get("runs", []):
+            latest[case_key(run)] = dict(run, commit=saved.get("commit"))
+    return latest
+
+
+def print_run(run, previous=None):
+    stages = run["stages"]
+    print(f"- {run['downloader']:<8} {run['products']:>6} products: {run['seconds']:.1f}s, "
+          f"{run['products_per_second']:.1f} products/s, {run['image_mb_per_second']:.2f} MB/s, "
+          f"peak RSS {run['peak_rss_mb']:.0f} MB, {run['failed']} failed")
+    for stage in ("fetch", "parse", "select_image", "download", "write"):
+        timing = stages[stage]
+        if timing["count"]:
+            print(f"    {stage:<13} p50 {timing['p50'] * 1000:7.1f} ms  p95 {timing['p95'] * 1000:7.1f} ms  "
+                  f"p99 {timing['p99'] * 1000:7.1f} ms")
+    if previous:
+        change = (run["products_per_second"] / previous["products_per_second"] - 1) * 100 \
+            if previous["products_per_second"] else 0.0
+        print(f"    vs {previous.get('commit')}: {previous['products_per_second']:.1f} products/s ({change:+.1f}%), "
+              f"peak RSS {previous['peak_rss_mb']:.0f} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--products", type=int, nargs="+", default=[200],
+                        help="catalog sizes to run, e.g. 200 2000 20000")
+    parser.add_argument("--latency", type=float, default=0.02, help="seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.01, help="random extra seconds, up to this much")
+    parser.add_argument("--downloader", choices=DOWNLOADERS, action="append",
+                        help="only run this downloader (repeatable); default both")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--rate", type=float, default=0.0, help="requests per second per host, 0 for unlimited")
+    parser.add_argument("--output", default=RESULTS_DIR, help="directory for saved results")
+    args = parser.parse_args()
+
+    options = {"concurrency": args.concurrency, "rate_limit": args.rate}
+    previous = previous_runs(args.output)
+    runs = []
+    print(f"Mock site latency {args.latency * 1000:.0f} ms (+ up to {args.jitter * 1000:.0f} ms), "
+          f"concurrency {args.concurrency}")
+    for products in args.products:
+        for name in args.downloader or DOWNLOADERS:
+            run = dict(downloader=name, products=products, latency=args.latency, jitter=args.jitter,
+                       concurrency=args.concurrency, rate=args.rate)
+            run.update(run_case(name, products, args.latency, args.jitter, options))
+            print_run(run, previous.get(case_key(run)))
+            runs.append(run)
+
+    output = Path(args.output)
+    output.mkdir(parents=True, exist_ok=True)
+    commit = git_commit()
+    result_file = output / f"site-{time.strftime('%Y%m%d-%H%M%S')}-{commit}.json"
+    with open(result_file, 'w') as f:
+        json.dump({"commit": commit, "time": time.time(), "python": sys.version.split()[0], "runs": runs}, f, indent=2)
+    print(f"Results saved to: {result_file}")
+
+
+if __name__ == "__main__":
+    main()
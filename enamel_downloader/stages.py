@@ -0,0 +1,39 @@
+"""
+Post-download stages
+Everything that is rebuilt from the stored swatches after a download, in
+order: the type folders, the swatch type report, responsive variants,
+color features, the nearest-color index and the storefront catalog. Each
+stage skips the work its inputs did not change. Shared by both downloader
+scripts and `python -m enamel_downloader sync`.
+"""
+
+
+def run_post_download(base_dir):
+    """Run every post-download stage over base_dir; returns each stage's stats"""
+    results = {}
+
+    # Type folders as links into the content-addressed store, rebuilt from the manifests
+    from enamel_downloader.store import ViewBuilder
+    results["views"] = ViewBuilder(base_dir).build()
+
+    # Report swatches that look filed under the wrong enamel type; moving them is a separate,
+    # reviewed step (python -m enamel_downloader.swatch_types --move) (needs NumPy)
+    from enamel_downloader.swatch_types import SwatchTypeClassifier
+    results["swatch_types"] = SwatchTypeClassifier(base_dir).run(move=False)
+
+    # Responsive JPEG/WebP variants for the storefront (needs Pillow)
+    from enamel_downloader.variants import VariantBuilder
+    results["variants"] = VariantBuilder(base_dir).build()
+
+    # Dominant colors, Lab values and histograms per swatch (needs NumPy)
+    from enamel_downloader.features import FeatureBuilder
+    results["features"] = FeatureBuilder(base_dir).build()
+
+    # Nearest-color index (public/color_index.json), synced with the changed features only
+    from enamel_downloader.similarity import build_index
+    results["color_index"] = build_index(base_dir)
+
+    # Storefront catalog (src/data/catalog.ts), rewritten only when its inputs changed
+    from enamel_downloader.catalog import CatalogBuilder
+    results["catalog"] = CatalogBuilder(base_dir).build()
+    return results
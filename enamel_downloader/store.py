@@ -0,0 +1,430 @@
+"""
+Content-addressed image store
+Every downloaded image is kept once, as .cache/blobs/sha256/<ab>/<hash>.jpg
+(or .png) under the base directory, named by the sha256 of its bytes. The
+folders the storefront reads (opaques/, transparent_colors/, opale_colors/
+and emaux_soyer_samples/) only hold views: hard links to the blobs, or
+relative symlinks where the filesystem cannot hard-link or when asked for.
+62F_hq.jpg and 62_hq.jpg with the same bytes are two names for one file, so
+the images take their unique bytes on disk and nothing more.
+
+The views are generated from the download manifests, one per filename they
+record. Retyping or renaming a color rewrites its manifest entries (type
+and filename, as the type classifier does when it refiles a swatch) and
+rebuilds the views, which only moves links around; nothing is downloaded
+or copied. Swatches without a manifest entry (older downloads, the samples)
+keep their place and are linked into the store as they are, so their
+duplicates are stored once too. A blob that is no longer linked from
+anywhere (its own name is its only link) is pruned.
+
+Hard links are the default because the views are committed with the site:
+git stores a hard link as an ordinary file, a symlink as a link into the
+ignored .cache directory.
+
+    python -m enamel_downloader.store [--symlinks]
+    python -m enamel_downloader.store --retype 62F opal
+    python -m enamel_downloader.store --rename opaques/62_hq.jpg 62-bleu_hq.jpg
+"""
+
+import argparse
+import json
+import os
+import shutil
+import threading
+from pathlib import Path
+
+from enamel_downloader.dedupe import DedupeIndex
+from enamel_downloader.download import PNG_SIGNATURE
+from enamel_downloader.manifest import Manifest, file_sha256
+
+STORE_DIR = ".cache/blobs"
+VIEWS_FILE = ".cache/views.json"
+# Written by swatch_types; its "moves" have to follow views moved here
+TYPE_SCORES_FILE = ".cache/type_scores.json"
+# Enamel type -> folder under public/
+TYPE_FOLDERS = {"transparent": "transparent_colors", "opaque": "opaques", "opal": "opale_colors"}
+# Folders of views; the samples hold what the soyer downloader could not type
+VIEW_FOLDERS = tuple(TYPE_FOLDERS.values()) + ("emaux_soyer_samples",)
+MANIFESTS = (".cache/complete_download_manifest.sqlite", ".cache/download_manifest.sqlite")
+SOURCE_SUFFIXES = (".jpg", ".jpeg", ".png")
+
+
+def view_key(base_dir, filename):
+    """filename as a path under base_dir, however it was recorded
+
+    Only the folder is resolved, so a symlinked view keeps its own name
+    instead of turning into its blob's.
+    """
+    path = Path(filename)
+    try:
+        return (path.parent.resolve() / path.name).relative_to(Path(base_dir).resolve()).as_posix()
+    except ValueError:
+        return Path(*path.parts[-2:]).as_posix()
+
+
+def repoint(base_dir, moved):
+    """Point the manifests and the dedupe index at moved views; moved is {old key: (new key, type)}"""
+    base_dir = Path(base_dir)
+    for name in MANIFESTS:
+        path = base_dir / name
+        if not path.exists():
+            continue
+        manifest = Manifest(path)
+        for entry in manifest.entries():
+            filename = entry.get("filename")
+            if filename and view_key(base_dir, filename) in moved:
+                new_key, type_name = moved[view_key(base_dir, filename)]
+                # Same path style the downloader used, only the folder and name change
+                new_filename = str(Path(filename).parent.parent / new_key)
+                manifest.record(entry["product_url"], filename=new_filename,
+                                enamel_type=type_name or entry["enamel_type"], checked_at=entry["checked_at"])
+        manifest.close()
+
+    dedupe_file = base_dir / ".cache" / "dedupe_index.json"
+    if dedupe_file.exists():
+        dedupe = DedupeIndex(dedupe_file)
+        for entry in dedupe.files.values():
+            key = view_key(base_dir, entry["path"])
+            if key in moved:
+                entry["path"] = str(Path(entry["path"]).parent.parent / moved[key][0])
+        dedupe.save()
+
+    # The type classifier's record of its own moves, which the catalog applies to old paths
+    scores_file = base_dir / TYPE_SCORES_FILE
+    try:
+        with open(scores_file) as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return
+    new_keys = {new_key for new_key, _ in moved.values()}
+    moves = {old_key: moved.get(new_key, (new_key,))[0] for old_key, new_key in state.get("moves", {}).items()
+             if old_key not in new_keys}
+    if moves != state.get("moves", {}):
+        state["moves"] = moves
+        temp_file = scores_file.with_suffix(".tmp")
+        with open(temp_file, 'w') as f:
+            json.dump(state, f, indent=2)
+        os.replace(temp_file, scores_file)
+
+
+class BlobStore:
+    """Image files named by their sha256, and the views linking to them"""
+
+    def __init__(self, root, symlinks=False):
+        self.root = Path(root)
+        self.symlinks = symlinks
+        self.lock = threading.Lock()
+        self.stats = {"stored": 0, "existing": 0, "hardlinks": 0, "symlinks": 0}
+
+    def blob_path(self, content_hash, suffix=".jpg"):
+        return self.root / "sha256" / content_hash[:2] / f"{content_hash}{suffix}"
+
+    def find(self, content_hash):
+        """The blob of a content hash, or None"""
+        for suffix in (".jpg", ".png"):
+            path = self.blob_path(content_hash, suffix)
+            if path.exists():
+                return path
+        return None
+
+    def blobs(self):
+        """(content hash, path) of every blob"""
+        for path in sorted(self.root.glob("sha256/*/*")):
+            if path.suffix in (".jpg", ".png"):
+                yield path.stem, path
+
+    def inodes(self):
+        """(device, inode) -> content hash of every blob, to recognise hard-linked views"""
+        inodes = {}
+        for content_hash, path in self.blobs():
+            stat = path.stat()
+            inodes[stat.st_dev, stat.st_ino] = content_hash
+        return inodes
+
+    def put(self, path, content_hash=None, keep=False):
+        """Move a complete image file into the store; returns its blob
+
+        With keep the file stays where it is, hard-linked (or, across
+        filesystems, copied) into the store. If the blob already exists the
+        file is dropped instead, unless keep is set.
+        """
+        path = Path(path)
+        content_hash = content_hash or file_sha256(path)
+        with self.lock:
+            blob = self.find(content_hash)
+            if blob:
+                self.stats["existing"] += 1
+                if not keep:
+                    path.unlink()
+                return blob
+
+            with open(path, 'rb') as f:
+                suffix = ".png" if f.read(len(PNG_SIGNATURE)) == PNG_SIGNATURE else ".jpg"
+            blob = self.blob_path(content_hash, suffix)
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = blob.with_name(f".{blob.name}.{threading.get_ident()}.tmp")
+            try:
+                if keep:
+                    os.link(path, temp_file)
+                else:
+                    os.replace(path, temp_file)
+            except OSError:
+                shutil.copyfile(path, temp_file)
+                if not keep:
+                    path.unlink()
+            os.replace(temp_file, blob)
+            self.stats["stored"] += 1
+            return blob
+
+    def is_view(self, path, blob):
+        """True if path is a name of blob, by hard link or symlink"""
+        try:
+            return os.path.samefile(path, blob)
+        except OSError:
+            return False
+
+    def link(self, blob, view):
+        """Make view a name of blob, replacing whatever was there; False if it already was"""
+        view = Path(view)
+        if self.is_view(view, blob) and view.is_symlink() == self.symlinks:
+            return False
+        view.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = view.with_name(f".{view.name}.{threading.get_ident()}.link")
+        temp_file.unlink(missing_ok=True)
+        kind = "symlinks"
+        if not self.symlinks:
+            try:
+                os.link(blob, temp_file)
+                kind = "hardlinks"
+            except OSError:
+                # Another filesystem, or one without hard links
+                pass
+        if kind == "symlinks":
+            os.symlink(os.path.relpath(blob, view.parent), temp_file)
+        os.replace(temp_file, view)
+        with self.lock:
+            self.stats[kind] += 1
+        return True
+
+    def size(self):
+        return sum(path.stat().st_size for _, path in self.blobs())
+
+
+class ViewBuilder:
+    """Regenerate the type folders as views of the BlobStore from the download manifests"""
+
+    def __init__(self, base_dir="public", symlinks=False):
+        self.base_dir = Path(base_dir)
+        self.store = BlobStore(self.base_dir / STORE_DIR, symlinks=symlinks)
+        self.state_file = self.base_dir / VIEWS_FILE
+        self.stats = {"views": 0, "moved": 0, "adopted": 0, "relinked": 0, "removed": 0,
+                      "missing": 0, "conflicts": 0, "pruned": 0}
+        # Keys moved away since the last build, removed even if they were never a recorded view
+        self.retired = set()
+
+    def load_views(self):
+        """key -> content hash of the views the last build generated"""
+        try:
+            with open(self.state_file) as f:
+                return json.load(f).get("views", {})
+        except (OSError, ValueError):
+            return {}
+
+    def save_views(self, views):
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = self.state_file.with_suffix(".tmp")
+        with open(temp_file, 'w') as f:
+            json.dump({"views": views}, f, indent=2, sort_keys=True)
+        os.replace(temp_file, self.state_file)
+
+    def manifest_files(self):
+        """key -> manifest rows whose filename is that view, across every manifest"""
+        files = {}
+        for name in MANIFESTS:
+            path = self.base_dir / name
+            if path.exists():
+                manifest = Manifest(path)
+                for entry in manifest.entries():
+                    if entry.get("filename"):
+                        files.setdefault(view_key(self.base_dir, entry["filename"]), []).append(entry)
+                manifest.close()
+        return files
+
+    def blob_for(self, key, entries, inodes):
+        """The blob behind a manifest view, adopting the file on disk into the store if needed"""
+        latest = max(entries, key=lambda entry: entry.get("checked_at") or 0)
+        blob = self.store.find(latest["content_hash"]) if latest.get("content_hash") else None
+        if blob:
+            return blob
+        path = self.base_dir / key
+        if not path.is_file():
+            return None
+        blob = self.store.put(path, keep=True)
+        self.stats["adopted"] += 1
+        stat = blob.stat()
+        inodes[stat.st_dev, stat.st_ino] = blob.stem
+        return blob
+
+    def place(self, blob, key, inodes):
+        """Link key to blob unless a file with other bytes is already there; False on conflict"""
+        path = self.base_dir / key
+        if path.exists() and not self.store.is_view(path, blob):
+            stat = path.stat()
+            # Another image's view, or a file with different bytes: never overwritten silently
+            if path.is_symlink() or (stat.st_dev, stat.st_ino) in inodes or file_sha256(path) != blob.stem:
+                self.stats["conflicts"] += 1
+                print(f"Not linking {key}: a different image is already there")
+                return False
+        if self.store.link(blob, path):
+            self.stats["relinked"] += 1
+        return True
+
+    def adopt_untracked(self, wanted, inodes):
+        """Link swatches without a manifest entry into the store where they are; returns their hashes"""
+        hashes = set()
+        for folder in VIEW_FOLDERS:
+            directory = self.base_dir / folder
+            if not directory.is_dir():
+                continue
+            for path in sorted(directory.iterdir()):
+                key = path.relative_to(self.base_dir).as_posix()
+                if (key in wanted or path.name.startswith('.') or path.suffix.lower() not in SOURCE_SUFFIXES
+                        or not path.is_file()):
+                    continue
+                stat = path.stat()
+                if (stat.st_dev, stat.st_ino) in inodes:
+                    # Already a view (a symlink stats as its blob)
+                    hashes.add(inodes[stat.st_dev, stat.st_ino])
+                    continue
+                content_hash = file_sha256(path)
+                blob = self.store.put(path, content_hash, keep=True)
+                if self.store.link(blob, path):
+                    # A duplicate of a stored image: its bytes are freed
+                    self.stats["relinked"] += 1
+                stat = blob.stat()
+                inodes[stat.st_dev, stat.st_ino] = content_hash
+                hashes.add(content_hash)
+                self.stats["adopted"] += 1
+        return hashes
+
+    def prune(self, referenced):
+        """Remove blobs nothing links to any more
+
+        A blob whose only name is its own has no hard-linked view and no
+        HTTP cache entry; referenced covers the symlinked views, which do
+        not show in the link count.
+        """
+        for content_hash, path in self.store.blobs():
+            if content_hash not in referenced and path.stat().st_nlink == 1:
+                path.unlink()
+                self.stats["pruned"] += 1
+
+    def build(self):
+        """Link every manifest view and untracked swatch into place; returns the stats"""
+        inodes = self.store.inodes()
+        previous = self.load_views()
+
+        wanted = {}
+        for key, entries in sorted(self.manifest_files().items()):
+            blob = self.blob_for(key, entries, inodes)
+            if blob is None:
+                self.stats["missing"] += 1
+            elif self.place(blob, key, inodes):
+                wanted[key] = blob.stem
+            # else other bytes are under its name: left alone, and adopted below as an untracked swatch
+
+        # Names the manifests no longer give a view: earlier views, and keys moved since
+        for key in (set(previous) | self.retired) - set(wanted):
+            path = self.base_dir / key
+            if not path.is_file():
+                continue
+            blob = self.store.find(previous.get(key) or file_sha256(path))
+            # Only extra names are removed: the image must be a view under its new key
+            if blob and blob.stem in wanted.values() and self.store.is_view(path, blob):
+                path.unlink()
+                self.stats["removed"] += 1
+
+        referenced = set(wanted.values()) | self.adopt_untracked(wanted, inodes)
+        self.prune(referenced)
+        self.save_views(wanted)
+        self.stats["views"] = len(wanted)
+        self.stats["store_bytes"] = self.store.size()
+        self.stats.update(self.store.stats)
+        print(f"Content store: {len(referenced)} images in {self.stats['store_bytes'] / 1e6:.1f} MB, "
+              f"{len(wanted)} manifest views")
+        return self.stats
+
+    def relocate(self, moved):
+        """Give views new keys in the manifests, then rebuild; moved is {old key: (new key, type or None)}"""
+        for key, (new_key, _) in list(moved.items()):
+            path = self.base_dir / key
+            if path.is_file():
+                # Stored first (a no-op for views), so the new name can link to it
+                blob = self.store.put(path, keep=True)
+                if (self.base_dir / new_key).exists() and not self.store.is_view(self.base_dir / new_key, blob):
+                    self.stats["conflicts"] += 1
+                    print(f"Not moving {key}: {new_key} already exists")
+                    del moved[key]
+                    continue
+            self.retired.add(key)
+            self.stats["moved"] += 1
+            print(f"Moved {key} -> {new_key}")
+        if moved:
+            repoint(self.base_dir, moved)
+        return self.build()
+
+    def retype(self, reference, enamel_type):
+        """File every product of a color reference under another enamel type"""
+        if enamel_type not in TYPE_FOLDERS:
+            raise ValueError(f"Unknown enamel type {enamel_type!r}; one of {', '.join(TYPE_FOLDERS)}")
+        keys = set()
+        for name in MANIFESTS:
+            path = self.base_dir / name
+            if not path.exists():
+                continue
+            manifest = Manifest(path)
+            for entry in manifest.entries():
+                if entry.get("filename") and (entry.get("color_reference") or "").upper() == reference.upper():
+                    keys.add(view_key(self.base_dir, entry["filename"]))
+                    manifest.record(entry["product_url"], enamel_type=enamel_type, checked_at=entry["checked_at"])
+            manifest.close()
+        if not keys:
+            raise ValueError(f"No stored products of {reference} in the manifests")
+        targets = {key: f"{TYPE_FOLDERS[enamel_type]}/{key.split('/', 1)[-1]}" for key in keys}
+        return self.relocate({key: (target, enamel_type) for key, target in targets.items() if target != key})
+
+    def rename(self, key, name):
+        """Give the view key (e.g. opaques/62_hq.jpg) a new file name"""
+        key = view_key(self.base_dir, self.base_dir / key)
+        if "/" in name:
+            raise ValueError("The new name is a file name; the folder follows the enamel type")
+        if key not in self.manifest_files():
+            raise ValueError(f"{key} is not in the download manifests")
+        return self.relocate({key: (f"{key.rsplit('/', 1)[0]}/{name}", None)})
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Store each swatch once by content hash and link the type folders")
+    parser.add_argument("--base-dir", default="public")
+    parser.add_argument("--symlinks", action="store_true",
+                        help="relative symlinks instead of hard links (not for trees committed to git)")
+    parser.add_argument("--retype", nargs=2, metavar=("REFERENCE", "TYPE"),
+                        help=f"file a color reference under another type ({', '.join(TYPE_FOLDERS)})")
+    parser.add_argument("--rename", nargs=2, metavar=("VIEW", "NAME"),
+                        help="rename a view, e.g. opaques/62_hq.jpg 62-bleu_hq.jpg")
+    args = parser.parse_args()
+    builder = ViewBuilder(args.base_dir, symlinks=args.symlinks)
+    try:
+        if args.retype:
+            stats = builder.retype(*args.retype)
+        elif args.rename:
+            stats = builder.rename(*args.rename)
+        else:
+            stats = builder.build()
+    except ValueError as e:
+        parser.error(str(e))
+    print(stats)
+
+
+if __name__ == "__main__":
+    main()
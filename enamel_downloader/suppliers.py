@@ -0,0 +1,266 @@
+"""
+Supplier adapters
+What differs between enamel catalogs sits behind one small interface, so a
+new supplier is an adapter class instead of a copy of a downloader script.
+The complete downloader keeps the shared machinery (concurrent fetching,
+HTTP cache, original-image resolution, resumable writes, dedupe, manifest,
+sharding and reports) and asks its adapter for:
+
+- discovery: the catalog's product URLs
+- reference: a product's color reference and number
+- enamel_type: transparent, opaque or opal from the page text
+- image_candidates: the product image URLs on a parsed page, best first
+- original_url: the full-size asset behind a resized image URL
+- filename: the stored file name for a reference
+
+EmauxSoyerAdapter is the emaux-soyer.com (Magento) logic the downloaders
+were written for, including the image ranking the soyer downloader uses;
+ShopifyAdapter reads Shopify storefronts.
+"""
+
+import abc
+import json
+import re
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
+
+from enamel_downloader import candidates, classifier
+from enamel_downloader.discovery import EMAUX_SOYER_LISTING_URLS, CatalogDiscovery, normalize_url
+
+# Image URLs that are never the product photo
+PLACEHOLDER_WORDS = ('placeholder', 'default', 'defaut')
+
+
+class SupplierAdapter(abc.ABC):
+    """The catalog-specific parts of a download; subclasses fill them in"""
+
+    name = None
+    listing_urls = ()
+    # CSS selectors for product media on a product page, in order of preference
+    image_selectors = ()
+
+    def __init__(self, listing_urls=None):
+        if listing_urls:
+            self.listing_urls = list(listing_urls)
+
+    def discovery(self, get, listing_urls=None, state_file=None, fallback=()):
+        """A CatalogDiscovery over the supplier's listing pages"""
+        return CatalogDiscovery(get, listing_urls or self.listing_urls, state_file=state_file, fallback=fallback)
+
+    def reference(self, url, title=""):
+        """(color reference, number) of a product, or (None, None)"""
+        return classifier.extract_reference(url, title)
+
+    def enamel_type(self, url, title="", content=""):
+        """Type named in the page text; suppliers without a known numbering default to opaque"""
+        return classifier.keyword_type(url, title, content) or classifier.DEFAULT_TYPE
+
+    @abc.abstractmethod
+    def image_candidates(self, page):
+        """Product image URLs on a parsed product page, best first"""
+
+    def original_url(self, url):
+        """The full-size asset behind a resized image URL, or None"""
+        return None
+
+    def filename(self, reference):
+        # References of different suppliers overlap, so they get the supplier's name in front
+        return f"{self.name}-{reference}_hq.jpg"
+
+    @property
+    def discovery_file(self):
+        return f"discovered_products_{self.name}.json"
+
+
+# Image classes that mark the main product image and gallery images
+MAIN_IMAGE_CLASS = re.compile(r'product.*image|main.*image', re.I)
+GALLERY_IMAGE_CLASS = re.compile(r'gallery|zoom|product', re.I)
+# URL words of large renditions, and of images that are never the product
+HIGH_RES_WORDS = ('large', 'zoom', 'full', 'hd', 'high', 'original')
+SITE_IMAGE_WORDS = ('logo', 'icon', 'banner', 'nav', 'footer')
+
+
+class EmauxSoyerAdapter(SupplierAdapter):
+    """emaux-soyer.com: Magento listings, cache renditions and the Emaux Soyer numbering"""
+
+    name = "emaux-soyer"
+    listing_urls = EMAUX_SOYER_LISTING_URLS
+    image_selectors = [
+        'img.product-image-main',
+        '.product-image-main img',
+        '.fotorama__img',
+        '.gallery-image img',
+        'img[src*="catalog/product"]',
+        '.product-media img',
+        'img[alt*="enamel"]',
+        'img[alt*="Enamel"]'
+    ]
+
+    def enamel_type(self, url, title="", content=""):
+        """Keywords, then the Emaux Soyer numbering system"""
+        return classifier.enamel_type(url, title, content)
+
+    def image_candidates(self, page):
+        """Product image URLs on a parsed product page, in page order"""
+        urls = []
+        for img in page.candidates:
+            src = img.get('src') or img.get('data-src')
+            if not src or any(skip in src.lower() for skip in PLACEHOLDER_WORDS):
+                continue
+            if 'catalog/product' in src:
+                url = urljoin(page.url, src)
+                if url not in urls:
+                    urls.append(url)
+        return urls
+
+    def ranked_images(self, page):
+        """Every image on a parsed page ranked by how likely it is the product photo, absolute URLs
+
+        The soyer downloader's heuristic: main and gallery images by CSS
+        class and high-resolution renditions by URL, falling back to any
+        image that is not part of the site chrome.
+        """
+        main_images = []
+        gallery_images = []
+        high_res_images = []
+        other_images = []
+        for img in page.images:
+            src = img.get('src', '')
+            css_class = img.get('class', '')
+            if src and not main_images and MAIN_IMAGE_CLASS.search(css_class):
+                main_images.append(src)
+            if src and GALLERY_IMAGE_CLASS.search(css_class):
+                gallery_images.append(src)
+            for url in (src, img.get('data-src', ''), img.get('data-zoom-image', '')):
+                if url and any(word in url.lower() for word in HIGH_RES_WORDS):
+                    high_res_images.append(url)
+            if src and not any(word in src.lower() for word in SITE_IMAGE_WORDS):
+                other_images.append(src)
+
+        found = dict.fromkeys(main_images + gallery_images + high_res_images) or dict.fromkeys(other_images)
+        found = [url for url in found if not any(word in url.lower() for word in SITE_IMAGE_WORDS + PLACEHOLDER_WORDS)]
+
+        def score(url):
+            url_lower = url.lower()
+            points = 0
+            if any(word in url_lower for word in ('large', 'zoom', 'full', 'hd')):
+                points += 10
+            if 'product' in url_lower:
+                points += 5
+            if url_lower.endswith(('.jpg', '.jpeg')):
+                points += 3
+            elif url_lower.endswith('.png'):
+                points += 2
+            # Prefer longer URLs (often more detailed)
+            return points + len(url) * 0.01
+
+        ranked = sorted(found, key=score, reverse=True)
+        urls = ['https:' + url if url.startswith('//') else urljoin(page.url, url) for url in ranked]
+        return list(dict.fromkeys(urls))
+
+    def original_url(self, url):
+        return candidates.original_url(url)
+
+    def filename(self, reference):
+        # The layout the existing swatches and the storefront catalog already use
+        return f"{reference}_hq.jpg"
+
+    @property
+    def discovery_file(self):
+        return "discovered_products.json"
+
+
+# Shopify image size suffixes: name_600x.jpg, name_600x600@2x.jpg, name_grande.jpg
+_SHOPIFY_SIZE = re.compile(r'_(?:\d+x\d*|\d*x\d+|pico|icon|thumb|small|compact|medium|large|grande|1024x1024|'
+                           r'2048x2048|master)(?:_crop_[a-z]+)?(?:@\dx)?(?=\.[A-Za-z]+$)')
+_SHOPIFY_RESIZE_PARAMS = {"width", "height", "crop"}
+
+
+class ShopifyDiscovery(CatalogDiscovery):
+    """Walk Shopify collections through their products.json feed instead of the HTML listings"""
+
+    PAGE_SIZE = 250
+
+    def walk(self):
+        for collection_url in self.listing_urls:
+            parts = urlsplit(normalize_url(collection_url))
+            origin = f"{parts.scheme}://{parts.netloc}"
+            page = 1
+            while self.stats["listing_pages"] < self.max_pages:
+                feed_url = f"{origin}{parts.path.rstrip('/')}/products.json?limit={self.PAGE_SIZE}&page={page}"
+                try:
+                    response = self.get(feed_url, timeout=30)
+                    response.raise_for_status()
+                    products = json.loads(response.content).get("products", [])
+                except Exception as e:
+                    print(f"Error fetching listing {feed_url}: {e}")
+                    self.stats["errors"] += 1
+                    break
+                self.stats["listing_pages"] += 1
+                if not products:
+                    break
+                for product in products:
+                    if product.get("handle"):
+                        yield f"{origin}/products/{product['handle']}"
+                page += 1
+            else:
+                # Stopped at max_pages before the feed ran out
+                self.truncated = True
+
+
+class ShopifyAdapter(SupplierAdapter):
+    """Any Shopify storefront; listing URLs are its collection pages, e.g. https://shop.example/collections/enamels"""
+
+    name = "shopify"
+    image_selectors = [
+        '.product__media img',
+        '.product-single__media img',
+        '.product-gallery img',
+        'img[src*="/products/"]',
+    ]
+
+    def __init__(self, listing_urls=None, name=None):
+        super().__init__(listing_urls)
+        if not self.listing_urls:
+            raise ValueError("ShopifyAdapter needs the store's collection URLs")
+        # Files are named after the store, e.g. "shop-example-1040_hq.jpg"
+        labels = re.sub(r'^www\.', '', urlsplit(self.listing_urls[0]).hostname or '').split('.')
+        if len(labels) > 1 and not labels[-1].isdigit():
+            labels = labels[:-1]
+        self.name = name or '-'.join(labels)
+
+    def discovery(self, get, listing_urls=None, state_file=None, fallback=()):
+        return ShopifyDiscovery(get, listing_urls or self.listing_urls, state_file=state_file, fallback=fallback)
+
+    def image_candidates(self, page):
+        """The og:image, then the product media images, in page order"""
+        sources = [page.metadata.get("og:image:secure_url") or page.metadata.get("og:image")]
+        for img in page.candidates:
+            # Themes leave trailing commas; the last non-empty srcset entry is the widest rendition
+            srcset = [entry for entry in (img.get('data-srcset') or img.get('srcset') or '').split(',')
+                      if entry.strip()]
+            sources.append(srcset[-1].split()[0] if srcset else None)
+            sources.append(img.get('data-src') or img.get('src'))
+        urls = []
+        for src in sources:
+            if not src or any(skip in src.lower() for skip in PLACEHOLDER_WORDS):
+                continue
+            url = urljoin(page.url, src)
+            if url not in urls:
+                urls.append(url)
+        return urls
+
+    def original_url(self, url):
+        """Drop Shopify's size suffix and resize parameters; None if url has neither"""
+        parts = urlsplit(url)
+        path = _SHOPIFY_SIZE.sub('', parts.path, count=1)
+        query = [(key, value) for key, value in parse_qsl(parts.query) if key not in _SHOPIFY_RESIZE_PARAMS]
+        if path == parts.path and len(query) == len(parse_qsl(parts.query)):
+            return None
+        return urlunsplit(parts._replace(path=path, query=urlencode(query)))
+
+
+# name -> adapter class, for the command line
+SUPPLIERS = {
+    EmauxSoyerAdapter.name: EmauxSoyerAdapter,
+    ShopifyAdapter.name: ShopifyAdapter,
+}
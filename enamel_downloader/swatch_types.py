@@ -0,0 +1,387 @@
+"""
+Image-based enamel type classifier
+The downloaders file each swatch by keywords in its product URL and title,
+falling back to a table of product numbers and finally to "opaque", which
+puts nearly everything in opaques/. This stage looks at the swatch itself:
+it measures how light, how spread out in lightness, how saturated, how
+textured (lightness gradients) and how glossy the enamel is, on the
+downsampled foreground with NumPy in a process pool. Transparent enamels
+show the metal through them, so they are textured and uneven; opals are
+light, milky and smooth; opaques are flat.
+
+The folders themselves are not trusted as labels. A Gaussian naive Bayes
+model over those statistics is fitted only on swatches whose type is
+proven: the hand-filed swatches listed in swatch_labels.json (by content
+hash) and files whose product page names the type in a keyword. For these
+the proven type is final; for the others the image probabilities are
+combined with the number table into a suggested type and a confidence.
+
+By default misfiled swatches are only reported. With --move the proven
+ones are moved to their type's folder, and the manifests, the dedupe index
+and the storefront catalog follow the move; image-based suggestions are
+left for a person to check (and add to swatch_labels.json).
+
+Scores are cached by content hash in public/.cache/type_scores.json, so a
+file is only re-scored when its content changes.
+
+Requires NumPy and Pillow.
+
+    python -m enamel_downloader.swatch_types [--move] [--refit]
+"""
+
+import argparse
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from enamel_downloader import classifier
+from enamel_downloader.features import SAMPLE_SIZE, foreground_mask, rgb_to_lab
+from enamel_downloader.manifest import Manifest, file_sha256
+from enamel_downloader.store import MANIFESTS, TYPE_FOLDERS, TYPE_SCORES_FILE as SCORES_FILE, repoint, view_key
+
+TYPES = tuple(TYPE_FOLDERS)
+# Hand-checked swatches: {"labels": [{"file", "type", "sha256"}, ...]}, matched by content hash
+LABELS_FILE = Path(__file__).with_name("swatch_labels.json")
+REPORTS = ("complete_download_report.json", "download_report.json")
+SOURCE_SUFFIXES = (".jpg", ".jpeg", ".png")
+
+STAT_NAMES = ("lightness", "lightness_spread", "chroma", "gradient", "highlights", "lightness_range")
+# How far the number table is trusted; a keyword is proof
+TEXT_CONFIDENCE = {"number": 0.65}
+# Swatches are only reported as misfiled when the confidence reaches this
+MOVE_CONFIDENCE = 0.8
+# The statistics are far from independent (lightness spread and range move together), so
+# the summed log-likelihoods are divided by this to keep naive Bayes from being overconfident
+TEMPERATURE = 3.0
+
+
+def swatch_stats(source):
+    """Translucency and texture statistics of one swatch; runs in a worker process"""
+    with Image.open(source) as image:
+        image = image.convert("RGB")
+        image.thumbnail((SAMPLE_SIZE, SAMPLE_SIZE), Image.BILINEAR)
+        array = np.asarray(image, dtype=np.uint8)
+
+    mask = foreground_mask(array)
+    lab = rgb_to_lab(array)
+    lightness = lab[..., 0]
+    chroma = np.hypot(lab[..., 1], lab[..., 2])
+    gradient_y, gradient_x = np.gradient(lightness)
+    gradient = np.hypot(gradient_x, gradient_y)
+
+    foreground = lightness[mask]
+    low, high = np.percentile(foreground, [5, 95])
+    return [
+        float(foreground.mean()),
+        float(foreground.std()),
+        float(chroma[mask].mean()),
+        # Median rather than mean: the swatch's own edge is a gradient too
+        float(np.median(gradient[mask])),
+        float((foreground > 90).mean()),
+        float(high - low),
+    ]
+
+
+def _stats_or_error(source):
+    # Exceptions are returned rather than raised so one bad file does not end pool.map
+    try:
+        return swatch_stats(source), None
+    except Exception as e:
+        return None, str(e)
+
+
+class TypeModel:
+    """Gaussian naive Bayes over standardized swatch statistics"""
+
+    def __init__(self, center, scale, means, variances):
+        self.center = np.asarray(center, dtype=np.float64)
+        self.scale = np.asarray(scale, dtype=np.float64)
+        self.means = np.asarray(means, dtype=np.float64)
+        self.variances = np.asarray(variances, dtype=np.float64)
+
+    @classmethod
+    def fit(cls, stats, labels):
+        """Fit on an (n, len(STAT_NAMES)) array and the type of each row"""
+        stats = np.asarray(stats, dtype=np.float64)
+        labels = np.asarray(labels)
+        center = stats.mean(axis=0)
+        scale = np.where(stats.std(axis=0) > 0, stats.std(axis=0), 1.0)
+        standardized = (stats - center) / scale
+        means, variances = [], []
+        for type_name in TYPES:
+            rows = standardized[labels == type_name]
+            if len(rows) < 2:
+                # Too few examples to say anything about this type
+                rows = standardized
+            means.append(rows.mean(axis=0))
+            # Floored so one tight class cannot claim everything near its mean
+            variances.append(np.maximum(rows.var(axis=0), 0.05))
+        return cls(center, scale, means, variances)
+
+    def probabilities(self, stats):
+        """(n, len(TYPES)) probabilities per row of stats"""
+        standardized = (np.atleast_2d(np.asarray(stats, dtype=np.float64)) - self.center) / self.scale
+        log_likelihood = -0.5 * (((standardized[:, None, :] - self.means[None]) ** 2) / self.variances[None]
+                                 + np.log(2 * np.pi * self.variances[None])).sum(axis=2) / TEMPERATURE
+        log_likelihood -= log_likelihood.max(axis=1, keepdims=True)
+        likelihood = np.exp(log_likelihood)
+        return likelihood / likelihood.sum(axis=1, keepdims=True)
+
+    def to_dict(self):
+        return {"center": self.center.tolist(), "scale": self.scale.tolist(),
+                "means": self.means.tolist(), "variances": self.variances.tolist()}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["center"], data["scale"], data["means"], data["variances"])
+
+
+def text_probabilities(type_name, source):
+    """Probabilities per type implied by classifier.type_evidence"""
+    if type_name is None:
+        return np.full(len(TYPES), 1 / len(TYPES))
+    confidence = TEXT_CONFIDENCE[source]
+    probabilities = np.full(len(TYPES), (1 - confidence) / (len(TYPES) - 1))
+    probabilities[TYPES.index(type_name)] = confidence
+    return probabilities
+
+
+def load_labels(path=LABELS_FILE):
+    """content hash -> hand-checked type"""
+    try:
+        with open(path) as f:
+            return {label["sha256"]: label["type"] for label in json.load(f).get("labels", [])}
+    except (OSError, ValueError):
+        return {}
+
+
+class SwatchTypeClassifier:
+    """Score every swatch's type from its pixels and page text, and report (or refile) misfiled ones"""
+
+    def __init__(self, base_dir="public", workers=None, min_confidence=MOVE_CONFIDENCE, labels_file=LABELS_FILE):
+        self.base_dir = Path(base_dir)
+        self.state_file = self.base_dir / SCORES_FILE
+        self.workers = workers
+        self.min_confidence = min_confidence
+        self.labels = load_labels(labels_file)
+        self.stats = {"sources": 0, "scored": 0, "unchanged": 0, "failed": 0, "training": 0, "moved": 0,
+                      "conflicts": 0}
+
+    def load_state(self):
+        try:
+            with open(self.state_file) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save_state(self, state):
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = self.state_file.with_suffix(".tmp")
+        with open(temp_file, 'w') as f:
+            json.dump(state, f, indent=2)
+        os.replace(temp_file, self.state_file)
+
+    def sources(self):
+        """(key, folder type, path) of every swatch, key being its path under base_dir"""
+        for type_name, folder in TYPE_FOLDERS.items():
+            directory = self.base_dir / folder
+            if not directory.is_dir():
+                continue
+            for path in sorted(directory.iterdir()):
+                if path.suffix.lower() in SOURCE_SUFFIXES and not path.name.startswith('.'):
+                    yield path.relative_to(self.base_dir).as_posix(), type_name, path
+
+    def key_of(self, filename):
+        return view_key(self.base_dir, filename)
+
+    def text_evidence(self):
+        """key -> (type, source) from the product URLs (and titles) that stored each file"""
+        products = []
+        for name in MANIFESTS:
+            path = self.base_dir / name
+            if path.exists():
+                manifest = Manifest(path)
+                products.extend((entry["filename"], entry["product_url"], "")
+                                for entry in manifest.entries() if entry.get("filename"))
+                manifest.close()
+        if not products:
+            for name in REPORTS:
+                path = self.base_dir / name
+                if not path.exists():
+                    continue
+                with open(path) as f:
+                    report = json.load(f)
+                products.extend((result.get("filename"), result["product_url"], "")
+                                for result in report.get("results", []))
+                products.extend((result.get("filepath"), "", result.get("title", ""))
+                                for result in report.get("detailed_results", {}).get("downloaded", []))
+
+        evidence = {}
+        for filename, url, title in products:
+            if not filename:
+                continue
+            type_name, source = classifier.type_evidence(url, title)
+            key = self.key_of(filename)
+            # A keyword on any product page sharing the file beats the number table
+            if type_name and (key not in evidence or source == "keyword"):
+                evidence[key] = (type_name, source)
+        return evidence
+
+    def score(self, state, refit=False):
+        """Compute stats for new content hashes and decide their type; returns {key: (hash, path, folder type)}"""
+        scores = state.setdefault("scores", {})
+        files = {}
+        jobs = {}
+        for key, folder_type, path in self.sources():
+            content_hash = file_sha256(path)
+            self.stats["sources"] += 1
+            files[key] = (content_hash, path, folder_type)
+            if content_hash in scores and not refit:
+                self.stats["unchanged"] += 1
+            else:
+                jobs.setdefault(content_hash, path)
+
+        print(f"Scoring enamel type of {len(jobs)} swatches ({self.stats['unchanged']} unchanged)")
+        if jobs:
+            hashes = list(jobs)
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                chunksize = max(1, len(hashes) // ((self.workers or os.cpu_count() or 1) * 4))
+                for content_hash, (stats, error) in zip(hashes, pool.map(
+                        _stats_or_error, [str(jobs[content_hash]) for content_hash in hashes], chunksize=chunksize)):
+                    if error:
+                        print(f"Error scoring {jobs[content_hash]}: {error}")
+                        self.stats["failed"] += 1
+                        continue
+                    scores[content_hash] = {"stats": [round(value, 4) for value in stats]}
+
+        known = [(key, content_hash) for key, (content_hash, _, _) in files.items() if content_hash in scores]
+        if not known:
+            return files
+
+        evidence = self.text_evidence()
+        proven = {}
+        for key, content_hash in known:
+            text_type, text_source = evidence.get(key, (None, None))
+            if content_hash in self.labels:
+                proven[key] = (self.labels[content_hash], "label")
+            elif text_source == "keyword":
+                proven[key] = (text_type, "keyword")
+
+        # Only proven types teach the model what each type looks like; the folders are what it checks
+        training = [(scores[content_hash]["stats"], proven[key][0]) for key, content_hash in known if key in proven]
+        self.stats["training"] = len(training)
+        if training:
+            model = TypeModel.fit(*zip(*training))
+            state["model"] = model.to_dict()
+            image = model.probabilities([scores[content_hash]["stats"] for _, content_hash in known])
+        else:
+            state.pop("model", None)
+            image = np.full((len(known), len(TYPES)), 1 / len(TYPES))
+
+        for (key, content_hash), image_probabilities in zip(known, image):
+            text_type, text_source = evidence.get(key, (None, None))
+            if key in proven:
+                type_name, proof = proven[key]
+                confidence = 1.0
+            else:
+                proof = None
+                combined = image_probabilities * text_probabilities(text_type, text_source)
+                combined /= combined.sum()
+                type_name, confidence = TYPES[int(combined.argmax())], float(combined.max())
+            scores[content_hash].update({
+                "type": type_name,
+                "confidence": round(confidence, 3),
+                "proof": proof,
+                "image": {name: round(float(p), 3) for name, p in zip(TYPES, image_probabilities)},
+                "text": [text_type, text_source] if text_type else None,
+            })
+            self.stats["scored"] += 1
+        return files
+
+    def move(self, key, path, type_name, state):
+        """Move one swatch to its type's folder; False if a different file is already there"""
+        target = self.base_dir / TYPE_FOLDERS[type_name] / path.name
+        if target.exists():
+            self.stats["conflicts"] += 1
+            print(f"Not moving {key}: {target} already exists")
+            return False
+        os.replace(path, target)
+        new_key = target.relative_to(self.base_dir).as_posix()
+        moves = state.setdefault("moves", {})
+        # Earlier moves that ended at key now end at new_key
+        for old_key, moved_to in moves.items():
+            if moved_to == key:
+                moves[old_key] = new_key
+        moves[key] = new_key
+        self.stats["moved"] += 1
+        print(f"Moved {key} -> {new_key} ({type_name})")
+        return True
+
+    def run(self, move=False, refit=False):
+        """Score changed swatches and report the confidently misfiled ones; returns the stats
+
+        With move, the misfiled swatches whose type is proven are moved to
+        their folder; suggestions from the pixels alone are only reported.
+        """
+        state = self.load_state()
+        files = self.score(state, refit=refit)
+        scores = state.get("scores", {})
+
+        misfiled = []
+        for key, (content_hash, path, folder_type) in files.items():
+            score = scores.get(content_hash, {})
+            if score.get("type") and score["type"] != folder_type and score["confidence"] >= self.min_confidence:
+                misfiled.append((key, path, folder_type, score))
+
+        moved = {}
+        for key, path, folder_type, score in misfiled:
+            if not score.get("proof"):
+                print(f"Check {key}: looks {score['type']} rather than {folder_type} ({score['confidence']:.0%})")
+                continue
+            if not move:
+                print(f"Would move {key}: {folder_type} -> {score['type']} ({score['proof']})")
+                continue
+            if self.move(key, path, score["type"], state):
+                moved[key] = (state["moves"][key], score["type"])
+        if moved:
+            # The manifests and the dedupe index follow; the store's views are built from the manifests
+            repoint(self.base_dir, moved)
+
+        # Scores of content no longer on disk
+        current = {content_hash for content_hash, _, _ in files.values()}
+        state["scores"] = {content_hash: score for content_hash, score in scores.items() if content_hash in current}
+        self.save_state(state)
+        self.stats["misfiled"] = len(misfiled)
+        self.stats["to_check"] = sum(1 for *_, score in misfiled if not score.get("proof"))
+        return self.stats
+
+
+def load_moves(base_dir="public"):
+    """Old path -> current path of every swatch this stage moved"""
+    try:
+        with open(Path(base_dir) / SCORES_FILE) as f:
+            return json.load(f).get("moves", {})
+    except (OSError, ValueError):
+        return {}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Classify swatches by enamel type from their pixels and page text")
+    parser.add_argument("--base-dir", default="public")
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--move", action="store_true",
+                        help="move misfiled swatches whose type is proven (by default they are only reported)")
+    parser.add_argument("--refit", action="store_true", help="re-score every swatch, not only changed ones")
+    parser.add_argument("--min-confidence", type=float, default=MOVE_CONFIDENCE)
+    parser.add_argument("--labels", default=LABELS_FILE, help="hand-checked swatch types (default: %(default)s)")
+    args = parser.parse_args()
+    print(SwatchTypeClassifier(args.base_dir, args.workers, args.min_confidence, args.labels).run(
+        move=args.move, refit=args.refit))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+Responsive image variants
+Post-download stage that renders each swatch at several widths in JPEG and
+WebP on a process pool, and writes public/image_variants.json for the
+storefront's srcset attributes. Sources whose hash has not changed since the
+last build are skipped.
+
+Requires Pillow.
+"""
+
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from PIL import Image
+
+from enamel_downloader.manifest import file_sha256
+
+# Folders under public/ that hold downloaded swatches
+SOURCE_DIRS = ("opaques", "transparent_colors", "opale_colors")
+SOURCE_SUFFIXES = (".jpg", ".jpeg", ".png")
+
+VARIANT_WIDTHS = (160, 320, 640)
+
+# (file extension, Pillow format, save options)
+VARIANT_FORMATS = (
+    ("jpg", "JPEG", {"quality": 82, "optimize": True, "progressive": True}),
+    ("webp", "WEBP", {"quality": 80, "method": 6}),
+)
+
+
+def render_variants(source, output_dir, widths):
+    """Write every width/format variant of one source image; runs in a worker process"""
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    stem = Path(source).stem
+    variants = []
+
+    with Image.open(source) as image:
+        image = image.convert("RGB")
+        width, height = image.size
+        # Never upscale; a source narrower than every width gets one variant at its own size
+        targets = [w for w in widths if w < width] or [width]
+
+        for target in targets:
+            resized = image if target == width else image.resize(
+                (target, max(1, round(height * target / width))), Image.LANCZOS)
+            for ext, image_format, options in VARIANT_FORMATS:
+                path = output_dir / f"{stem}-{target}.{ext}"
+                temp_file = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+                resized.save(temp_file, image_format, **options)
+                os.replace(temp_file, path)
+                variants.append({
+                    "width": target,
+                    "format": ext,
+                    "path": str(path),
+                    "bytes": path.stat().st_size,
+                })
+
+    return {"width": width, "height": height, "variants": variants}
+
+
+class VariantBuilder:
+    """Generate responsive variants for every downloaded swatch"""
+
+    def __init__(self, base_dir="public", widths=VARIANT_WIDTHS, workers=None):
+        self.base_dir = Path(base_dir)
+        self.output_dir = self.base_dir / "variants"
+        self.manifest_file = self.base_dir / "image_variants.json"
+        self.widths = tuple(widths)
+        self.workers = workers
+        self.stats = {"sources": 0, "rendered": 0, "unchanged": 0, "removed": 0, "failed": 0}
+
+    def sources(self):
+        for folder in SOURCE_DIRS:
+            directory = self.base_dir / folder
+            if not directory.is_dir():
+                continue
+            for path in sorted(directory.iterdir()):
+                if path.suffix.lower() in SOURCE_SUFFIXES and not path.name.startswith('.'):
+                    yield path
+
+    def load_manifest(self):
+        if not self.manifest_file.exists():
+            return {}
+        try:
+            with open(self.manifest_file) as f:
+                return json.load(f).get("images", {})
+        except (OSError, ValueError):
+            return {}
+
+    def is_current(self, entry, source_hash):
+        return (entry and entry.get("hash") == source_hash and entry.get("widths") == list(self.widths)
+                and all((self.base_dir / variant["path"]).exists() for variant in entry["variants"]))
+
+    def build(self):
+        """Render changed sources and rewrite the variant manifest"""
+        previous = self.load_manifest()
+        images = {}
+        jobs = {}
+
+        for source in self.sources():
+            key = source.relative_to(self.base_dir).as_posix()
+            source_hash = file_sha256(source)
+            self.stats["sources"] += 1
+            if self.is_current(previous.get(key), source_hash):
+                images[key] = previous[key]
+                self.stats["unchanged"] += 1
+            else:
+                jobs[key] = (source, source_hash)
+
+        print(f"Rendering variants for {len(jobs)} images ({self.stats['unchanged']} unchanged)")
+
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            futures = {
+                key: pool.submit(render_variants, str(source), str(self.output_dir / Path(key).parent), self.widths)
+                for key, (source, _) in jobs.items()
+            }
+            for key, future in futures.items():
+                try:
+                    rendered = future.result()
+                except Exception as e:
+                    print(f"Error rendering variants for {key}: {e}")
+                    self.stats["failed"] += 1
+                    continue
+                for variant in rendered["variants"]:
+                    variant["path"] = Path(variant["path"]).relative_to(self.base_dir).as_posix()
+                images[key] = dict(rendered, hash=jobs[key][1], widths=list(self.widths))
+                self.stats["rendered"] += 1
+
+        # Variants of sources that no longer exist
+        for key in set(previous) - set(images) - set(jobs):
+            for variant in previous[key].get("variants", []):
+                try:
+                    (self.base_dir / variant["path"]).unlink()
+                except FileNotFoundError:
+                    pass
+            self.stats["removed"] += 1
+
+        for entry in images.values():
+            entry["srcset"] = {
+                ext: ", ".join(f"{variant['path']} {variant['width']}w"
+                               for variant in entry["variants"] if variant["format"] == ext)
+                for ext, _, _ in VARIANT_FORMATS
+            }
+
+        temp_file = self.manifest_file.with_suffix(".tmp")
+        with open(temp_file, 'w') as f:
+            json.dump({"widths": list(self.widths), "images": dict(sorted(images.items()))}, f, indent=2)
+        os.replace(temp_file, self.manifest_file)
+
+        print(f"Variant manifest saved to: {self.manifest_file}")
+        return self.stats
+
+
+if __name__ == "__main__":
+    print(VariantBuilder().build())
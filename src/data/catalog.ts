@@ -0,0 +1,6311 @@
+// Generated by `python -m enamel_downloader.catalog` from the download manifest. Do not edit.
+// source: cfa82d150fe7cd06
+
+export interface CatalogImage {
+  id: string;
+  reference: string;
+  colorReference: string | null;
+  type: 'transparent' | 'opaque' | 'opale';
+  image: string;
+  width: number | null;
+  height: number | null;
+  bytes: number;
+  hash: string | null;
+  srcset: { jpg: string; webp: string } | null;
+  productUrls: string[];
+  color: string | null;
+  palette: string[];
+  lab: [number, number, number] | null;
+  hue: number | null;
+}
+
+export const catalogImages: CatalogImage[] = [
+  {
+    "id": "op-08",
+    "reference": "08",
+    "colorReference": null,
+    "type": "opale",
+    "image": "opale_colors/08.jpg",
+    "width": 235,
+    "height": 257,
+    "bytes": 9297,
+    "hash": "d3fa20bf5b42363073670fd377e41007d000fe9f671959140473583f1f18f40f",
+    "srcset": {
+      "jpg": "variants/opale_colors/08-160.jpg 160w",
+      "webp": "variants/opale_colors/08-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#99a3b3",
+    "palette": [
+      "#99a3b3",
+      "#fcfcfc",
+      "#bbbdc3"
+    ],
+    "lab": [
+      73.8,
+      -0.1,
+      -7.1
+    ],
+    "hue": 269.2
+  },
+  {
+    "id": "op-101",
+    "reference": "101",
+    "colorReference": null,
+    "type": "opale",
+    "image": "opale_colors/101.jpg",
+    "width": 258,
+    "height": 258,
+    "bytes": 8981,
+    "hash": "db3932a876c214ebfdd06a27b4bb45046b6063f8c15f9caf0aa5634bf312c184",
+    "srcset": {
+      "jpg": "variants/opale_colors/101-160.jpg 160w",
+      "webp": "variants/opale_colors/101-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#dbc6bc",
+    "palette": [
+      "#dbc6bc",
+      "#d6bfb3",
+      "#e7dcd6"
+    ],
+    "lab": [
+      80.6,
+      5.7,
+      8.0
+    ],
+    "hue": 54.5
+  },
+  {
+    "id": "op-607",
+    "reference": "607",
+    "colorReference": null,
+    "type": "opale",
+    "image": "opale_colors/607.jpg",
+    "width": 263,
+    "height": 260,
+    "bytes": 9937,
+    "hash": "8df2b4fdd421c6a9b59d9db2a3ee4e3d951f05cf56b1aa41d715b8c1cefc98a0",
+    "srcset": {
+      "jpg": "variants/opale_colors/607-160.jpg 160w",
+      "webp": "variants/opale_colors/607-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#cfb1a6",
+    "palette": [
+      "#cfb1a6",
+      "#cbab9d",
+      "#e2d6ce"
+    ],
+    "lab": [
+      74.3,
+      9.0,
+      10.3
+    ],
+    "hue": 48.9
+  },
+  {
+    "id": "op-609",
+    "reference": "609",
+    "colorReference": null,
+    "type": "opale",
+    "image": "opale_colors/609.jpg",
+    "width": 262,
+    "height": 262,
+    "bytes": 10154,
+    "hash": "c4ba714a2570f5db097f375d366f3238e599ce1ef67c0d2748502a22a7a03f75",
+    "srcset": {
+      "jpg": "variants/opale_colors/609-160.jpg 160w",
+      "webp": "variants/opale_colors/609-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#ceb38f",
+    "palette": [
+      "#ceb38f",
+      "#d3bb9b",
+      "#e6dccd"
+    ],
+    "lab": [
+      75.6,
+      4.2,
+      20.8
+    ],
+    "hue": 78.6
+  },
+  {
+    "id": "op-610",
+    "reference": "610",
+    "colorReference": null,
+    "type": "opale",
+    "image": "opale_colors/610.jpg",
+    "width": 263,
+    "height": 260,
+    "bytes": 10832,
+    "hash": "3383e56594395908ab2dc6eb53860e5e712c1da42a0ed6a2a7a82e523479e2cd",
+    "srcset": {
+      "jpg": "variants/opale_colors/610-160.jpg 160w",
+      "webp": "variants/opale_colors/610-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#c2b7a2",
+    "palette": [
+      "#c2b7a2",
+      "#b7a794",
+      "#ddd7ce"
+    ],
+    "lab": [
+      74.6,
+      0.9,
+      11.7
+    ],
+    "hue": 85.6
+  },
+  {
+    "id": "op-610B",
+    "reference": "610B",
+    "colorReference": null,
+    "type": "opale",
+    "image": "opale_colors/610B.jpg",
+    "width": 500,
+    "height": 500,
+    "bytes": 12613,
+    "hash": "b610cbc383c16e18e2f6409952d7e16f31225f013b8469cfc6e6b2145fc6e7b1",
+    "srcset": {
+      "jpg": "variants/opale_colors/610B-160.jpg 160w, variants/opale_colors/610B-320.jpg 320w",
+      "webp": "variants/opale_colors/610B-160.webp 160w, variants/opale_colors/610B-320.webp 320w"
+    },
+    "productUrls": [],
+    "color": "#798e41",
+    "palette": [
+      "#798e41",
+      "#899445",
+      "#a1ab72"
+    ],
+    "lab": [
+      58.0,
+      -17.6,
+      38.2
+    ],
+    "hue": 114.7
+  },
+  {
+    "id": "op-6B10B",
+    "reference": "6B10B",
+    "colorReference": null,
+    "type": "opale",
+    "image": "opale_colors/6B10B.jpg",
+    "width": 262,
+    "height": 263,
+    "bytes": 11451,
+    "hash": "296254c1917782bdf1fcb0bc9f90eae32d88c2b1e70a42b7e7608bc913f9c29c",
+    "srcset": {
+      "jpg": "variants/opale_colors/6B10B-160.jpg 160w",
+      "webp": "variants/opale_colors/6B10B-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#a1a361",
+    "palette": [
+      "#a1a361",
+      "#aca96e",
+      "#d7d3bf"
+    ],
+    "lab": [
+      67.7,
+      -9.3,
+      31.3
+    ],
+    "hue": 106.5
+  },
+  {
+    "id": "op-8",
+    "reference": "8",
+    "colorReference": null,
+    "type": "opale",
+    "image": "opale_colors/8.jpg",
+    "width": 256,
+    "height": 260,
+    "bytes": 7827,
+    "hash": "df79873eb855b24cc6431642623802e20e8f689313f7c0b9b86b7bcabc098f3f",
+    "srcset": {
+      "jpg": "variants/opale_colors/8-160.jpg 160w",
+      "webp": "variants/opale_colors/8-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#acc7d7",
+    "palette": [
+      "#acc7d7",
+      "#baceda",
+      "#d0dce2"
+    ],
+    "lab": [
+      79.9,
+      -5.0,
+      -10.0
+    ],
+    "hue": 243.4
+  },
+  {
+    "id": "op-swatch_2",
+    "reference": "swatch_2",
+    "colorReference": null,
+    "type": "opale",
+    "image": "opale_colors/swatch_2.jpg",
+    "width": 252,
+    "height": 255,
+    "bytes": 6734,
+    "hash": "bd227f015fda8039e126df27ce54ff901cccfd25bb803346aa340e1c2eb9ac5a",
+    "srcset": {
+      "jpg": "variants/opale_colors/swatch_2-160.jpg 160w",
+      "webp": "variants/opale_colors/swatch_2-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#e1d6bd",
+    "palette": [
+      "#e1d6bd",
+      "#e5ddc9",
+      "#f1eee6"
+    ],
+    "lab": [
+      87.3,
+      -0.2,
+      12.0
+    ],
+    "hue": 91.0
+  },
+  {
+    "id": "o-100_hq",
+    "reference": "100_hq",
+    "colorReference": "100",
+    "type": "opaque",
+    "image": "opaques/100_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 19270,
+    "hash": "9d3d046ac316fbddf451c777880ee2d251c92217c60b3210ecd006abcac4f277",
+    "srcset": {
+      "jpg": "variants/opaques/100_hq-160.jpg 160w, variants/opaques/100_hq-320.jpg 320w",
+      "webp": "variants/opaques/100_hq-160.webp 160w, variants/opaques/100_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/bleu-100-en-poudre.html"
+    ],
+    "color": "#283c75",
+    "palette": [
+      "#283c75",
+      "#1f356f",
+      "#53638d"
+    ],
+    "lab": [
+      26.7,
+      11.8,
+      -34.9
+    ],
+    "hue": 288.7
+  },
+  {
+    "id": "o-1044_hq",
+    "reference": "1044_hq",
+    "colorReference": "1044",
+    "type": "opaque",
+    "image": "opaques/1044_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 13129,
+    "hash": "4b41995769e737da6cc33606b6444d8fce79b907d8d35f8bfc72799b5eeeae88",
+    "srcset": {
+      "jpg": "variants/opaques/1044_hq-160.jpg 160w, variants/opaques/1044_hq-320.jpg 320w",
+      "webp": "variants/opaques/1044_hq-160.webp 160w, variants/opaques/1044_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/rose-1044-en-poudre.html"
+    ],
+    "color": "#ce6767",
+    "palette": [
+      "#ce6767",
+      "#ed958f",
+      "#d97e7a"
+    ],
+    "lab": [
+      58.8,
+      38.6,
+      18.7
+    ],
+    "hue": 25.8
+  },
+  {
+    "id": "o-1046_hq",
+    "reference": "1046_hq",
+    "colorReference": "1046",
+    "type": "opaque",
+    "image": "opaques/1046_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 21955,
+    "hash": "8fa981c0ad189a4fa772ef6081a2855357cb9bd9e1109a17c1bed7fa211ce4ea",
+    "srcset": {
+      "jpg": "variants/opaques/1046_hq-160.jpg 160w, variants/opaques/1046_hq-320.jpg 320w",
+      "webp": "variants/opaques/1046_hq-160.webp 160w, variants/opaques/1046_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/rose-1046-en-poudre.html"
+    ],
+    "color": "#bf6e5a",
+    "palette": [
+      "#bf6e5a",
+      "#d5826c",
+      "#f4ab91"
+    ],
+    "lab": [
+      58.5,
+      29.3,
+      25.2
+    ],
+    "hue": 40.7
+  },
+  {
+    "id": "o-104_hq",
+    "reference": "104_hq",
+    "colorReference": "104",
+    "type": "opaque",
+    "image": "opaques/104_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 22096,
+    "hash": "eb13e18e8dc02c12eb994a1e38d77c994f8c9beace9dc80f845cc43ceec8dabd",
+    "srcset": {
+      "jpg": "variants/opaques/104_hq-160.jpg 160w, variants/opaques/104_hq-320.jpg 320w",
+      "webp": "variants/opaques/104_hq-160.webp 160w, variants/opaques/104_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/violet-104-en-poudre.html"
+    ],
+    "color": "#2c2829",
+    "palette": [
+      "#2c2829",
+      "#3a3335",
+      "#615d5e"
+    ],
+    "lab": [
+      19.5,
+      2.4,
+      -0.3
+    ],
+    "hue": null
+  },
+  {
+    "id": "o-10_hq",
+    "reference": "10_hq",
+    "colorReference": "10",
+    "type": "opaque",
+    "image": "opaques/10_hq.jpg",
+    "width": 220,
+    "height": 220,
+    "bytes": 9421,
+    "hash": "abd45120b0fa31f173306d8fcdfc405212045dce648f8d02f6f89d9990697a74",
+    "srcset": {
+      "jpg": "variants/opaques/10_hq-160.jpg 160w",
+      "webp": "variants/opaques/10_hq-160.webp 160w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/vert-10-en-poudre.html"
+    ],
+    "color": "#28221b",
+    "palette": [
+      "#28221b",
+      "#352d21",
+      "#443925"
+    ],
+    "lab": [
+      16.3,
+      1.2,
+      7.5
+    ],
+    "hue": 80.9
+  },
+  {
+    "id": "o-111_hq",
+    "reference": "111_hq",
+    "colorReference": "111",
+    "type": "opaque",
+    "image": "opaques/111_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 20726,
+    "hash": "c2ad853644b81191ef16702515c6f226fdf1414d0ab69780d0cceda1a5b95356",
+    "srcset": {
+      "jpg": "variants/opaques/111_hq-160.jpg 160w, variants/opaques/111_hq-320.jpg 320w",
+      "webp": "variants/opaques/111_hq-160.webp 160w, variants/opaques/111_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/lilas-111-en-poudre.html"
+    ],
+    "color": "#323232",
+    "palette": [
+      "#323232",
+      "#5d5d5d",
+      "#656565"
+    ],
+    "lab": [
+      22.3,
+      -0.0,
+      0.0
+    ],
+    "hue": null
+  },
+  {
+    "id": "o-119_hq",
+    "reference": "119_hq",
+    "colorReference": "119",
+    "type": "opaque",
+    "image": "opaques/119_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 24795,
+    "hash": "f3c0a375cee5ff8a0d225fa11b9db758604f77a0b4cedaab34bfd15799cddd0f",
+    "srcset": {
+      "jpg": "variants/opaques/119_hq-160.jpg 160w, variants/opaques/119_hq-320.jpg 320w",
+      "webp": "variants/opaques/119_hq-160.webp 160w, variants/opaques/119_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/vert-119-en-poudre.html"
+    ],
+    "color": "#034428",
+    "palette": [
+      "#034428",
+      "#02542c",
+      "#45896b"
+    ],
+    "lab": [
+      29.2,
+      -29.1,
+      13.6
+    ],
+    "hue": 155.0
+  },
+  {
+    "id": "o-126_hq",
+    "reference": "126_hq",
+    "colorReference": "126",
+    "type": "opaque",
+    "image": "opaques/126_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 32613,
+    "hash": "9b9cef92c512a927822b0ebbddc2f72ec6c298b83d69c77dd356b68884f586d9",
+    "srcset": {
+      "jpg": "variants/opaques/126_hq-160.jpg 160w, variants/opaques/126_hq-320.jpg 320w",
+      "webp": "variants/opaques/126_hq-160.webp 160w, variants/opaques/126_hq-320.webp 320w"
+    },
+    "productUrls": [],
+    "color": "#4897b5",
+    "palette": [
+      "#4897b5",
+      "#e8efed",
+      "#91bcca"
+    ],
+    "lab": [
+      70.3,
+      -11.1,
+      -15.1
+    ],
+    "hue": 233.7
+  },
+  {
+    "id": "o-127_hq",
+    "reference": "127_hq",
+    "colorReference": "127",
+    "type": "opaque",
+    "image": "opaques/127_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 35120,
+    "hash": "48954268d3bd1172100f4114ffaf50742a6be1d1896713ab577885dca1b8b331",
+    "srcset": {
+      "jpg": "variants/opaques/127_hq-160.jpg 160w, variants/opaques/127_hq-320.jpg 320w",
+      "webp": "variants/opaques/127_hq-160.webp 160w, variants/opaques/127_hq-320.webp 320w"
+    },
+    "productUrls": [],
+    "color": "#196289",
+    "palette": [
+      "#196289",
+      "#eaefed",
+      "#6f92a8"
+    ],
+    "lab": [
+      56.5,
+      -5.6,
+      -18.5
+    ],
+    "hue": 253.2
+  },
+  {
+    "id": "o-13_hq",
+    "reference": "13_hq",
+    "colorReference": "13",
+    "type": "opaque",
+    "image": "opaques/13_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 16243,
+    "hash": "8ff1308b8b33a97b5f4c560afb45b975195de2321c247a8192e446e734eed43d",
+    "srcset": {
+      "jpg": "variants/opaques/13_hq-160.jpg 160w, variants/opaques/13_hq-320.jpg 320w",
+      "webp": "variants/opaques/13_hq-160.webp 160w, variants/opaques/13_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/gris-bleu-13-en-poudre.html"
+    ],
+    "color": "#485a7b",
+    "palette": [
+      "#485a7b",
+      "#374b77",
+      "#6a7894"
+    ],
+    "lab": [
+      36.6,
+      3.7,
+      -23.2
+    ],
+    "hue": 279.1
+  },
+  {
+    "id": "o-157",
+    "reference": "157",
+    "colorReference": null,
+    "type": "opaque",
+    "image": "opaques/157.jpg",
+    "width": 180,
+    "height": 184,
+    "bytes": 6842,
+    "hash": "3401249c8de944c4c7057c62ac02a187efc776f0647a08558778a852ae38bd37",
+    "srcset": {
+      "jpg": "variants/opaques/157-160.jpg 160w",
+      "webp": "variants/opaques/157-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#d6c8ac",
+    "palette": [
+      "#d6c8ac",
+      "#c9bc9d",
+      "#e4ddcd"
+    ],
+    "lab": [
+      80.6,
+      -0.2,
+      15.5
+    ],
+    "hue": 90.7
+  },
+  {
+    "id": "o-15_hq",
+    "reference": "15_hq",
+    "colorReference": "15",
+    "type": "opaque",
+    "image": "opaques/15_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 16833,
+    "hash": "46de6b7884ddae3cd0a52e465e16be5f51a3c1b809abe5767b7bab45d52a95f6",
+    "srcset": {
+      "jpg": "variants/opaques/15_hq-160.jpg 160w, variants/opaques/15_hq-320.jpg 320w",
+      "webp": "variants/opaques/15_hq-160.webp 160w, variants/opaques/15_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/jaune-15-en-poudre.html"
+    ],
+    "color": "#9a692e",
+    "palette": [
+      "#9a692e",
+      "#af844d",
+      "#d2c1b1"
+    ],
+    "lab": [
+      53.2,
+      12.2,
+      37.0
+    ],
+    "hue": 71.8
+  },
+  {
+    "id": "o-160_hq",
+    "reference": "160_hq",
+    "colorReference": "160",
+    "type": "opaque",
+    "image": "opaques/160_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 2775,
+    "hash": "9db10a609dae5b33c22ffe6ebc34300f2208036bc47a56e2146ca87091a41d21",
+    "srcset": {
+      "jpg": "variants/opaques/160_hq-160.jpg 160w, variants/opaques/160_hq-320.jpg 320w",
+      "webp": "variants/opaques/160_hq-160.webp 160w, variants/opaques/160_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/blanc-160-en-poudre.html"
+    ],
+    "color": "#ffffff",
+    "palette": [
+      "#ffffff"
+    ],
+    "lab": [
+      100.0,
+      -0.0,
+      0.0
+    ],
+    "hue": null
+  },
+  {
+    "id": "o-163_hq",
+    "reference": "163_hq",
+    "colorReference": "163",
+    "type": "opaque",
+    "image": "opaques/163_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 30439,
+    "hash": "52489dd3c9f8b16db25e2ac71c211217376fd00a904de321cf03029f4d45f2e5",
+    "srcset": {
+      "jpg": "variants/opaques/163_hq-160.jpg 160w, variants/opaques/163_hq-320.jpg 320w",
+      "webp": "variants/opaques/163_hq-160.webp 160w, variants/opaques/163_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/bleu-163-en-poudre.html"
+    ],
+    "color": "#6669a8",
+    "palette": [
+      "#6669a8",
+      "#141c52",
+      "#c5d0ef"
+    ],
+    "lab": [
+      38.2,
+      14.7,
+      -31.3
+    ],
+    "hue": 295.2
+  },
+  {
+    "id": "o-172_hq",
+    "reference": "172_hq",
+    "colorReference": "172",
+    "type": "opaque",
+    "image": "opaques/172_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 27347,
+    "hash": "535df6195ab3d3e1675b114403e666e93eb48ea41893df28ef6f1d24f8a80e48",
+    "srcset": {
+      "jpg": "variants/opaques/172_hq-160.jpg 160w, variants/opaques/172_hq-320.jpg 320w",
+      "webp": "variants/opaques/172_hq-160.webp 160w, variants/opaques/172_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/marron-172-en-poudre.html"
+    ],
+    "color": "#986c2c",
+    "palette": [
+      "#986c2c",
+      "#a77327",
+      "#c6995f"
+    ],
+    "lab": [
+      52.8,
+      11.8,
+      42.5
+    ],
+    "hue": 74.5
+  },
+  {
+    "id": "o-173_hq",
+    "reference": "173_hq",
+    "colorReference": "173",
+    "type": "opaque",
+    "image": "opaques/173_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 25489,
+    "hash": "38369ae8ce8a1bb87af3e587308f1264932d8999066f1b6a3010f4fb0efcf605",
+    "srcset": {
+      "jpg": "variants/opaques/173_hq-160.jpg 160w, variants/opaques/173_hq-320.jpg 320w",
+      "webp": "variants/opaques/173_hq-160.webp 160w, variants/opaques/173_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/marron-173-en-poudre.html"
+    ],
+    "color": "#563e2e",
+    "palette": [
+      "#563e2e",
+      "#ad8f7b",
+      "#7b5d48"
+    ],
+    "lab": [
+      36.0,
+      8.5,
+      14.2
+    ],
+    "hue": 59.1
+  },
+  {
+    "id": "o-175_hq",
+    "reference": "175_hq",
+    "colorReference": "175",
+    "type": "opaque",
+    "image": "opaques/175_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 26885,
+    "hash": "5c49e3a548afaf719fc5182ebe302d20d09a0068393b556b6f7725c192cc4f97",
+    "srcset": {
+      "jpg": "variants/opaques/175_hq-160.jpg 160w, variants/opaques/175_hq-320.jpg 320w",
+      "webp": "variants/opaques/175_hq-160.webp 160w, variants/opaques/175_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/marron-175-en-poudre.html"
+    ],
+    "color": "#131313",
+    "palette": [
+      "#131313",
+      "#202020",
+      "#4b4b4b"
+    ],
+    "lab": [
+      8.8,
+      -0.0,
+      0.0
+    ],
+    "hue": null
+  },
+  {
+    "id": "o-176_hq",
+    "reference": "176_hq",
+    "colorReference": "176",
+    "type": "opaque",
+    "image": "opaques/176_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 26154,
+    "hash": "65ff60a982aaa570151b4cd2bfa4649741f687b473593f05c64134ec2f25ef98",
+    "srcset": {
+      "jpg": "variants/opaques/176_hq-160.jpg 160w, variants/opaques/176_hq-320.jpg 320w",
+      "webp": "variants/opaques/176_hq-160.webp 160w, variants/opaques/176_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/marron-176-en-poudre.html"
+    ],
+    "color": "#111111",
+    "palette": [
+      "#111111",
+      "#181818",
+      "#494949"
+    ],
+    "lab": [
+      8.0,
+      -0.0,
+      0.0
+    ],
+    "hue": null
+  },
+  {
+    "id": "o-177_hq",
+    "reference": "177_hq",
+    "colorReference": "177",
+    "type": "opaque",
+    "image": "opaques/177_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 16299,
+    "hash": "c02d18818912574841eafe229fa4dea668e2d84f52c78b42d42eb9d3b79d44c1",
+    "srcset": {
+      "jpg": "variants/opaques/177_hq-160.jpg 160w, variants/opaques/177_hq-320.jpg 320w",
+      "webp": "variants/opaques/177_hq-160.webp 160w, variants/opaques/177_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/noir-177-en-poudre.html"
+    ],
+    "color": "#16201f",
+    "palette": [
+      "#16201f",
+      "#3f4440",
+      "#7a7f78"
+    ],
+    "lab": [
+      17.3,
+      -4.2,
+      0.0
+    ],
+    "hue": null
+  },
+  {
+    "id": "o-184_hq",
+    "reference": "184_hq",
+    "colorReference": "184",
+    "type": "opaque",
+    "image": "opaques/184_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 22459,
+    "hash": "8b4299b6111913eb2db40a1cc16e638d8a7149ae37870586fbdaa06564afd66c",
+    "srcset": {
+      "jpg": "variants/opaques/184_hq-160.jpg 160w, variants/opaques/184_hq-320.jpg 320w",
+      "webp": "variants/opaques/184_hq-160.webp 160w, variants/opaques/184_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/turquoise-184-en-poudre.html"
+    ],
+    "color": "#105879",
+    "palette": [
+      "#105879",
+      "#2c6782",
+      "#7496aa"
+    ],
+    "lab": [
+      40.8,
+      -8.4,
+      -21.9
+    ],
+    "hue": 249.0
+  },
+  {
+    "id": "o-185_hq",
+    "reference": "185_hq",
+    "colorReference": "185",
+    "type": "opaque",
+    "image": "opaques/185_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 15225,
+    "hash": "6e1ee74e342b4599f630fbaebc492492d06e256deb2dea52bd2742afb760365f",
+    "srcset": {
+      "jpg": "variants/opaques/185_hq-160.jpg 160w, variants/opaques/185_hq-320.jpg 320w",
+      "webp": "variants/opaques/185_hq-160.webp 160w, variants/opaques/185_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/turquoise-185-en-poudre.html"
+    ],
+    "color": "#126b70",
+    "palette": [
+      "#126b70",
+      "#08636d",
+      "#43898e"
+    ],
+    "lab": [
+      40.6,
+      -21.0,
+      -11.1
+    ],
+    "hue": 207.9
+  },
+  {
+    "id": "o-188_hq",
+    "reference": "188_hq",
+    "colorReference": "188",
+    "type": "opaque",
+    "image": "opaques/188_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 28772,
+    "hash": "005aacbcd2f1ea32776470e6b7f4461f7b5d27d50dd29abd5a63681e768e49d0",
+    "srcset": {
+      "jpg": "variants/opaques/188_hq-160.jpg 160w, variants/opaques/188_hq-320.jpg 320w",
+      "webp": "variants/opaques/188_hq-160.webp 160w, variants/opaques/188_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/vert-188-en-poudre.html"
+    ],
+    "color": "#986f17",
+    "palette": [
+      "#986f17",
+      "#b28020",
+      "#c49d56"
+    ],
+    "lab": [
+      53.0,
+      8.5,
+      50.6
+    ],
+    "hue": 80.5
+  },
+  {
+    "id": "o-189_hq",
+    "reference": "189_hq",
+    "colorReference": "189",
+    "type": "opaque",
+    "image": "opaques/189_hq.jpg",
+    "width": 220,
+    "height": 220,
+    "bytes": 9421,
+    "hash": "abd45120b0fa31f173306d8fcdfc405212045dce648f8d02f6f89d9990697a74",
+    "srcset": {
+      "jpg": "variants/opaques/189_hq-160.jpg 160w",
+      "webp": "variants/opaques/189_hq-160.webp 160w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/vert-189-en-poudre.html"
+    ],
+    "color": "#28221b",
+    "palette": [
+      "#28221b",
+      "#352d21",
+      "#443925"
+    ],
+    "lab": [
+      16.3,
+      1.2,
+      7.5
+    ],
+    "hue": 80.9
+  },
+  {
+    "id": "o-191_hq",
+    "reference": "191_hq",
+    "colorReference": "191",
+    "type": "opaque",
+    "image": "opaques/191_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 26258,
+    "hash": "f9ea9c728c0a351d1f69b2c41939b4909718c424c68ab0cac9a01bc1fdf36de6",
+    "srcset": {
+      "jpg": "variants/opaques/191_hq-160.jpg 160w, variants/opaques/191_hq-320.jpg 320w",
+      "webp": "variants/opaques/191_hq-160.webp 160w, variants/opaques/191_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/violet-191-en-poudre.html"
+    ],
+    "color": "#171717",
+    "palette": [
+      "#171717",
+      "#272727",
+      "#575757"
+    ],
+    "lab": [
+      12.1,
+      -0.0,
+      0.0
+    ],
+    "hue": null
+  },
+  {
+    "id": "o-1940_hq",
+    "reference": "1940_hq",
+    "colorReference": "1940",
+    "type": "opaque",
+    "image": "opaques/1940_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 18595,
+    "hash": "db1f17b3b212f5b5ac613208fb037f51b21aafaaf68f15195072c475340d9ada",
+    "srcset": {
+      "jpg": "variants/opaques/1940_hq-160.jpg 160w, variants/opaques/1940_hq-320.jpg 320w",
+      "webp": "variants/opaques/1940_hq-160.webp 160w, variants/opaques/1940_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/rose-1940-en-poudre.html"
+    ],
+    "color": "#ae6256",
+    "palette": [
+      "#ae6256",
+      "#bf6d5e",
+      "#c78b80"
+    ],
+    "lab": [
+      52.1,
+      29.2,
+      20.3
+    ],
+    "hue": 34.8
+  },
+  {
+    "id": "o-1942_hq",
+    "reference": "1942_hq",
+    "colorReference": "1942",
+    "type": "opaque",
+    "image": "opaques/1942_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 22430,
+    "hash": "fcc134638ad4e1bdc951f13b13adbef9a297363a108858fd7018bd7affd56f62",
+    "srcset": {
+      "jpg": "variants/opaques/1942_hq-160.jpg 160w, variants/opaques/1942_hq-320.jpg 320w",
+      "webp": "variants/opaques/1942_hq-160.webp 160w, variants/opaques/1942_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/rose-1942-en-poudre.html"
+    ],
+    "color": "#633340",
+    "palette": [
+      "#633340",
+      "#7e3a4d",
+      "#a06e75"
+    ],
+    "lab": [
+      32.4,
+      26.0,
+      2.1
+    ],
+    "hue": 4.6
+  },
+  {
+    "id": "o-194_hq",
+    "reference": "194_hq",
+    "colorReference": "194",
+    "type": "opaque",
+    "image": "opaques/194_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 26167,
+    "hash": "7ad483f57263ead18588d0bea8045e9dec9146e97102ed76cafc42ae5e9493c3",
+    "srcset": {
+      "jpg": "variants/opaques/194_hq-160.jpg 160w, variants/opaques/194_hq-320.jpg 320w",
+      "webp": "variants/opaques/194_hq-160.webp 160w, variants/opaques/194_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/violet-194-en-poudre.html"
+    ],
+    "color": "#141414",
+    "palette": [
+      "#141414",
+      "#4d4d4d",
+      "#242424"
+    ],
+    "lab": [
+      8.7,
+      -0.0,
+      0.0
+    ],
+    "hue": null
+  },
+  {
+    "id": "o-195",
+    "reference": "195",
+    "colorReference": null,
+    "type": "opaque",
+    "image": "opaques/195.jpg",
+    "width": 183,
+    "height": 184,
+    "bytes": 9278,
+    "hash": "7eda0e3079b17037dc8a58fff0d36f03b324538232cd7d633fdf7e1e9738d067",
+    "srcset": {
+      "jpg": "variants/opaques/195-160.jpg 160w",
+      "webp": "variants/opaques/195-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#25316f",
+    "palette": [
+      "#25316f",
+      "#464e7f",
+      "#b3b4c6"
+    ],
+    "lab": [
+      28.4,
+      14.9,
+      -34.1
+    ],
+    "hue": 293.6
+  },
+  {
+    "id": "o-195_hq",
+    "reference": "195_hq",
+    "colorReference": "195",
+    "type": "opaque",
+    "image": "opaques/195_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 15002,
+    "hash": "70a34d5d187ac53bc85c8298778e1d71487ee121fa850233520b56cd35cfeada",
+    "srcset": {
+      "jpg": "variants/opaques/195_hq-160.jpg 160w, variants/opaques/195_hq-320.jpg 320w",
+      "webp": "variants/opaques/195_hq-160.webp 160w, variants/opaques/195_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/bleu-195-f-en-poudre.html"
+    ],
+    "color": "#2a4294",
+    "palette": [
+      "#2a4294",
+      "#2c4892",
+      "#5a6ea9"
+    ],
+    "lab": [
+      32.5,
+      17.7,
+      -45.6
+    ],
+    "hue": 291.2
+  },
+  {
+    "id": "o-196",
+    "reference": "196",
+    "colorReference": null,
+    "type": "opaque",
+    "image": "opaques/196.jpg",
+    "width": 184,
+    "height": 184,
+    "bytes": 8714,
+    "hash": "7b6353dd88f2a275da321e94ca0590ad5d904e1a129d27668e8c66d93a9764ce",
+    "srcset": {
+      "jpg": "variants/opaques/196-160.jpg 160w",
+      "webp": "variants/opaques/196-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#4b58a5",
+    "palette": [
+      "#4b58a5",
+      "#656eaf",
+      "#b8bbd8"
+    ],
+    "lab": [
+      43.9,
+      16.5,
+      -40.1
+    ],
+    "hue": 292.4
+  },
+  {
+    "id": "o-196_hq",
+    "reference": "196_hq",
+    "colorReference": "196",
+    "type": "opaque",
+    "image": "opaques/196_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 12591,
+    "hash": "9a284d7eb3ee0bbe3ab69aa2f49afd4eff3b568cfe61717fa1a25d0999e4e0f3",
+    "srcset": {
+      "jpg": "variants/opaques/196_hq-160.jpg 160w, variants/opaques/196_hq-320.jpg 320w",
+      "webp": "variants/opaques/196_hq-160.webp 160w, variants/opaques/196_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/bleu-196-f-poudre.html"
+    ],
+    "color": "#3052a3",
+    "palette": [
+      "#3052a3",
+      "#5e78b4",
+      "#8498c2"
+    ],
+    "lab": [
+      37.7,
+      15.4,
+      -46.5
+    ],
+    "hue": 288.3
+  },
+  {
+    "id": "o-197_hq",
+    "reference": "197_hq",
+    "colorReference": "197",
+    "type": "opaque",
+    "image": "opaques/197_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 15775,
+    "hash": "0e8317dcf2525c9ebe22642029f182bff518657b1be6fbdb396fcdbed7f5ce45",
+    "srcset": {
+      "jpg": "variants/opaques/197_hq-160.jpg 160w, variants/opaques/197_hq-320.jpg 320w",
+      "webp": "variants/opaques/197_hq-160.webp 160w, variants/opaques/197_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/gris-bleu-197-f-en-poudre.html"
+    ],
+    "color": "#314150",
+    "palette": [
+      "#314150",
+      "#3a4954",
+      "#606c76"
+    ],
+    "lab": [
+      28.5,
+      -2.2,
+      -10.6
+    ],
+    "hue": 258.3
+  },
+  {
+    "id": "o-1_hq",
+    "reference": "1_hq",
+    "colorReference": "1",
+    "type": "opaque",
+    "image": "opaques/1_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 20402,
+    "hash": "80d8ccb5ec3152f4da036984eea3168953bd3953ec3eede886715295d6516247",
+    "srcset": {
+      "jpg": "variants/opaques/1_hq-160.jpg 160w, variants/opaques/1_hq-320.jpg 320w",
+      "webp": "variants/opaques/1_hq-160.webp 160w, variants/opaques/1_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/fondant-pour-cuivre-n-1-en-poudre.html"
+    ],
+    "color": "#d59776",
+    "palette": [
+      "#d59776",
+      "#e19e7b",
+      "#e5b497"
+    ],
+    "lab": [
+      69.8,
+      19.3,
+      27.0
+    ],
+    "hue": 54.4
+  },
+  {
+    "id": "o-2004_hq",
+    "reference": "2004_hq",
+    "colorReference": "2004",
+    "type": "opaque",
+    "image": "opaques/2004_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 23428,
+    "hash": "0573325efdead6f71a52cc351f2e6c45381620985ede1d987aa5900bc250aab1",
+    "srcset": {
+      "jpg": "variants/opaques/2004_hq-160.jpg 160w, variants/opaques/2004_hq-320.jpg 320w",
+      "webp": "variants/opaques/2004_hq-160.webp 160w, variants/opaques/2004_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/rose-2004-en-poudre.html"
+    ],
+    "color": "#250f15",
+    "palette": [
+      "#250f15",
+      "#3a2830",
+      "#aea8ab"
+    ],
+    "lab": [
+      15.2,
+      10.2,
+      -0.2
+    ],
+    "hue": 358.9
+  },
+  {
+    "id": "o-200_hq",
+    "reference": "200_hq",
+    "colorReference": "200",
+    "type": "opaque",
+    "image": "opaques/200_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 15746,
+    "hash": "68b46e16e1a9884404149b61ea32bb6f79a8cffcafce76a0d239f10ec914601e",
+    "srcset": {
+      "jpg": "variants/opaques/200_hq-160.jpg 160w, variants/opaques/200_hq-320.jpg 320w",
+      "webp": "variants/opaques/200_hq-160.webp 160w, variants/opaques/200_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/gris-bleu-200-poudre.html"
+    ],
+    "color": "#b1d5fa",
+    "palette": [
+      "#b1d5fa",
+      "#c2dbf9",
+      "#d4e8fc"
+    ],
+    "lab": [
+      84.8,
+      -3.2,
+      -20.7
+    ],
+    "hue": 261.2
+  },
+  {
+    "id": "o-20_hq",
+    "reference": "20_hq",
+    "colorReference": "20",
+    "type": "opaque",
+    "image": "opaques/20_hq.jpg",
+    "width": 220,
+    "height": 220,
+    "bytes": 9421,
+    "hash": "abd45120b0fa31f173306d8fcdfc405212045dce648f8d02f6f89d9990697a74",
+    "srcset": {
+      "jpg": "variants/opaques/20_hq-160.jpg 160w",
+      "webp": "variants/opaques/20_hq-160.webp 160w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/violet-20-en-morceaux.html"
+    ],
+    "color": "#28221b",
+    "palette": [
+      "#28221b",
+      "#352d21",
+      "#443925"
+    ],
+    "lab": [
+      16.3,
+      1.2,
+      7.5
+    ],
+    "hue": 80.9
+  },
+  {
+    "id": "o-237_hq",
+    "reference": "237_hq",
+    "colorReference": "237",
+    "type": "opaque",
+    "image": "opaques/237_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 20942,
+    "hash": "ce598b61075cb3dcd0f0cdf46375bae3e71f1a075225c292de39962365b88daa",
+    "srcset": {
+      "jpg": "variants/opaques/237_hq-160.jpg 160w, variants/opaques/237_hq-320.jpg 320w",
+      "webp": "variants/opaques/237_hq-160.webp 160w, variants/opaques/237_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/bleu-237-en-poudre.html"
+    ],
+    "color": "#487179",
+    "palette": [
+      "#487179",
+      "#5b777d",
+      "#779398"
+    ],
+    "lab": [
+      46.9,
+      -11.0,
+      -8.0
+    ],
+    "hue": 216.0
+  },
+  {
+    "id": "o-238_hq",
+    "reference": "238_hq",
+    "colorReference": "238",
+    "type": "opaque",
+    "image": "opaques/238_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 16995,
+    "hash": "5921ae0dd90dfc6c4ed1f52cfcf17c3beef6508adc2a568338ea0bc78ac7aaba",
+    "srcset": {
+      "jpg": "variants/opaques/238_hq-160.jpg 160w, variants/opaques/238_hq-320.jpg 320w",
+      "webp": "variants/opaques/238_hq-160.webp 160w, variants/opaques/238_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/bleu-238-en-poudre.html"
+    ],
+    "color": "#a1cbdd",
+    "palette": [
+      "#a1cbdd",
+      "#569bb8",
+      "#7bb1c6"
+    ],
+    "lab": [
+      71.2,
+      -11.5,
+      -16.7
+    ],
+    "hue": 235.4
+  },
+  {
+    "id": "o-239_hq",
+    "reference": "239_hq",
+    "colorReference": "239",
+    "type": "opaque",
+    "image": "opaques/239_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 21824,
+    "hash": "19338d4b4fc3b8c6a1537cbe33f930c994457115cb1a59d390c18fe266af24c5",
+    "srcset": {
+      "jpg": "variants/opaques/239_hq-160.jpg 160w, variants/opaques/239_hq-320.jpg 320w",
+      "webp": "variants/opaques/239_hq-160.webp 160w, variants/opaques/239_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/bleu-239-en-poudre.html"
+    ],
+    "color": "#557571",
+    "palette": [
+      "#557571",
+      "#2b7274",
+      "#728f8d"
+    ],
+    "lab": [
+      47.1,
+      -14.9,
+      -4.1
+    ],
+    "hue": 195.4
+  },
+  {
+    "id": "o-23_hq",
+    "reference": "23_hq",
+    "colorReference": "23",
+    "type": "opaque",
+    "image": "opaques/23_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 20847,
+    "hash": "87670bb6d9e7e4f4d02adcabeb3a50d17d9539ec4369f8c78372e05431cfab49",
+    "srcset": {
+      "jpg": "variants/opaques/23_hq-160.jpg 160w, variants/opaques/23_hq-320.jpg 320w",
+      "webp": "variants/opaques/23_hq-160.webp 160w, variants/opaques/23_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/bleu-23-en-poudre.html"
+    ],
+    "color": "#274171",
+    "palette": [
+      "#274171",
+      "#5e6e86",
+      "#3d587b"
+    ],
+    "lab": [
+      34.3,
+      3.8,
+      -25.1
+    ],
+    "hue": 278.6
+  },
+  {
+    "id": "o-240_hq",
+    "reference": "240_hq",
+    "colorReference": "240",
+    "type": "opaque",
+    "image": "opaques/240_hq.jpg",
+    "width": 220,
+    "height": 220,
+    "bytes": 9421,
+    "hash": "abd45120b0fa31f173306d8fcdfc405212045dce648f8d02f6f89d9990697a74",
+    "srcset": {
+      "jpg": "variants/opaques/240_hq-160.jpg 160w",
+      "webp": "variants/opaques/240_hq-160.webp 160w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/turquoise-240-en-grains.html"
+    ],
+    "color": "#28221b",
+    "palette": [
+      "#28221b",
+      "#352d21",
+      "#443925"
+    ],
+    "lab": [
+      16.3,
+      1.2,
+      7.5
+    ],
+    "hue": 80.9
+  },
+  {
+    "id": "o-241_hq",
+    "reference": "241_hq",
+    "colorReference": "241",
+    "type": "opaque",
+    "image": "opaques/241_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 22153,
+    "hash": "2f7e90f5eb80032554ea54d596c2e1c331aa879e833a058fc7ca6bb3767ad255",
+    "srcset": {
+      "jpg": "variants/opaques/241_hq-160.jpg 160w, variants/opaques/241_hq-320.jpg 320w",
+      "webp": "variants/opaques/241_hq-160.webp 160w, variants/opaques/241_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/bleu-241-en-poudre.html"
+    ],
+    "color": "#0a2d4e",
+    "palette": [
+      "#0a2d4e",
+      "#08385a",
+      "#405f77"
+    ],
+    "lab": [
+      21.5,
+      -0.4,
+      -23.4
+    ],
+    "hue": 269.0
+  },
+  {
+    "id": "o-248",
+    "reference": "248",
+    "colorReference": null,
+    "type": "opaque",
+    "image": "opaques/248.jpg",
+    "width": 183,
+    "height": 184,
+    "bytes": 7396,
+    "hash": "1ab9aa5e8244642f0692a921a83ab157faa20c4dda5b4a41a099677361005f01",
+    "srcset": {
+      "jpg": "variants/opaques/248-160.jpg 160w",
+      "webp": "variants/opaques/248-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#74b566",
+    "palette": [
+      "#74b566",
+      "#88c380",
+      "#c1dfb9"
+    ],
+    "lab": [
+      71.8,
+      -32.7,
+      29.7
+    ],
+    "hue": 137.8
+  },
+  {
+    "id": "o-250_hq",
+    "reference": "250_hq",
+    "colorReference": "250",
+    "type": "opaque",
+    "image": "opaques/250_hq.jpg",
+    "width": 220,
+    "height": 220,
+    "bytes": 9421,
+    "hash": "abd45120b0fa31f173306d8fcdfc405212045dce648f8d02f6f89d9990697a74",
+    "srcset": {
+      "jpg": "variants/opaques/250_hq-160.jpg 160w",
+      "webp": "variants/opaques/250_hq-160.webp 160w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/turquoise-250-en-grains.html"
+    ],
+    "color": "#28221b",
+    "palette": [
+      "#28221b",
+      "#352d21",
+      "#443925"
+    ],
+    "lab": [
+      16.3,
+      1.2,
+      7.5
+    ],
+    "hue": 80.9
+  },
+  {
+    "id": "o-251_hq",
+    "reference": "251_hq",
+    "colorReference": "251",
+    "type": "opaque",
+    "image": "opaques/251_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 15419,
+    "hash": "3cb65b56867c372fdecbc09fb09c2120db5d331bb43b712f901852783e144a23",
+    "srcset": {
+      "jpg": "variants/opaques/251_hq-160.jpg 160w, variants/opaques/251_hq-320.jpg 320w",
+      "webp": "variants/opaques/251_hq-160.webp 160w, variants/opaques/251_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/bleu-251-f-poudre.html"
+    ],
+    "color": "#044366",
+    "palette": [
+      "#044366",
+      "#044d6d",
+      "#3b6f89"
+    ],
+    "lab": [
+      29.6,
+      -5.5,
+      -24.6
+    ],
+    "hue": 257.4
+  },
+  {
+    "id": "o-254",
+    "reference": "254",
+    "colorReference": null,
+    "type": "opaque",
+    "image": "opaques/254.jpg",
+    "width": 184,
+    "height": 185,
+    "bytes": 7744,
+    "hash": "cd1d1f6efbb1f7edde5e3fa65ae2d3f36a846af3b1acc6b5e52badfa03f5b382",
+    "srcset": {
+      "jpg": "variants/opaques/254-160.jpg 160w",
+      "webp": "variants/opaques/254-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#63a2ce",
+    "palette": [
+      "#63a2ce",
+      "#72a9d2",
+      "#b6d0e2"
+    ],
+    "lab": [
+      66.1,
+      -7.4,
+      -27.0
+    ],
+    "hue": 254.7
+  },
+  {
+    "id": "o-256_hq",
+    "reference": "256_hq",
+    "colorReference": "256",
+    "type": "opaque",
+    "image": "opaques/256_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 18309,
+    "hash": "40652a0d61dd570b0244882ad39ea08e9e4341303d5caea6464725c6b43e2e88",
+    "srcset": {
+      "jpg": "variants/opaques/256_hq-160.jpg 160w, variants/opaques/256_hq-320.jpg 320w",
+      "webp": "variants/opaques/256_hq-160.webp 160w, variants/opaques/256_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/vert-256-en-poudre.html"
+    ],
+    "color": "#5f7e47",
+    "palette": [
+      "#5f7e47",
+      "#6f844c",
+      "#8e9e73"
+    ],
+    "lab": [
+      51.2,
+      -19.8,
+      26.3
+    ],
+    "hue": 127.0
+  },
+  {
+    "id": "o-25_hq",
+    "reference": "25_hq",
+    "colorReference": "25",
+    "type": "opaque",
+    "image": "opaques/25_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 23703,
+    "hash": "1dfbe1b7238afc8d5df7cdc16d506f734d0bfd561bb038b464285303442ab39d",
+    "srcset": {
+      "jpg": "variants/opaques/25_hq-160.jpg 160w, variants/opaques/25_hq-320.jpg 320w",
+      "webp": "variants/opaques/25_hq-160.webp 160w, variants/opaques/25_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/bleu-25-en-poudre.html"
+    ],
+    "color": "#122d62",
+    "palette": [
+      "#122d62",
+      "#25417f",
+      "#5f6fa4"
+    ],
+    "lab": [
+      25.5,
+      10.9,
+      -34.8
+    ],
+    "hue": 287.4
+  },
+  {
+    "id": "o-268_hq",
+    "reference": "268_hq",
+    "colorReference": "268",
+    "type": "opaque",
+    "image": "opaques/268_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 34266,
+    "hash": "3a7a3503e22817ef5b7cf03fa6ea08f26800b6f5ea52292c4067591eefc16de2",
+    "srcset": {
+      "jpg": "variants/opaques/268_hq-160.jpg 160w, variants/opaques/268_hq-320.jpg 320w",
+      "webp": "variants/opaques/268_hq-160.webp 160w, variants/opaques/268_hq-320.webp 320w"
+    },
+    "productUrls": [],
+    "color": "#55371f",
+    "palette": [
+      "#55371f",
+      "#e9eeeb",
+      "#928e86"
+    ],
+    "lab": [
+      48.7,
+      5.8,
+      12.8
+    ],
+    "hue": 65.6
+  },
+  {
+    "id": "o-269_hq",
+    "reference": "269_hq",
+    "colorReference": "269",
+    "type": "opaque",
+    "image": "opaques/269_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 35940,
+    "hash": "ca0548e15686e709cc2c151329a2ad42d92b98a177d734e4a2228d65874b3651",
+    "srcset": {
+      "jpg": "variants/opaques/269_hq-160.jpg 160w, variants/opaques/269_hq-320.jpg 320w",
+      "webp": "variants/opaques/269_hq-160.webp 160w, variants/opaques/269_hq-320.webp 320w"
+    },
+    "productUrls": [],
+    "color": "#5f421d",
+    "palette": [
+      "#5f421d",
+      "#e7ebe8",
+      "#958d7f"
+    ],
+    "lab": [
+      52.3,
+      4.3,
+      16.9
+    ],
+    "hue": 75.7
+  },
+  {
+    "id": "o-26_hq",
+    "reference": "26_hq",
+    "colorReference": "26",
+    "type": "opaque",
+    "image": "opaques/26_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 25630,
+    "hash": "a68c21321bbd7c7204bc8803f532f15c78f40531ea45f94f24095614814158b3",
+    "srcset": {
+      "jpg": "variants/opaques/26_hq-160.jpg 160w, variants/opaques/26_hq-320.jpg 320w",
+      "webp": "variants/opaques/26_hq-160.webp 160w, variants/opaques/26_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/bleu-26-en-poudre.html"
+    ],
+    "color": "#141e59",
+    "palette": [
+      "#141e59",
+      "#101850",
+      "#474e78"
+    ],
+    "lab": [
+      14.8,
+      17.8,
+      -35.0
+    ],
+    "hue": 297.0
+  },
+  {
+    "id": "o-271_hq",
+    "reference": "271_hq",
+    "colorReference": "271",
+    "type": "opaque",
+    "image": "opaques/271_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 30529,
+    "hash": "8d50a527daaaea3c7dd6c243c3297144e8b58321a55ff8f9cd197cd10131d9cc",
+    "srcset": {
+      "jpg": "variants/opaques/271_hq-160.jpg 160w, variants/opaques/271_hq-320.jpg 320w",
+      "webp": "variants/opaques/271_hq-160.webp 160w, variants/opaques/271_hq-320.webp 320w"
+    },
+    "productUrls": [],
+    "color": "#7293f2",
+    "palette": [
+      "#7293f2",
+      "#e9efed",
+      "#9eb5e5"
+    ],
+    "lab": [
+      71.0,
+      9.7,
+      -36.4
+    ],
+    "hue": 284.9
+  },
+  {
+    "id": "o-272_hq",
+    "reference": "272_hq",
+    "colorReference": "272",
+    "type": "opaque",
+    "image": "opaques/272_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 20294,
+    "hash": "acf348c815834c61ba0ce577b8f7dfa0fcd85b818aade10e47709ad3809504ff",
+    "srcset": {
+      "jpg": "variants/opaques/272_hq-160.jpg 160w, variants/opaques/272_hq-320.jpg 320w",
+      "webp": "variants/opaques/272_hq-160.webp 160w, variants/opaques/272_hq-320.webp 320w"
+    },
+    "productUrls": [],
+    "color": "#5bbae6",
+    "palette": [
+      "#5bbae6",
+      "#ccdde0",
+      "#67a1b8"
+    ],
+    "lab": [
+      73.4,
+      -13.2,
+      -23.7
+    ],
+    "hue": 240.9
+  },
+  {
+    "id": "o-273_hq",
+    "reference": "273_hq",
+    "colorReference": "273",
+    "type": "opaque",
+    "image": "opaques/273_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 30733,
+    "hash": "9cce6d52fc707b4c99bc1faf0c34258a275243ebf61926eded9eedc6ca5cdf6f",
+    "srcset": {
+      "jpg": "variants/opaques/273_hq-160.jpg 160w, variants/opaques/273_hq-320.jpg 320w",
+      "webp": "variants/opaques/273_hq-160.webp 160w, variants/opaques/273_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/turquoise-273-poudre.html"
+    ],
+    "color": "#1090a2",
+    "palette": [
+      "#1090a2",
+      "#ecf2f0",
+      "#67a5ac"
+    ],
+    "lab": [
+      67.1,
+      -17.4,
+      -11.7
+    ],
+    "hue": 213.9
+  },
+  {
+    "id": "o-27_hq",
+    "reference": "27_hq",
+    "colorReference": "27",
+    "type": "opaque",
+    "image": "opaques/27_hq.jpg",
+    "width": 220,
+    "height": 220,
+    "bytes": 9421,
+    "hash": "abd45120b0fa31f173306d8fcdfc405212045dce648f8d02f6f89d9990697a74",
+    "srcset": {
+      "jpg": "variants/opaques/27_hq-160.jpg 160w",
+      "webp": "variants/opaques/27_hq-160.webp 160w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/bleu-27-en-grains.html"
+    ],
+    "color": "#28221b",
+    "palette": [
+      "#28221b",
+      "#352d21",
+      "#443925"
+    ],
+    "lab": [
+      16.3,
+      1.2,
+      7.5
+    ],
+    "hue": 80.9
+  },
+  {
+    "id": "o-283_hq",
+    "reference": "283_hq",
+    "colorReference": "283",
+    "type": "opaque",
+    "image": "opaques/283_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 28941,
+    "hash": "32aa9fb6007164de9d8c40472817373f80e0a70dd3c1f00a23005e3bcd65e472",
+    "srcset": {
+      "jpg": "variants/opaques/283_hq-160.jpg 160w, variants/opaques/283_hq-320.jpg 320w",
+      "webp": "variants/opaques/283_hq-160.webp 160w, variants/opaques/283_hq-320.webp 320w"
+    },
+    "productUrls": [],
+    "color": "#ac7990",
+    "palette": [
+      "#ac7990",
+      "#b17c92",
+      "#c28a97"
+    ],
+    "lab": [
+      57.3,
+      23.7,
+      -3.7
+    ],
+    "hue": 351.1
+  },
+  {
+    "id": "o-286_hq",
+    "reference": "286_hq",
+    "colorReference": "286",
+    "type": "opaque",
+    "image": "opaques/286_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 24558,
+    "hash": "fa207ba9480e36ec9f3705a56959b7bef7adb36b999d3f47bbaec161ce6b202a",
+    "srcset": {
+      "jpg": "variants/opaques/286_hq-160.jpg 160w, variants/opaques/286_hq-320.jpg 320w",
+      "webp": "variants/opaques/286_hq-160.webp 160w, variants/opaques/286_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/vert-tilleul-286-150g.html"
+    ],
+    "color": "#839e30",
+    "palette": [
+      "#839e30",
+      "#7d9932",
+      "#86a233"
+    ],
+    "lab": [
+      61.0,
+      -25.4,
+      50.9
+    ],
+    "hue": 116.5
+  },
+  {
+    "id": "o-288_hq",
+    "reference": "288_hq",
+    "colorReference": "288",
+    "type": "opaque",
+    "image": "opaques/288_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 33767,
+    "hash": "4a0d5cd3e0eb6d1e709f81036df43836458d334a7fde768fe95066bc819ee357",
+    "srcset": {
+      "jpg": "variants/opaques/288_hq-160.jpg 160w, variants/opaques/288_hq-320.jpg 320w",
+      "webp": "variants/opaques/288_hq-160.webp 160w, variants/opaques/288_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/rouge-288-en-poudre-800-c-840-c.html"
+    ],
+    "color": "#bc1115",
+    "palette": [
+      "#bc1115",
+      "#e9edea",
+      "#ba6b5f"
+    ],
+    "lab": [
+      54.3,
+      41.9,
+      31.6
+    ],
+    "hue": 37.0
+  },
+  {
+    "id": "o-289",
+    "reference": "289",
+    "colorReference": null,
+    "type": "opaque",
+    "image": "opaques/289.jpg",
+    "width": 185,
+    "height": 185,
+    "bytes": 10046,
+    "hash": "44ffca4e834f68750c2a8c81c688926ec3d67377bd4b866b88d08c93d6d94320",
+    "srcset": {
+      "jpg": "variants/opaques/289-160.jpg 160w",
+      "webp": "variants/opaques/289-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#c1181e",
+    "palette": [
+      "#c1181e",
+      "#d2aea6",
+      "#b62c32"
+    ],
+    "lab": [
+      44.3,
+      56.4,
+      38.0
+    ],
+    "hue": 34.0
+  },
+  {
+    "id": "o-289_hq",
+    "reference": "289_hq",
+    "colorReference": "289",
+    "type": "opaque",
+    "image": "opaques/289_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 11093,
+    "hash": "6b777d9705ae7d50a4977640b80b6d9f6ded5fe8a8a1bfafae472c6957beaa59",
+    "srcset": {
+      "jpg": "variants/opaques/289_hq-160.jpg 160w, variants/opaques/289_hq-320.jpg 320w",
+      "webp": "variants/opaques/289_hq-160.webp 160w, variants/opaques/289_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/red-289-powder.html"
+    ],
+    "color": "#9d1623",
+    "palette": [
+      "#9d1623",
+      "#9e1e2a",
+      "#ac444e"
+    ],
+    "lab": [
+      35.1,
+      51.6,
+      27.8
+    ],
+    "hue": 28.3
+  },
+  {
+    "id": "o-28_hq",
+    "reference": "28_hq",
+    "colorReference": "28",
+    "type": "opaque",
+    "image": "opaques/28_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 23329,
+    "hash": "e3ecd423ed050dc792885d5665f76189026c3591ffa30df16a46d839cdd5a6d6",
+    "srcset": {
+      "jpg": "variants/opaques/28_hq-160.jpg 160w, variants/opaques/28_hq-320.jpg 320w",
+      "webp": "variants/opaques/28_hq-160.webp 160w, variants/opaques/28_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/jaune-28-en-poudre.html"
+    ],
+    "color": "#775026",
+    "palette": [
+      "#775026",
+      "#85592e",
+      "#9d7e5e"
+    ],
+    "lab": [
+      39.9,
+      11.5,
+      30.4
+    ],
+    "hue": 69.3
+  },
+  {
+    "id": "o-290",
+    "reference": "290",
+    "colorReference": null,
+    "type": "opaque",
+    "image": "opaques/290.jpg",
+    "width": 186,
+    "height": 185,
+    "bytes": 7755,
+    "hash": "f1d6b1874cc3075ecedb092c0da8645df369640d397eafe1017b600f6723359a",
+    "srcset": {
+      "jpg": "variants/opaques/290-160.jpg 160w",
+      "webp": "variants/opaques/290-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#e5a929",
+    "palette": [
+      "#e5a929",
+      "#cca25b",
+      "#ead6b2"
+    ],
+    "lab": [
+      73.5,
+      10.7,
+      63.0
+    ],
+    "hue": 80.4
+  },
+  {
+    "id": "o-291",
+    "reference": "291",
+    "colorReference": null,
+    "type": "opaque",
+    "image": "opaques/291.jpg",
+    "width": 193,
+    "height": 185,
+    "bytes": 9628,
+    "hash": "34e9ee4463f694f9851cfb519e3500f0444cac51dd1ea73b6b1e993360ce1df6",
+    "srcset": {
+      "jpg": "variants/opaques/291-160.jpg 160w",
+      "webp": "variants/opaques/291-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#e12f24",
+    "palette": [
+      "#e12f24",
+      "#e4bbb2",
+      "#ca6157"
+    ],
+    "lab": [
+      51.9,
+      61.1,
+      46.1
+    ],
+    "hue": 37.0
+  },
+  {
+    "id": "o-291_hq",
+    "reference": "291_hq",
+    "colorReference": "291",
+    "type": "opaque",
+    "image": "opaques/291_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 16182,
+    "hash": "04947b390088998a1341fe6419d6ca6559642cfd0a4b0f012903a43a748d4509",
+    "srcset": {
+      "jpg": "variants/opaques/291_hq-160.jpg 160w, variants/opaques/291_hq-320.jpg 320w",
+      "webp": "variants/opaques/291_hq-160.webp 160w, variants/opaques/291_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/orange-291-en-poudre.html"
+    ],
+    "color": "#df460c",
+    "palette": [
+      "#df460c",
+      "#dd4a14",
+      "#e07145"
+    ],
+    "lab": [
+      52.6,
+      55.6,
+      58.4
+    ],
+    "hue": 46.4
+  },
+  {
+    "id": "o-294",
+    "reference": "294",
+    "colorReference": null,
+    "type": "opaque",
+    "image": "opaques/294.jpg",
+    "width": 185,
+    "height": 185,
+    "bytes": 9517,
+    "hash": "3b45aa1e4de9315665f3f03d57ab5fb1461aa6d542f9e9ebdae4c9016aa3ed9e",
+    "srcset": {
+      "jpg": "variants/opaques/294-160.jpg 160w",
+      "webp": "variants/opaques/294-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#8e1216",
+    "palette": [
+      "#8e1216",
+      "#a25e5d",
+      "#dabdb9"
+    ],
+    "lab": [
+      33.4,
+      45.9,
+      30.3
+    ],
+    "hue": 33.4
+  },
+  {
+    "id": "o-295",
+    "reference": "295",
+    "colorReference": null,
+    "type": "opaque",
+    "image": "opaques/295.jpg",
+    "width": 186,
+    "height": 185,
+    "bytes": 9513,
+    "hash": "e3b98b2b882e2e23aa2cdc122b0fe50d2a8f87faf6a4abbd55e5f10101d297bc",
+    "srcset": {
+      "jpg": "variants/opaques/295-160.jpg 160w",
+      "webp": "variants/opaques/295-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#99161c",
+    "palette": [
+      "#99161c",
+      "#d7b1b0",
+      "#a0484e"
+    ],
+    "lab": [
+      36.0,
+      48.2,
+      29.9
+    ],
+    "hue": 31.8
+  },
+  {
+    "id": "o-296",
+    "reference": "296",
+    "colorReference": null,
+    "type": "opaque",
+    "image": "opaques/296.jpg",
+    "width": 186,
+    "height": 185,
+    "bytes": 9445,
+    "hash": "a05bb0e7cafbf69d1ae4d0afd59d6347bc99a51a4d6e4f17f977a0c793d99492",
+    "srcset": {
+      "jpg": "variants/opaques/296-160.jpg 160w",
+      "webp": "variants/opaques/296-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#9c1620",
+    "palette": [
+      "#9c1620",
+      "#d9b5b5",
+      "#a14f58"
+    ],
+    "lab": [
+      36.3,
+      49.3,
+      28.8
+    ],
+    "hue": 30.3
+  },
+  {
+    "id": "o-296_hq",
+    "reference": "296_hq",
+    "colorReference": "296",
+    "type": "opaque",
+    "image": "opaques/296_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 16938,
+    "hash": "452de7349e9cf8ecf07dd693dff9adcfd3772d8aeeb9a6f31d10b56e100a70ba",
+    "srcset": {
+      "jpg": "variants/opaques/296_hq-160.jpg 160w, variants/opaques/296_hq-320.jpg 320w",
+      "webp": "variants/opaques/296_hq-160.webp 160w, variants/opaques/296_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/rouge-296-en-poudre.html"
+    ],
+    "color": "#781a23",
+    "palette": [
+      "#781a23",
+      "#79232b",
+      "#94535a"
+    ],
+    "lab": [
+      28.2,
+      38.5,
+      17.4
+    ],
+    "hue": 24.3
+  },
+  {
+    "id": "o-297_hq",
+    "reference": "297_hq",
+    "colorReference": "297",
+    "type": "opaque",
+    "image": "opaques/297_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 12516,
+    "hash": "761d7f71b174c583b21500a71184bb7f9100bf2efce46aad05707eaadceba2da",
+    "srcset": {
+      "jpg": "variants/opaques/297_hq-160.jpg 160w, variants/opaques/297_hq-320.jpg 320w",
+      "webp": "variants/opaques/297_hq-160.webp 160w, variants/opaques/297_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/rose-297-en-poudre.html"
+    ],
+    "color": "#f1cdeb",
+    "palette": [
+      "#f1cdeb",
+      "#eccbe7",
+      "#e4c9e0"
+    ],
+    "lab": [
+      85.7,
+      16.8,
+      -9.6
+    ],
+    "hue": 330.3
+  },
+  {
+    "id": "o-298_hq",
+    "reference": "298_hq",
+    "colorReference": "298",
+    "type": "opaque",
+    "image": "opaques/298_hq.jpg",
+    "width": 220,
+    "height": 220,
+    "bytes": 9421,
+    "hash": "abd45120b0fa31f173306d8fcdfc405212045dce648f8d02f6f89d9990697a74",
+    "srcset": {
+      "jpg": "variants/opaques/298_hq-160.jpg 160w",
+      "webp": "variants/opaques/298_hq-160.webp 160w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/rose-298-f-en-poudre.html"
+    ],
+    "color": "#28221b",
+    "palette": [
+      "#28221b",
+      "#352d21",
+      "#443925"
+    ],
+    "lab": [
+      16.3,
+      1.2,
+      7.5
+    ],
+    "hue": 80.9
+  },
+  {
+    "id": "o-299_hq",
+    "reference": "299_hq",
+    "colorReference": "299",
+    "type": "opaque",
+    "image": "opaques/299_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 24940,
+    "hash": "e2f0ad3fec419d61f48fda1bde0c2bfc0ea0718336d49057b2b7b2ae34969219",
+    "srcset": {
+      "jpg": "variants/opaques/299_hq-160.jpg 160w, variants/opaques/299_hq-320.jpg 320w",
+      "webp": "variants/opaques/299_hq-160.webp 160w, variants/opaques/299_hq-320.webp 320w"
+    },
+    "productUrls": [],
+    "color": "#b2a3b1",
+    "palette": [
+      "#b2a3b1",
+      "#dfe1e0",
+      "#837e83"
+    ],
+    "lab": [
+      72.8,
+      4.8,
+      -3.1
+    ],
+    "hue": 327.1
+  },
+  {
+    "id": "o-29_hq",
+    "reference": "29_hq",
+    "colorReference": "29",
+    "type": "opaque",
+    "image": "opaques/29_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 19894,
+    "hash": "33afe03894f13253e53fe9f88e9e7ad80036f54a0623c1e108b14d16b63ac6e7",
+    "srcset": {
+      "jpg": "variants/opaques/29_hq-160.jpg 160w, variants/opaques/29_hq-320.jpg 320w",
+      "webp": "variants/opaques/29_hq-160.webp 160w, variants/opaques/29_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/lilas-29-en-poudre.html"
+    ],
+    "color": "#4d3b3b",
+    "palette": [
+      "#4d3b3b",
+      "#654846",
+      "#83706d"
+    ],
+    "lab": [
+      30.2,
+      8.7,
+      3.7
+    ],
+    "hue": 23.0
+  },
+  {
+    "id": "o-2_hq",
+    "reference": "2_hq",
+    "colorReference": "2",
+    "type": "opaque",
+    "image": "opaques/2_hq.jpg",
+    "width": 220,
+    "height": 220,
+    "bytes": 9421,
+    "hash": "abd45120b0fa31f173306d8fcdfc405212045dce648f8d02f6f89d9990697a74",
+    "srcset": {
+      "jpg": "variants/opaques/2_hq-160.jpg 160w",
+      "webp": "variants/opaques/2_hq-160.webp 160w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/fondant-pour-or-n-2-en-poudre.html"
+    ],
+    "color": "#28221b",
+    "palette": [
+      "#28221b",
+      "#352d21",
+      "#443925"
+    ],
+    "lab": [
+      16.3,
+      1.2,
+      7.5
+    ],
+    "hue": 80.9
+  },
+  {
+    "id": "o-300",
+    "reference": "300",
+    "colorReference": null,
+    "type": "opaque",
+    "image": "opaques/300.jpg",
+    "width": 184,
+    "height": 185,
+    "bytes": 7846,
+    "hash": "44f239c2c22f7253033cb140400ab2a91fe4cb55eb467328d7a89c4324ec1ad7",
+    "srcset": {
+      "jpg": "variants/opaques/300-160.jpg 160w",
+      "webp": "variants/opaques/300-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#a55d7c",
+    "palette": [
+      "#a55d7c",
+      "#ae6f8f",
+      "#d4b8c6"
+    ],
+    "lab": [
+      52.1,
+      30.9,
+      -5.0
+    ],
+    "hue": 350.8
+  },
+  {
+    "id": "o-304",
+    "reference": "304",
+    "colorReference": null,
+    "type": "opaque",
+    "image": "opaques/304.jpg",
+    "width": 172,
+    "height": 183,
+    "bytes": 8373,
+    "hash": "6796238cb40c86c4ff0c06eebea99f5524fc52c0c3e87b3491a80cec033dde32",
+    "srcset": {
+      "jpg": "variants/opaques/304-160.jpg 160w",
+      "webp": "variants/opaques/304-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#8a7674",
+    "palette": [
+      "#8a7674",
+      "#f8f7f6",
+      "#a29293"
+    ],
+    "lab": [
+      67.2,
+      4.9,
+      2.4
+    ],
+    "hue": 26.1
+  },
+  {
+    "id": "o-304_hq",
+    "reference": "304_hq",
+    "colorReference": "304",
+    "type": "opaque",
+    "image": "opaques/304_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 16218,
+    "hash": "a790132b4eb71455c2c4fca21eceb81bc78ae0f5d67ab3e00731c5cd6a2639cd",
+    "srcset": {
+      "jpg": "variants/opaques/304_hq-160.jpg 160w, variants/opaques/304_hq-320.jpg 320w",
+      "webp": "variants/opaques/304_hq-160.webp 160w, variants/opaques/304_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/gris-304-en-poudre.html"
+    ],
+    "color": "#777777",
+    "palette": [
+      "#777777",
+      "#949494",
+      "#acacac"
+    ],
+    "lab": [
+      50.9,
+      -0.0,
+      0.0
+    ],
+    "hue": null
+  },
+  {
+    "id": "o-306",
+    "reference": "306",
+    "colorReference": null,
+    "type": "opaque",
+    "image": "opaques/306.jpg",
+    "width": 187,
+    "height": 184,
+    "bytes": 7885,
+    "hash": "d179d6600e284cf7d0b990a2bd0678d37f31f07a15a5015f9ad78b3d701df4a9",
+    "srcset": {
+      "jpg": "variants/opaques/306-160.jpg 160w",
+      "webp": "variants/opaques/306-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#c9a982",
+    "palette": [
+      "#c9a982",
+      "#d7b995",
+      "#e5d5c1"
+    ],
+    "lab": [
+      74.4,
+      5.8,
+      22.5
+    ],
+    "hue": 75.5
+  },
+  {
+    "id": "o-307",
+    "reference": "307",
+    "colorReference": null,
+    "type": "opaque",
+    "image": "opaques/307.jpg",
+    "width": 185,
+    "height": 185,
+    "bytes": 8655,
+    "hash": "43075078330d10c47fa045b841a5622af1e1c72a0930d6bc95606ca0462192c3",
+    "srcset": {
+      "jpg": "variants/opaques/307-160.jpg 160w",
+      "webp": "variants/opaques/307-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#b18053",
+    "palette": [
+      "#b18053",
+      "#bb8f67",
+      "#dac6b4"
+    ],
+    "lab": [
+      61.7,
+      11.9,
+      28.3
+    ],
+    "hue": 67.2
+  },
+  {
+    "id": "o-307_hq",
+    "reference": "307_hq",
+    "colorReference": "307",
+    "type": "opaque",
+    "image": "opaques/307_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 13604,
+    "hash": "ba560ffb4f25ed5743d58dc79e49da56d22795facfd71f3b27421c6f974e948f",
+    "srcset": {
+      "jpg": "variants/opaques/307_hq-160.jpg 160w, variants/opaques/307_hq-320.jpg 320w",
+      "webp": "variants/opaques/307_hq-160.webp 160w, variants/opaques/307_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/marron-307-en-poudre.html"
+    ],
+    "color": "#9d865c",
+    "palette": [
+      "#9d865c",
+      "#cbb48c",
+      "#b6a078"
+    ],
+    "lab": [
+      59.8,
+      2.3,
+      25.6
+    ],
+    "hue": 84.9
+  },
+  {
+    "id": "o-309",
+    "reference": "309",
+    "colorReference": null,
+    "type": "opaque",
+    "image": "opaques/309.jpg",
+    "width": 184,
+    "height": 185,
+    "bytes": 9716,
+    "hash": "63514b6539b8ad334ac026ffe6fa7417335c6922111949042d8d34d567b92576",
+    "srcset": {
+      "jpg": "variants/opaques/309-160.jpg 160w",
+      "webp": "variants/opaques/309-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#5b1007",
+    "palette": [
+      "#5b1007",
+      "#6c352c",
+      "#c6b2ae"
+    ],
+    "lab": [
+      25.6,
+      28.0,
+      21.2
+    ],
+    "hue": 37.1
+  },
+  {
+    "id": "o-309_hq",
+    "reference": "309_hq",
+    "colorReference": "309",
+    "type": "opaque",
+    "image": "opaques/309_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 20698,
+    "hash": "47b10c684ee305254e27cf9c43ec284890de6b4bbcfe463b3cea55ac7020c773",
+    "srcset": {
+      "jpg": "variants/opaques/309_hq-160.jpg 160w, variants/opaques/309_hq-320.jpg 320w",
+      "webp": "variants/opaques/309_hq-160.webp 160w, variants/opaques/309_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/marron-309-en-poudre.html"
+    ],
+    "color": "#352f2b",
+    "palette": [
+      "#352f2b",
+      "#605c59",
+      "#6b6a69"
+    ],
+    "lab": [
+      21.6,
+      2.0,
+      3.3
+    ],
+    "hue": null
+  },
+  {
+    "id": "o-30_hq",
+    "reference": "30_hq",
+    "colorReference": "30",
+    "type": "opaque",
+    "image": "opaques/30_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 29461,
+    "hash": "29cfb7699867c45ab314f34f7f071d2e72882a3e156e4d4fd710c15a3ff2bd0a",
+    "srcset": {
+      "jpg": "variants/opaques/30_hq-160.jpg 160w, variants/opaques/30_hq-320.jpg 320w",
+      "webp": "variants/opaques/30_hq-160.webp 160w, variants/opaques/30_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/jaune-30-en-poudre.html"
+    ],
+    "color": "#a76511",
+    "palette": [
+      "#a76511",
+      "#c97b1e",
+      "#f9c376"
+    ],
+    "lab": [
+      59.0,
+      19.5,
+      52.5
+    ],
+    "hue": 69.6
+  },
+  {
+    "id": "o-310",
+    "reference": "310",
+    "colorReference": null,
+    "type": "opaque",
+    "image": "opaques/310.jpg",
+    "width": 184,
+    "height": 183,
+    "bytes": 6870,
+    "hash": "73f745b05f6cbeaf9e809ee62a67e9c5c6183ff2d2bf0859b54eb376a3d6046e",
+    "srcset": {
+      "jpg": "variants/opaques/310-160.jpg 160w",
+      "webp": "variants/opaques/310-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#b6a185",
+    "palette": [
+      "#b6a185",
+      "#c0ae95",
+      "#dad4c7"
+    ],
+    "lab": [
+      70.2,
+      2.6,
+      15.9
+    ],
+    "hue": 80.7
+  },
+  {
+    "id": "o-32_hq",
+    "reference": "32_hq",
+    "colorReference": "32",
+    "type": "opaque",
+    "image": "opaques/32_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 45372,
+    "hash": "bc3511d381f338532f74f00d5c0592479b03c3f262526d6e4e967dfcb86e71e5",
+    "srcset": {
+      "jpg": "variants/opaques/32_hq-160.jpg 160w, variants/opaques/32_hq-320.jpg 320w",
+      "webp": "variants/opaques/32_hq-160.webp 160w, variants/opaques/32_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/marron-32-en-poudre.html"
+    ],
+    "color": "#b35224",
+    "palette": [
+      "#b35224",
+      "#843114",
+      "#de7c3a"
+    ],
+    "lab": [
+      47.0,
+      34.8,
+      43.3
+    ],
+    "hue": 51.2
+  },
+  {
+    "id": "o-33_hq",
+    "reference": "33_hq",
+    "colorReference": "33",
+    "type": "opaque",
+    "image": "opaques/33_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 23458,
+    "hash": "f0fb6b3a0e3af100afaf9972ceaef6e66431330836db91fc0e0bc71286adb4c7",
+    "srcset": {
+      "jpg": "variants/opaques/33_hq-160.jpg 160w, variants/opaques/33_hq-320.jpg 320w",
+      "webp": "variants/opaques/33_hq-160.webp 160w, variants/opaques/33_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/lilas-33-en-poudre.html"
+    ],
+    "color": "#72514d",
+    "palette": [
+      "#72514d",
+      "#7f5a53",
+      "#997e78"
+    ],
+    "lab": [
+      40.4,
+      13.0,
+      8.4
+    ],
+    "hue": 32.9
+  },
+  {
+    "id": "o-36",
+    "reference": "36",
+    "colorReference": null,
+    "type": "opaque",
+    "image": "opaques/36.jpg",
+    "width": 500,
+    "height": 500,
+    "bytes": 24657,
+    "hash": "22a8d47ea099c82abdc8e77ca9cb32384adda093c0211ad0bd15d6f4e10797c1",
+    "srcset": {
+      "jpg": "variants/opaques/36-160.jpg 160w, variants/opaques/36-320.jpg 320w",
+      "webp": "variants/opaques/36-160.webp 160w, variants/opaques/36-320.webp 320w"
+    },
+    "productUrls": [],
+    "color": "#101817",
+    "palette": [
+      "#101817",
+      "#17201f",
+      "#4c5251"
+    ],
+    "lab": [
+      9.9,
+      -3.6,
+      -0.7
+    ],
+    "hue": null
+  },
+  {
+    "id": "o-36_hq",
+    "reference": "36_hq",
+    "colorReference": "36",
+    "type": "opaque",
+    "image": "opaques/36_hq.jpg",
+    "width": 220,
+    "height": 220,
+    "bytes": 9421,
+    "hash": "abd45120b0fa31f173306d8fcdfc405212045dce648f8d02f6f89d9990697a74",
+    "srcset": {
+      "jpg": "variants/opaques/36_hq-160.jpg 160w",
+      "webp": "variants/opaques/36_hq-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#28221b",
+    "palette": [
+      "#28221b",
+      "#352d21",
+      "#443925"
+    ],
+    "lab": [
+      16.3,
+      1.2,
+      7.5
+    ],
+    "hue": 80.9
+  },
+  {
+    "id": "o-38_hq",
+    "reference": "38_hq",
+    "colorReference": "38",
+    "type": "opaque",
+    "image": "opaques/38_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 23440,
+    "hash": "6ce794f023afe7df34c73e44fe81a28ce773adbe47582ba037c6681131e229ba",
+    "srcset": {
+      "jpg": "variants/opaques/38_hq-160.jpg 160w, variants/opaques/38_hq-320.jpg 320w",
+      "webp": "variants/opaques/38_hq-160.webp 160w, variants/opaques/38_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/orange-38-en-poudre.html"
+    ],
+    "color": "#935431",
+    "palette": [
+      "#935431",
+      "#ad6d4d",
+      "#d39b7f"
+    ],
+    "lab": [
+      45.4,
+      22.6,
+      30.4
+    ],
+    "hue": 53.4
+  },
+  {
+    "id": "o-3_hq",
+    "reference": "3_hq",
+    "colorReference": "3",
+    "type": "opaque",
+    "image": "opaques/3_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 20301,
+    "hash": "20331867a92a34e7bca678f4b311b70a10d424c1583a4b048e369f02f6f411d7",
+    "srcset": {
+      "jpg": "variants/opaques/3_hq-160.jpg 160w, variants/opaques/3_hq-320.jpg 320w",
+      "webp": "variants/opaques/3_hq-160.webp 160w, variants/opaques/3_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/fondant-pour-argent-n-3-en-morceaux.html"
+    ],
+    "color": "#98826a",
+    "palette": [
+      "#98826a",
+      "#a8896c",
+      "#b29f8d"
+    ],
+    "lab": [
+      58.0,
+      6.0,
+      17.3
+    ],
+    "hue": 70.9
+  },
+  {
+    "id": "o-42_hq",
+    "reference": "42_hq",
+    "colorReference": "42",
+    "type": "opaque",
+    "image": "opaques/42_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 27937,
+    "hash": "808bfccebd153ddfd51f335eb41f4cf7e01095cb8e8ac5752a742d667adac2f5",
+    "srcset": {
+      "jpg": "variants/opaques/42_hq-160.jpg 160w, variants/opaques/42_hq-320.jpg 320w",
+      "webp": "variants/opaques/42_hq-160.webp 160w, variants/opaques/42_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/rouge-42-poudre.html"
+    ],
+    "color": "#61151d",
+    "palette": [
+      "#61151d",
+      "#450c11",
+      "#733c3c"
+    ],
+    "lab": [
+      18.7,
+      31.3,
+      14.3
+    ],
+    "hue": 24.6
+  },
+  {
+    "id": "o-430",
+    "reference": "430",
+    "colorReference": null,
+    "type": "opaque",
+    "image": "opaques/430.jpg",
+    "width": 184,
+    "height": 184,
+    "bytes": 7603,
+    "hash": "bcd4708241f141e252dd413d386532b656e93cc93cb5dd2a7791fff772a21bfc",
+    "srcset": {
+      "jpg": "variants/opaques/430-160.jpg 160w",
+      "webp": "variants/opaques/430-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#a383ad",
+    "palette": [
+      "#a383ad",
+      "#917299",
+      "#d1c2d4"
+    ],
+    "lab": [
+      59.4,
+      19.3,
+      -16.7
+    ],
+    "hue": 319.1
+  },
+  {
+    "id": "o-430_hq",
+    "reference": "430_hq",
+    "colorReference": "430",
+    "type": "opaque",
+    "image": "opaques/430_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 12084,
+    "hash": "1b41de9cd8ab7d6665d3fbb1ca18604cc73d00c9e632955c487227a2c99406c2",
+    "srcset": {
+      "jpg": "variants/opaques/430_hq-160.jpg 160w, variants/opaques/430_hq-320.jpg 320w",
+      "webp": "variants/opaques/430_hq-160.webp 160w, variants/opaques/430_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/violet-430-f-en-poudre.html"
+    ],
+    "color": "#756b7e",
+    "palette": [
+      "#756b7e",
+      "#796f81",
+      "#968e9a"
+    ],
+    "lab": [
+      47.9,
+      7.9,
+      -8.8
+    ],
+    "hue": 311.9
+  },
+  {
+    "id": "o-431_hq",
+    "reference": "431_hq",
+    "colorReference": "431",
+    "type": "opaque",
+    "image": "opaques/431_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 21451,
+    "hash": "8ab6b53bf3aae1e092e705974b8cd76bfda51058af5212f6f0a9b30e89230020",
+    "srcset": {
+      "jpg": "variants/opaques/431_hq-160.jpg 160w, variants/opaques/431_hq-320.jpg 320w",
+      "webp": "variants/opaques/431_hq-160.webp 160w, variants/opaques/431_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/violet-431-f-powder.html"
+    ],
+    "color": "#4f3a47",
+    "palette": [
+      "#4f3a47",
+      "#d5d7d6",
+      "#797276"
+    ],
+    "lab": [
+      44.2,
+      7.3,
+      -2.5
+    ],
+    "hue": 341.1
+  },
+  {
+    "id": "o-43_hq",
+    "reference": "43_hq",
+    "colorReference": "43",
+    "type": "opaque",
+    "image": "opaques/43_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 16916,
+    "hash": "f256163d4ea295a534e8987371b4c9d102dfbd2d0861039661da3acc089fb701",
+    "srcset": {
+      "jpg": "variants/opaques/43_hq-160.jpg 160w, variants/opaques/43_hq-320.jpg 320w",
+      "webp": "variants/opaques/43_hq-160.webp 160w, variants/opaques/43_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/red-43-powder.html"
+    ],
+    "color": "#54201d",
+    "palette": [
+      "#54201d",
+      "#6e2621",
+      "#bca8a7"
+    ],
+    "lab": [
+      25.7,
+      26.5,
+      16.4
+    ],
+    "hue": 31.8
+  },
+  {
+    "id": "o-45_hq",
+    "reference": "45_hq",
+    "colorReference": "45",
+    "type": "opaque",
+    "image": "opaques/45_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 15550,
+    "hash": "851d78d80b1eefa79ea1ef7bdc78aac7dfc5470dfb5960b27e6015bf78e39996",
+    "srcset": {
+      "jpg": "variants/opaques/45_hq-160.jpg 160w, variants/opaques/45_hq-320.jpg 320w",
+      "webp": "variants/opaques/45_hq-160.webp 160w, variants/opaques/45_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/turquoise-45-en-poudre.html"
+    ],
+    "color": "#045b66",
+    "palette": [
+      "#045b66",
+      "#035161",
+      "#3b7f88"
+    ],
+    "lab": [
+      35.1,
+      -17.3,
+      -13.6
+    ],
+    "hue": 218.2
+  },
+  {
+    "id": "o-46_hq",
+    "reference": "46_hq",
+    "colorReference": "46",
+    "type": "opaque",
+    "image": "opaques/46_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 17885,
+    "hash": "15fc786de1a79af6882cc3cb24972fee563574e449f51d8e5c9ca91bda5084c3",
+    "srcset": {
+      "jpg": "variants/opaques/46_hq-160.jpg 160w, variants/opaques/46_hq-320.jpg 320w",
+      "webp": "variants/opaques/46_hq-160.webp 160w, variants/opaques/46_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/vert-46-en-poudre.html"
+    ],
+    "color": "#2c6a50",
+    "palette": [
+      "#2c6a50",
+      "#215f46",
+      "#6f8e7c"
+    ],
+    "lab": [
+      41.8,
+      -24.7,
+      8.0
+    ],
+    "hue": 162.1
+  },
+  {
+    "id": "o-47_hq",
+    "reference": "47_hq",
+    "colorReference": "47",
+    "type": "opaque",
+    "image": "opaques/47_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 23850,
+    "hash": "ff06869bc777bd3447a098611f35bb1bd6282b1058c941205f8e7c26ccab95bb",
+    "srcset": {
+      "jpg": "variants/opaques/47_hq-160.jpg 160w, variants/opaques/47_hq-320.jpg 320w",
+      "webp": "variants/opaques/47_hq-160.webp 160w, variants/opaques/47_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/vert-47-en-poudre.html"
+    ],
+    "color": "#988218",
+    "palette": [
+      "#988218",
+      "#b7951a",
+      "#cdac3e"
+    ],
+    "lab": [
+      59.4,
+      -1.0,
+      57.1
+    ],
+    "hue": 91.0
+  },
+  {
+    "id": "o-48_hq",
+    "reference": "48_hq",
+    "colorReference": "48",
+    "type": "opaque",
+    "image": "opaques/48_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 24172,
+    "hash": "e6409d519e44589f67328cf4dff92ec7724d8f8e5c88b205b010c36f0c6ea3b8",
+    "srcset": {
+      "jpg": "variants/opaques/48_hq-160.jpg 160w, variants/opaques/48_hq-320.jpg 320w",
+      "webp": "variants/opaques/48_hq-160.webp 160w, variants/opaques/48_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/vert-48-en-poudre.html"
+    ],
+    "color": "#296631",
+    "palette": [
+      "#296631",
+      "#4c8043",
+      "#86ae7a"
+    ],
+    "lab": [
+      45.6,
+      -30.1,
+      24.7
+    ],
+    "hue": 140.6
+  },
+  {
+    "id": "o-490",
+    "reference": "490",
+    "colorReference": null,
+    "type": "opaque",
+    "image": "opaques/490.jpg",
+    "width": 185,
+    "height": 186,
+    "bytes": 9288,
+    "hash": "2738f4807564c275fcdfd1dea9678ea1a469972d06df4e76d58a9b4624191fcd",
+    "srcset": {
+      "jpg": "variants/opaques/490-160.jpg 160w",
+      "webp": "variants/opaques/490-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#e25422",
+    "palette": [
+      "#e25422",
+      "#d0724c",
+      "#e1c1ae"
+    ],
+    "lab": [
+      57.0,
+      47.9,
+      50.5
+    ],
+    "hue": 46.5
+  },
+  {
+    "id": "o-491",
+    "reference": "491",
+    "colorReference": null,
+    "type": "opaque",
+    "image": "opaques/491.jpg",
+    "width": 187,
+    "height": 186,
+    "bytes": 9533,
+    "hash": "20622ccb5174f34c3bacffbb2dd42b91d1fbbd10bf929b14d435d59c01261806",
+    "srcset": {
+      "jpg": "variants/opaques/491-160.jpg 160w",
+      "webp": "variants/opaques/491-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#cd2520",
+    "palette": [
+      "#cd2520",
+      "#c64437",
+      "#e0b8af"
+    ],
+    "lab": [
+      47.9,
+      56.4,
+      41.4
+    ],
+    "hue": 36.3
+  },
+  {
+    "id": "o-491_hq",
+    "reference": "491_hq",
+    "colorReference": "491",
+    "type": "opaque",
+    "image": "opaques/491_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 18774,
+    "hash": "6a96045e8bb21163b44c68d627c4c68d329bc2390febe7137b93f36fbf3d6c2b",
+    "srcset": {
+      "jpg": "variants/opaques/491_hq-160.jpg 160w, variants/opaques/491_hq-320.jpg 320w",
+      "webp": "variants/opaques/491_hq-160.webp 160w, variants/opaques/491_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/orange-491-en-poudre.html"
+    ],
+    "color": "#b13e23",
+    "palette": [
+      "#b13e23",
+      "#af4a35",
+      "#bd705e"
+    ],
+    "lab": [
+      44.4,
+      42.6,
+      37.2
+    ],
+    "hue": 41.1
+  },
+  {
+    "id": "o-49_hq",
+    "reference": "49_hq",
+    "colorReference": "49",
+    "type": "opaque",
+    "image": "opaques/49_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 20712,
+    "hash": "f66342db244f4d562f2d95f6255f1cf0136e975662549e653b402bd10e7ed661",
+    "srcset": {
+      "jpg": "variants/opaques/49_hq-160.jpg 160w, variants/opaques/49_hq-320.jpg 320w",
+      "webp": "variants/opaques/49_hq-160.webp 160w, variants/opaques/49_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/vert-49-en-morceaux.html"
+    ],
+    "color": "#183c2c",
+    "palette": [
+      "#183c2c",
+      "#1d4432",
+      "#516a5f"
+    ],
+    "lab": [
+      25.3,
+      -17.6,
+      6.2
+    ],
+    "hue": 160.6
+  },
+  {
+    "id": "o-4_hq",
+    "reference": "4_hq",
+    "colorReference": "4",
+    "type": "opaque",
+    "image": "opaques/4_hq.jpg",
+    "width": 220,
+    "height": 220,
+    "bytes": 9421,
+    "hash": "abd45120b0fa31f173306d8fcdfc405212045dce648f8d02f6f89d9990697a74",
+    "srcset": {
+      "jpg": "variants/opaques/4_hq-160.jpg 160w",
+      "webp": "variants/opaques/4_hq-160.webp 160w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/bleu-4-en-poudre.html"
+    ],
+    "color": "#28221b",
+    "palette": [
+      "#28221b",
+      "#352d21",
+      "#443925"
+    ],
+    "lab": [
+      16.3,
+      1.2,
+      7.5
+    ],
+    "hue": 80.9
+  },
+  {
+    "id": "o-50_hq",
+    "reference": "50_hq",
+    "colorReference": "50",
+    "type": "opaque",
+    "image": "opaques/50_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 21196,
+    "hash": "423592a50f0d5b97386b3e6795d761fe82baac9305c8d2faec9902f96372b13b",
+    "srcset": {
+      "jpg": "variants/opaques/50_hq-160.jpg 160w, variants/opaques/50_hq-320.jpg 320w",
+      "webp": "variants/opaques/50_hq-160.webp 160w, variants/opaques/50_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/vert-50-poudre.html"
+    ],
+    "color": "#183a28",
+    "palette": [
+      "#183a28",
+      "#547e69",
+      "#214f33"
+    ],
+    "lab": [
+      31.2,
+      -18.8,
+      8.0
+    ],
+    "hue": 156.9
+  },
+  {
+    "id": "o-518_hq",
+    "reference": "518_hq",
+    "colorReference": "518",
+    "type": "opaque",
+    "image": "opaques/518_hq.jpg",
+    "width": 220,
+    "height": 220,
+    "bytes": 9421,
+    "hash": "abd45120b0fa31f173306d8fcdfc405212045dce648f8d02f6f89d9990697a74",
+    "srcset": {
+      "jpg": "variants/opaques/518_hq-160.jpg 160w",
+      "webp": "variants/opaques/518_hq-160.webp 160w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/fondant-de-finition-518-en-poudre.html"
+    ],
+    "color": "#28221b",
+    "palette": [
+      "#28221b",
+      "#352d21",
+      "#443925"
+    ],
+    "lab": [
+      16.3,
+      1.2,
+      7.5
+    ],
+    "hue": 80.9
+  },
+  {
+    "id": "o-51_hq",
+    "reference": "51_hq",
+    "colorReference": "51",
+    "type": "opaque",
+    "image": "opaques/51_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 19571,
+    "hash": "e6da2a0ebd1fdcf73f04ef9fd80c77a7c31f81281e3393db9e49ea7a6eaca70a",
+    "srcset": {
+      "jpg": "variants/opaques/51_hq-160.jpg 160w, variants/opaques/51_hq-320.jpg 320w",
+      "webp": "variants/opaques/51_hq-160.webp 160w, variants/opaques/51_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/vert-51-en-poudre.html"
+    ],
+    "color": "#16423c",
+    "palette": [
+      "#16423c",
+      "#18504a",
+      "#567470"
+    ],
+    "lab": [
+      29.5,
+      -17.1,
+      -1.2
+    ],
+    "hue": 184.0
+  },
+  {
+    "id": "o-52_hq",
+    "reference": "52_hq",
+    "colorReference": "52",
+    "type": "opaque",
+    "image": "opaques/52_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 22296,
+    "hash": "0df49020b702c2774a94a8908a44623ead8f17f4065faa942674b804e833c995",
+    "srcset": {
+      "jpg": "variants/opaques/52_hq-160.jpg 160w, variants/opaques/52_hq-320.jpg 320w",
+      "webp": "variants/opaques/52_hq-160.webp 160w, variants/opaques/52_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/vert-52-en-poudre.html"
+    ],
+    "color": "#183224",
+    "palette": [
+      "#183224",
+      "#527663",
+      "#1f4b2c"
+    ],
+    "lab": [
+      27.3,
+      -16.4,
+      7.6
+    ],
+    "hue": 155.1
+  },
+  {
+    "id": "o-53_hq",
+    "reference": "53_hq",
+    "colorReference": "53",
+    "type": "opaque",
+    "image": "opaques/53_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 26298,
+    "hash": "350245e06880485865fa6e1f1346334419278373633faf7b6652be9b31572e5d",
+    "srcset": {
+      "jpg": "variants/opaques/53_hq-160.jpg 160w, variants/opaques/53_hq-320.jpg 320w",
+      "webp": "variants/opaques/53_hq-160.webp 160w, variants/opaques/53_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/violet-53-en-poudre.html"
+    ],
+    "color": "#121212",
+    "palette": [
+      "#121212",
+      "#1d1d1d",
+      "#4c4c4c"
+    ],
+    "lab": [
+      8.0,
+      -0.0,
+      0.0
+    ],
+    "hue": null
+  },
+  {
+    "id": "o-55_hq",
+    "reference": "55_hq",
+    "colorReference": "55",
+    "type": "opaque",
+    "image": "opaques/55_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 17536,
+    "hash": "a5b6ede4cd78ed83301278732b2c7864099c89c59a66ad11fb31cc182af7de77",
+    "srcset": {
+      "jpg": "variants/opaques/55_hq-160.jpg 160w, variants/opaques/55_hq-320.jpg 320w",
+      "webp": "variants/opaques/55_hq-160.webp 160w, variants/opaques/55_hq-320.webp 320w"
+    },
+    "productUrls": [],
+    "color": "#0e1515",
+    "palette": [
+      "#0e1515",
+      "#373f3e",
+      "#555d5c"
+    ],
+    "lab": [
+      8.5,
+      -2.8,
+      -0.7
+    ],
+    "hue": null
+  },
+  {
+    "id": "o-56_hq",
+    "reference": "56_hq",
+    "colorReference": "56",
+    "type": "opaque",
+    "image": "opaques/56_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 17536,
+    "hash": "a5b6ede4cd78ed83301278732b2c7864099c89c59a66ad11fb31cc182af7de77",
+    "srcset": {
+      "jpg": "variants/opaques/56_hq-160.jpg 160w, variants/opaques/56_hq-320.jpg 320w",
+      "webp": "variants/opaques/56_hq-160.webp 160w, variants/opaques/56_hq-320.webp 320w"
+    },
+    "productUrls": [],
+    "color": "#0e1515",
+    "palette": [
+      "#0e1515",
+      "#373f3e",
+      "#555d5c"
+    ],
+    "lab": [
+      8.5,
+      -2.8,
+      -0.7
+    ],
+    "hue": null
+  },
+  {
+    "id": "o-59",
+    "reference": "59",
+    "colorReference": null,
+    "type": "opaque",
+    "image": "opaques/59.jpg",
+    "width": 500,
+    "height": 500,
+    "bytes": 2134,
+    "hash": "3fceaede115713a9278984bdd0134d63e5e466dca73cab3b001d6c0d0e0fe341",
+    "srcset": {
+      "jpg": "variants/opaques/59-160.jpg 160w, variants/opaques/59-320.jpg 320w",
+      "webp": "variants/opaques/59-160.webp 160w, variants/opaques/59-320.webp 320w"
+    },
+    "productUrls": [],
+    "color": "#ffffff",
+    "palette": [
+      "#ffffff"
+    ],
+    "lab": [
+      100.0,
+      -0.0,
+      0.0
+    ],
+    "hue": null
+  },
+  {
+    "id": "o-59_hq",
+    "reference": "59_hq",
+    "colorReference": "59",
+    "type": "opaque",
+    "image": "opaques/59_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 2760,
+    "hash": "091ac7a07b4c13a3c1070023ec433fd107911f757e4beed5c0cda8dca6372377",
+    "srcset": {
+      "jpg": "variants/opaques/59_hq-160.jpg 160w, variants/opaques/59_hq-320.jpg 320w",
+      "webp": "variants/opaques/59_hq-160.webp 160w, variants/opaques/59_hq-320.webp 320w"
+    },
+    "productUrls": [],
+    "color": "#ffffff",
+    "palette": [
+      "#ffffff"
+    ],
+    "lab": [
+      100.0,
+      -0.0,
+      0.0
+    ],
+    "hue": null
+  },
+  {
+    "id": "o-600_hq",
+    "reference": "600_hq",
+    "colorReference": "600",
+    "type": "opaque",
+    "image": "opaques/600_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 18204,
+    "hash": "39ce6e1d789d1b780a90249ae2a2707b6e0b369b1616b494f239094ca0d9b64c",
+    "srcset": {
+      "jpg": "variants/opaques/600_hq-160.jpg 160w, variants/opaques/600_hq-320.jpg 320w",
+      "webp": "variants/opaques/600_hq-160.webp 160w, variants/opaques/600_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/gris-violace-600-en-poudre.html"
+    ],
+    "color": "#44403b",
+    "palette": [
+      "#44403b",
+      "#514c45",
+      "#78736d"
+    ],
+    "lab": [
+      30.6,
+      0.8,
+      4.0
+    ],
+    "hue": null
+  },
+  {
+    "id": "o-601_hq",
+    "reference": "601_hq",
+    "colorReference": "601",
+    "type": "opaque",
+    "image": "opaques/601_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 21803,
+    "hash": "4e9b777aecd2540797476455867dc260f2d34ca54bb1adff9a57ca0e7cb4c922",
+    "srcset": {
+      "jpg": "variants/opaques/601_hq-160.jpg 160w, variants/opaques/601_hq-320.jpg 320w",
+      "webp": "variants/opaques/601_hq-160.webp 160w, variants/opaques/601_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/gris-vert-601-en-poudre.html"
+    ],
+    "color": "#4d4a38",
+    "palette": [
+      "#4d4a38",
+      "#6c644e",
+      "#928976"
+    ],
+    "lab": [
+      38.0,
+      -1.3,
+      11.6
+    ],
+    "hue": 96.4
+  },
+  {
+    "id": "o-602_hq",
+    "reference": "602_hq",
+    "colorReference": "602",
+    "type": "opaque",
+    "image": "opaques/602_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 20986,
+    "hash": "4f0d968c8cdddab014aa2459de49eea47186ba2ce30b9aba3b0542d099459b31",
+    "srcset": {
+      "jpg": "variants/opaques/602_hq-160.jpg 160w, variants/opaques/602_hq-320.jpg 320w",
+      "webp": "variants/opaques/602_hq-160.webp 160w, variants/opaques/602_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/gris-terre-602-en-poudre.html"
+    ],
+    "color": "#453e32",
+    "palette": [
+      "#453e32",
+      "#302d26",
+      "#615f5a"
+    ],
+    "lab": [
+      24.7,
+      0.6,
+      6.6
+    ],
+    "hue": 84.8
+  },
+  {
+    "id": "o-603_hq",
+    "reference": "603_hq",
+    "colorReference": "603",
+    "type": "opaque",
+    "image": "opaques/603_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 20417,
+    "hash": "cd9cee85d4f8cc77557c3b10b0a738ce6efddd5f295a8566d7bbab267992f362",
+    "srcset": {
+      "jpg": "variants/opaques/603_hq-160.jpg 160w, variants/opaques/603_hq-320.jpg 320w",
+      "webp": "variants/opaques/603_hq-160.webp 160w, variants/opaques/603_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/gris-souris-603-en-poudre.html"
+    ],
+    "color": "#595751",
+    "palette": [
+      "#595751",
+      "#696258",
+      "#877d71"
+    ],
+    "lab": [
+      41.3,
+      0.3,
+      5.5
+    ],
+    "hue": 86.9
+  },
+  {
+    "id": "o-604_hq",
+    "reference": "604_hq",
+    "colorReference": "604",
+    "type": "opaque",
+    "image": "opaques/604_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 18092,
+    "hash": "5ae54bfa09e07f9b40f065ec87836c9d33cb3159b006455abdc6d93877105619",
+    "srcset": {
+      "jpg": "variants/opaques/604_hq-160.jpg 160w, variants/opaques/604_hq-320.jpg 320w",
+      "webp": "variants/opaques/604_hq-160.webp 160w, variants/opaques/604_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/gris-turquoise-604-en-poudre.html"
+    ],
+    "color": "#4c4e4a",
+    "palette": [
+      "#4c4e4a",
+      "#5e5d58",
+      "#7b7a76"
+    ],
+    "lab": [
+      36.2,
+      -1.2,
+      2.2
+    ],
+    "hue": null
+  },
+  {
+    "id": "o-605",
+    "reference": "605",
+    "colorReference": null,
+    "type": "opaque",
+    "image": "opaques/605.jpg",
+    "width": 183,
+    "height": 183,
+    "bytes": 9437,
+    "hash": "e7d59a3452a4c43d6a98a73950a4919b21a29fd47093a0982fb49c547e73b0b0",
+    "srcset": {
+      "jpg": "variants/opaques/605-160.jpg 160w",
+      "webp": "variants/opaques/605-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#25387c",
+    "palette": [
+      "#25387c",
+      "#465186",
+      "#b1b4c9"
+    ],
+    "lab": [
+      30.7,
+      15.3,
+      -37.3
+    ],
+    "hue": 292.3
+  },
+  {
+    "id": "o-605_hq",
+    "reference": "605_hq",
+    "colorReference": "605",
+    "type": "opaque",
+    "image": "opaques/605_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 25499,
+    "hash": "891d8d1702f05c1259bbf68d1a405ad707764b298635309a51b69cd3dbaa9b0d",
+    "srcset": {
+      "jpg": "variants/opaques/605_hq-160.jpg 160w, variants/opaques/605_hq-320.jpg 320w",
+      "webp": "variants/opaques/605_hq-160.webp 160w, variants/opaques/605_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/bleu-marine-605-poudre.html"
+    ],
+    "color": "#121f3f",
+    "palette": [
+      "#121f3f",
+      "#1d2b44",
+      "#4b556a"
+    ],
+    "lab": [
+      15.2,
+      5.6,
+      -20.6
+    ],
+    "hue": 285.2
+  },
+  {
+    "id": "o-606",
+    "reference": "606",
+    "colorReference": null,
+    "type": "opaque",
+    "image": "opaques/606.jpg",
+    "width": 183,
+    "height": 184,
+    "bytes": 8444,
+    "hash": "03c242b28063d5dce060e7ae40eb4369d64a57fe6bb19ffb7c28fe53d160de89",
+    "srcset": {
+      "jpg": "variants/opaques/606-160.jpg 160w",
+      "webp": "variants/opaques/606-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#3c6249",
+    "palette": [
+      "#3c6249",
+      "#547660",
+      "#b5c4b9"
+    ],
+    "lab": [
+      44.1,
+      -17.9,
+      9.2
+    ],
+    "hue": 152.8
+  },
+  {
+    "id": "o-614_hq",
+    "reference": "614_hq",
+    "colorReference": "614",
+    "type": "opaque",
+    "image": "opaques/614_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 29099,
+    "hash": "39d482c596340c655249a1678df7d34ee0d364653030c73c258bece946996d0f",
+    "srcset": {
+      "jpg": "variants/opaques/614_hq-160.jpg 160w, variants/opaques/614_hq-320.jpg 320w",
+      "webp": "variants/opaques/614_hq-160.webp 160w, variants/opaques/614_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/marron-614-en-poudre.html"
+    ],
+    "color": "#693d18",
+    "palette": [
+      "#693d18",
+      "#80481d",
+      "#a67659"
+    ],
+    "lab": [
+      35.5,
+      16.6,
+      30.0
+    ],
+    "hue": 61.0
+  },
+  {
+    "id": "o-619_hq",
+    "reference": "619_hq",
+    "colorReference": "619",
+    "type": "opaque",
+    "image": "opaques/619_hq.jpg",
+    "width": 220,
+    "height": 220,
+    "bytes": 9421,
+    "hash": "abd45120b0fa31f173306d8fcdfc405212045dce648f8d02f6f89d9990697a74",
+    "srcset": {
+      "jpg": "variants/opaques/619_hq-160.jpg 160w",
+      "webp": "variants/opaques/619_hq-160.webp 160w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/fondant-de-finition-619-en-poudre.html"
+    ],
+    "color": "#28221b",
+    "palette": [
+      "#28221b",
+      "#352d21",
+      "#443925"
+    ],
+    "lab": [
+      16.3,
+      1.2,
+      7.5
+    ],
+    "hue": 80.9
+  },
+  {
+    "id": "o-62",
+    "reference": "62",
+    "colorReference": null,
+    "type": "opaque",
+    "image": "opaques/62.jpg",
+    "width": 184,
+    "height": 185,
+    "bytes": 8722,
+    "hash": "140cca7694766e2ead7101b17546a991e9e0244a8187a67b4a40cae6c965dffb",
+    "srcset": {
+      "jpg": "variants/opaques/62-160.jpg 160w",
+      "webp": "variants/opaques/62-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#3e499e",
+    "palette": [
+      "#3e499e",
+      "#7377af",
+      "#bec0db"
+    ],
+    "lab": [
+      38.4,
+      20.5,
+      -44.1
+    ],
+    "hue": 294.9
+  },
+  {
+    "id": "o-620_hq",
+    "reference": "620_hq",
+    "colorReference": "620",
+    "type": "opaque",
+    "image": "opaques/620_hq.jpg",
+    "width": 220,
+    "height": 220,
+    "bytes": 9421,
+    "hash": "abd45120b0fa31f173306d8fcdfc405212045dce648f8d02f6f89d9990697a74",
+    "srcset": {
+      "jpg": "variants/opaques/620_hq-160.jpg 160w",
+      "webp": "variants/opaques/620_hq-160.webp 160w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/orange-620-en-poudre.html"
+    ],
+    "color": "#28221b",
+    "palette": [
+      "#28221b",
+      "#352d21",
+      "#443925"
+    ],
+    "lab": [
+      16.3,
+      1.2,
+      7.5
+    ],
+    "hue": 80.9
+  },
+  {
+    "id": "o-62F_hq",
+    "reference": "62F_hq",
+    "colorReference": "62F",
+    "type": "opaque",
+    "image": "opaques/62F_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 20010,
+    "hash": "249d32b7b5c6a9112c2da310d3d0c40752cc2b35ef5fe58a8280f9eeda77b16e",
+    "srcset": {
+      "jpg": "variants/opaques/62F_hq-160.jpg 160w, variants/opaques/62F_hq-320.jpg 320w",
+      "webp": "variants/opaques/62F_hq-160.webp 160w, variants/opaques/62F_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/bleu-62f-en-poudre.html"
+    ],
+    "color": "#152b73",
+    "palette": [
+      "#152b73",
+      "#1f3375",
+      "#4f5f8f"
+    ],
+    "lab": [
+      22.8,
+      18.7,
+      -41.9
+    ],
+    "hue": 294.1
+  },
+  {
+    "id": "o-62_hq",
+    "reference": "62_hq",
+    "colorReference": "62",
+    "type": "opaque",
+    "image": "opaques/62_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 20010,
+    "hash": "249d32b7b5c6a9112c2da310d3d0c40752cc2b35ef5fe58a8280f9eeda77b16e",
+    "srcset": {
+      "jpg": "variants/opaques/62_hq-160.jpg 160w, variants/opaques/62_hq-320.jpg 320w",
+      "webp": "variants/opaques/62_hq-160.webp 160w, variants/opaques/62_hq-320.webp 320w"
+    },
+    "productUrls": [],
+    "color": "#152b73",
+    "palette": [
+      "#152b73",
+      "#1f3375",
+      "#4f5f8f"
+    ],
+    "lab": [
+      22.8,
+      18.7,
+      -41.9
+    ],
+    "hue": 294.1
+  },
+  {
+    "id": "o-630",
+    "reference": "630",
+    "colorReference": null,
+    "type": "opaque",
+    "image": "opaques/630.jpg",
+    "width": 185,
+    "height": 185,
+    "bytes": 9037,
+    "hash": "9935e985d0ce050c4a2b878dcb4f53b41819afbe6b3d4e819a47a1bc99e051ad",
+    "srcset": {
+      "jpg": "variants/opaques/630-160.jpg 160w",
+      "webp": "variants/opaques/630-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#c37b59",
+    "palette": [
+      "#c37b59",
+      "#bc6e4e",
+      "#d5c3b5"
+    ],
+    "lab": [
+      59.2,
+      23.8,
+      28.4
+    ],
+    "hue": 50.0
+  },
+  {
+    "id": "o-631",
+    "reference": "631",
+    "colorReference": null,
+    "type": "opaque",
+    "image": "opaques/631.jpg",
+    "width": 185,
+    "height": 187,
+    "bytes": 8826,
+    "hash": "6ba390a91d45fe9eafea0f089e94c1e732cbcaef9f32a42129d5ad64a29f9307",
+    "srcset": {
+      "jpg": "variants/opaques/631-160.jpg 160w",
+      "webp": "variants/opaques/631-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#da702e",
+    "palette": [
+      "#da702e",
+      "#db7f41",
+      "#dbc1aa"
+    ],
+    "lab": [
+      61.4,
+      32.9,
+      48.3
+    ],
+    "hue": 55.7
+  },
+  {
+    "id": "o-631_hq",
+    "reference": "631_hq",
+    "colorReference": "631",
+    "type": "opaque",
+    "image": "opaques/631_hq.jpg",
+    "width": 220,
+    "height": 220,
+    "bytes": 9421,
+    "hash": "abd45120b0fa31f173306d8fcdfc405212045dce648f8d02f6f89d9990697a74",
+    "srcset": {
+      "jpg": "variants/opaques/631_hq-160.jpg 160w",
+      "webp": "variants/opaques/631_hq-160.webp 160w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/peche-631-en-poudre.html"
+    ],
+    "color": "#28221b",
+    "palette": [
+      "#28221b",
+      "#352d21",
+      "#443925"
+    ],
+    "lab": [
+      16.3,
+      1.2,
+      7.5
+    ],
+    "hue": 80.9
+  },
+  {
+    "id": "o-632",
+    "reference": "632",
+    "colorReference": null,
+    "type": "opaque",
+    "image": "opaques/632.jpg",
+    "width": 181,
+    "height": 182,
+    "bytes": 8673,
+    "hash": "fb669c63d0f1328b270104a706aa81d05da612bdb4661afb446414b61dfd4789",
+    "srcset": {
+      "jpg": "variants/opaques/632-160.jpg 160w",
+      "webp": "variants/opaques/632-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#2f4720",
+    "palette": [
+      "#2f4720",
+      "#505c42",
+      "#bfc3b7"
+    ],
+    "lab": [
+      35.6,
+      -13.3,
+      16.5
+    ],
+    "hue": 128.9
+  },
+  {
+    "id": "o-632_hq",
+    "reference": "632_hq",
+    "colorReference": "632",
+    "type": "opaque",
+    "image": "opaques/632_hq.jpg",
+    "width": 220,
+    "height": 220,
+    "bytes": 9421,
+    "hash": "abd45120b0fa31f173306d8fcdfc405212045dce648f8d02f6f89d9990697a74",
+    "srcset": {
+      "jpg": "variants/opaques/632_hq-160.jpg 160w",
+      "webp": "variants/opaques/632_hq-160.webp 160w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/vert-anglais-632-en-poudre.html"
+    ],
+    "color": "#28221b",
+    "palette": [
+      "#28221b",
+      "#352d21",
+      "#443925"
+    ],
+    "lab": [
+      16.3,
+      1.2,
+      7.5
+    ],
+    "hue": 80.9
+  },
+  {
+    "id": "o-633",
+    "reference": "633",
+    "colorReference": null,
+    "type": "opaque",
+    "image": "opaques/633.jpg",
+    "width": 184,
+    "height": 184,
+    "bytes": 8684,
+    "hash": "3665eaadba495ea0894440559e9e06384a83b838165b8e49d2ce66e0280244a2",
+    "srcset": {
+      "jpg": "variants/opaques/633-160.jpg 160w",
+      "webp": "variants/opaques/633-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#a2616b",
+    "palette": [
+      "#a2616b",
+      "#af7b83",
+      "#ddc8c8"
+    ],
+    "lab": [
+      53.3,
+      24.4,
+      4.8
+    ],
+    "hue": 11.1
+  },
+  {
+    "id": "o-633_hq",
+    "reference": "633_hq",
+    "colorReference": "633",
+    "type": "opaque",
+    "image": "opaques/633_hq.jpg",
+    "width": 220,
+    "height": 220,
+    "bytes": 9421,
+    "hash": "abd45120b0fa31f173306d8fcdfc405212045dce648f8d02f6f89d9990697a74",
+    "srcset": {
+      "jpg": "variants/opaques/633_hq-160.jpg 160w",
+      "webp": "variants/opaques/633_hq-160.webp 160w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/lilas-633-en-poudre.html"
+    ],
+    "color": "#28221b",
+    "palette": [
+      "#28221b",
+      "#352d21",
+      "#443925"
+    ],
+    "lab": [
+      16.3,
+      1.2,
+      7.5
+    ],
+    "hue": 80.9
+  },
+  {
+    "id": "o-634",
+    "reference": "634",
+    "colorReference": null,
+    "type": "opaque",
+    "image": "opaques/634.jpg",
+    "width": 186,
+    "height": 186,
+    "bytes": 7566,
+    "hash": "9b606440b78ce61ec6c164d887de0b66e9fb798bb4e76a906531fb2bcebd4a06",
+    "srcset": {
+      "jpg": "variants/opaques/634-160.jpg 160w",
+      "webp": "variants/opaques/634-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#ebcf3a",
+    "palette": [
+      "#ebcf3a",
+      "#dbbc5e",
+      "#eddfb2"
+    ],
+    "lab": [
+      83.0,
+      -4.4,
+      66.9
+    ],
+    "hue": 93.8
+  },
+  {
+    "id": "o-635",
+    "reference": "635",
+    "colorReference": null,
+    "type": "opaque",
+    "image": "opaques/635.jpg",
+    "width": 185,
+    "height": 185,
+    "bytes": 8766,
+    "hash": "94cc2696489301c54ec1463f1e5d6ed89b1d8970fee3f178d18f2170f7fbad45",
+    "srcset": {
+      "jpg": "variants/opaques/635-160.jpg 160w",
+      "webp": "variants/opaques/635-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#ce3f31",
+    "palette": [
+      "#ce3f31",
+      "#ce5044",
+      "#e1b5ad"
+    ],
+    "lab": [
+      51.4,
+      50.1,
+      35.4
+    ],
+    "hue": 35.2
+  },
+  {
+    "id": "o-636",
+    "reference": "636",
+    "colorReference": null,
+    "type": "opaque",
+    "image": "opaques/636.jpg",
+    "width": 184,
+    "height": 186,
+    "bytes": 8082,
+    "hash": "faea7d52485bfbd406724d1fa392df24f4f9d84861d5cbee663118656c93605d",
+    "srcset": {
+      "jpg": "variants/opaques/636-160.jpg 160w",
+      "webp": "variants/opaques/636-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#888d2f",
+    "palette": [
+      "#888d2f",
+      "#989d4f",
+      "#d0ceaa"
+    ],
+    "lab": [
+      62.1,
+      -12.7,
+      40.8
+    ],
+    "hue": 107.3
+  },
+  {
+    "id": "o-636_hq",
+    "reference": "636_hq",
+    "colorReference": "636",
+    "type": "opaque",
+    "image": "opaques/636_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 14839,
+    "hash": "4233adc4c4aa14847907e80bc4ad43b31acefd6385509efe874d4c1215520d3e",
+    "srcset": {
+      "jpg": "variants/opaques/636_hq-160.jpg 160w, variants/opaques/636_hq-320.jpg 320w",
+      "webp": "variants/opaques/636_hq-160.webp 160w, variants/opaques/636_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/vert-olive-636-en-poudre.html"
+    ],
+    "color": "#5b7033",
+    "palette": [
+      "#5b7033",
+      "#5f7442",
+      "#7a8a61"
+    ],
+    "lab": [
+      45.9,
+      -17.5,
+      28.4
+    ],
+    "hue": 121.6
+  },
+  {
+    "id": "o-637_hq",
+    "reference": "637_hq",
+    "colorReference": "637",
+    "type": "opaque",
+    "image": "opaques/637_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 7751,
+    "hash": "ac9c7526e5efa46f5de1838ae4c6113a5fc621d59443bcd9878df511d1812859",
+    "srcset": {
+      "jpg": "variants/opaques/637_hq-160.jpg 160w, variants/opaques/637_hq-320.jpg 320w",
+      "webp": "variants/opaques/637_hq-160.webp 160w, variants/opaques/637_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/celadon-637-f-en-poudre.html"
+    ],
+    "color": "#7c7c7c",
+    "palette": [
+      "#7c7c7c",
+      "#929292",
+      "#a5a5a5"
+    ],
+    "lab": [
+      53.1,
+      -0.0,
+      0.0
+    ],
+    "hue": null
+  },
+  {
+    "id": "o-668",
+    "reference": "668",
+    "colorReference": null,
+    "type": "opaque",
+    "image": "opaques/668.jpg",
+    "width": 184,
+    "height": 185,
+    "bytes": 8679,
+    "hash": "08ae0ab27cf388496f5d31f959364a6c3a8898152e4fdec52548dbfa6960930e",
+    "srcset": {
+      "jpg": "variants/opaques/668-160.jpg 160w",
+      "webp": "variants/opaques/668-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#4e64ac",
+    "palette": [
+      "#4e64ac",
+      "#737fb8",
+      "#b7bbd8"
+    ],
+    "lab": [
+      47.9,
+      12.2,
+      -37.8
+    ],
+    "hue": 287.9
+  },
+  {
+    "id": "o-66_hq",
+    "reference": "66_hq",
+    "colorReference": "66",
+    "type": "opaque",
+    "image": "opaques/66_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 8998,
+    "hash": "f4dfd8a23617142cee4ce01f2e089f23c26e24701caee44aa80a02034b5f113a",
+    "srcset": {
+      "jpg": "variants/opaques/66_hq-160.jpg 160w, variants/opaques/66_hq-320.jpg 320w",
+      "webp": "variants/opaques/66_hq-160.webp 160w, variants/opaques/66_hq-320.webp 320w"
+    },
+    "productUrls": [],
+    "color": "#3a60c2",
+    "palette": [
+      "#3a60c2",
+      "#3860bd",
+      "#5b7bc5"
+    ],
+    "lab": [
+      43.9,
+      17.8,
+      -52.9
+    ],
+    "hue": 288.6
+  },
+  {
+    "id": "o-68",
+    "reference": "68",
+    "colorReference": null,
+    "type": "opaque",
+    "image": "opaques/68.jpg",
+    "width": 183,
+    "height": 184,
+    "bytes": 7874,
+    "hash": "2e0e095b8a2cca65e610f6cb237d02ad9628336ca81bf919884912d4313e3f80",
+    "srcset": {
+      "jpg": "variants/opaques/68-160.jpg 160w",
+      "webp": "variants/opaques/68-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#8691c0",
+    "palette": [
+      "#8691c0",
+      "#96a2cb",
+      "#ced1e1"
+    ],
+    "lab": [
+      64.2,
+      6.2,
+      -23.4
+    ],
+    "hue": 284.8
+  },
+  {
+    "id": "o-68_hq",
+    "reference": "68_hq",
+    "colorReference": "68",
+    "type": "opaque",
+    "image": "opaques/68_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 12163,
+    "hash": "15166f13edd4dd0ea487c2df46eaa1ea886524db6411ffb275d37817c7dfcb5e",
+    "srcset": {
+      "jpg": "variants/opaques/68_hq-160.jpg 160w, variants/opaques/68_hq-320.jpg 320w",
+      "webp": "variants/opaques/68_hq-160.webp 160w, variants/opaques/68_hq-320.webp 320w"
+    },
+    "productUrls": [],
+    "color": "#90b7eb",
+    "palette": [
+      "#90b7eb",
+      "#b6d3fb",
+      "#a7c6ef"
+    ],
+    "lab": [
+      75.7,
+      -0.3,
+      -28.2
+    ],
+    "hue": 269.4
+  },
+  {
+    "id": "o-71_hq",
+    "reference": "71_hq",
+    "colorReference": "71",
+    "type": "opaque",
+    "image": "opaques/71_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 13072,
+    "hash": "4a2007c81dccca759f929c57e5f7ad120d544a0297415a4cfec88e70f8fdb8c7",
+    "srcset": {
+      "jpg": "variants/opaques/71_hq-160.jpg 160w, variants/opaques/71_hq-320.jpg 320w",
+      "webp": "variants/opaques/71_hq-160.webp 160w, variants/opaques/71_hq-320.webp 320w"
+    },
+    "productUrls": [],
+    "color": "#959595",
+    "palette": [
+      "#959595",
+      "#ababab",
+      "#bbbbbb"
+    ],
+    "lab": [
+      62.5,
+      -0.0,
+      0.0
+    ],
+    "hue": null
+  },
+  {
+    "id": "o-75",
+    "reference": "75",
+    "colorReference": null,
+    "type": "opaque",
+    "image": "opaques/75.jpg",
+    "width": 187,
+    "height": 187,
+    "bytes": 6846,
+    "hash": "707d532f0c685f7e5bcb6e142b4b0ebb7d05c001a7a0d0e6d79f390169febe6e",
+    "srcset": {
+      "jpg": "variants/opaques/75-160.jpg 160w",
+      "webp": "variants/opaques/75-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#cdb757",
+    "palette": [
+      "#cdb757",
+      "#d0c071",
+      "#e8e1ba"
+    ],
+    "lab": [
+      75.7,
+      -4.0,
+      48.0
+    ],
+    "hue": 94.8
+  },
+  {
+    "id": "o-75_hq",
+    "reference": "75_hq",
+    "colorReference": "75",
+    "type": "opaque",
+    "image": "opaques/75_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 17623,
+    "hash": "5f77d5732c84f0f8ba3bcc9ab1720f1a3f9e74c57753c70d441ea345fac7ec0e",
+    "srcset": {
+      "jpg": "variants/opaques/75_hq-160.jpg 160w, variants/opaques/75_hq-320.jpg 320w",
+      "webp": "variants/opaques/75_hq-160.webp 160w, variants/opaques/75_hq-320.webp 320w"
+    },
+    "productUrls": [],
+    "color": "#e5d35e",
+    "palette": [
+      "#e5d35e",
+      "#e0cf5e",
+      "#e6da81"
+    ],
+    "lab": [
+      83.7,
+      -7.8,
+      57.4
+    ],
+    "hue": 97.7
+  },
+  {
+    "id": "o-76",
+    "reference": "76",
+    "colorReference": null,
+    "type": "opaque",
+    "image": "opaques/76.jpg",
+    "width": 186,
+    "height": 187,
+    "bytes": 6564,
+    "hash": "dbc9cecaf605116ee8deb3c9dbe69c03a22c1cc338a16f141732b6b71dc01e40",
+    "srcset": {
+      "jpg": "variants/opaques/76-160.jpg 160w",
+      "webp": "variants/opaques/76-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#f6d448",
+    "palette": [
+      "#f6d448",
+      "#f4d257",
+      "#f4e6b1"
+    ],
+    "lab": [
+      85.8,
+      -2.3,
+      64.1
+    ],
+    "hue": 92.1
+  },
+  {
+    "id": "o-77",
+    "reference": "77",
+    "colorReference": null,
+    "type": "opaque",
+    "image": "opaques/77.jpg",
+    "width": 181,
+    "height": 181,
+    "bytes": 9664,
+    "hash": "6f3725f2ed024d8b51abff97899a767099d0627471cacea5d425c7b435e83c20",
+    "srcset": {
+      "jpg": "variants/opaques/77-160.jpg 160w",
+      "webp": "variants/opaques/77-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#20170f",
+    "palette": [
+      "#20170f",
+      "#403b37",
+      "#a9a8a8"
+    ],
+    "lab": [
+      19.8,
+      2.5,
+      4.5
+    ],
+    "hue": 60.9
+  },
+  {
+    "id": "o-78",
+    "reference": "78",
+    "colorReference": null,
+    "type": "opaque",
+    "image": "opaques/78.jpg",
+    "width": 185,
+    "height": 185,
+    "bytes": 6741,
+    "hash": "ae36b167aa5df415906794fec47680b1aab883c45f0fa7701e3e64fbfc658a4d",
+    "srcset": {
+      "jpg": "variants/opaques/78-160.jpg 160w",
+      "webp": "variants/opaques/78-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#cdc66c",
+    "palette": [
+      "#cdc66c",
+      "#d4d17c",
+      "#e9e7c4"
+    ],
+    "lab": [
+      80.7,
+      -9.8,
+      42.8
+    ],
+    "hue": 102.9
+  },
+  {
+    "id": "o-79_hq",
+    "reference": "79_hq",
+    "colorReference": "79",
+    "type": "opaque",
+    "image": "opaques/79_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 27082,
+    "hash": "0a2bbac4f48a28a95206f68c2a292cfdf023a7a9350bf4aaa15712779177ab27",
+    "srcset": {
+      "jpg": "variants/opaques/79_hq-160.jpg 160w, variants/opaques/79_hq-320.jpg 320w",
+      "webp": "variants/opaques/79_hq-160.webp 160w, variants/opaques/79_hq-320.webp 320w"
+    },
+    "productUrls": [],
+    "color": "#fbe949",
+    "palette": [
+      "#fbe949",
+      "#e4e9e2",
+      "#dad174"
+    ],
+    "lab": [
+      89.9,
+      -8.4,
+      51.1
+    ],
+    "hue": 99.3
+  },
+  {
+    "id": "o-80_hq",
+    "reference": "80_hq",
+    "colorReference": "80",
+    "type": "opaque",
+    "image": "opaques/80_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 10290,
+    "hash": "4817e47151ce735c776877cae9216b7e888e9c1bea31f663e04cf0a114b93913",
+    "srcset": {
+      "jpg": "variants/opaques/80_hq-160.jpg 160w, variants/opaques/80_hq-320.jpg 320w",
+      "webp": "variants/opaques/80_hq-160.webp 160w, variants/opaques/80_hq-320.webp 320w"
+    },
+    "productUrls": [],
+    "color": "#059fc2",
+    "palette": [
+      "#059fc2",
+      "#0a9fc0",
+      "#3fb2cc"
+    ],
+    "lab": [
+      61.1,
+      -22.2,
+      -27.1
+    ],
+    "hue": 230.7
+  },
+  {
+    "id": "o-81",
+    "reference": "81",
+    "colorReference": null,
+    "type": "opaque",
+    "image": "opaques/81.jpg",
+    "width": 184,
+    "height": 185,
+    "bytes": 7326,
+    "hash": "8068c791b944597ce7c5c04b184c8d298417b57fd4b230807260cc953d9d96b5",
+    "srcset": {
+      "jpg": "variants/opaques/81-160.jpg 160w",
+      "webp": "variants/opaques/81-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#7dbedd",
+    "palette": [
+      "#7dbedd",
+      "#73b6d6",
+      "#bdd8e6"
+    ],
+    "lab": [
+      73.1,
+      -12.1,
+      -21.6
+    ],
+    "hue": 240.7
+  },
+  {
+    "id": "o-81_hq",
+    "reference": "81_hq",
+    "colorReference": "81",
+    "type": "opaque",
+    "image": "opaques/81_hq.jpg",
+    "width": 220,
+    "height": 220,
+    "bytes": 9421,
+    "hash": "abd45120b0fa31f173306d8fcdfc405212045dce648f8d02f6f89d9990697a74",
+    "srcset": {
+      "jpg": "variants/opaques/81_hq-160.jpg 160w",
+      "webp": "variants/opaques/81_hq-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#28221b",
+    "palette": [
+      "#28221b",
+      "#352d21",
+      "#443925"
+    ],
+    "lab": [
+      16.3,
+      1.2,
+      7.5
+    ],
+    "hue": 80.9
+  },
+  {
+    "id": "o-82",
+    "reference": "82",
+    "colorReference": null,
+    "type": "opaque",
+    "image": "opaques/82.jpg",
+    "width": 184,
+    "height": 185,
+    "bytes": 6992,
+    "hash": "4198d6fdce8f04b188954cf49975dabf9a972cdd566d3f6114dd9970d927ee95",
+    "srcset": {
+      "jpg": "variants/opaques/82-160.jpg 160w",
+      "webp": "variants/opaques/82-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#7bb0d5",
+    "palette": [
+      "#7bb0d5",
+      "#85badc",
+      "#bcd5e5"
+    ],
+    "lab": [
+      71.8,
+      -8.0,
+      -22.5
+    ],
+    "hue": 250.4
+  },
+  {
+    "id": "o-83",
+    "reference": "83",
+    "colorReference": null,
+    "type": "opaque",
+    "image": "opaques/83.jpg",
+    "width": 183,
+    "height": 183,
+    "bytes": 8452,
+    "hash": "36c935cdc32836be894c79811c0704886fbdf9306f3081ad866a4b3819c98899",
+    "srcset": {
+      "jpg": "variants/opaques/83-160.jpg 160w",
+      "webp": "variants/opaques/83-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#43684d",
+    "palette": [
+      "#43684d",
+      "#597c63",
+      "#b8c8bd"
+    ],
+    "lab": [
+      46.3,
+      -18.0,
+      10.0
+    ],
+    "hue": 150.9
+  },
+  {
+    "id": "o-83_hq",
+    "reference": "83_hq",
+    "colorReference": "83",
+    "type": "opaque",
+    "image": "opaques/83_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 13197,
+    "hash": "3b669dab6300ac12f67891960f5a80c7935cdcd2c31d510b49176a8304639d4f",
+    "srcset": {
+      "jpg": "variants/opaques/83_hq-160.jpg 160w, variants/opaques/83_hq-320.jpg 320w",
+      "webp": "variants/opaques/83_hq-160.webp 160w, variants/opaques/83_hq-320.webp 320w"
+    },
+    "productUrls": [],
+    "color": "#323232",
+    "palette": [
+      "#323232",
+      "#555555",
+      "#7c7c7c"
+    ],
+    "lab": [
+      22.8,
+      -0.0,
+      0.0
+    ],
+    "hue": null
+  },
+  {
+    "id": "o-84",
+    "reference": "84",
+    "colorReference": null,
+    "type": "opaque",
+    "image": "opaques/84.jpg",
+    "width": 182,
+    "height": 183,
+    "bytes": 7970,
+    "hash": "244c8d522ffcc6d99757c35b4f45da60d33c85614269439ca9ec910f639f89e5",
+    "srcset": {
+      "jpg": "variants/opaques/84-160.jpg 160w",
+      "webp": "variants/opaques/84-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#618a6a",
+    "palette": [
+      "#618a6a",
+      "#779d83",
+      "#c2d1c4"
+    ],
+    "lab": [
+      59.6,
+      -18.9,
+      10.8
+    ],
+    "hue": 150.3
+  },
+  {
+    "id": "o-84_hq",
+    "reference": "84_hq",
+    "colorReference": "84",
+    "type": "opaque",
+    "image": "opaques/84_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 32607,
+    "hash": "9cbac7add9f1ae3db16451c2c4ea1dd390aab89ac9194093226817ec88912360",
+    "srcset": {
+      "jpg": "variants/opaques/84_hq-160.jpg 160w, variants/opaques/84_hq-320.jpg 320w",
+      "webp": "variants/opaques/84_hq-160.webp 160w, variants/opaques/84_hq-320.webp 320w"
+    },
+    "productUrls": [],
+    "color": "#208331",
+    "palette": [
+      "#208331",
+      "#e6ece9",
+      "#6c9f73"
+    ],
+    "lab": [
+      60.9,
+      -31.8,
+      24.5
+    ],
+    "hue": 142.4
+  },
+  {
+    "id": "o-85_hq",
+    "reference": "85_hq",
+    "colorReference": "85",
+    "type": "opaque",
+    "image": "opaques/85_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 29992,
+    "hash": "41aa1f9b5547e5cb2655f017ffdbbf3008313f863c91e0cb290d37e511ab6459",
+    "srcset": {
+      "jpg": "variants/opaques/85_hq-160.jpg 160w, variants/opaques/85_hq-320.jpg 320w",
+      "webp": "variants/opaques/85_hq-160.webp 160w, variants/opaques/85_hq-320.webp 320w"
+    },
+    "productUrls": [],
+    "color": "#207830",
+    "palette": [
+      "#207830",
+      "#e5ebe8",
+      "#66946e"
+    ],
+    "lab": [
+      58.0,
+      -28.9,
+      21.5
+    ],
+    "hue": 143.4
+  },
+  {
+    "id": "o-88",
+    "reference": "88",
+    "colorReference": null,
+    "type": "opaque",
+    "image": "opaques/88.jpg",
+    "width": 183,
+    "height": 184,
+    "bytes": 6283,
+    "hash": "90a3613f7e8f90bbefa834121c0e37645d6da40e366f7ceab092fb7ec118f9a1",
+    "srcset": {
+      "jpg": "variants/opaques/88-160.jpg 160w",
+      "webp": "variants/opaques/88-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#c9b796",
+    "palette": [
+      "#c9b796",
+      "#d1c3a5",
+      "#e1dac9"
+    ],
+    "lab": [
+      77.6,
+      0.9,
+      17.4
+    ],
+    "hue": 87.0
+  },
+  {
+    "id": "o-90",
+    "reference": "90",
+    "colorReference": null,
+    "type": "opaque",
+    "image": "opaques/90.jpg",
+    "width": 183,
+    "height": 191,
+    "bytes": 6900,
+    "hash": "86ad6885fb628550cec6e83588ce767ff17e5184e2c0cdbdbd225b8f2860b7c5",
+    "srcset": {
+      "jpg": "variants/opaques/90-160.jpg 160w",
+      "webp": "variants/opaques/90-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#e0bcc1",
+    "palette": [
+      "#e0bcc1",
+      "#ccaead",
+      "#e6d5d7"
+    ],
+    "lab": [
+      79.3,
+      12.9,
+      2.4
+    ],
+    "hue": 10.5
+  },
+  {
+    "id": "o-92",
+    "reference": "92",
+    "colorReference": null,
+    "type": "opaque",
+    "image": "opaques/92.jpg",
+    "width": 195,
+    "height": 186,
+    "bytes": 7982,
+    "hash": "c8edf18487d6f260aa673073b8fa5d9e9c18d518c8cfe818d79920736db863dc",
+    "srcset": {
+      "jpg": "variants/opaques/92-160.jpg 160w",
+      "webp": "variants/opaques/92-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#de9c33",
+    "palette": [
+      "#de9c33",
+      "#cc9a5a",
+      "#e3ceaf"
+    ],
+    "lab": [
+      70.0,
+      14.3,
+      56.4
+    ],
+    "hue": 75.8
+  },
+  {
+    "id": "o-94_hq",
+    "reference": "94_hq",
+    "colorReference": "94",
+    "type": "opaque",
+    "image": "opaques/94_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 11187,
+    "hash": "ca4b5aaebe1c09d02dbfc81b3dea6216494387c82b865433e7dd3f7bd837d3c7",
+    "srcset": {
+      "jpg": "variants/opaques/94_hq-160.jpg 160w, variants/opaques/94_hq-320.jpg 320w",
+      "webp": "variants/opaques/94_hq-160.webp 160w, variants/opaques/94_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/anis-94-en-poudre.html"
+    ],
+    "color": "#edea7d",
+    "palette": [
+      "#edea7d",
+      "#eeec98",
+      "#eff1ac"
+    ],
+    "lab": [
+      90.9,
+      -13.3,
+      51.9
+    ],
+    "hue": 104.4
+  },
+  {
+    "id": "o-95_hq",
+    "reference": "95_hq",
+    "colorReference": "95",
+    "type": "opaque",
+    "image": "opaques/95_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 11917,
+    "hash": "3e004b21043ef4c41ac64134e9bc85fa9849caab97d7b1713249f5e6614a53e6",
+    "srcset": {
+      "jpg": "variants/opaques/95_hq-160.jpg 160w, variants/opaques/95_hq-320.jpg 320w",
+      "webp": "variants/opaques/95_hq-160.webp 160w, variants/opaques/95_hq-320.webp 320w"
+    },
+    "productUrls": [],
+    "color": "#fef216",
+    "palette": [
+      "#fef216",
+      "#fee81a",
+      "#fcef4f"
+    ],
+    "lab": [
+      93.1,
+      -14.1,
+      88.3
+    ],
+    "hue": 99.1
+  },
+  {
+    "id": "o-97_hq",
+    "reference": "97_hq",
+    "colorReference": "97",
+    "type": "opaque",
+    "image": "opaques/97_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 3371,
+    "hash": "c1473d7c4c48cc7d12fee8bce57f22d055221b9b9c18d7b43e1a83ca7e68b739",
+    "srcset": {
+      "jpg": "variants/opaques/97_hq-160.jpg 160w, variants/opaques/97_hq-320.jpg 320w",
+      "webp": "variants/opaques/97_hq-160.webp 160w, variants/opaques/97_hq-320.webp 320w"
+    },
+    "productUrls": [],
+    "color": "#ffffff",
+    "palette": [
+      "#ffffff"
+    ],
+    "lab": [
+      100.0,
+      -0.0,
+      0.0
+    ],
+    "hue": null
+  },
+  {
+    "id": "o-98",
+    "reference": "98",
+    "colorReference": null,
+    "type": "opaque",
+    "image": "opaques/98.jpg",
+    "width": 179,
+    "height": 183,
+    "bytes": 5503,
+    "hash": "1930fe9b6165a673b80181e997a7dad99f89f6752cdc36f4cc3f2e06f77cc4d7",
+    "srcset": {
+      "jpg": "variants/opaques/98-160.jpg 160w",
+      "webp": "variants/opaques/98-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#eadfc5",
+    "palette": [
+      "#eadfc5",
+      "#f0ead4",
+      "#aaa79b"
+    ],
+    "lab": [
+      90.3,
+      -1.1,
+      13.2
+    ],
+    "hue": 94.8
+  },
+  {
+    "id": "o-BLEU161_hq",
+    "reference": "BLEU161_hq",
+    "colorReference": "BLEU161",
+    "type": "opaque",
+    "image": "opaques/BLEU161_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 22397,
+    "hash": "19a5c7030c17c45ccd6e5cb24b685079b1a996e56d8b792b87bb8a4d864805eb",
+    "srcset": {
+      "jpg": "variants/opaques/BLEU161_hq-160.jpg 160w, variants/opaques/BLEU161_hq-320.jpg 320w",
+      "webp": "variants/opaques/BLEU161_hq-160.webp 160w, variants/opaques/BLEU161_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/gris-bleu-161-b-en-poudre.html"
+    ],
+    "color": "#2b2f36",
+    "palette": [
+      "#2b2f36",
+      "#3a3b48",
+      "#676c71"
+    ],
+    "lab": [
+      25.4,
+      1.1,
+      -6.2
+    ],
+    "hue": 280.1
+  },
+  {
+    "id": "o-BLEU238_hq",
+    "reference": "BLEU238_hq",
+    "colorReference": "BLEU238",
+    "type": "opaque",
+    "image": "opaques/BLEU238_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 24051,
+    "hash": "f3fee48f9fbf0b0b9fe1ebf016f35758874f91672d46402ec9c86d56a3ecb38c",
+    "srcset": {
+      "jpg": "variants/opaques/BLEU238_hq-160.jpg 160w, variants/opaques/BLEU238_hq-320.jpg 320w",
+      "webp": "variants/opaques/BLEU238_hq-160.webp 160w, variants/opaques/BLEU238_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/bleu-238-b-en-poudre.html"
+    ],
+    "color": "#727e79",
+    "palette": [
+      "#727e79",
+      "#909891",
+      "#b5b9b2"
+    ],
+    "lab": [
+      57.2,
+      -5.0,
+      1.8
+    ],
+    "hue": 160.2
+  },
+  {
+    "id": "o-BLEU68_hq",
+    "reference": "BLEU68_hq",
+    "colorReference": "BLEU68",
+    "type": "opaque",
+    "image": "opaques/BLEU68_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 12163,
+    "hash": "15166f13edd4dd0ea487c2df46eaa1ea886524db6411ffb275d37817c7dfcb5e",
+    "srcset": {
+      "jpg": "variants/opaques/BLEU68_hq-160.jpg 160w, variants/opaques/BLEU68_hq-320.jpg 320w",
+      "webp": "variants/opaques/BLEU68_hq-160.webp 160w, variants/opaques/BLEU68_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/bleu-68-f-sans-plomb.html"
+    ],
+    "color": "#90b7eb",
+    "palette": [
+      "#90b7eb",
+      "#b6d3fb",
+      "#a7c6ef"
+    ],
+    "lab": [
+      75.7,
+      -0.3,
+      -28.2
+    ],
+    "hue": 269.4
+  },
+  {
+    "id": "o-CLAIR126_hq",
+    "reference": "CLAIR126_hq",
+    "colorReference": "CLAIR126",
+    "type": "opaque",
+    "image": "opaques/CLAIR126_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 32613,
+    "hash": "9b9cef92c512a927822b0ebbddc2f72ec6c298b83d69c77dd356b68884f586d9",
+    "srcset": {
+      "jpg": "variants/opaques/CLAIR126_hq-160.jpg 160w, variants/opaques/CLAIR126_hq-320.jpg 320w",
+      "webp": "variants/opaques/CLAIR126_hq-160.webp 160w, variants/opaques/CLAIR126_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/turquoise-opaque-clair-126.html"
+    ],
+    "color": "#4897b5",
+    "palette": [
+      "#4897b5",
+      "#e8efed",
+      "#91bcca"
+    ],
+    "lab": [
+      70.3,
+      -11.1,
+      -15.1
+    ],
+    "hue": 233.7
+  },
+  {
+    "id": "o-CLAIR174_hq",
+    "reference": "CLAIR174_hq",
+    "colorReference": "CLAIR174",
+    "type": "opaque",
+    "image": "opaques/CLAIR174_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 21138,
+    "hash": "3cd5151df8dcb80a34215a6d25b46dd3cbbf3ad0ff51faae0ccd9ec17a4bfd95",
+    "srcset": {
+      "jpg": "variants/opaques/CLAIR174_hq-160.jpg 160w, variants/opaques/CLAIR174_hq-320.jpg 320w",
+      "webp": "variants/opaques/CLAIR174_hq-160.webp 160w, variants/opaques/CLAIR174_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/marron-clair-174-c-en-poudre.html"
+    ],
+    "color": "#5d3e21",
+    "palette": [
+      "#5d3e21",
+      "#95765e",
+      "#7f532c"
+    ],
+    "lab": [
+      34.7,
+      10.6,
+      22.6
+    ],
+    "hue": 64.9
+  },
+  {
+    "id": "o-EAU270_hq",
+    "reference": "EAU270_hq",
+    "colorReference": "EAU270",
+    "type": "opaque",
+    "image": "opaques/EAU270_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 29546,
+    "hash": "9d1e9637e40d497834d5be729e1960aedb7da2ccfb6d4da8b06a6ee79b3b2678",
+    "srcset": {
+      "jpg": "variants/opaques/EAU270_hq-160.jpg 160w, variants/opaques/EAU270_hq-320.jpg 320w",
+      "webp": "variants/opaques/EAU270_hq-160.webp 160w, variants/opaques/EAU270_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/vert-d-eau-270.html"
+    ],
+    "color": "#85e1be",
+    "palette": [
+      "#85e1be",
+      "#e5f0eb",
+      "#85b09e"
+    ],
+    "lab": [
+      84.5,
+      -25.6,
+      6.3
+    ],
+    "hue": 166.2
+  },
+  {
+    "id": "o-FLAMME287_hq",
+    "reference": "FLAMME287_hq",
+    "colorReference": "FLAMME287",
+    "type": "opaque",
+    "image": "opaques/FLAMME287_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 39692,
+    "hash": "cfedb5bd9e6e68e85fd6b87dbe74e0222228ed041c0f6a6986fc81a8f21e833c",
+    "srcset": {
+      "jpg": "variants/opaques/FLAMME287_hq-160.jpg 160w, variants/opaques/FLAMME287_hq-320.jpg 320w",
+      "webp": "variants/opaques/FLAMME287_hq-160.webp 160w, variants/opaques/FLAMME287_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/rouge-flamme-287.html"
+    ],
+    "color": "#c22a1e",
+    "palette": [
+      "#c22a1e",
+      "#b42f21",
+      "#c2352b"
+    ],
+    "lab": [
+      42.6,
+      55.5,
+      42.1
+    ],
+    "hue": 37.2
+  },
+  {
+    "id": "o-FONCE127_hq",
+    "reference": "FONCE127_hq",
+    "colorReference": "FONCE127",
+    "type": "opaque",
+    "image": "opaques/FONCE127_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 35120,
+    "hash": "48954268d3bd1172100f4114ffaf50742a6be1d1896713ab577885dca1b8b331",
+    "srcset": {
+      "jpg": "variants/opaques/FONCE127_hq-160.jpg 160w, variants/opaques/FONCE127_hq-320.jpg 320w",
+      "webp": "variants/opaques/FONCE127_hq-160.webp 160w, variants/opaques/FONCE127_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/turquoise-opaque-fonce-127.html"
+    ],
+    "color": "#196289",
+    "palette": [
+      "#196289",
+      "#eaefed",
+      "#6f92a8"
+    ],
+    "lab": [
+      56.5,
+      -5.6,
+      -18.5
+    ],
+    "hue": 253.2
+  },
+  {
+    "id": "o-MARRON173_hq",
+    "reference": "MARRON173_hq",
+    "colorReference": "MARRON173",
+    "type": "opaque",
+    "image": "opaques/MARRON173_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 22169,
+    "hash": "d355d82d49b205cfe7dc318bf12c291b25eddc98a85b1c0e62130ad23765c5bd",
+    "srcset": {
+      "jpg": "variants/opaques/MARRON173_hq-160.jpg 160w, variants/opaques/MARRON173_hq-320.jpg 320w",
+      "webp": "variants/opaques/MARRON173_hq-160.webp 160w, variants/opaques/MARRON173_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/marron-173-c-en-poudre.html"
+    ],
+    "color": "#856145",
+    "palette": [
+      "#856145",
+      "#9b6e50",
+      "#b08a70"
+    ],
+    "lab": [
+      47.4,
+      11.7,
+      21.6
+    ],
+    "hue": 61.6
+  },
+  {
+    "id": "o-MARRON302_hq",
+    "reference": "MARRON302_hq",
+    "colorReference": "MARRON302",
+    "type": "opaque",
+    "image": "opaques/MARRON302_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 17078,
+    "hash": "901bc24f936d60e22c12648ef08ac8e315160c49c8991c75ff8de21b2b046d34",
+    "srcset": {
+      "jpg": "variants/opaques/MARRON302_hq-160.jpg 160w, variants/opaques/MARRON302_hq-320.jpg 320w",
+      "webp": "variants/opaques/MARRON302_hq-160.webp 160w, variants/opaques/MARRON302_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/marron-302-c-en-poudre.html"
+    ],
+    "color": "#503e2d",
+    "palette": [
+      "#503e2d",
+      "#534335",
+      "#776c61"
+    ],
+    "lab": [
+      30.0,
+      4.5,
+      12.1
+    ],
+    "hue": 69.6
+  },
+  {
+    "id": "o-N1_hq",
+    "reference": "N1_hq",
+    "colorReference": "N1",
+    "type": "opaque",
+    "image": "opaques/N1_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 20402,
+    "hash": "80d8ccb5ec3152f4da036984eea3168953bd3953ec3eede886715295d6516247",
+    "srcset": {
+      "jpg": "variants/opaques/N1_hq-160.jpg 160w, variants/opaques/N1_hq-320.jpg 320w",
+      "webp": "variants/opaques/N1_hq-160.webp 160w, variants/opaques/N1_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/fondant-pour-cuivre-n-1-sans-plomb-en-poudre.html"
+    ],
+    "color": "#d59776",
+    "palette": [
+      "#d59776",
+      "#e19e7b",
+      "#e5b497"
+    ],
+    "lab": [
+      69.8,
+      19.3,
+      27.0
+    ],
+    "hue": 54.4
+  },
+  {
+    "id": "o-NOIR55_hq",
+    "reference": "NOIR55_hq",
+    "colorReference": "NOIR55",
+    "type": "opaque",
+    "image": "opaques/NOIR55_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 17536,
+    "hash": "a5b6ede4cd78ed83301278732b2c7864099c89c59a66ad11fb31cc182af7de77",
+    "srcset": {
+      "jpg": "variants/opaques/NOIR55_hq-160.jpg 160w, variants/opaques/NOIR55_hq-320.jpg 320w",
+      "webp": "variants/opaques/NOIR55_hq-160.webp 160w, variants/opaques/NOIR55_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/noir-55-f-morceaux.html"
+    ],
+    "color": "#0e1515",
+    "palette": [
+      "#0e1515",
+      "#373f3e",
+      "#555d5c"
+    ],
+    "lab": [
+      8.5,
+      -2.8,
+      -0.7
+    ],
+    "hue": null
+  },
+  {
+    "id": "o-POMME285_hq",
+    "reference": "POMME285_hq",
+    "colorReference": "POMME285",
+    "type": "opaque",
+    "image": "opaques/POMME285_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 18335,
+    "hash": "c286c39213ce7b947cbbfc3f1c90cccec6708604fc6eb4fc56211fca8bfed537",
+    "srcset": {
+      "jpg": "variants/opaques/POMME285_hq-160.jpg 160w, variants/opaques/POMME285_hq-320.jpg 320w",
+      "webp": "variants/opaques/POMME285_hq-160.webp 160w, variants/opaques/POMME285_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/vert-pomme-285.html"
+    ],
+    "color": "#badf4c",
+    "palette": [
+      "#badf4c",
+      "#b6db4f",
+      "#d5e066"
+    ],
+    "lab": [
+      83.4,
+      -32.1,
+      64.3
+    ],
+    "hue": 116.5
+  },
+  {
+    "id": "o-POURPRE284_hq",
+    "reference": "POURPRE284_hq",
+    "colorReference": "POURPRE284",
+    "type": "opaque",
+    "image": "opaques/POURPRE284_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 26066,
+    "hash": "08506203b6bf1bf145c6cf7ad5e62b7278995a2432f0222735fa6ef4ec251839",
+    "srcset": {
+      "jpg": "variants/opaques/POURPRE284_hq-160.jpg 160w, variants/opaques/POURPRE284_hq-320.jpg 320w",
+      "webp": "variants/opaques/POURPRE284_hq-160.webp 160w, variants/opaques/POURPRE284_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/pourpre-284.html"
+    ],
+    "color": "#743e5d",
+    "palette": [
+      "#743e5d",
+      "#76405e",
+      "#774460"
+    ],
+    "lab": [
+      34.5,
+      27.5,
+      -7.6
+    ],
+    "hue": 344.6
+  },
+  {
+    "id": "o-RUBIS31_hq",
+    "reference": "RUBIS31_hq",
+    "colorReference": "RUBIS31",
+    "type": "opaque",
+    "image": "opaques/RUBIS31_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 8371,
+    "hash": "8e5c590f69890dea9f1c2c63d5bb5d63f2056523317d2bcc15a15d0b6e9f9a63",
+    "srcset": {
+      "jpg": "variants/opaques/RUBIS31_hq-160.jpg 160w, variants/opaques/RUBIS31_hq-320.jpg 320w",
+      "webp": "variants/opaques/RUBIS31_hq-160.webp 160w, variants/opaques/RUBIS31_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/rubis-31.html"
+    ],
+    "color": "#774755",
+    "palette": [
+      "#774755",
+      "#90616b",
+      "#e4dddf"
+    ],
+    "lab": [
+      41.3,
+      21.3,
+      0.9
+    ],
+    "hue": 2.4
+  },
+  {
+    "id": "o-TEINTE97_hq",
+    "reference": "TEINTE97_hq",
+    "colorReference": "TEINTE97",
+    "type": "opaque",
+    "image": "opaques/TEINTE97_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 3371,
+    "hash": "c1473d7c4c48cc7d12fee8bce57f22d055221b9b9c18d7b43e1a83ca7e68b739",
+    "srcset": {
+      "jpg": "variants/opaques/TEINTE97_hq-160.jpg 160w, variants/opaques/TEINTE97_hq-320.jpg 320w",
+      "webp": "variants/opaques/TEINTE97_hq-160.webp 160w, variants/opaques/TEINTE97_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/blanc-teinte-97-p.html"
+    ],
+    "color": "#ffffff",
+    "palette": [
+      "#ffffff"
+    ],
+    "lab": [
+      100.0,
+      -0.0,
+      0.0
+    ],
+    "hue": null
+  },
+  {
+    "id": "o-r1_c8",
+    "reference": "r1_c8",
+    "colorReference": null,
+    "type": "opaque",
+    "image": "opaques/r1_c8.jpg",
+    "width": 181,
+    "height": 170,
+    "bytes": 9291,
+    "hash": "f2cb9f0e125bd6ea48dc679ab47000332e000ffd539f689a01e299658df0bec7",
+    "srcset": {
+      "jpg": "variants/opaques/r1_c8-160.jpg 160w",
+      "webp": "variants/opaques/r1_c8-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#211811",
+    "palette": [
+      "#211811",
+      "#f4f4f4",
+      "#47433f"
+    ],
+    "lab": [
+      38.8,
+      1.6,
+      3.5
+    ],
+    "hue": null
+  },
+  {
+    "id": "t-0",
+    "reference": "0",
+    "colorReference": null,
+    "type": "transparent",
+    "image": "transparent_colors/0.jpg",
+    "width": 235,
+    "height": 235,
+    "bytes": 11564,
+    "hash": "34888239b51ae9a1ffa235561a1940f9b98d78a4eedb214fa24d234d5125a791",
+    "srcset": {
+      "jpg": "variants/transparent_colors/0-160.jpg 160w",
+      "webp": "variants/transparent_colors/0-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#5e1620",
+    "palette": [
+      "#5e1620",
+      "#67202b",
+      "#ddd1d1"
+    ],
+    "lab": [
+      25.5,
+      31.0,
+      11.3
+    ],
+    "hue": 20.0
+  },
+  {
+    "id": "t-104",
+    "reference": "104",
+    "colorReference": null,
+    "type": "transparent",
+    "image": "transparent_colors/104.jpg",
+    "width": 233,
+    "height": 234,
+    "bytes": 11907,
+    "hash": "aa7075ec823b68e44753f34f2387b7fcfac05a62c0921d4ed10fd41bf529e9dc",
+    "srcset": {
+      "jpg": "variants/transparent_colors/104-160.jpg 160w",
+      "webp": "variants/transparent_colors/104-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#41192f",
+    "palette": [
+      "#41192f",
+      "#5a3149",
+      "#c5b7be"
+    ],
+    "lab": [
+      24.1,
+      21.3,
+      -5.4
+    ],
+    "hue": 345.8
+  },
+  {
+    "id": "t-1045",
+    "reference": "1045",
+    "colorReference": null,
+    "type": "transparent",
+    "image": "transparent_colors/1045.jpg",
+    "width": 235,
+    "height": 234,
+    "bytes": 10283,
+    "hash": "0de7782a9cf674f4c1cfc7fa8e4eecda1ea58f36d5e5980cfb5e1798bbf7ff31",
+    "srcset": {
+      "jpg": "variants/transparent_colors/1045-160.jpg 160w",
+      "webp": "variants/transparent_colors/1045-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#b68587",
+    "palette": [
+      "#b68587",
+      "#bd908e",
+      "#e9ded9"
+    ],
+    "lab": [
+      63.3,
+      17.3,
+      7.0
+    ],
+    "hue": 22.0
+  },
+  {
+    "id": "t-1047",
+    "reference": "1047",
+    "colorReference": null,
+    "type": "transparent",
+    "image": "transparent_colors/1047.jpg",
+    "width": 233,
+    "height": 233,
+    "bytes": 10442,
+    "hash": "67cc9606a6211cbee1539cb446a9226d649523e4f994879b23aa9a6d729582de",
+    "srcset": {
+      "jpg": "variants/transparent_colors/1047-160.jpg 160w",
+      "webp": "variants/transparent_colors/1047-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#ad8e92",
+    "palette": [
+      "#ad8e92",
+      "#b79b9e",
+      "#ded4d3"
+    ],
+    "lab": [
+      65.3,
+      11.1,
+      2.4
+    ],
+    "hue": 12.2
+  },
+  {
+    "id": "t-111",
+    "reference": "111",
+    "colorReference": null,
+    "type": "transparent",
+    "image": "transparent_colors/111.jpg",
+    "width": 233,
+    "height": 233,
+    "bytes": 12118,
+    "hash": "96ef30d149903e46f5f0e7a206021f6f67c906d9182a78099b3fd08b50266579",
+    "srcset": {
+      "jpg": "variants/transparent_colors/111-160.jpg 160w",
+      "webp": "variants/transparent_colors/111-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#51466f",
+    "palette": [
+      "#51466f",
+      "#675c84",
+      "#c1beca"
+    ],
+    "lab": [
+      39.3,
+      13.3,
+      -20.4
+    ],
+    "hue": 303.1
+  },
+  {
+    "id": "t-194",
+    "reference": "194",
+    "colorReference": null,
+    "type": "transparent",
+    "image": "transparent_colors/194.jpg",
+    "width": 228,
+    "height": 229,
+    "bytes": 10610,
+    "hash": "5a0486cba0b0b713f4ac53902f360dea72df4441e09ee678f154ede1a57277f8",
+    "srcset": {
+      "jpg": "variants/transparent_colors/194-160.jpg 160w",
+      "webp": "variants/transparent_colors/194-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#241511",
+    "palette": [
+      "#241511",
+      "#f0efee",
+      "#5b5554"
+    ],
+    "lab": [
+      15.3,
+      6.2,
+      4.8
+    ],
+    "hue": 37.7
+  },
+  {
+    "id": "t-1942",
+    "reference": "1942",
+    "colorReference": null,
+    "type": "transparent",
+    "image": "transparent_colors/1942.jpg",
+    "width": 224,
+    "height": 231,
+    "bytes": 9506,
+    "hash": "3abf92cafc0d3b5b36914a1495aee35eb77f8c20f7a23712dcea585fbf25bce5",
+    "srcset": {
+      "jpg": "variants/transparent_colors/1942-160.jpg 160w",
+      "webp": "variants/transparent_colors/1942-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#bfa4a8",
+    "palette": [
+      "#bfa4a8",
+      "#cbb6b8",
+      "#f3eeed"
+    ],
+    "lab": [
+      74.1,
+      8.7,
+      1.6
+    ],
+    "hue": 10.4
+  },
+  {
+    "id": "t-2000",
+    "reference": "2000",
+    "colorReference": null,
+    "type": "transparent",
+    "image": "transparent_colors/2000.jpg",
+    "width": 235,
+    "height": 234,
+    "bytes": 11782,
+    "hash": "5dae40f9c2ad58aa8f163a6f1f1a39ef46bb49c437182a5b05c6972b460d847e",
+    "srcset": {
+      "jpg": "variants/transparent_colors/2000-160.jpg 160w",
+      "webp": "variants/transparent_colors/2000-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#a5596f",
+    "palette": [
+      "#a5596f",
+      "#9e4960",
+      "#e7d3d9"
+    ],
+    "lab": [
+      47.7,
+      34.1,
+      2.3
+    ],
+    "hue": 3.9
+  },
+  {
+    "id": "t-2002",
+    "reference": "2002",
+    "colorReference": null,
+    "type": "transparent",
+    "image": "transparent_colors/2002.jpg",
+    "width": 233,
+    "height": 234,
+    "bytes": 10488,
+    "hash": "562da4c10d5ada5f9a71e7ac875674b606c137e9a3940031b18532854d81b895",
+    "srcset": {
+      "jpg": "variants/transparent_colors/2002-160.jpg 160w",
+      "webp": "variants/transparent_colors/2002-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#9c7c91",
+    "palette": [
+      "#9c7c91",
+      "#a8899a",
+      "#dfd5d8"
+    ],
+    "lab": [
+      59.4,
+      14.5,
+      -5.3
+    ],
+    "hue": 339.9
+  },
+  {
+    "id": "t-2003",
+    "reference": "2003",
+    "colorReference": null,
+    "type": "transparent",
+    "image": "transparent_colors/2003.jpg",
+    "width": 235,
+    "height": 234,
+    "bytes": 11589,
+    "hash": "5ce25167edd1e822db0a1106205bee05c11528ef93910c07d3e4e61b3269b638",
+    "srcset": {
+      "jpg": "variants/transparent_colors/2003-160.jpg 160w",
+      "webp": "variants/transparent_colors/2003-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#633d67",
+    "palette": [
+      "#633d67",
+      "#6e4971",
+      "#dcd1db"
+    ],
+    "lab": [
+      37.2,
+      22.7,
+      -16.4
+    ],
+    "hue": 324.2
+  },
+  {
+    "id": "t-272_hq",
+    "reference": "272_hq",
+    "colorReference": null,
+    "type": "transparent",
+    "image": "transparent_colors/272_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 20294,
+    "hash": "acf348c815834c61ba0ce577b8f7dfa0fcd85b818aade10e47709ad3809504ff",
+    "srcset": {
+      "jpg": "variants/transparent_colors/272_hq-160.jpg 160w, variants/transparent_colors/272_hq-320.jpg 320w",
+      "webp": "variants/transparent_colors/272_hq-160.webp 160w, variants/transparent_colors/272_hq-320.webp 320w"
+    },
+    "productUrls": [],
+    "color": "#5bbae6",
+    "palette": [
+      "#5bbae6",
+      "#ccdde0",
+      "#67a1b8"
+    ],
+    "lab": [
+      73.4,
+      -13.2,
+      -23.7
+    ],
+    "hue": 240.9
+  },
+  {
+    "id": "t-29",
+    "reference": "29",
+    "colorReference": null,
+    "type": "transparent",
+    "image": "transparent_colors/29.jpg",
+    "width": 234,
+    "height": 234,
+    "bytes": 13146,
+    "hash": "f2a4bc027ff9b389eb9fc88cc5583de8cd2a30305189826ee80a75ddfa80933a",
+    "srcset": {
+      "jpg": "variants/transparent_colors/29-160.jpg 160w",
+      "webp": "variants/transparent_colors/29-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#895d64",
+    "palette": [
+      "#895d64",
+      "#9e7379",
+      "#dbcfd0"
+    ],
+    "lab": [
+      49.1,
+      18.1,
+      3.3
+    ],
+    "hue": 10.3
+  },
+  {
+    "id": "t-31",
+    "reference": "31",
+    "colorReference": null,
+    "type": "transparent",
+    "image": "transparent_colors/31.jpg",
+    "width": 500,
+    "height": 500,
+    "bytes": 8462,
+    "hash": "6d99e7c56b298ffb6ae1230da7d8d2f87b91ff825953efe21a46239643322878",
+    "srcset": {
+      "jpg": "variants/transparent_colors/31-160.jpg 160w, variants/transparent_colors/31-320.jpg 320w",
+      "webp": "variants/transparent_colors/31-160.webp 160w, variants/transparent_colors/31-320.webp 320w"
+    },
+    "productUrls": [],
+    "color": "#764654",
+    "palette": [
+      "#764654",
+      "#8c5b66",
+      "#e6dfe2"
+    ],
+    "lab": [
+      41.4,
+      21.3,
+      0.9
+    ],
+    "hue": 2.4
+  },
+  {
+    "id": "t-383",
+    "reference": "383",
+    "colorReference": null,
+    "type": "transparent",
+    "image": "transparent_colors/383.jpg",
+    "width": 233,
+    "height": 234,
+    "bytes": 12899,
+    "hash": "a99ffc3b9c6c5159ed3b5a8233026d3ddcf8f5c1549cc86ed4abf49040de829f",
+    "srcset": {
+      "jpg": "variants/transparent_colors/383-160.jpg 160w",
+      "webp": "variants/transparent_colors/383-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#865a61",
+    "palette": [
+      "#865a61",
+      "#9d777f",
+      "#dacbcd"
+    ],
+    "lab": [
+      51.0,
+      16.9,
+      2.4
+    ],
+    "hue": 8.1
+  },
+  {
+    "id": "t-388",
+    "reference": "388",
+    "colorReference": null,
+    "type": "transparent",
+    "image": "transparent_colors/388.jpg",
+    "width": 236,
+    "height": 235,
+    "bytes": 11720,
+    "hash": "e5161003d133e6c4e2670493f6c531043701d536ff67f73c921181ba7043c767",
+    "srcset": {
+      "jpg": "variants/transparent_colors/388-160.jpg 160w",
+      "webp": "variants/transparent_colors/388-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#9e6b3a",
+    "palette": [
+      "#9e6b3a",
+      "#aa7e4f",
+      "#eae1cf"
+    ],
+    "lab": [
+      52.9,
+      13.7,
+      33.6
+    ],
+    "hue": 67.8
+  },
+  {
+    "id": "t-39",
+    "reference": "39",
+    "colorReference": null,
+    "type": "transparent",
+    "image": "transparent_colors/39.jpg",
+    "width": 237,
+    "height": 235,
+    "bytes": 11118,
+    "hash": "e12ca5342f84bfba2eb5930830a17ae3c31d52dc55f11e204222a36e3f336119",
+    "srcset": {
+      "jpg": "variants/transparent_colors/39-160.jpg 160w",
+      "webp": "variants/transparent_colors/39-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#74231a",
+    "palette": [
+      "#74231a",
+      "#863629",
+      "#dac4ba"
+    ],
+    "lab": [
+      32.4,
+      32.5,
+      24.5
+    ],
+    "hue": 37.0
+  },
+  {
+    "id": "t-40",
+    "reference": "40",
+    "colorReference": null,
+    "type": "transparent",
+    "image": "transparent_colors/40.jpg",
+    "width": 236,
+    "height": 235,
+    "bytes": 11357,
+    "hash": "dc04f383e47ec60ca969b67d38f9ad1be666dcc4988d55da2292267051c7c9f4",
+    "srcset": {
+      "jpg": "variants/transparent_colors/40-160.jpg 160w",
+      "webp": "variants/transparent_colors/40-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#983741",
+    "palette": [
+      "#983741",
+      "#a65055",
+      "#e3cccb"
+    ],
+    "lab": [
+      40.0,
+      39.4,
+      15.2
+    ],
+    "hue": 21.1
+  },
+  {
+    "id": "t-4044836",
+    "reference": "4044836",
+    "colorReference": null,
+    "type": "transparent",
+    "image": "transparent_colors/4044836.jpg",
+    "width": 227,
+    "height": 226,
+    "bytes": 9025,
+    "hash": "b058015b4b543b626a56a69c6c8e8de16f2abe40f212693108dc2547ddc5491d",
+    "srcset": {
+      "jpg": "variants/transparent_colors/4044836-160.jpg 160w",
+      "webp": "variants/transparent_colors/4044836-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#c1adae",
+    "palette": [
+      "#c1adae",
+      "#ccbcbc",
+      "#f2edeb"
+    ],
+    "lab": [
+      76.0,
+      6.2,
+      2.0
+    ],
+    "hue": 17.9
+  },
+  {
+    "id": "t-4046",
+    "reference": "4046",
+    "colorReference": null,
+    "type": "transparent",
+    "image": "transparent_colors/4046.jpg",
+    "width": 234,
+    "height": 234,
+    "bytes": 10432,
+    "hash": "adf089c9c9552de208efafeb217ef15ef81bf0454284968f250e08e2f1c0f6f6",
+    "srcset": {
+      "jpg": "variants/transparent_colors/4046-160.jpg 160w",
+      "webp": "variants/transparent_colors/4046-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#b79d94",
+    "palette": [
+      "#b79d94",
+      "#bfa89f",
+      "#e5ddd4"
+    ],
+    "lab": [
+      69.1,
+      7.2,
+      8.0
+    ],
+    "hue": 48.0
+  },
+  {
+    "id": "t-41",
+    "reference": "41",
+    "colorReference": null,
+    "type": "transparent",
+    "image": "transparent_colors/41.jpg",
+    "width": 235,
+    "height": 235,
+    "bytes": 11385,
+    "hash": "1664b64db0e0937771c31d27ec417a7e87c0beddf0f43d05ef07233f03041476",
+    "srcset": {
+      "jpg": "variants/transparent_colors/41-160.jpg 160w",
+      "webp": "variants/transparent_colors/41-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#863428",
+    "palette": [
+      "#863428",
+      "#9c4f44",
+      "#e5d3ca"
+    ],
+    "lab": [
+      38.6,
+      32.1,
+      23.5
+    ],
+    "hue": 36.2
+  },
+  {
+    "id": "t-4940",
+    "reference": "4940",
+    "colorReference": null,
+    "type": "transparent",
+    "image": "transparent_colors/4940.jpg",
+    "width": 239,
+    "height": 242,
+    "bytes": 12111,
+    "hash": "a796c39df3ff13077ff655522cc0a19441b960b66fefae955984461ed837dfef",
+    "srcset": {
+      "jpg": "variants/transparent_colors/4940-160.jpg 160w",
+      "webp": "variants/transparent_colors/4940-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#b8a298",
+    "palette": [
+      "#b8a298",
+      "#c3afa7",
+      "#e8e0d9"
+    ],
+    "lab": [
+      71.0,
+      6.0,
+      7.2
+    ],
+    "hue": 50.2
+  },
+  {
+    "id": "t-4942",
+    "reference": "4942",
+    "colorReference": null,
+    "type": "transparent",
+    "image": "transparent_colors/4942.jpg",
+    "width": 235,
+    "height": 234,
+    "bytes": 12076,
+    "hash": "2c412e34509ea1bee52ba10f6d2741f7d867c376f3bde8a64116699008138ce0",
+    "srcset": {
+      "jpg": "variants/transparent_colors/4942-160.jpg 160w",
+      "webp": "variants/transparent_colors/4942-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#792b3d",
+    "palette": [
+      "#792b3d",
+      "#873c48",
+      "#dfcdce"
+    ],
+    "lab": [
+      34.9,
+      33.4,
+      6.8
+    ],
+    "hue": 11.5
+  },
+  {
+    "id": "t-53",
+    "reference": "53",
+    "colorReference": null,
+    "type": "transparent",
+    "image": "transparent_colors/53.jpg",
+    "width": 231,
+    "height": 234,
+    "bytes": 10124,
+    "hash": "a28722432878d513e76dd78571c489a818a0d6b28fe13cce2bd994ffde715b88",
+    "srcset": {
+      "jpg": "variants/transparent_colors/53-160.jpg 160w",
+      "webp": "variants/transparent_colors/53-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#29070c",
+    "palette": [
+      "#29070c",
+      "#cbc4c4",
+      "#fcfdfb"
+    ],
+    "lab": [
+      14.8,
+      15.2,
+      3.9
+    ],
+    "hue": 14.4
+  },
+  {
+    "id": "t-620",
+    "reference": "620",
+    "colorReference": null,
+    "type": "transparent",
+    "image": "transparent_colors/620.jpg",
+    "width": 238,
+    "height": 239,
+    "bytes": 12992,
+    "hash": "dd3ca2794074ae238789e6b5dcb1ca291a7d1bafabe2ea6c81c8429c8f180575",
+    "srcset": {
+      "jpg": "variants/transparent_colors/620-160.jpg 160w",
+      "webp": "variants/transparent_colors/620-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#a95a3f",
+    "palette": [
+      "#a95a3f",
+      "#b7704e",
+      "#cfaf8e"
+    ],
+    "lab": [
+      51.2,
+      26.7,
+      29.5
+    ],
+    "hue": 47.9
+  },
+  {
+    "id": "t-8",
+    "reference": "8",
+    "colorReference": null,
+    "type": "transparent",
+    "image": "transparent_colors/8.jpg",
+    "width": 237,
+    "height": 238,
+    "bytes": 12055,
+    "hash": "712f10c2af8106d3efad886cd23b05dcd909541598f01f367802dca762831147",
+    "srcset": {
+      "jpg": "variants/transparent_colors/8-160.jpg 160w",
+      "webp": "variants/transparent_colors/8-160.webp 160w"
+    },
+    "productUrls": [],
+    "color": "#a34642",
+    "palette": [
+      "#a34642",
+      "#ae554f",
+      "#dbbdaf"
+    ],
+    "lab": [
+      45.5,
+      36.0,
+      20.8
+    ],
+    "hue": 30.0
+  },
+  {
+    "id": "t-JAUNE3063_hq",
+    "reference": "JAUNE3063_hq",
+    "colorReference": "JAUNE3063",
+    "type": "transparent",
+    "image": "transparent_colors/JAUNE3063_hq.jpg",
+    "width": 600,
+    "height": 600,
+    "bytes": 29818,
+    "hash": "825319609ace3b67126b4f3b1c829b796476d32bc49b53077c70e61129f6a793",
+    "srcset": {
+      "jpg": "variants/transparent_colors/JAUNE3063_hq-160.jpg 160w, variants/transparent_colors/JAUNE3063_hq-320.jpg 320w",
+      "webp": "variants/transparent_colors/JAUNE3063_hq-160.webp 160w, variants/transparent_colors/JAUNE3063_hq-320.webp 320w"
+    },
+    "productUrls": [
+      "https://www.emaux-soyer.com/en/jaune-3063-transparent-en-poudre-3444.html"
+    ],
+    "color": "#ae751b",
+    "palette": [
+      "#ae751b",
+      "#d7d9d6",
+      "#bc935d"
+    ],
+    "lab": [
+      64.5,
+      10.0,
+      35.6
+    ],
+    "hue": 74.3
+  }
+];
@@ -1,3 +1,5 @@
+import { catalogImages, type CatalogImage } from './catalog';
+
 export interface Product {
   id: string;
   name: string;
@@ -17,27 +19,67 @@ export interface Product {
   };
 }
 
+const DEFAULT_PRICE = 45;
+
+// Hand-set prices by enamel number (type prefix and reference); anything else costs DEFAULT_PRICE
+const PRICES: Record<string, number> = {
+  // Transparent
+  'T-0': 57, 'T-104': 61, 'T-1045': 52, 'T-1047': 51, 'T-111': 51, 'T-194': 59, 'T-1942': 62, 'T-2000': 47,
+  'T-2002': 56, 'T-2003': 43, 'T-272_hq': 63, 'T-29': 62, 'T-31': 54, 'T-383': 42, 'T-388': 63, 'T-39': 54,
+  'T-40': 55, 'T-4044836': 52, 'T-4046': 42, 'T-41': 48, 'T-4940': 52, 'T-4942': 53, 'T-53': 58, 'T-620': 48,
+  'T-8': 47, 'T-JAUNE3063_hq': 63,
+  // Opale
+  'OP-08': 55, 'OP-101': 55, 'OP-607': 58, 'OP-609': 59, 'OP-610': 57, 'OP-610B': 59, 'OP-6B10B': 57,
+  'OP-8': 57, 'OP-swatch_2': 55,
+  // Opaque
+  'O-100_hq': 42, 'O-1044_hq': 46, 'O-1046_hq': 45, 'O-104_hq': 43, 'O-10_hq': 44, 'O-111_hq': 46,
+  'O-119_hq': 43, 'O-126_hq': 46, 'O-127_hq': 41, 'O-13_hq': 42, 'O-157': 43, 'O-15_hq': 41, 'O-160_hq': 41,
+  'O-163_hq': 41, 'O-172_hq': 41, 'O-173_hq': 44, 'O-175_hq': 45, 'O-176_hq': 46, 'O-177_hq': 46,
+  'O-184_hq': 43, 'O-185_hq': 44, 'O-188_hq': 42, 'O-189_hq': 44, 'O-191_hq': 42, 'O-1940_hq': 44,
+  'O-1942_hq': 42, 'O-194_hq': 41, 'O-195': 41, 'O-195_hq': 45, 'O-196': 41, 'O-196_hq': 46, 'O-197_hq': 43,
+  'O-1_hq': 46, 'O-2004_hq': 41, 'O-200_hq': 46, 'O-20_hq': 46, 'O-237_hq': 43, 'O-238_hq': 46,
+  'O-239_hq': 46, 'O-23_hq': 41, 'O-240_hq': 44, 'O-241_hq': 41, 'O-248': 45, 'O-250_hq': 42, 'O-251_hq': 44,
+  'O-254': 46, 'O-256_hq': 42, 'O-25_hq': 45, 'O-268_hq': 45, 'O-269_hq': 41, 'O-26_hq': 42, 'O-271_hq': 46,
+  'O-272_hq': 43, 'O-273_hq': 46, 'O-27_hq': 43, 'O-283_hq': 45, 'O-286_hq': 46, 'O-288_hq': 42, 'O-289': 46,
+  'O-289_hq': 41, 'O-28_hq': 42, 'O-290': 44, 'O-291': 46, 'O-291_hq': 45, 'O-294': 45, 'O-295': 45,
+  'O-296': 44, 'O-296_hq': 46, 'O-297_hq': 44, 'O-298_hq': 45, 'O-299_hq': 43, 'O-29_hq': 46, 'O-2_hq': 42,
+  'O-300': 45, 'O-304': 43, 'O-304_hq': 46, 'O-306': 44, 'O-307': 46, 'O-307_hq': 42, 'O-309': 44,
+  'O-309_hq': 44, 'O-30_hq': 42, 'O-310': 46, 'O-32_hq': 46, 'O-33_hq': 43, 'O-36': 42, 'O-36_hq': 43,
+  'O-38_hq': 41, 'O-3_hq': 44, 'O-42_hq': 45, 'O-430': 44, 'O-430_hq': 42, 'O-431_hq': 42, 'O-43_hq': 45,
+  'O-45_hq': 41, 'O-46_hq': 45, 'O-47_hq': 43, 'O-48_hq': 45, 'O-490': 45, 'O-491': 44, 'O-491_hq': 42,
+  'O-49_hq': 45, 'O-4_hq': 41, 'O-50_hq': 45, 'O-518_hq': 43, 'O-51_hq': 46, 'O-52_hq': 41, 'O-53_hq': 41,
+  'O-55_hq': 45, 'O-56_hq': 44, 'O-59': 44, 'O-59_hq': 41, 'O-600_hq': 45, 'O-601_hq': 44, 'O-602_hq': 42,
+  'O-603_hq': 42, 'O-604_hq': 43, 'O-605': 45, 'O-605_hq': 45, 'O-606': 44, 'O-614_hq': 41, 'O-619_hq': 44,
+  'O-62': 44, 'O-620_hq': 46, 'O-62F_hq': 41, 'O-62_hq': 41, 'O-630': 45, 'O-631': 45, 'O-631_hq': 41,
+  'O-632': 43, 'O-632_hq': 41, 'O-633': 41, 'O-633_hq': 43, 'O-634': 43, 'O-635': 41, 'O-636': 41,
+  'O-636_hq': 43, 'O-637_hq': 46, 'O-668': 45, 'O-66_hq': 43, 'O-68': 45, 'O-68_hq': 41, 'O-71_hq': 46,
+  'O-75': 43, 'O-75_hq': 43, 'O-76': 41, 'O-77': 46, 'O-78': 41, 'O-79_hq': 43, 'O-80_hq': 43, 'O-81': 42,
+  'O-81_hq': 43, 'O-82': 42, 'O-83': 44, 'O-83_hq': 46, 'O-84': 41, 'O-84_hq': 41, 'O-85_hq': 42, 'O-88': 46,
+  'O-90': 46, 'O-92': 43, 'O-94_hq': 46, 'O-95_hq': 42, 'O-97_hq': 46, 'O-98': 45, 'O-BLEU161_hq': 43,
+  'O-BLEU238_hq': 43, 'O-BLEU68_hq': 45, 'O-CLAIR126_hq': 45, 'O-CLAIR174_hq': 45, 'O-EAU270_hq': 41,
+  'O-FLAMME287_hq': 46, 'O-FONCE127_hq': 46, 'O-MARRON173_hq': 42, 'O-MARRON302_hq': 41, 'O-N1_hq': 42,
+  'O-NOIR55_hq': 43, 'O-POMME285_hq': 42, 'O-POURPRE284_hq': 41, 'O-RUBIS31_hq': 42, 'O-TEINTE97_hq': 45,
+  'O-r1_c8': 42
+};
+
 // Helper function to generate product data - NO fake color codes, use actual images
-const createProduct = (
-  type: 'transparent' | 'opaque' | 'opale',
-  reference: string,
-  price: number = 45
-): Product => {
+const createProduct = (entry: CatalogImage): Product => {
+  const { type, reference } = entry;
   const typePrefix = type === 'transparent' ? 'T' : type === 'opaque' ? 'O' : 'OP';
-  const folder = type === 'transparent' ? 'transparent_colors' : type === 'opaque' ? 'opaques' : 'opale_colors';
+  const enamelNumber = `${typePrefix}-${reference}`;
   
   return {
-    id: `${type.charAt(0)}-${reference}`,
-    name: `${type.charAt(0).toUpperCase() + type.slice(1)} ${typePrefix}-${reference}`,
+    id: entry.id,
+    name: `${type.charAt(0).toUpperCase() + type.slice(1)} ${enamelNumber}`,
     description: `Premium ${type} enamel with excellent quality and color depth. Perfect for professional jewelry making and artistic applications.`,
-    price,
-    colorCode: '', // Use empty string - we'll display actual image instead
+    price: PRICES[enamelNumber] ?? DEFAULT_PRICE,
+    colorCode: entry.color ?? '', // Dominant swatch color from the features stage, if it has run
     category: type, // Group by enamel type
     type,
-    image: `${import.meta.env.BASE_URL}${folder}/${reference}.jpg`,
+    image: `${import.meta.env.BASE_URL}${entry.image}`,
     inStock: true,
     quantity: Math.floor(Math.random() * 20) + 5, // Random quantity between 5-24
-    enamelNumber: `${typePrefix}-${reference}`,
+    enamelNumber,
     specifications: {
       firingTemp: '780-820°C',
       mesh: '80 mesh',
@@ -46,227 +88,6 @@ const createProduct = (
   };
 };
 
-export const realProducts: Product[] = [
-  // TRANSPARENT ENAMELS - All available images
-  createProduct('transparent', '0', 57),
-  createProduct('transparent', '104', 61),
-  createProduct('transparent', '1045', 52),
-  createProduct('transparent', '1047', 51),
-  createProduct('transparent', '111', 51),
-  createProduct('transparent', '194', 59),
-  createProduct('transparent', '1942', 62),
-  createProduct('transparent', '2000', 47),
-  createProduct('transparent', '2002', 56),
-  createProduct('transparent', '2003', 43),
-  createProduct('transparent', '272_hq', 63),
-  createProduct('transparent', '29', 62),
-  createProduct('transparent', '31', 54),
-  createProduct('transparent', '383', 42),
-  createProduct('transparent', '388', 63),
-  createProduct('transparent', '39', 54),
-  createProduct('transparent', '40', 55),
-  createProduct('transparent', '4044836', 52),
-  createProduct('transparent', '4046', 42),
-  createProduct('transparent', '41', 48),
-  createProduct('transparent', '4940', 52),
-  createProduct('transparent', '4942', 53),
-  createProduct('transparent', '53', 58),
-  createProduct('transparent', '620', 48),
-  createProduct('transparent', '8', 47),
-  createProduct('transparent', 'JAUNE3063_hq', 63),
-
-  // OPALE ENAMELS - All available images
-  createProduct('opale', '08', 55),
-  createProduct('opale', '101', 55),
-  createProduct('opale', '607', 58),
-  createProduct('opale', '609', 59),
-  createProduct('opale', '610', 57),
-  createProduct('opale', '610B', 59),
-  createProduct('opale', '6B10B', 57),
-  createProduct('opale', '8', 57),
-  createProduct('opale', 'swatch_2', 55),
-
-  // OPAQUE ENAMELS - All available images
-  createProduct('opaque', '100_hq', 42),
-  createProduct('opaque', '1044_hq', 46),
-  createProduct('opaque', '1046_hq', 45),
-  createProduct('opaque', '104_hq', 43),
-  createProduct('opaque', '10_hq', 44),
-  createProduct('opaque', '111_hq', 46),
-  createProduct('opaque', '119_hq', 43),
-  createProduct('opaque', '126_hq', 46),
-  createProduct('opaque', '127_hq', 41),
-  createProduct('opaque', '13_hq', 42),
-  createProduct('opaque', '157', 43),
-  createProduct('opaque', '15_hq', 41),
-  createProduct('opaque', '160_hq', 41),
-  createProduct('opaque', '163_hq', 41),
-  createProduct('opaque', '172_hq', 41),
-  createProduct('opaque', '173_hq', 44),
-  createProduct('opaque', '175_hq', 45),
-  createProduct('opaque', '176_hq', 46),
-  createProduct('opaque', '177_hq', 46),
-  createProduct('opaque', '184_hq', 43),
-  createProduct('opaque', '185_hq', 44),
-  createProduct('opaque', '188_hq', 42),
-  createProduct('opaque', '189_hq', 44),
-  createProduct('opaque', '191_hq', 42),
-  createProduct('opaque', '1940_hq', 44),
-  createProduct('opaque', '1942_hq', 42),
-  createProduct('opaque', '194_hq', 41),
-  createProduct('opaque', '195', 41),
-  createProduct('opaque', '195_hq', 45),
-  createProduct('opaque', '196', 41),
-  createProduct('opaque', '196_hq', 46),
-  createProduct('opaque', '197_hq', 43),
-  createProduct('opaque', '1_hq', 46),
-  createProduct('opaque', '2004_hq', 41),
-  createProduct('opaque', '200_hq', 46),
-  createProduct('opaque', '20_hq', 46),
-  createProduct('opaque', '237_hq', 43),
-  createProduct('opaque', '238_hq', 46),
-  createProduct('opaque', '239_hq', 46),
-  createProduct('opaque', '23_hq', 41),
-  createProduct('opaque', '240_hq', 44),
-  createProduct('opaque', '241_hq', 41),
-  createProduct('opaque', '248', 45),
-  createProduct('opaque', '250_hq', 42),
-  createProduct('opaque', '251_hq', 44),
-  createProduct('opaque', '254', 46),
-  createProduct('opaque', '256_hq', 42),
-  createProduct('opaque', '25_hq', 45),
-  createProduct('opaque', '268_hq', 45),
-  createProduct('opaque', '269_hq', 41),
-  createProduct('opaque', '26_hq', 42),
-  createProduct('opaque', '271_hq', 46),
-  createProduct('opaque', '272_hq', 43),
-  createProduct('opaque', '273_hq', 46),
-  createProduct('opaque', '27_hq', 43),
-  createProduct('opaque', '283_hq', 45),
-  createProduct('opaque', '286_hq', 46),
-  createProduct('opaque', '288_hq', 42),
-  createProduct('opaque', '289', 46),
-  createProduct('opaque', '289_hq', 41),
-  createProduct('opaque', '28_hq', 42),
-  createProduct('opaque', '290', 44),
-  createProduct('opaque', '291', 46),
-  createProduct('opaque', '291_hq', 45),
-  createProduct('opaque', '294', 45),
-  createProduct('opaque', '295', 45),
-  createProduct('opaque', '296', 44),
-  createProduct('opaque', '296_hq', 46),
-  createProduct('opaque', '297_hq', 44),
-  createProduct('opaque', '298_hq', 45),
-  createProduct('opaque', '299_hq', 43),
-  createProduct('opaque', '29_hq', 46),
-  createProduct('opaque', '2_hq', 42),
-  createProduct('opaque', '300', 45),
-  createProduct('opaque', '304', 43),
-  createProduct('opaque', '304_hq', 46),
-  createProduct('opaque', '306', 44),
-  createProduct('opaque', '307', 46),
-  createProduct('opaque', '307_hq', 42),
-  createProduct('opaque', '309', 44),
-  createProduct('opaque', '309_hq', 44),
-  createProduct('opaque', '30_hq', 42),
-  createProduct('opaque', '310', 46),
-  createProduct('opaque', '32_hq', 46),
-  createProduct('opaque', '33_hq', 43),
-  createProduct('opaque', '36', 42),
-  createProduct('opaque', '36_hq', 43),
-  createProduct('opaque', '38_hq', 41),
-  createProduct('opaque', '3_hq', 44),
-  createProduct('opaque', '42_hq', 45),
-  createProduct('opaque', '430', 44),
-  createProduct('opaque', '430_hq', 42),
-  createProduct('opaque', '431_hq', 42),
-  createProduct('opaque', '43_hq', 45),
-  createProduct('opaque', '45_hq', 41),
-  createProduct('opaque', '46_hq', 45),
-  createProduct('opaque', '47_hq', 43),
-  createProduct('opaque', '48_hq', 45),
-  createProduct('opaque', '490', 45),
-  createProduct('opaque', '491', 44),
-  createProduct('opaque', '491_hq', 42),
-  createProduct('opaque', '49_hq', 45),
-  createProduct('opaque', '4_hq', 41),
-  createProduct('opaque', '50_hq', 45),
-  createProduct('opaque', '518_hq', 43),
-  createProduct('opaque', '51_hq', 46),
-  createProduct('opaque', '52_hq', 41),
-  createProduct('opaque', '53_hq', 41),
-  createProduct('opaque', '55_hq', 45),
-  createProduct('opaque', '56_hq', 44),
-  createProduct('opaque', '59', 44),
-  createProduct('opaque', '59_hq', 41),
-  createProduct('opaque', '600_hq', 45),
-  createProduct('opaque', '601_hq', 44),
-  createProduct('opaque', '602_hq', 42),
-  createProduct('opaque', '603_hq', 42),
-  createProduct('opaque', '604_hq', 43),
-  createProduct('opaque', '605', 45),
-  createProduct('opaque', '605_hq', 45),
-  createProduct('opaque', '606', 44),
-  createProduct('opaque', '614_hq', 41),
-  createProduct('opaque', '619_hq', 44),
-  createProduct('opaque', '62', 44),
-  createProduct('opaque', '620_hq', 46),
-  createProduct('opaque', '62F_hq', 41),
-  createProduct('opaque', '62_hq', 41),
-  createProduct('opaque', '630', 45),
-  createProduct('opaque', '631', 45),
-  createProduct('opaque', '631_hq', 41),
-  createProduct('opaque', '632', 43),
-  createProduct('opaque', '632_hq', 41),
-  createProduct('opaque', '633', 41),
-  createProduct('opaque', '633_hq', 43),
-  createProduct('opaque', '634', 43),
-  createProduct('opaque', '635', 41),
-  createProduct('opaque', '636', 41),
-  createProduct('opaque', '636_hq', 43),
-  createProduct('opaque', '637_hq', 46),
-  createProduct('opaque', '668', 45),
-  createProduct('opaque', '66_hq', 43),
-  createProduct('opaque', '68', 45),
-  createProduct('opaque', '68_hq', 41),
-  createProduct('opaque', '71_hq', 46),
-  createProduct('opaque', '75', 43),
-  createProduct('opaque', '75_hq', 43),
-  createProduct('opaque', '76', 41),
-  createProduct('opaque', '77', 46),
-  createProduct('opaque', '78', 41),
-  createProduct('opaque', '79_hq', 43),
-  createProduct('opaque', '80_hq', 43),
-  createProduct('opaque', '81', 42),
-  createProduct('opaque', '81_hq', 43),
-  createProduct('opaque', '82', 42),
-  createProduct('opaque', '83', 44),
-  createProduct('opaque', '83_hq', 46),
-  createProduct('opaque', '84', 41),
-  createProduct('opaque', '84_hq', 41),
-  createProduct('opaque', '85_hq', 42),
-  createProduct('opaque', '88', 46),
-  createProduct('opaque', '90', 46),
-  createProduct('opaque', '92', 43),
-  createProduct('opaque', '94_hq', 46),
-  createProduct('opaque', '95_hq', 42),
-  createProduct('opaque', '97_hq', 46),
-  createProduct('opaque', '98', 45),
-  createProduct('opaque', 'BLEU161_hq', 43),
-  createProduct('opaque', 'BLEU238_hq', 43),
-  createProduct('opaque', 'BLEU68_hq', 45),
-  createProduct('opaque', 'CLAIR126_hq', 45),
-  createProduct('opaque', 'CLAIR174_hq', 45),
-  createProduct('opaque', 'EAU270_hq', 41),
-  createProduct('opaque', 'FLAMME287_hq', 46),
-  createProduct('opaque', 'FONCE127_hq', 46),
-  createProduct('opaque', 'MARRON173_hq', 42),
-  createProduct('opaque', 'MARRON302_hq', 41),
-  createProduct('opaque', 'N1_hq', 42),
-  createProduct('opaque', 'NOIR55_hq', 43),
-  createProduct('opaque', 'POMME285_hq', 42),
-  createProduct('opaque', 'POURPRE284_hq', 41),
-  createProduct('opaque', 'RUBIS31_hq', 42),
-  createProduct('opaque', 'TEINTE97_hq', 45),
-  createProduct('opaque', 'r1_c8', 42),
-];
+// One product per image the downloaders stored; regenerate src/data/catalog.ts with
+// `python -m enamel_downloader.catalog` instead of listing images here by hand
+export const realProducts: Product[] = catalogImages.map(createProduct);
@@ -0,0 +1,35 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+
+# The downloader scripts and the enamel_downloader package live at the repo root, outside any installed package
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+
+@pytest.fixture
+def fixtures_dir():
+    return FIXTURES
+
+
+@pytest.fixture
+def mock_site():
+    """Start a mock catalog server on an ephemeral port; call it with MockCatalog arguments"""
+    from enamel_downloader.mocksite import MockCatalog, listing_url, serve
+
+    servers = []
+
+    def start(products=12, **options):
+        catalog = MockCatalog(products, **options)
+        server = serve(catalog)
+        servers.append(server)
+        return catalog, listing_url(server)
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
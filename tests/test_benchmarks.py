@@ -0,0 +1,15 @@
+from enamel_downloader import benchmarks, parsers
+
+
+def test_parser_benchmark_runs_on_the_committed_pages(fixtures_dir, capsys):
+    assert benchmarks.PAGES_DIR == fixtures_dir / "pages"
+    assert len(benchmarks.page_fixtures()) == len(list((fixtures_dir / "pages").glob("*.html")))
+
+    timings = benchmarks.bench_parser(repeat=1)
+    assert set(timings) == {"beautifulsoup (full tree)", *parsers.BACKENDS}
+    assert "disagrees" not in capsys.readouterr().out
+
+
+def test_parser_benchmark_without_pages(tmp_path, capsys):
+    assert benchmarks.bench_parser(repeat=1, pages=tmp_path) is None
+    assert "No saved product pages" in capsys.readouterr().out
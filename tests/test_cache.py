@@ -0,0 +1,77 @@
+import requests
+
+from enamel_downloader.cache import HttpCache
+from enamel_downloader.mocksite import LAST_MODIFIED
+
+
+class RecordingSession:
+    """send() for HttpCache.get that remembers the headers of every request"""
+
+    def __init__(self):
+        self.session = requests.Session()
+        self.sent = []
+
+    def send(self, url, **kwargs):
+        self.sent.append(dict(kwargs.get("headers") or {}))
+        return self.session.get(url, timeout=5, **kwargs)
+
+
+def site_url(listing, path):
+    return listing.replace("/en/emaux.html", path)
+
+
+def test_second_fetch_is_revalidated_and_served_from_the_cache(tmp_path, mock_site):
+    catalog, listing = mock_site(products=2)
+    url = site_url(listing, catalog.product_path(1))
+    client = RecordingSession()
+    cache = HttpCache(tmp_path / "http")
+
+    first = cache.get(client.send, url)
+    assert first.cache_status == "miss" and first.status_code == 200
+    assert client.sent[0] == {}
+    cache.save()
+
+    # A new run, from the saved index
+    cache = HttpCache(tmp_path / "http")
+    second = cache.get(client.send, url)
+    assert client.sent[1] == {"If-None-Match": '"page-1"', "If-Modified-Since": LAST_MODIFIED}
+    assert second.cache_status == "revalidated"
+    assert second.content == first.content
+    assert cache.stats["revalidated"] == 1
+
+
+def test_streamed_bodies_are_revalidated_too(tmp_path, mock_site):
+    catalog, listing = mock_site(products=2)
+    url = site_url(listing, catalog.image_path(2))
+    client = RecordingSession()
+    cache = HttpCache(tmp_path / "http")
+
+    cache.get(client.send, url)
+    response = cache.get(client.send, url, stream=True)
+    assert response.cache_status == "revalidated"
+    assert b"".join(response.iter_content(1024)) == catalog.image(2)
+    response.raw.close()
+
+
+def test_least_recently_used_bodies_are_evicted(tmp_path, mock_site):
+    catalog, listing = mock_site(products=3)
+    urls = {n: site_url(listing, catalog.image_path(n)) for n in (1, 2, 3)}
+    sizes = {n: len(catalog.image(n)) for n in urls}
+    client = RecordingSession()
+    cache = HttpCache(tmp_path / "http", max_bytes=sum(sizes.values()) - 1)
+
+    cache.get(client.send, urls[1])
+    cache.get(client.send, urls[2])
+    # Using 1 again makes 2 the least recently used
+    assert cache.get(client.send, urls[1]).cache_status == "revalidated"
+    cache.get(client.send, urls[3])
+
+    assert set(cache.index) == {urls[1], urls[3]}
+    assert not cache.body_path(urls[2]).exists()
+    assert cache.total_bytes == sizes[1] + sizes[3] <= cache.max_bytes
+    assert cache.stats["evicted"] == 1
+
+    cache.forget(urls[3])
+    assert cache.total_bytes == sizes[1]
+    cache.save()
+    assert HttpCache(tmp_path / "http").total_bytes == sizes[1]
@@ -0,0 +1,67 @@
+import requests
+
+from enamel_downloader.candidates import CandidateResolver, original_url
+from enamel_downloader.mocksite import IMAGE_SIZE, ORIGINAL_SIZE
+
+
+def site_url(listing, path):
+    return listing.replace("/en/emaux.html", path)
+
+
+def resolver(path, **kwargs):
+    session = requests.Session()
+    return CandidateResolver(lambda method, url, **kw: session.request(method, url, **kw), path, **kwargs)
+
+
+def test_the_original_is_preferred_over_the_cache_rendition(tmp_path, mock_site):
+    catalog, listing = mock_site(products=2)
+    product = site_url(listing, catalog.product_path(1))
+    rendition = site_url(listing, catalog.image_path(1))
+    choices = resolver(tmp_path / "image_choices.json")
+
+    chosen = choices.resolve(product, [rendition])
+    assert chosen == original_url(rendition) and "/cache/" not in chosen
+    assert choices.choices[product]["width"] == ORIGINAL_SIZE
+    assert choices.stats["originals"] == 1 and choices.stats["probes"] == 2
+
+    # Without the rewrite, the rendition is all there is
+    plain = resolver(tmp_path / "plain.json", originals=lambda url: None)
+    assert plain.resolve(product, [rendition]) == rendition
+    assert plain.choices[product]["width"] == IMAGE_SIZE
+
+
+def test_missing_and_html_candidates_are_rejected(tmp_path, mock_site):
+    catalog, listing = mock_site(products=2)
+    product = site_url(listing, catalog.product_path(1))
+    missing = site_url(listing, "/media/catalog/product/o/p/missing.jpg")
+    rendition = site_url(listing, catalog.image_path(1))
+    choices = resolver(tmp_path / "image_choices.json")
+
+    assert choices.probe(missing) is None
+    assert choices.probe(product) is None
+    assert choices.resolve(product, [missing, product, rendition]) == original_url(rendition)
+
+    # Nothing verifiable: the page's first choice, not remembered
+    assert choices.resolve("other", [missing, product]) == missing
+    assert choices.stats["unverified"] == 1 and "other" not in choices.choices
+
+
+def test_the_choice_is_reused_from_image_choices_json(tmp_path, mock_site):
+    catalog, listing = mock_site(products=2)
+    product = site_url(listing, catalog.product_path(1))
+    rendition = site_url(listing, catalog.image_path(1))
+    path = tmp_path / ".cache" / "image_choices.json"
+    first = resolver(path)
+    chosen = first.resolve(product, [rendition])
+    first.save()
+
+    image_requests = catalog.image_requests
+    second = resolver(path)
+    assert second.resolve(product, [rendition]) == chosen
+    assert second.stats["cached"] == 1 and second.stats["probes"] == 0
+    assert catalog.image_requests == image_requests
+
+    # A page offering different candidates is probed again
+    other = site_url(listing, catalog.image_path(2))
+    assert second.resolve(product, [other]) == original_url(other)
+    assert second.stats["probes"] == 2
@@ -0,0 +1,62 @@
+import json
+import os
+
+from PIL import Image
+
+from enamel_downloader.catalog import CatalogBuilder
+from enamel_downloader.manifest import Manifest
+from enamel_downloader.variants import VariantBuilder
+
+
+def swatch(path, color):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    Image.new("RGB", (400, 300), color).save(path, "JPEG")
+
+
+def test_untracked_swatches_are_products(tmp_path):
+    swatch(tmp_path / "opaques" / "62F_hq.jpg", (40, 60, 120))
+    swatch(tmp_path / "transparent_colors" / "31.jpg", (150, 20, 40))
+    swatch(tmp_path / "opale_colors" / "8.jpg", (230, 230, 220))
+    (tmp_path / "opale_colors" / ".8.jpg.part").write_bytes(b"partial")
+    (tmp_path / ".cache").mkdir()
+    manifest = Manifest(tmp_path / ".cache" / "complete_download_manifest.sqlite")
+    manifest.record("https://www.emaux-soyer.com/en/bleu-62f-en-poudre.html", filename="opaques/62F_hq.jpg",
+                    color_reference="62F", content_hash="abc")
+    manifest.record("https://www.emaux-soyer.com/en/gone-99.html", filename="opaques/99_hq.jpg",
+                    color_reference="99")
+    manifest.close()
+    VariantBuilder(tmp_path, widths=(160,), workers=1).build()
+
+    output = tmp_path / "catalog.json"
+    builder = CatalogBuilder(tmp_path, output, "json")
+    stats = builder.build()
+    images = {image["image"]: image for image in json.loads(output.read_text())["images"]}
+
+    assert sorted(images) == ["opale_colors/8.jpg", "opaques/62F_hq.jpg", "transparent_colors/31.jpg"]
+    assert stats["untracked"] == 2
+    assert stats["missing"] == 1
+    tracked = images["opaques/62F_hq.jpg"]
+    assert (tracked["id"], tracked["colorReference"], tracked["hash"]) == ("o-62F_hq", "62F", "abc")
+    assert tracked["productUrls"] == ["https://www.emaux-soyer.com/en/bleu-62f-en-poudre.html"]
+    opal = images["opale_colors/8.jpg"]
+    assert (opal["id"], opal["type"], opal["productUrls"], opal["width"]) == ("op-8", "opale", [], 400)
+    # Untracked swatches take their hash and srcset from the variants stage
+    assert opal["hash"] and opal["srcset"]["webp"] == "variants/opale_colors/8-160.webp 160w"
+
+    assert CatalogBuilder(tmp_path, output, "json").build()["written"] is False
+    # A checkout gives every file a new mtime; only content counts
+    for path in tmp_path.glob("*/*.jpg"):
+        os.utime(path, (1, 1))
+    assert CatalogBuilder(tmp_path, output, "json").build()["written"] is False
+    swatch(tmp_path / "opale_colors" / "101.jpg", (220, 220, 230))
+    assert CatalogBuilder(tmp_path, output, "json").build()["written"] is True
+
+
+def test_default_output_is_beside_the_public_folder(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    site = tmp_path / "site"
+    swatch(site / "public" / "opaques" / "62F_hq.jpg", (40, 60, 120))
+    builder = CatalogBuilder(site / "public")
+    assert builder.output == site / "src" / "data" / "catalog.ts"
+    builder.build()
+    assert builder.output.exists() and not (tmp_path / "src").exists()
@@ -0,0 +1,72 @@
+import json
+import re
+from pathlib import Path
+
+import pytest
+
+from enamel_downloader.benchmarks import REPORT_FILES, report_fixtures
+from enamel_downloader.classifier import classify, classify_urls, enamel_type, extract_reference, type_evidence
+
+ROOT = Path(__file__).resolve().parent.parent
+BASE = "https://www.emaux-soyer.com/en/"
+
+
+@pytest.fixture
+def report_references(fixtures_dir):
+    """Reference of every product in the saved reports, checked by hand against the slugs"""
+    return json.loads((fixtures_dir / "report_references.json").read_text())
+
+
+def test_report_references(report_references):
+    fixtures = report_fixtures([ROOT / report_file for report_file in REPORT_FILES])
+    assert fixtures
+    assert {url for url, _, _ in fixtures} == set(report_references)
+    results = classify_urls(list(report_references))
+    assert [result.reference for result in results] == list(report_references.values())
+
+    # The old scripts got the number right even where they mangled the reference ("BLEU161")
+    for (url, recorded, _), result in zip(fixtures, classify_urls([url for url, _, _ in fixtures])):
+        if recorded:
+            assert result.number == int(re.search(r"\d+", recorded).group())
+
+
+@pytest.mark.parametrize("slug, reference, number", [
+    ("bleu-62f-en-poudre", "62F", 62),
+    ("bleu-68-f-sans-plomb", "68F", 68),
+    ("gris-bleu-161-b-en-poudre", "161B", 161),
+    ("blanc-teinte-97-p", "97P", 97),
+    ("fondant-pour-or-n-2-en-poudre", "N2", 2),
+    ("fondant-pour-cuivre-n-1-sans-plomb-en-poudre", "N1", 1),
+    ("jaune-3063-transparent-en-poudre-3444", "3063", 3063),
+    ("rouge-288-en-poudre-800-c-840-c", "288", 288),
+    ("vert-tilleul-286-150g", "286", 286),
+    ("rubis-31", "31", 31),
+])
+def test_references(slug, reference, number):
+    assert extract_reference(f"{BASE}{slug}.html") == (reference, number)
+
+
+def test_reference_from_title():
+    assert extract_reference(f"{BASE}rouge-flamme.html", "Rouge flamme 287") == ("287", 287)
+    assert extract_reference(f"{BASE}rouge-flamme.html") == (None, None)
+
+
+@pytest.mark.parametrize("slug, title, expected", [
+    ("jaune-3063-transparent-en-poudre-3444", "", ("transparent", "keyword")),
+    ("turquoise-opaque-clair-126", "", ("opaque", "keyword")),
+    ("blanc-opale-8", "", ("opal", "keyword")),
+    ("rose", "Rose translucent", ("transparent", "keyword")),
+    ("rubis-31", "", ("transparent", "number")),
+    ("lilas-111-en-poudre", "", ("transparent", "number")),
+    ("rose-2004-en-poudre", "", ("transparent", "number")),
+    ("bleu-62f-en-poudre", "", (None, None)),
+])
+def test_type_evidence(slug, title, expected):
+    assert type_evidence(f"{BASE}{slug}.html", title) == expected
+
+
+def test_unknown_type_defaults_to_opaque():
+    assert enamel_type(f"{BASE}bleu-62f-en-poudre.html") == "opaque"
+    assert classify(f"{BASE}bleu-62f-en-poudre.html").enamel_type == "opaque"
+    # A keyword on the page wins over the number table
+    assert enamel_type(f"{BASE}rubis-31.html", content="Émail opaque") == "opaque"
@@ -0,0 +1,56 @@
+import json
+
+from enamel_downloader import cli
+from enamel_downloader.download import is_complete_image
+
+
+def sync(base_dir, listing, *step, post=False):
+    options = [] if post else ["--skip-post"]
+    return cli.main(["sync", "--base-dir", str(base_dir), "--rate", "0", "--listing-url", listing, *options, *step])
+
+
+def test_verify_repair_round_trip(tmp_path, mock_site):
+    _, listing = mock_site(products=4)
+    assert sync(tmp_path, listing) == 0
+    assert sync(tmp_path, listing, "verify") == 0
+
+    images = sorted((tmp_path / "opaques").glob("*.jpg"))
+    assert len(images) == 4
+    damaged = images[0]
+    original = damaged.read_bytes()
+    with open(damaged, 'r+b') as f:
+        f.truncate(len(original) // 2)
+    assert not is_complete_image(damaged)
+
+    assert sync(tmp_path, listing, "verify") == 1
+    assert sync(tmp_path, listing, "verify", "--repair") == 0
+    assert not damaged.exists()
+
+    assert sync(tmp_path, listing, "download", "--fresh") == 0
+    assert damaged.read_bytes() == original
+    assert sync(tmp_path, listing, "verify") == 0
+
+
+def test_verify_reports_missing_files(tmp_path, mock_site, capsys):
+    _, listing = mock_site(products=2)
+    sync(tmp_path, listing)
+    next((tmp_path / "opaques").glob("*.jpg")).unlink()
+    assert sync(tmp_path, listing, "verify") == 1
+    assert "missing:" in capsys.readouterr().out
+
+
+def test_sync_runs_the_post_download_stages(tmp_path, mock_site):
+    catalog, listing = mock_site(products=4)
+    public = tmp_path / "public"
+    assert sync(public, listing, post=True) == 0
+
+    assert len(json.loads((public / "image_variants.json").read_text())["images"]) == 4
+    assert (public / ".cache" / "swatch_features.npz").exists()
+    assert len(json.loads((public / "color_index.json").read_text())["keys"]) == 4
+    catalog_ts = tmp_path / "src" / "data" / "catalog.ts"
+    assert catalog_ts.read_text().count('"productUrls"') == 4
+
+    # --skip-post leaves the stages' outputs alone
+    catalog_ts.unlink()
+    assert sync(public, listing, "download", "--skip-post") == 0
+    assert not catalog_ts.exists()
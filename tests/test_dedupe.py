@@ -0,0 +1,75 @@
+import io
+
+from PIL import Image
+
+from download_all_emaux_images import CompleteEmauxDownloader
+from enamel_downloader.dedupe import DedupeIndex, variant_group
+from enamel_downloader.manifest import Manifest
+
+
+def swatch(path, color, noise=0):
+    """A flat swatch with a lighter stripe; noise shifts the color slightly"""
+    image = Image.new("RGB", (32, 32), tuple(min(255, c + noise) for c in color))
+    for x in range(8, 16):
+        for y in range(32):
+            image.putpixel((x, y), (255, 255, 255))
+    buffer = io.BytesIO()
+    image.save(buffer, "JPEG", quality=95)
+    path.write_bytes(buffer.getvalue())
+    return path
+
+
+def test_variant_group():
+    assert variant_group("62F") == variant_group("62") == "62"
+    assert variant_group("161B") == "161"
+    assert variant_group("N2") == "N2"
+    assert variant_group(None) is None
+
+
+def test_similar_colors_of_different_references_are_kept(tmp_path):
+    index = DedupeIndex(tmp_path / "index.json")
+    first = index.add("u/81.jpg", swatch(tmp_path / "a", (40, 120, 130)), tmp_path / "81_hq.jpg", reference="81")
+    second = index.add("u/82.jpg", swatch(tmp_path / "b", (40, 120, 130), noise=3), tmp_path / "82_hq.jpg",
+                       reference="82")
+    assert first[0] == str(tmp_path / "81_hq.jpg")
+    assert second[0] == str(tmp_path / "82_hq.jpg")
+    assert index.stats["near_duplicates"] == 0
+
+
+def test_near_duplicate_variant_takes_the_closest_match(tmp_path):
+    index = DedupeIndex(tmp_path / "index.json")
+    # Too far apart to be duplicates of each other
+    for name, noise in (("62_hq.jpg", 0), ("62F_hq.jpg", 12)):
+        staged = swatch(tmp_path / f"staged-{name}", (20, 60, 160), noise=noise)
+        stored, _ = index.add(f"u/{name}", staged, tmp_path / name, reference=name.split("_")[0])
+        assert stored == str(tmp_path / name)
+        staged.rename(stored)
+
+    stored, _ = index.add("u/62-lump.jpg", swatch(tmp_path / "lump", (20, 60, 160), noise=7), tmp_path / "62P_hq.jpg",
+                          reference="62P")
+    assert stored == str(tmp_path / "62F_hq.jpg")
+    assert index.stats["near_duplicates"] == 1
+
+
+def test_fresh_images_only(tmp_path):
+    manifest = Manifest(tmp_path / "manifest.sqlite", ttl=3600)
+    (tmp_path / "1_hq.jpg").write_bytes(b"jpeg")
+    manifest.record("p/1.html", image_url="u/1.jpg", filename=str(tmp_path / "1_hq.jpg"))
+    assert manifest.image_is_fresh("u/1.jpg")
+    assert not manifest.image_is_fresh("u/2.jpg")
+    manifest.ttl = 0
+    assert not manifest.image_is_fresh("u/1.jpg", now=manifest.get("p/1.html")["checked_at"] + 1)
+
+
+def test_stale_images_are_revalidated(tmp_path, mock_site):
+    catalog, listing = mock_site(products=6)
+    options = dict(concurrency=4, rate_limit=0, manifest_ttl=0)
+    CompleteEmauxDownloader(tmp_path, **options).run_complete_download(listing_urls=[listing])
+    first_run = catalog.image_requests
+
+    downloader = CompleteEmauxDownloader(tmp_path, **options)
+    downloader.run_complete_download(listing_urls=[listing])
+    # Every stale image is asked for again, conditionally, and nothing is stored twice
+    assert catalog.image_requests - first_run >= 6
+    assert downloader.stats["success"] == 6
+    assert len(list((tmp_path / "opaques").glob("*.jpg"))) == 6
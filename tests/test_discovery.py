@@ -0,0 +1,92 @@
+import json
+
+import pytest
+import requests
+
+from enamel_downloader.discovery import EMAUX_SOYER_LISTING_URLS, CatalogDiscovery, normalize_url
+
+LISTING = EMAUX_SOYER_LISTING_URLS[0]
+PAGE_1 = [
+    "https://www.emaux-soyer.com/en/bleu-62f-en-poudre.html",
+    "https://www.emaux-soyer.com/en/bleu-68-f-sans-plomb.html",
+    "https://www.emaux-soyer.com/en/turquoise-opaque-clair-126.html",
+    "https://www.emaux-soyer.com/en/jaune-3063-transparent-en-poudre-3444.html",
+]
+PAGE_2 = [
+    "https://www.emaux-soyer.com/en/rubis-31.html",
+    "https://www.emaux-soyer.com/en/lilas-111-en-poudre.html",
+    "https://www.emaux-soyer.com/en/orange-621-150g.html",
+]
+
+
+class SavedSite:
+    """get() over saved listing pages; counts the requests"""
+
+    def __init__(self, pages, failing=()):
+        self.pages = pages
+        self.failing = set(failing)
+        self.requested = []
+
+    def get(self, url, **kwargs):
+        self.requested.append(url)
+        response = requests.Response()
+        response.url = url
+        if url in self.failing:
+            response.status_code = 500
+            response._content = b"Internal Server Error"
+        elif url in self.pages:
+            response.status_code = 200
+            response._content = self.pages[url].read_bytes()
+        else:
+            response.status_code = 404
+            response._content = b"Not found"
+        return response
+
+
+@pytest.fixture
+def site(fixtures_dir):
+    listings = fixtures_dir / "listings"
+    return SavedSite({LISTING: listings / "emaux-p1.html", f"{LISTING}?p=2": listings / "emaux-p2.html"})
+
+
+def test_walks_the_pagination_in_order(site):
+    discovery = CatalogDiscovery(site.get, [LISTING])
+    assert list(discovery.discover()) == PAGE_1 + PAGE_2
+    # The pagination links back to page 1 are not followed again
+    assert site.requested == [LISTING, f"{LISTING}?p=2"]
+    assert discovery.stats["listing_pages"] == 2
+    assert discovery.stats["products"] == 7
+
+
+def test_compares_with_the_last_walk(site, tmp_path):
+    state_file = tmp_path / "discovered_products.json"
+    state_file.write_text(json.dumps(PAGE_1[1:] + ["https://www.emaux-soyer.com/en/noir-36-en-poudre.html"]))
+    discovery = CatalogDiscovery(site.get, [LISTING], state_file=state_file)
+    list(discovery.discover())
+    assert discovery.new_products == sorted([PAGE_1[0]] + PAGE_2)
+    assert discovery.removed_products == ["https://www.emaux-soyer.com/en/noir-36-en-poudre.html"]
+    assert sorted(json.loads(state_file.read_text())) == sorted(PAGE_1 + PAGE_2)
+
+
+@pytest.mark.parametrize("options, failing", [({}, [f"{LISTING}?p=2"]), ({"max_pages": 1}, [])])
+def test_an_incomplete_walk_is_not_saved(site, tmp_path, options, failing):
+    state_file = tmp_path / "discovered_products.json"
+    state_file.write_text(json.dumps(PAGE_1 + PAGE_2))
+    site.failing.update(failing)
+    discovery = CatalogDiscovery(site.get, [LISTING], state_file=state_file, **options)
+    assert list(discovery.discover()) == PAGE_1
+    # The products of the missed page are neither removed now nor new next time
+    assert discovery.removed_products == [] and discovery.new_products == []
+    assert json.loads(state_file.read_text()) == PAGE_1 + PAGE_2
+
+
+def test_falls_back_when_the_listing_is_gone(site):
+    fallback = ["https://www.emaux-soyer.com/en/noir-36-en-poudre.html"]
+    discovery = CatalogDiscovery(site.get, ["https://www.emaux-soyer.com/en/enamels.html"], fallback=fallback)
+    assert list(discovery.discover()) == fallback
+    assert discovery.stats["errors"] == 1
+
+
+def test_normalize_url():
+    assert normalize_url("https://www.emaux-soyer.com/en/rubis-31.html?___store=en#reviews") == \
+        "https://www.emaux-soyer.com/en/rubis-31.html"
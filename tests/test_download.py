@@ -0,0 +1,53 @@
+import hashlib
+
+import requests
+
+from download_all_emaux_images import CompleteEmauxDownloader
+from enamel_downloader import download
+from enamel_downloader.cache import HttpCache
+from enamel_downloader.candidates import original_url
+from enamel_downloader.download import fetch_to_file
+from enamel_downloader.manifest import Manifest
+
+
+def leftovers(base_dir):
+    return sorted(path.name for path in base_dir.rglob("*.part*"))
+
+
+def test_cut_off_bodies_resume_without_fetching_bytes_twice(tmp_path, mock_site, monkeypatch):
+    monkeypatch.setattr(download, "RESUME_DELAY", 0)
+    # Every image body breaks off halfway, so each range request gets half of what is left
+    catalog, listing = mock_site(products=3, drop=1.0)
+    url = original_url(listing.replace("/en/emaux.html", catalog.image_path(2)))
+    image = catalog.image(2, original=True)
+    session = requests.Session()
+    cache = HttpCache(tmp_path / "http")
+
+    destination = tmp_path / "2_hq.jpg"
+    size, digest = fetch_to_file(cache, session.get, url, destination, timeout=5)
+
+    assert destination.read_bytes() == image
+    assert (size, digest) == (len(image), hashlib.sha256(image).hexdigest())
+    assert catalog.dropped > 1
+    assert catalog.image_bytes == len(image)
+    assert leftovers(tmp_path) == []
+
+
+def test_flaky_downloads_store_exact_images(tmp_path, mock_site, monkeypatch):
+    monkeypatch.setattr(download, "RESUME_DELAY", 0)
+    catalog, listing = mock_site(products=8, drop=0.5)
+    downloader = CompleteEmauxDownloader(tmp_path, concurrency=4, rate_limit=0)
+    downloader.run_complete_download(listing_urls=[listing])
+
+    assert catalog.dropped > 0
+    assert downloader.stats["success"] == 8
+    manifest = Manifest(tmp_path / ".cache" / "complete_download_manifest.sqlite")
+    entries = manifest.entries()
+    manifest.close()
+    assert len(entries) == 8
+    for entry in entries:
+        number = int(entry["product_url"].rsplit("/", 1)[-1].split("-")[1])
+        # Byte for byte the image that was chosen, rendition or original
+        expected = catalog.image(number, original="/cache/" not in entry["image_url"])
+        assert (tmp_path / entry["filename"]).read_bytes() == expected
+    assert leftovers(tmp_path) == []
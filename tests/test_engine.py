@@ -0,0 +1,59 @@
+import hashlib
+import time
+
+import pytest
+import requests
+
+from download_all_emaux_images import CompleteEmauxDownloader
+from download_enamel_images import EmauxSoyerImageDownloader
+from enamel_downloader.engine import CrawlEngine
+
+
+def run_complete(base_dir, listing, **options):
+    """Download the mock catalog with the complete downloader; returns the number of swatches stored"""
+    downloader = CompleteEmauxDownloader(base_dir, **options)
+    downloader.run_complete_download(listing_urls=[listing])
+    return downloader.stats["success"]
+
+
+def run_soyer(base_dir, listing, **options):
+    downloader = EmauxSoyerImageDownloader(base_dir, **options)
+    downloader.process_product_urls(downloader.discover_products([listing]))
+    return downloader.generate_report()["summary"]["successful_downloads"]
+
+
+def swatches(base_dir):
+    return {path.relative_to(base_dir).as_posix(): hashlib.sha256(path.read_bytes()).hexdigest()
+            for folder in ("opaques", "transparent_colors", "opale_colors") for path in (base_dir / folder).glob("*")}
+
+
+@pytest.mark.parametrize("run", [run_complete, run_soyer])
+def test_concurrency_speedup(tmp_path, mock_site, run):
+    catalog, listing = mock_site(products=12, latency=0.05)
+    timings = {}
+    for concurrency in (1, 8):
+        base_dir = tmp_path / f"c{concurrency}"
+        started = time.perf_counter()
+        stored = run(base_dir, listing, concurrency=concurrency, host_concurrency=concurrency, rate_limit=0)
+        timings[concurrency] = time.perf_counter() - started
+        assert stored == 12
+
+    # Each product waits on a page, a probe and an image; eight at a time overlap those waits
+    assert timings[1] / timings[8] > 2.5, timings
+    assert swatches(tmp_path / "c1") == swatches(tmp_path / "c8")
+    assert len(swatches(tmp_path / "c8")) == 12
+
+
+def test_host_concurrency_limit(mock_site):
+    catalog, listing = mock_site(products=4, latency=0.05)
+    engine = CrawlEngine(concurrency=8, rate=0, host_concurrency=2)
+    session = requests.Session()
+
+    def fetch(n):
+        return engine.request(session, "GET", f"{listing}?p={n}").status_code
+
+    started = time.perf_counter()
+    assert engine.run(range(1, 9), fetch) == [200] * 8
+    # Eight requests of 50 ms, two at a time against the one host
+    assert time.perf_counter() - started >= 4 * 0.05
+    assert catalog.requests == 8
@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+from PIL import Image
+
+from enamel_downloader.features import FeatureBuilder, SwatchFeatures, dominant_colors, extract_features, rgb_to_lab
+
+RED = (200, 40, 40)
+
+
+def framed_swatch(path, color, border=(255, 255, 255), size=64, frame=10):
+    """A solid color on a plain frame, like the product photos"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    image = Image.new("RGB", (size, size), border)
+    image.paste(color, (frame, frame, size - frame, size - frame))
+    image.save(path)
+    return path
+
+
+def test_lab_of_known_colors():
+    lab = rgb_to_lab([[255, 255, 255], [0, 0, 0], [255, 0, 0]])
+    assert lab[0] == pytest.approx([100, 0, 0], abs=0.01)
+    assert lab[1] == pytest.approx([0, 0, 0], abs=0.01)
+    assert lab[2] == pytest.approx([53.24, 80.09, 67.20], abs=0.01)
+
+
+def test_dominant_colors_are_sorted_by_share():
+    pixels = np.array([RED] * 30 + [(20, 20, 220)] * 10, dtype=np.uint8)
+    centers, weights = dominant_colors(pixels, k=3)
+    assert centers.tolist() == [list(RED), [20, 20, 220], [20, 20, 220]]
+    assert weights.tolist() == pytest.approx([0.75, 0.25, 0.0])
+
+
+def test_the_plain_frame_is_excluded(tmp_path):
+    features = extract_features(framed_swatch(tmp_path / "62.png", RED))
+    assert features["dominant"][0].tolist() == list(RED)
+    # Nothing of the white frame is left
+    assert features["weights"][0] == pytest.approx(1.0)
+    assert features["lab"] == pytest.approx(rgb_to_lab(RED), abs=0.01)
+    assert features["histogram"].sum() == pytest.approx(1.0)
+
+
+def test_unchanged_swatches_are_not_recomputed(tmp_path):
+    framed_swatch(tmp_path / "opaques" / "62.png", RED)
+    framed_swatch(tmp_path / "opaques" / "81.png", (20, 20, 220))
+    assert FeatureBuilder(tmp_path, workers=1).build()["computed"] == 2
+
+    framed_swatch(tmp_path / "opaques" / "81.png", (20, 160, 20))
+    stats = FeatureBuilder(tmp_path, workers=1).build()
+    assert (stats["computed"], stats["unchanged"]) == (1, 1)
+    features = SwatchFeatures.load(tmp_path / ".cache" / "swatch_features.npz")
+    assert features.colors("opaques/62.png") == ["#c82828"]
+    assert features.colors("opaques/81.png") == ["#14a014"]
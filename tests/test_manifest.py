@@ -0,0 +1,50 @@
+from enamel_downloader.manifest import Manifest
+
+PRODUCT = "https://www.emaux-soyer.com/en/bleu-62f-en-poudre.html"
+IMAGE = "https://www.emaux-soyer.com/media/catalog/product/o/p/opq-0062.jpg"
+
+
+def test_new_fresh_and_stale(tmp_path):
+    swatch = tmp_path / "62F_hq.jpg"
+    swatch.write_bytes(b"swatch")
+    manifest = Manifest(tmp_path / "manifest.sqlite", ttl=3600)
+
+    assert manifest.classify(PRODUCT) == "new"
+    manifest.record(PRODUCT, image_url=IMAGE, filename=str(swatch), content_hash="a", checked_at=1000.0)
+    assert manifest.classify(PRODUCT, now=1000.0 + 3600) == "fresh"
+    # Past the TTL
+    assert manifest.classify(PRODUCT, now=1000.0 + 3601) == "stale"
+    assert manifest.image_is_fresh(IMAGE, now=1000.0 + 60)
+    assert not manifest.image_is_fresh(IMAGE, now=1000.0 + 3601)
+    assert not manifest.image_is_fresh(IMAGE + "?other", now=1000.0 + 60)
+
+    # Within the TTL, but the file is gone
+    swatch.unlink()
+    assert manifest.classify(PRODUCT, now=1000.0 + 60) == "stale"
+    assert not manifest.image_is_fresh(IMAGE, now=1000.0 + 60)
+    assert manifest.stats == {"new": 1, "stale": 2, "fresh": 1, "changed": 0, "unchanged": 0}
+    manifest.close()
+
+
+def test_changed_and_unchanged_content(tmp_path):
+    manifest = Manifest(tmp_path / "manifest.sqlite")
+    manifest.record(PRODUCT, content_hash="a", size=10)
+    manifest.record(PRODUCT, content_hash="a")
+    manifest.record(PRODUCT, content_hash="b", size=12)
+    # Fields other than the hash do not count either way
+    manifest.record(PRODUCT, enamel_type="opaque")
+    assert (manifest.stats["unchanged"], manifest.stats["changed"]) == (1, 1)
+    assert manifest.get(PRODUCT)["content_hash"] == "b" and manifest.get(PRODUCT)["size"] == 12
+    manifest.close()
+
+    # Rows survive a reopen
+    manifest = Manifest(tmp_path / "manifest.sqlite")
+    assert [entry["enamel_type"] for entry in manifest.entries()] == ["opaque"]
+    manifest.close()
+
+
+def test_image_lookups_use_an_index(tmp_path):
+    manifest = Manifest(tmp_path / "manifest.sqlite")
+    plan = manifest.db.execute("EXPLAIN QUERY PLAN SELECT * FROM products WHERE image_url = ?", (IMAGE,)).fetchall()
+    assert any("products_image_url" in row["detail"] for row in plan)
+    manifest.close()
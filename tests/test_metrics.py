@@ -0,0 +1,69 @@
+import json
+
+import pytest
+
+from enamel_downloader.metrics import StageMetrics, percentile
+
+
+def test_percentiles_are_nearest_rank():
+    values = [n / 1000 for n in range(1, 101)]
+    assert [percentile(values, q) for q in (0.5, 0.95, 0.99)] == [0.05, 0.095, 0.099]
+    assert percentile([0.2], 0.99) == 0.2
+    assert percentile([], 0.5) == 0.0
+
+    metrics = StageMetrics()
+    for n in range(100, 0, -1):
+        metrics.observe("fetch", n / 1000, nbytes=10)
+    fetch = metrics.report()["fetch"]
+    assert (fetch["p50"], fetch["p95"], fetch["p99"], fetch["max"]) == (0.05, 0.095, 0.099, 0.1)
+    assert (fetch["count"], fetch["bytes"], fetch["total_seconds"]) == (100, 1000, 5.05)
+    assert fetch["bytes_per_second"] == round(1000 / 5.05, 1)
+
+
+def test_errors_merge_and_event_log(tmp_path):
+    metrics = StageMetrics(event_log=tmp_path / "events.jsonl", run_id="run1")
+    with metrics.time("download", url="u") as observation:
+        observation["bytes"] = 2048
+    with pytest.raises(ValueError):
+        with metrics.time("parse"):
+            raise ValueError("bad page")
+
+    worker = StageMetrics()
+    worker.observe("download", 0.5, nbytes=1024)
+    metrics.merge(worker.state())
+    report = metrics.report()
+    assert (report["download"]["count"], report["download"]["bytes"]) == (2, 3072)
+    assert (report["parse"]["count"], report["parse"]["errors"]) == (1, 1)
+    metrics.close()
+
+    events = [json.loads(line) for line in (tmp_path / "events.jsonl").read_text().splitlines()]
+    assert [(e["event"], e.get("stage"), e.get("ok")) for e in events] == \
+        [("stage", "download", True), ("stage", "parse", False), ("run", None, None)]
+    assert events[0]["url"] == "u" and events[0]["bytes"] == 2048
+    assert events[-1]["stages"]["download"]["count"] == 2
+
+
+def test_prometheus_text(tmp_path):
+    metrics = StageMetrics()
+    metrics.durations = {"fetch": []}
+    for seconds in (0.1, 0.2, 0.4):
+        metrics.observe("fetch", seconds, nbytes=100)
+    metrics.observe("fetch", 0.3, ok=False)
+
+    assert metrics.prometheus(prefix="shop", labels={"supplier": "soyer"}) == (
+        '# HELP shop_stage_seconds Time spent per product in each pipeline stage\n'
+        '# TYPE shop_stage_seconds summary\n'
+        'shop_stage_seconds{stage="fetch",quantile="0.5",supplier="soyer"} 0.2\n'
+        'shop_stage_seconds{stage="fetch",quantile="0.95",supplier="soyer"} 0.4\n'
+        'shop_stage_seconds{stage="fetch",quantile="0.99",supplier="soyer"} 0.4\n'
+        'shop_stage_seconds_sum{stage="fetch",supplier="soyer"} 1.0\n'
+        'shop_stage_seconds_count{stage="fetch",supplier="soyer"} 4\n'
+        '# HELP shop_stage_bytes_total Bytes handled in each pipeline stage\n'
+        '# TYPE shop_stage_bytes_total counter\n'
+        'shop_stage_bytes_total{stage="fetch",supplier="soyer"} 300\n'
+        '# HELP shop_stage_errors_total Failed observations per pipeline stage\n'
+        '# TYPE shop_stage_errors_total counter\n'
+        'shop_stage_errors_total{stage="fetch",supplier="soyer"} 1\n'
+    )
+    metrics.write_prometheus(tmp_path / "enamel.prom", prefix="shop", labels={"supplier": "soyer"})
+    assert (tmp_path / "enamel.prom").read_text() == metrics.prometheus(prefix="shop", labels={"supplier": "soyer"})
@@ -0,0 +1,43 @@
+import pytest
+
+from enamel_downloader import parsers
+from enamel_downloader.page import ParsedPage
+from enamel_downloader.suppliers import EmauxSoyerAdapter
+
+CACHE = "https://www.emaux-soyer.com/media/catalog/product/cache/32da777feb9d2f52e427ce640ea952cf"
+# Saved product page -> (title, main product image)
+PAGES = {
+    "bleu-62f-en-poudre.html": ("Blue 62/F Powder", f"{CACHE}/o/p/opq-0062.jpg"),
+    "jaune-3063-transparent-en-poudre-3444.html": ("Yellow 3063 transparent powder",
+                                                   f"{CACHE}/p/3/p3063_jaune__3.jpg"),
+    "turquoise-opaque-clair-126.html": ("Light opaque turquoise 126", f"{CACHE}/1/2/126_1.jpg"),
+    "rubis-31.html": ("Ruby 31", f"{CACHE}/p/0/p0031_rogn_.jpg"),
+    "lilas-111-en-poudre.html": ("Lilac 111 Powder", f"{CACHE}/t/s/tsp-0111.jpg"),
+    "orange-621-150g.html": ("Orange 621 powder (150g)", None),
+}
+
+
+def parse(fixtures_dir, name, backend=None):
+    html = (fixtures_dir / "pages" / name).read_bytes()
+    return ParsedPage.from_html(f"https://www.emaux-soyer.com/en/{name}", html, EmauxSoyerAdapter.image_selectors,
+                                backend)
+
+
+@pytest.mark.parametrize("backend", parsers.BACKENDS)
+@pytest.mark.parametrize("name", PAGES)
+def test_product_page(fixtures_dir, name, backend):
+    title, image = PAGES[name]
+    page = parse(fixtures_dir, name, backend)
+    assert page.title == title
+    assert page.display_title == title
+    assert [img.get("src") for img in page.candidates] == ([image] if image else [])
+    # Logo, cart icon and footer icons are still seen, just not as candidates
+    assert len(page.images) == 4
+    assert page.metadata["og:image"].endswith(image or "placeholder/image.jpg")
+
+
+@pytest.mark.parametrize("name", PAGES)
+def test_backends_agree(fixtures_dir, name):
+    pages = [parse(fixtures_dir, name, backend) for backend in parsers.BACKENDS]
+    assert len({(page.title, page.heading, tuple(img.get("src") for img in page.images),
+                 tuple(img.get("src") for img in page.candidates)) for page in pages}) == 1
@@ -0,0 +1,61 @@
+import httpx
+import pytest
+import requests
+
+from enamel_downloader.pools import _HttpxBody
+
+
+class StreamedResponse:
+    """Stands in for a streamed httpx response whose body fails after some chunks"""
+
+    def __init__(self, chunks, error=None):
+        self.chunks = chunks
+        self.error = error
+        self.closed = False
+
+    def iter_bytes(self):
+        yield from self.chunks
+        if self.error:
+            raise self.error
+
+    def close(self):
+        self.closed = True
+
+
+def read_all(body, size=4):
+    data = b''
+    while True:
+        chunk = body.read(size)
+        if not chunk:
+            return data
+        data += chunk
+
+
+@pytest.mark.parametrize("error, expected", [
+    (httpx.RemoteProtocolError("peer closed connection"), requests.exceptions.ChunkedEncodingError),
+    (httpx.ReadError("connection reset"), requests.ConnectionError),
+    (httpx.ReadTimeout("timed out"), requests.ConnectionError),
+])
+def test_body_read_errors_become_requests_errors(error, expected):
+    body = _HttpxBody(StreamedResponse([b'abc', b'defgh'], error))
+    received = []
+    with pytest.raises(expected):
+        while True:
+            chunk = body.read(4)
+            if not chunk:
+                break
+            received.append(chunk)
+    # Every byte that arrived before the error is handed out first
+    assert b''.join(received) == b'abcdefgh'
+
+
+def test_iter_content_sees_requests_errors():
+    response = requests.Response()
+    response.raw = _HttpxBody(StreamedResponse([b'x' * 10], httpx.RemoteProtocolError("incomplete body")))
+    with pytest.raises(requests.exceptions.ChunkedEncodingError):
+        list(response.iter_content(4))
+
+
+def test_complete_body():
+    body = _HttpxBody(StreamedResponse([b'abc', b'def']))
+    assert read_all(body) == b'abcdef'
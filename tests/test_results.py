@@ -0,0 +1,37 @@
+import json
+
+from enamel_downloader.results import ResultLog, write_report
+
+
+def test_resumed_run_reports_each_product_once(tmp_path):
+    log = ResultLog(tmp_path / "results.jsonl")
+    log.write({"product_url": "a.html", "status": "failed", "seq": 0})
+    log.write({"product_url": "b.html", "status": "success", "seq": 1})
+    log.close()
+
+    # The interrupted run is resumed and retries the product that failed
+    resumed = ResultLog(tmp_path / "results.jsonl")
+    resumed.resume()
+    resumed.write({"product_url": "a.html", "status": "success", "seq": 0})
+    resumed.write({"product_url": "c.html", "status": "failed", "seq": 1})
+
+    statuses = {record["product_url"]: record["status"] for record in resumed.records()}
+    assert statuses == {"a.html": "success", "b.html": "success", "c.html": "failed"}
+    assert [record["product_url"] for record in resumed.records("failed")] == ["c.html"]
+    assert [record["product_url"] for record in resumed.sorted_records("success")] == ["b.html", "a.html"]
+
+
+def test_records_skip_torn_lines(tmp_path):
+    path = tmp_path / "results.jsonl"
+    log = ResultLog(path)
+    log.write({"product_url": "a.html", "status": "success"})
+    log.close()
+    with open(path, 'a') as f:
+        f.write('{"product_url": "b.ht')
+    assert [record["product_url"] for record in ResultLog(path).records()] == ["a.html"]
+
+
+def test_write_report_streams_generators(tmp_path):
+    path = tmp_path / "report.json"
+    write_report(path, {"summary": {"total": 2}, "results": (n for n in range(2)), "empty": (n for n in ())})
+    assert json.loads(path.read_text()) == {"summary": {"total": 2}, "results": [0, 1], "empty": []}
@@ -0,0 +1,107 @@
+import random
+import time
+
+import pytest
+import requests
+
+from download_all_emaux_images import CompleteEmauxDownloader
+from enamel_downloader.engine import CrawlEngine
+from enamel_downloader.retry import CircuitBreaker, CircuitOpenError, RetryPolicy
+
+
+def quick_retries(attempts=4):
+    return RetryPolicy(attempts=attempts, backoff=0.01, max_backoff=0.05, rng=random.Random(0))
+
+
+def test_server_errors_are_retried(tmp_path, mock_site):
+    catalog, listing = mock_site(products=12, errors=0.25)
+    downloader = CompleteEmauxDownloader(tmp_path, concurrency=4, rate_limit=0)
+    downloader.engine.retry = quick_retries(attempts=8)
+    downloader.run_complete_download(listing_urls=[listing])
+
+    assert catalog.failed > 0
+    assert downloader.stats["success"] == 12
+    # Every 503 cost one retry and none of them a product
+    assert downloader.engine.stats == {"retries": catalog.failed, "gave_up": 0}
+    assert len(downloader.retry_queue) == 0
+
+
+def test_timeouts_are_retried_then_raised(mock_site):
+    catalog, listing = mock_site(products=1, stalls=1.0, stall_time=0.5)
+    engine = CrawlEngine(rate=0, retry=quick_retries(attempts=3), breaker=CircuitBreaker(threshold=10))
+    with pytest.raises(requests.Timeout):
+        engine.request(requests.Session(), "GET", listing, timeout=0.1)
+    assert catalog.stalled == 3
+    assert engine.stats == {"retries": 2, "gave_up": 1}
+
+    catalog.stalls = 0.0
+    assert engine.request(requests.Session(), "GET", listing, timeout=2).status_code == 200
+
+
+def test_circuit_opens_on_a_failing_host_and_closes_after_it_recovers(mock_site):
+    catalog, listing = mock_site(products=1)
+    breaker = CircuitBreaker(threshold=4, reset_timeout=0.3)
+    engine = CrawlEngine(rate=0, retry=quick_retries(attempts=2), breaker=breaker)
+    session = requests.Session()
+    host = listing.split("/")[2]
+
+    catalog.down = True
+    assert engine.request(session, "GET", listing).status_code == 503
+    assert engine.request(session, "GET", listing).status_code == 503
+    assert breaker.is_open(host)
+    sent = catalog.requests
+    # Open: refused without reaching the server
+    with pytest.raises(CircuitOpenError):
+        engine.request(session, "GET", listing)
+    assert catalog.requests == sent
+    assert breaker.stats == {"opened": 1, "rejected": 1}
+
+    # Half-open trial while still down: open again at once
+    time.sleep(0.3)
+    with pytest.raises(CircuitOpenError):
+        engine.request(session, "GET", listing)
+    assert catalog.requests == sent + 1
+    assert breaker.is_open(host)
+
+    catalog.down = False
+    time.sleep(0.3)
+    assert engine.request(session, "GET", listing).status_code == 200
+    assert not breaker.is_open(host)
+
+
+def test_failed_products_are_replayed_from_the_queue(tmp_path, mock_site):
+    catalog, listing = mock_site(products=6)
+    downloader = CompleteEmauxDownloader(tmp_path, concurrency=2, rate_limit=0)
+    downloader.engine.retry = quick_retries(attempts=2)
+    urls = list(downloader.discover_products([listing]))
+
+    catalog.down = True
+    downloader.download_all(urls)
+    assert sorted(downloader.retry_queue.urls()) == sorted(urls)
+
+    catalog.down = False
+    downloader.engine.breaker = CircuitBreaker()
+    downloader.retry_failed()
+    assert len(downloader.retry_queue) == 0
+    assert len(list((tmp_path / "opaques").glob("*.jpg"))) == 6
+
+
+def test_an_unexpected_error_in_the_trial_does_not_wedge_the_circuit(mock_site):
+    catalog, listing = mock_site(products=1)
+    breaker = CircuitBreaker(threshold=1, reset_timeout=0.2)
+    engine = CrawlEngine(rate=0, retry=quick_retries(attempts=1), breaker=breaker)
+
+    catalog.down = True
+    assert engine.request(requests.Session(), "GET", listing).status_code == 503
+    catalog.down = False
+    time.sleep(0.2)
+
+    class BrokenSession(requests.Session):
+        def request(self, *args, **kwargs):
+            raise ValueError("not a network error")
+
+    with pytest.raises(ValueError):
+        engine.request(BrokenSession(), "GET", listing)
+    # The trial slot was given back, so the next request may try again
+    assert engine.request(requests.Session(), "GET", listing).status_code == 200
+    assert not breaker.is_open(listing.split("/")[2])
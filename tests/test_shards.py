@@ -0,0 +1,40 @@
+import pytest
+
+from enamel_downloader.shards import HashRing, ShardedCrawl, shard_key
+
+
+class Downloader:
+    base_dir = "public"
+
+
+@pytest.mark.parametrize("shards, host_concurrency", [(2, 4), (3, 4), (4, 4), (8, 4), (5, 1), (3, 8)])
+def test_shards_share_the_host_connections(shards, host_concurrency):
+    crawl = ShardedCrawl(Downloader(), None, shards, {"host_concurrency": host_concurrency, "concurrency": 8})
+    limits = [crawl.shard_settings(shard)["host_concurrency"] for shard in range(crawl.shards)]
+    assert sum(limits) == host_concurrency
+    assert min(limits) >= 1
+    assert crawl.shards == min(shards, host_concurrency)
+
+
+def test_rate_limit_is_split():
+    crawl = ShardedCrawl(Downloader(), None, 4, {"host_concurrency": 8, "rate_limit": 10.0})
+    assert sum(crawl.shard_settings(shard)["rate_limit"] for shard in range(4)) == pytest.approx(10.0)
+
+
+def test_ring_moves_few_keys_when_a_shard_is_added():
+    keys = [f"color-{n}" for n in range(2000)]
+    before, after = HashRing(4), HashRing(5)
+    moved = sum(before.shard(key) != after.shard(key) for key in keys)
+    # Ideally 1/5 of the keys move to the new shard; nothing moves between the old ones
+    assert moved < len(keys) * 0.3
+    assert all(after.shard(key) == 4 for key in keys if before.shard(key) != after.shard(key))
+
+
+def test_variants_of_a_color_share_a_shard():
+    base = "https://www.emaux-soyer.com/en/"
+    variants = [f"{base}bleu-62-en-poudre.html", f"{base}bleu-62f-en-poudre.html", f"{base}bleu-62-en-morceaux.html"]
+    assert {shard_key(url) for url in variants} == {"62"}
+    for shards in (2, 3, 4):
+        crawl = ShardedCrawl(Downloader(), None, shards, {"host_concurrency": 4})
+        split = crawl.split(variants + [f"{base}bleu-{n}-en-poudre.html" for n in range(100, 140)])
+        assert sum(all(url in urls for url in variants) for urls in split.values()) == 1
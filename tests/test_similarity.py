@@ -0,0 +1,72 @@
+import json
+
+import numpy as np
+import pytest
+
+from enamel_downloader.features import SwatchFeatures, rgb_to_lab
+from enamel_downloader.similarity import ColorIndex, build_index
+
+COLORS = {
+    "opaques/62.png": (200, 40, 40),
+    "opaques/81.png": (20, 20, 220),
+    "opaques/88.png": (20, 160, 20),
+    "opale_colors/607.png": (190, 60, 50),
+}
+
+
+def features(colors):
+    keys = sorted(colors)
+    return SwatchFeatures(keys=keys, hashes=["x"] * len(keys), lab=rgb_to_lab([colors[key] for key in keys]))
+
+
+def test_sync_only_touches_changed_swatches(monkeypatch):
+    index = ColorIndex()
+    assert index.sync(features(COLORS)) == {"added": 4, "updated": 0, "removed": 0}
+
+    touched = []
+    upsert, remove = ColorIndex.upsert, ColorIndex.remove
+    monkeypatch.setattr(ColorIndex, "upsert", lambda self, key, lab: (touched.append(key), upsert(self, key, lab)))
+    monkeypatch.setattr(ColorIndex, "remove", lambda self, key: (touched.append(key), remove(self, key)))
+
+    colors = dict(COLORS, **{"opaques/88.png": (240, 240, 60), "opaques/163.png": (0, 0, 0)})
+    del colors["opaques/81.png"]
+    assert index.sync(features(colors)) == {"added": 1, "updated": 1, "removed": 1}
+    assert sorted(touched) == ["opaques/163.png", "opaques/81.png", "opaques/88.png"]
+    assert sorted(index.keys) == sorted(colors)
+    for key, rgb in colors.items():
+        assert index.lab[index.rows[key]] == pytest.approx(rgb_to_lab(rgb), abs=0.05)
+
+    touched.clear()
+    assert index.sync(features(colors)) == {"added": 0, "updated": 0, "removed": 0}
+    assert touched == []
+
+
+def test_nearest_is_ordered_by_delta_e():
+    index = ColorIndex()
+    index.sync(features(COLORS))
+    results = index.nearest("#c82828", k=4)
+    keys = [key for key, _ in results]
+    assert keys == ["opaques/62.png", "opale_colors/607.png", "opaques/88.png", "opaques/81.png"]
+    distances = [distance for _, distance in results]
+    assert distances == sorted(distances) and distances[0] == pytest.approx(0, abs=0.1)
+    expected = np.linalg.norm(rgb_to_lab(COLORS["opale_colors/607.png"]) - rgb_to_lab((200, 40, 40)))
+    assert distances[1] == pytest.approx(expected, abs=0.1)
+    # A tuple is a Lab triple
+    assert index.nearest(rgb_to_lab((20, 20, 220)), k=1)[0][0] == "opaques/81.png"
+
+
+def test_unknown_excluded_keys_do_not_shrink_the_results():
+    index = ColorIndex()
+    index.sync(features(COLORS))
+    results = index.nearest("#c82828", k=3, exclude=("opaques/62.png", "opaques/62.png", "missing.png"))
+    assert [key for key, _ in results] == ["opale_colors/607.png", "opaques/88.png", "opaques/81.png"]
+    assert [key for key, _ in index.similar("opaques/62.png", k=1)] == ["opale_colors/607.png"]
+
+
+def test_build_index_saves_only_on_changes(tmp_path, capsys):
+    features(COLORS).save(tmp_path / ".cache" / "swatch_features.npz")
+    assert build_index(tmp_path) == {"added": 4, "updated": 0, "removed": 0, "swatches": 4}
+    saved = json.loads((tmp_path / "color_index.json").read_text())
+    assert len(saved["lab"]) == 3 * len(saved["keys"]) == 12
+    assert build_index(tmp_path)["swatches"] == 4
+    assert "up to date" in capsys.readouterr().out
@@ -0,0 +1,41 @@
+import os
+import stat
+
+from enamel_downloader.manifest import file_sha256
+from enamel_downloader.store import BlobStore, ViewBuilder
+
+
+def write(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return path
+
+
+def test_blobs_keep_normal_permissions(tmp_path):
+    store = BlobStore(tmp_path / "blobs")
+    blob = store.put(write(tmp_path / "a.jpg", b"\xff\xd8 swatch a"))
+    assert os.stat(blob).st_mode & stat.S_IWUSR
+    assert blob.stem == file_sha256(blob)
+
+
+def test_untracked_duplicates_share_one_blob(tmp_path):
+    write(tmp_path / "opaques" / "62_hq.jpg", b"\xff\xd8 same bytes")
+    write(tmp_path / "opaques" / "62F_hq.jpg", b"\xff\xd8 same bytes")
+    ViewBuilder(tmp_path).build()
+    assert os.path.samefile(tmp_path / "opaques" / "62_hq.jpg", tmp_path / "opaques" / "62F_hq.jpg")
+    assert len(list(BlobStore(tmp_path / ".cache" / "blobs").blobs())) == 1
+
+
+def test_prune_removes_only_unlinked_blobs(tmp_path):
+    builder = ViewBuilder(tmp_path)
+    kept = write(tmp_path / "opaques" / "1_hq.jpg", b"\xff\xd8 kept")
+    builder.build()
+    cached = builder.store.put(write(tmp_path / "cached.jpg", b"\xff\xd8 cached"), keep=True)
+    orphan = builder.store.put(write(tmp_path / "orphan.jpg", b"\xff\xd8 orphan"))
+
+    stats = ViewBuilder(tmp_path).build()
+    assert stats["pruned"] == 1
+    assert not orphan.exists()
+    # Still linked from elsewhere, e.g. the HTTP cache
+    assert cached.exists()
+    assert builder.store.find(file_sha256(kept))
@@ -0,0 +1,127 @@
+import pytest
+import requests
+
+from enamel_downloader.page import ParsedPage
+from enamel_downloader.suppliers import SUPPLIERS, EmauxSoyerAdapter, ShopifyAdapter, SupplierAdapter
+
+SOYER = "https://www.emaux-soyer.com/en/"
+CACHE = "https://www.emaux-soyer.com/media/catalog/product/cache/32da777feb9d2f52e427ce640ea952cf"
+STORE = "https://enamel-supply.example"
+SHOPIFY_CDN = f"{STORE}/cdn/shop/products"
+
+
+def parse(path, url, adapter):
+    return ParsedPage.from_html(url, path.read_bytes(), adapter.image_selectors)
+
+
+def test_adapters_must_find_images():
+    with pytest.raises(TypeError):
+        SupplierAdapter()
+
+    class NoImages(SupplierAdapter):
+        name = "none"
+
+    with pytest.raises(TypeError):
+        NoImages()
+    assert set(SUPPLIERS.values()) == {EmauxSoyerAdapter, ShopifyAdapter}
+
+
+@pytest.mark.parametrize("name, image, reference, enamel_type", [
+    ("bleu-62f-en-poudre", "o/p/opq-0062.jpg", "62F", "opaque"),
+    ("jaune-3063-transparent-en-poudre-3444", "p/3/p3063_jaune__3.jpg", "3063", "transparent"),
+    ("turquoise-opaque-clair-126", "1/2/126_1.jpg", "126", "opaque"),
+    ("rubis-31", "p/0/p0031_rogn_.jpg", "31", "transparent"),
+    ("lilas-111-en-poudre", "t/s/tsp-0111.jpg", "111", "transparent"),
+])
+def test_emaux_soyer_product_pages(fixtures_dir, name, image, reference, enamel_type):
+    adapter = EmauxSoyerAdapter()
+    page = parse(fixtures_dir / "pages" / f"{name}.html", f"{SOYER}{name}.html", adapter)
+    assert adapter.image_candidates(page) == [f"{CACHE}/{image}"]
+    # The soyer downloader's ranking puts the product image first and drops logo, icons and placeholders
+    assert adapter.ranked_images(page) == [f"{CACHE}/{image}"]
+    assert adapter.original_url(f"{CACHE}/{image}") == f"https://www.emaux-soyer.com/media/catalog/product/{image}"
+    assert adapter.reference(page.url, page.title)[0] == reference
+    assert adapter.enamel_type(page.url, page.title) == enamel_type
+    assert adapter.filename(reference) == f"{reference}_hq.jpg"
+
+
+def test_emaux_soyer_placeholder_only(fixtures_dir):
+    adapter = EmauxSoyerAdapter()
+    page = parse(fixtures_dir / "pages" / "orange-621-150g.html", f"{SOYER}orange-621-150g.html", adapter)
+    assert adapter.image_candidates(page) == []
+    assert adapter.ranked_images(page) == []
+
+
+class SavedStore:
+    def __init__(self, feeds):
+        self.feeds = feeds
+
+    def get(self, url, **kwargs):
+        response = requests.Response()
+        response.url = url
+        response.status_code = 200 if url in self.feeds else 404
+        response._content = self.feeds[url].read_bytes() if url in self.feeds else b"Not found"
+        return response
+
+
+def test_shopify_discovery(fixtures_dir, tmp_path):
+    adapter = ShopifyAdapter([f"{STORE}/collections/enamels?sort_by=manual"])
+    assert adapter.name == "enamel-supply"
+    assert adapter.discovery_file == "discovered_products_enamel-supply.json"
+    feed = f"{STORE}/collections/enamels/products.json?limit=250&page="
+    store = SavedStore({f"{feed}{n}": fixtures_dir / "shopify" / f"products-p{n}.json" for n in (1, 2, 3)})
+
+    discovery = adapter.discovery(store.get, state_file=tmp_path / adapter.discovery_file)
+    assert list(discovery.discover()) == [
+        f"{STORE}/products/transparent-enamel-1040-light-blue",
+        f"{STORE}/products/opaque-enamel-62-blue",
+        f"{STORE}/products/opal-enamel-8-white",
+    ]
+    assert discovery.stats["listing_pages"] == 3
+
+
+def test_shopify_product_page(fixtures_dir):
+    adapter = ShopifyAdapter([f"{STORE}/collections/enamels"])
+    url = f"{STORE}/products/transparent-enamel-1040-light-blue"
+    page = parse(fixtures_dir / "shopify" / "transparent-enamel-1040-light-blue.html", url, adapter)
+
+    # og:image first, then the widest srcset entry and src of each media image; never the logo
+    assert adapter.image_candidates(page) == [
+        f"{SHOPIFY_CDN}/1040-light-blue.jpg?v=1690000001",
+        f"{SHOPIFY_CDN}/1040-light-blue_1500x.jpg?v=1690000001",
+        f"{SHOPIFY_CDN}/1040-light-blue_600x.jpg?v=1690000001",
+        f"{SHOPIFY_CDN}/1040-fired-sample_600x.jpg?v=1690000009",
+    ]
+    assert adapter.original_url(f"{SHOPIFY_CDN}/1040-light-blue_1500x.jpg?v=1690000001") == \
+        f"{SHOPIFY_CDN}/1040-light-blue.jpg?v=1690000001"
+    assert adapter.original_url(f"{SHOPIFY_CDN}/1040-light-blue.jpg?v=1690000001&width=600") == \
+        f"{SHOPIFY_CDN}/1040-light-blue.jpg?v=1690000001"
+    assert adapter.original_url(f"{SHOPIFY_CDN}/1040-light-blue.jpg?v=1690000001") is None
+
+    assert adapter.reference(url, page.title) == ("1040", 1040)
+    assert adapter.enamel_type(url, page.title) == "transparent"
+    # No numbering system for other stores: without a keyword the type is the default
+    assert adapter.enamel_type(f"{STORE}/products/enamel-8-white") == "opaque"
+    assert adapter.filename("1040") == "enamel-supply-1040_hq.jpg"
+
+
+@pytest.mark.parametrize("srcset", [
+    "/cdn/shop/products/62_360x.jpg 360w, /cdn/shop/products/62_1500x.jpg 1500w,",
+    "/cdn/shop/products/62_360x.jpg 360w, /cdn/shop/products/62_1500x.jpg 1500w, ",
+    "/cdn/shop/products/62_1500x.jpg,",
+])
+def test_shopify_srcset_with_a_trailing_comma(srcset):
+    adapter = ShopifyAdapter([f"{STORE}/collections/enamels"])
+    url = f"{STORE}/products/opaque-enamel-62-blue"
+    html = f'<div class="product__media"><img src="/cdn/shop/products/62_600x.jpg" srcset="{srcset}"></div>'
+    page = ParsedPage.from_html(url, html.encode(), adapter.image_selectors)
+    assert adapter.image_candidates(page) == [f"{STORE}/cdn/shop/products/62_1500x.jpg",
+                                              f"{STORE}/cdn/shop/products/62_600x.jpg"]
+
+
+def test_shopify_srcset_of_only_commas():
+    adapter = ShopifyAdapter([f"{STORE}/collections/enamels"])
+    url = f"{STORE}/products/opaque-enamel-62-blue"
+    html = '<div class="product__media"><img src="/cdn/shop/products/62_600x.jpg" srcset=" , "></div>'
+    page = ParsedPage.from_html(url, html.encode(), adapter.image_selectors)
+    assert adapter.image_candidates(page) == [f"{STORE}/cdn/shop/products/62_600x.jpg"]
@@ -0,0 +1,97 @@
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+
+from enamel_downloader.manifest import Manifest, file_sha256
+from enamel_downloader.swatch_types import LABELS_FILE, SwatchTypeClassifier, load_labels
+
+PUBLIC = Path(__file__).resolve().parent.parent / "public"
+
+# Hand-labeled swatches from the storefront, filed where a wrong label would put them
+HAND_LABELED = {
+    "transparent_colors/2000.jpg": ("transparent", "transparent_colors"),
+    "transparent_colors/4046.jpg": ("transparent", "transparent_colors"),
+    "transparent_colors/39.jpg": ("transparent", "opaques"),
+    "opale_colors/607.jpg": ("opal", "opale_colors"),
+    "opale_colors/609.jpg": ("opal", "opale_colors"),
+    "opale_colors/101.jpg": ("opal", "opaques"),
+    "opaques/81.jpg": ("opaque", "opaques"),
+    "opaques/82.jpg": ("opaque", "opale_colors"),
+    "opaques/632.jpg": ("opaque", "transparent_colors"),
+    "opaques/68.jpg": ("opaque", "opaques"),
+}
+# Downloaded swatches nobody has labeled
+UNLABELED = ("opaques/163_hq.jpg", "opaques/BLEU68_hq.jpg", "opaques/88.jpg")
+
+
+@pytest.fixture
+def swatches(tmp_path):
+    labels = []
+    for source, (type_name, folder) in HAND_LABELED.items():
+        target = tmp_path / folder / Path(source).name
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(PUBLIC / source, target)
+        labels.append({"file": source, "type": type_name, "sha256": file_sha256(target)})
+    for source in UNLABELED:
+        shutil.copyfile(PUBLIC / source, tmp_path / source)
+    labels_file = tmp_path / "labels.json"
+    labels_file.write_text(json.dumps({"labels": labels}))
+    return tmp_path, labels_file
+
+
+def scores_by_key(base_dir):
+    with open(base_dir / ".cache" / "type_scores.json") as f:
+        scores = json.load(f)["scores"]
+    return {path.relative_to(base_dir).as_posix(): scores[file_sha256(path)]
+            for path in base_dir.glob("*/*.jpg")}
+
+
+def test_default_run_only_reports(swatches):
+    base_dir, labels_file = swatches
+    before = sorted(path.relative_to(base_dir) for path in base_dir.glob("*/*.jpg"))
+    stats = SwatchTypeClassifier(base_dir, workers=1, labels_file=labels_file).run()
+    assert sorted(path.relative_to(base_dir) for path in base_dir.glob("*/*.jpg")) == before
+    assert stats["moved"] == 0
+    # Trained on the hand-labeled swatches only, not on the folders
+    assert stats["training"] == len(HAND_LABELED)
+
+
+def test_hand_labeled_swatches_keep_their_type(swatches):
+    base_dir, labels_file = swatches
+    SwatchTypeClassifier(base_dir, workers=1, labels_file=labels_file).run()
+    scores = scores_by_key(base_dir)
+    for source, (type_name, folder) in HAND_LABELED.items():
+        score = scores[f"{folder}/{Path(source).name}"]
+        assert (score["type"], score["proof"]) == (type_name, "label"), source
+
+
+def test_move_refiles_only_proven_swatches(swatches):
+    base_dir, labels_file = swatches
+    stats = SwatchTypeClassifier(base_dir, workers=1, labels_file=labels_file).run(move=True)
+    assert stats["moved"] == 4
+    for source, (type_name, _) in HAND_LABELED.items():
+        folder = {"transparent": "transparent_colors", "opaque": "opaques", "opal": "opale_colors"}[type_name]
+        assert (base_dir / folder / Path(source).name).exists(), source
+    for source in UNLABELED:
+        assert (base_dir / source).exists(), source
+
+
+def test_keyword_proves_a_type(swatches):
+    base_dir, labels_file = swatches
+    (base_dir / ".cache").mkdir()
+    manifest = Manifest(base_dir / ".cache" / "complete_download_manifest.sqlite")
+    manifest.record("https://www.emaux-soyer.com/en/bleu-163-transparent-en-poudre.html",
+                    filename=str(base_dir / "opaques" / "163_hq.jpg"))
+    manifest.close()
+    stats = SwatchTypeClassifier(base_dir, workers=1, labels_file=labels_file).run(move=True)
+    assert (base_dir / "transparent_colors" / "163_hq.jpg").exists()
+    assert stats["training"] == len(HAND_LABELED) + 1
+
+
+def test_shipped_labels_cover_the_hand_filed_swatches():
+    labels = load_labels(LABELS_FILE)
+    assert labels[file_sha256(PUBLIC / "opaques" / "632.jpg")] == "opaque"
+    assert labels[file_sha256(PUBLIC / "opale_colors" / "607.jpg")] == "opal"
+    assert labels[file_sha256(PUBLIC / "transparent_colors" / "2000.jpg")] == "transparent"
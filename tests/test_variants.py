@@ -0,0 +1,46 @@
+import json
+
+from PIL import Image
+
+from enamel_downloader.variants import VariantBuilder
+
+
+def swatch(path, width, color=(200, 40, 40)):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    Image.new("RGB", (width, width), color).save(path)
+    return path
+
+
+def test_unchanged_sources_are_skipped(tmp_path):
+    swatch(tmp_path / "opaques" / "62.png", 400)
+    swatch(tmp_path / "transparent_colors" / "2000.png", 400, (40, 40, 200))
+    first = VariantBuilder(tmp_path, workers=1).build()
+    assert (first["rendered"], first["unchanged"]) == (2, 0)
+
+    swatch(tmp_path / "opaques" / "62.png", 400, (40, 200, 40))
+    (tmp_path / "transparent_colors" / "2000.png").unlink()
+    second = VariantBuilder(tmp_path, workers=1).build()
+    assert (second["rendered"], second["unchanged"], second["removed"]) == (1, 0, 1)
+    assert not list((tmp_path / "variants" / "transparent_colors").iterdir())
+
+    third = VariantBuilder(tmp_path, workers=1).build()
+    assert (third["rendered"], third["unchanged"]) == (0, 1)
+
+
+def test_variants_are_never_larger_than_the_source(tmp_path):
+    swatch(tmp_path / "opaques" / "62.png", 400)
+    swatch(tmp_path / "opaques" / "81.png", 200)
+    swatch(tmp_path / "opaques" / "88.png", 100)
+    VariantBuilder(tmp_path, workers=1).build()
+    images = json.loads((tmp_path / "image_variants.json").read_text())["images"]
+
+    widths = {key: sorted({v["width"] for v in entry["variants"]}) for key, entry in images.items()}
+    assert widths == {"opaques/62.png": [160, 320], "opaques/81.png": [160], "opaques/88.png": [100]}
+    for entry in images.values():
+        # Every width in both formats
+        assert len(entry["variants"]) == 2 * len({v["width"] for v in entry["variants"]})
+        assert {v["format"] for v in entry["variants"]} == {"jpg", "webp"}
+        for variant in entry["variants"]:
+            with Image.open(tmp_path / variant["path"]) as image:
+                assert image.width == variant["width"] <= entry["width"]
+    assert images["opaques/81.png"]["srcset"]["webp"] == "variants/opaques/81-160.webp 160w"